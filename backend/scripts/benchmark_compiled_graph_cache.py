@@ -0,0 +1,90 @@
+"""Benchmark subgraph compile cost against invoke cost.
+
+Run from the repository root:
+    PYTHONPATH=backend/src python3 backend/scripts/benchmark_compiled_graph_cache.py
+
+Uses a stub GitHub client so that only LangGraph overhead is measured. The
+"per call" column is the old ``Subgraph(...).build_graph().ainvoke(...)``
+pattern; "cached" is ``Subgraph(...).ainvoke(...)`` backed by
+``airas.core.compiled_graph``.
+"""
+
+import asyncio
+import time
+from statistics import median
+
+from airas.core.types.github import GitHubConfig
+from airas.usecases.executors.dispatch_experiment_on_static_runner_subgraph.dispatch_experiment_on_static_runner_subgraph import (
+    DispatchExperimentOnStaticRunnerSubgraph,
+)
+from airas.usecases.executors.dispatch_experiment_validation_subgraph.dispatch_experiment_validation_subgraph import (
+    DispatchExperimentValidationSubgraph,
+)
+from airas.usecases.github.poll_github_actions_subgraph.poll_github_actions_subgraph import (
+    PollGithubActionsSubgraph,
+)
+
+ITERATIONS = 200
+GITHUB_CONFIG = GitHubConfig(
+    github_owner="airas-org", repository_name="bench", branch_name="main"
+)
+
+
+class _StubGithubClient:
+    async def acreate_workflow_dispatch(self, *args, **kwargs) -> bool:
+        return True
+
+
+def _time_compile(subgraph_cls) -> float:
+    timings = []
+    for _ in range(ITERATIONS):
+        start = time.perf_counter()
+        subgraph_cls(github_client=_StubGithubClient()).build_graph()
+        timings.append(time.perf_counter() - start)
+    return median(timings)
+
+
+async def _time_invoke(make_call) -> tuple[float, float]:
+    uncached, cached = [], []
+    for _ in range(ITERATIONS):
+        start = time.perf_counter()
+        await make_call(cached=False)
+        uncached.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        await make_call(cached=True)
+        cached.append(time.perf_counter() - start)
+    return median(uncached), median(cached)
+
+
+async def _dispatch(cached: bool) -> None:
+    subgraph = DispatchExperimentOnStaticRunnerSubgraph(
+        github_client=_StubGithubClient()
+    )
+    state = {"github_config": GITHUB_CONFIG, "run_id": "bench"}
+    if cached:
+        await subgraph.ainvoke(state)
+    else:
+        await subgraph.build_graph().ainvoke(state)
+
+
+async def main() -> None:
+    print(f"median of {ITERATIONS} iterations\n")
+    print(f"{'subgraph':<42}{'compile (ms)':>14}")
+    for subgraph_cls in (
+        PollGithubActionsSubgraph,
+        DispatchExperimentValidationSubgraph,
+        DispatchExperimentOnStaticRunnerSubgraph,
+    ):
+        print(f"{subgraph_cls.__name__:<42}{_time_compile(subgraph_cls) * 1000:>14.3f}")
+
+    uncached, cached = await _time_invoke(_dispatch)
+    print(
+        f"\nDispatchExperimentOnStaticRunnerSubgraph end-to-end (stub client):\n"
+        f"  compile + invoke per call: {uncached * 1000:.3f} ms\n"
+        f"  cached graph, invoke only: {cached * 1000:.3f} ms"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,139 @@
+"""Benchmark readiness probes against the fixed sleeps they replace.
+
+Run from the repository root:
+    PYTHONPATH=backend/src python3 backend/scripts/benchmark_github_readiness.py
+
+A fake GitHub API makes each write visible only PROPAGATION_DELAYS seconds
+after it happened: a template repository's main branch, a file's new blob sha
+and a workflow run's artifact. For each delay the GithubClient readiness
+waits are timed (with the requests they made). They are compared with the
+fixed sleep each call site used before:
+- prepare_repository slept 5 s;
+- github_upload slept 3 s;
+- publish_html slept 3 s;
+- the interactive repo agent polled its artifact every 10 s.
+
+A fixed sleep shorter than the delay returned before the write was visible
+("stale").
+"""
+
+import asyncio
+import json
+import logging
+import math
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+import httpx
+
+from airas.infra.github_client import GithubClient
+
+PROPAGATION_DELAYS = [0.3, 1.5, 4.0]
+OLD_SHA = "0" * 40
+NEW_SHA = "1" * 40
+
+
+class _FakeGithub(BaseHTTPRequestHandler):
+    # Resource -> monotonic time at which the write becomes visible.
+    visible_at: dict[str, float] = {}
+    requests = 0
+
+    def _visible(self, resource: str) -> bool:
+        return time.monotonic() >= self.visible_at.get(resource, math.inf)
+
+    def _reply(self, status: int, body: dict) -> None:
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self) -> None:
+        type(self).requests += 1
+        path = urlparse(self.path).path
+        if path.endswith("/branches/main"):
+            if self._visible("branch"):
+                self._reply(200, {"commit": {"sha": NEW_SHA}})
+            else:
+                self._reply(404, {"message": "Branch not found"})
+        elif "/contents/" in path:
+            sha = NEW_SHA if self._visible("file") else OLD_SHA
+            self._reply(200, {"sha": sha})
+        elif path.endswith("/artifacts"):
+            artifacts = (
+                [{"name": "tunnel-url", "id": 1}] if self._visible("artifact") else []
+            )
+            self._reply(200, {"artifacts": artifacts})
+        else:
+            self._reply(404, {"message": "Not Found"})
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+def _publish(resource: str, delay: float) -> None:
+    _FakeGithub.visible_at[resource] = time.monotonic() + delay
+    _FakeGithub.requests = 0
+
+
+def _fixed(label: str, sleep: float, delay: float) -> str:
+    stale = " (stale)" if sleep < delay else ""
+    return f"{label:<22}{sleep:>10.2f}{stale:<9}"
+
+
+def _row(label: str, fixed_sleep: float, delay: float, start: float) -> None:
+    waited = time.perf_counter() - start
+    print(
+        f"{_fixed(label, fixed_sleep, delay)}{waited:>10.2f}{_FakeGithub.requests:>10}"
+    )
+
+
+async def _run(client: GithubClient, delay: float) -> None:
+    _publish("branch", delay)
+    start = time.perf_counter()
+    assert client.wait_until_ref_exists("o", "r", "main")
+    _row("prepare_repository", 5.0, delay, start)
+
+    for label in ("github_upload", "publish_html"):
+        _publish("file", delay)
+        start = time.perf_counter()
+        assert await client.await_until_file_sha("o", "r", "f", NEW_SHA, "main")
+        _row(label, 3.0, delay, start)
+
+    _publish("artifact", delay)
+    start = time.perf_counter()
+    assert await client.await_until_artifact(
+        "o", "r", 1, "tunnel-url", timeout=120, initial_delay=1, max_delay=5
+    )
+    # The old loop probed, then slept 10 s between probes.
+    _row("interactive agent", math.ceil(delay / 10) * 10, delay, start)
+
+
+def main() -> None:
+    # The probes log every not-yet-visible response.
+    logging.disable(logging.WARNING)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FakeGithub)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_port}"
+    with httpx.Client() as sync_session:
+        client = GithubClient(
+            github_token="fake",
+            base_url=base_url,
+            sync_session=sync_session,
+            async_session=httpx.AsyncClient(),
+        )
+        for delay in PROPAGATION_DELAYS:
+            print(f"\npropagation delay {delay:.1f} s")
+            print(
+                f"{'call site':<22}{'fixed (s)':>10}{'':<9}{'probe (s)':>10}"
+                f"{'requests':>10}"
+            )
+            asyncio.run(_run(client, delay))
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
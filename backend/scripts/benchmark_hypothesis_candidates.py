@@ -0,0 +1,105 @@
+"""Benchmark parallel hypothesis candidates against the sequential refine loop.
+
+Run from the repository root:
+    PYTHONPATH=backend/src python3 backend/scripts/benchmark_hypothesis_candidates.py
+
+Uses a fake LLM client with a fixed per-call latency. A drafted hypothesis
+gets a random quality; each refinement raises it by 0-2 points. The evaluator
+reports that quality as novelty and significance, and the loop stops early
+once both reach 9, as in GenerateHypothesisSubgraphV0. Results are averaged
+over TRIALS seeds.
+"""
+
+import asyncio
+import random
+import time
+from statistics import mean
+
+from airas.core.types.research_hypothesis import (
+    HypothesisEvaluation,
+    ResearchHypothesis,
+)
+from airas.usecases.generators.generate_hypothesis_subgraph.generate_hypothesis_subgraph_v0 import (
+    GenerateHypothesisSubgraphV0,
+)
+
+TRIALS = 20
+LLM_LATENCY_SECONDS = 0.05
+CONFIGURATIONS = {
+    "sequential (4 refinement rounds)": {"refinement_rounds": 4},
+    "8 candidates, concurrency 4, 1 round": {
+        "refinement_rounds": 1,
+        "num_candidates": 8,
+        "max_concurrency": 4,
+    },
+    "8 candidates, concurrency 8, 1 round": {
+        "refinement_rounds": 1,
+        "num_candidates": 8,
+        "max_concurrency": 8,
+    },
+}
+
+
+class _FakeLLMClient:
+    def __init__(self, seed: int) -> None:
+        self.rng = random.Random(seed)
+        self.calls = 0
+
+    async def structured_outputs(
+        self, llm_name, message, data_model, params=None, web_search=False
+    ):
+        self.calls += 1
+        await asyncio.sleep(LLM_LATENCY_SECONDS)
+        if data_model is HypothesisEvaluation:
+            quality = int(message.split("quality=")[1].split()[0])
+            return HypothesisEvaluation(
+                novelty_reason="fake",
+                novelty_score=quality,
+                significance_reason="fake",
+                significance_score=quality,
+            )
+        if "quality=" in message:  # refine: the prompt carries the current one
+            quality = int(message.split("quality=")[1].split()[0])
+            quality = min(10, quality + self.rng.randint(0, 2))
+        else:
+            quality = self.rng.randint(3, 8)
+        return ResearchHypothesis(
+            open_problems="fake",
+            method=f"quality={quality} ",
+            experimental_setup="fake",
+            primary_metric="fake",
+            experimental_code="fake",
+            expected_result="fake",
+            expected_conclusion="fake",
+        )
+
+
+async def _trial(seed: int, config: dict) -> tuple[float, int, int]:
+    client = _FakeLLMClient(seed)
+    start = time.perf_counter()
+    result = (
+        await GenerateHypothesisSubgraphV0(langchain_client=client, **config)
+        .build_graph()
+        .ainvoke({"research_topic": "benchmark", "research_study_list": []})
+    )
+    wall = time.perf_counter() - start
+    quality = int(result["research_hypothesis"].method.split("quality=")[1].split()[0])
+    return wall, client.calls, quality
+
+
+async def main() -> None:
+    print(
+        f"mean of {TRIALS} trials, {LLM_LATENCY_SECONDS * 1000:.0f} ms per LLM call\n"
+    )
+    print(f"{'mode':<40}{'wall (s)':>10}{'LLM calls':>11}{'quality':>9}")
+    for label, config in CONFIGURATIONS.items():
+        results = [await _trial(seed, config) for seed in range(TRIALS)]
+        walls, calls, qualities = zip(*results, strict=True)
+        print(
+            f"{label:<40}{mean(walls):>10.3f}{mean(calls):>11.1f}"
+            f"{mean(qualities):>9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
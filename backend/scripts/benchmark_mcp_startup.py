@@ -0,0 +1,134 @@
+"""Benchmark MCP server cold start: process start to the `initialize` response.
+
+Run from the repository root:
+    PYTHONPATH=backend/src python3 backend/scripts/benchmark_mcp_startup.py
+
+Spawns the stdio server RUNS times and speaks JSON-RPC to it the way an MCP
+client does. For each run it records three times:
+- process start to the `initialize` response;
+- the `tools/list` round trip;
+- the first call of a tool whose implementation is imported on demand
+  (`retrieve_models`).
+
+The "eager" mode first imports every module that the tools import lazily,
+collected from server.py's function bodies. That reproduces a server which
+imports all of its implementation modules at the top.
+"""
+
+import ast
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from statistics import median
+
+import airas.mcp.server as server_module
+
+RUNS = 5
+SERVER_PATH = Path(server_module.__file__)
+
+
+def _lazy_imports() -> list[str]:
+    """Modules server.py imports inside functions (excluding TYPE_CHECKING)."""
+    modules: set[str] = set()
+    for node in ast.walk(ast.parse(SERVER_PATH.read_text())):
+        if not isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef):
+            continue
+        for inner in ast.walk(node):
+            if isinstance(inner, ast.ImportFrom) and inner.module:
+                modules.add(inner.module)
+            elif isinstance(inner, ast.Import):
+                modules.update(alias.name for alias in inner.names)
+    return sorted(modules)
+
+
+def _send(proc: subprocess.Popen, message: dict) -> None:
+    proc.stdin.write(json.dumps(message) + "\n")
+    proc.stdin.flush()
+
+
+def _receive(proc: subprocess.Popen, request_id: int) -> dict:
+    while line := proc.stdout.readline():
+        message = json.loads(line)
+        if message.get("id") == request_id:
+            return message
+    raise RuntimeError("server exited before responding")
+
+
+def _request(proc: subprocess.Popen, request_id: int, method: str, params: dict):
+    start = time.perf_counter()
+    _send(
+        proc, {"jsonrpc": "2.0", "id": request_id, "method": method, "params": params}
+    )
+    response = _receive(proc, request_id)
+    if "error" in response:
+        raise RuntimeError(f"{method} failed: {response['error']}")
+    return response["result"], time.perf_counter() - start
+
+
+def _run_once(eager: bool) -> tuple[float, float, float, int]:
+    preamble = (
+        "".join(f"import {module}; " for module in _lazy_imports()) if eager else ""
+    )
+    code = f"{preamble}from airas.mcp.server import main; main()"
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-c", code],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+        env={**os.environ, "AIRAS_TRACING": "false"},
+    )
+    try:
+        _send(
+            proc,
+            {
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "initialize",
+                "params": {
+                    "protocolVersion": "2025-06-18",
+                    "capabilities": {},
+                    "clientInfo": {"name": "airas-benchmark", "version": "0"},
+                },
+            },
+        )
+        _receive(proc, 1)
+        initialize = time.perf_counter() - start
+        _send(proc, {"jsonrpc": "2.0", "method": "notifications/initialized"})
+        tools, list_tools = _request(proc, 2, "tools/list", {})
+        _, first_call = _request(
+            proc,
+            3,
+            "tools/call",
+            {
+                "name": "retrieve_models",
+                "arguments": {"model_subfield": "image_models"},
+            },
+        )
+        return initialize, list_tools, first_call, len(tools["tools"])
+    finally:
+        proc.stdin.close()
+        proc.terminate()
+        proc.wait()
+
+
+def main() -> None:
+    print(f"median of {RUNS} server launches (s)\n")
+    print(
+        f"{'mode':<8}{'tools':>7}{'initialize':>12}{'tools/list':>12}{'first call':>12}"
+    )
+    for label, eager in (("eager", True), ("lazy", False)):
+        runs = [_run_once(eager) for _ in range(RUNS)]
+        initialize, list_tools, first_call, num_tools = zip(*runs, strict=True)
+        print(
+            f"{label:<8}{num_tools[0]:>7}{median(initialize):>12.2f}"
+            f"{median(list_tools):>12.3f}{median(first_call):>12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""Benchmark async cursor-paginated OpenAlex harvesting against the page loop.
+
+Run from the repository root:
+    PYTHONPATH=backend/src python3 backend/scripts/benchmark_openalex_harvest.py
+
+A local stub of the OpenAlex /works endpoint serves NUM_RESULTS works for
+each of NUM_QUERIES queries and answers after REQUEST_LATENCY_SECONDS. It
+supports both `page` and `cursor` paging and honours `select`; without
+`select`, it returns full work records. It records the response bytes and
+the mean rate at which requests arrived, which must stay within OpenAlex's
+10 requests per second.
+
+Compared:
+- the sequential page loop, openalex_search_titles, run once per query;
+- OpenAlexClient.aharvest_works, which shares OPENALEX_SCHEDULER.
+"""
+
+import asyncio
+import json
+import logging
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import httpx
+
+from airas.infra.openalex_client import DEFAULT_FIELDS, OpenAlexClient
+from airas.usecases.retrieve.retrieve_paper_subgraph.nodes.openalex_search_titles import (
+    openalex_search_titles,
+)
+
+NUM_QUERIES = 10
+NUM_RESULTS = 1000
+REQUEST_LATENCY_SECONDS = 0.05
+QUERIES = [f"benchmark topic {i}" for i in range(NUM_QUERIES)]
+
+
+def _work(query: str, i: int) -> dict:
+    words = f"{query} method result dataset baseline ablation".split()
+    return {
+        "id": f"https://openalex.org/W{abs(hash(query)) % 10**6}{i:05d}",
+        "doi": f"https://doi.org/10.0000/{i}",
+        "display_name": f"{query.title()} paper {i}",
+        "publication_year": 2024,
+        "publication_date": "2024-01-01",
+        "authorships": [{"author": {"display_name": f"Author {j}"}} for j in range(5)],
+        "biblio": {"volume": "1", "first_page": "1", "last_page": "10"},
+        "primary_location": {"source": {"display_name": "Venue"}},
+        "referenced_works": [f"https://openalex.org/W{j}" for j in range(30)],
+        "related_works": [f"https://openalex.org/W{j}" for j in range(10)],
+        "abstract_inverted_index": {w: [k] for k, w in enumerate(words * 20)},
+    }
+
+
+class _FakeOpenAlex(BaseHTTPRequestHandler):
+    bytes_sent = 0
+    starts: list[float] = []
+    lock = threading.Lock()
+
+    def do_GET(self) -> None:
+        with self.lock:
+            type(self).starts.append(time.monotonic())
+        params = {k: v[0] for k, v in parse_qs(urlparse(self.path).query).items()}
+        query = params["filter"].split(",")[0].removeprefix("default.search:")
+        per_page = int(params["per-page"])
+        if "cursor" in params:
+            offset = 0 if params["cursor"] == "*" else int(params["cursor"])
+        else:
+            offset = (int(params.get("page", 1)) - 1) * per_page
+        end = min(offset + per_page, NUM_RESULTS)
+        works = [_work(query, i) for i in range(offset, end)]
+        if "select" in params:
+            keep = params["select"].split(",")
+            works = [{k: w[k] for k in keep if k in w} for w in works]
+        meta = {
+            "count": NUM_RESULTS,
+            "next_cursor": str(end) if end < NUM_RESULTS else None,
+        }
+        data = json.dumps({"meta": meta, "results": works}).encode()
+        time.sleep(REQUEST_LATENCY_SECONDS)
+        with self.lock:
+            type(self).bytes_sent += len(data)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+class _Server(ThreadingHTTPServer):
+    # The default listen backlog (5) drops part of a burst of concurrent
+    # connections, which then retry after a second.
+    request_queue_size = 64
+
+
+def _reset() -> None:
+    _FakeOpenAlex.bytes_sent = 0
+    _FakeOpenAlex.starts = []
+
+
+def _mean_rate() -> float:
+    starts = sorted(_FakeOpenAlex.starts)
+    return (len(starts) - 1) / (starts[-1] - starts[0])
+
+
+def _report(label: str, elapsed: float, works: int) -> None:
+    print(
+        f"{label:<42}{elapsed:>9.2f}{works:>8}{len(_FakeOpenAlex.starts):>10}"
+        f"{_FakeOpenAlex.bytes_sent / 1e6:>9.2f}{_mean_rate():>10.1f}"
+    )
+
+
+def main() -> None:
+    logging.disable(logging.WARNING)
+    server = _Server(("127.0.0.1", 0), _FakeOpenAlex)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    client = OpenAlexClient(
+        base_url=f"http://127.0.0.1:{server.server_port}",
+        sync_session=httpx.Client(),
+        async_session=httpx.AsyncClient(),
+    )
+    print(
+        f"{NUM_QUERIES} queries x {NUM_RESULTS} results, "
+        f"{REQUEST_LATENCY_SECONDS * 1000:.0f} ms per request\n"
+    )
+    print(
+        f"{'mode':<42}{'wall (s)':>9}{'works':>8}{'requests':>10}{'MB':>9}{'req/s':>10}"
+    )
+
+    _reset()
+    start = time.perf_counter()
+    titles = sum(
+        len(openalex_search_titles([q], max_results=NUM_RESULTS, client=client) or [])
+        for q in QUERIES
+    )
+    _report("page loop, sequential (before)", time.perf_counter() - start, titles)
+
+    for label, fields, concurrency in (
+        ("cursor harvest, id+title, concurrency 1", ("id", "display_name"), 1),
+        ("cursor harvest, id+title, concurrency 4", ("id", "display_name"), 4),
+        ("cursor harvest, default fields, conc. 4", DEFAULT_FIELDS, 4),
+    ):
+        _reset()
+        start = time.perf_counter()
+        harvested = asyncio.run(
+            client.aharvest_works(
+                QUERIES,
+                max_results_per_query=NUM_RESULTS,
+                fields=fields,
+                max_concurrency=concurrency,
+            )
+        )
+        works = sum(len(w) for w in harvested.values())
+        _report(label, time.perf_counter() - start, works)
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Benchmark prompt rendering with and without the shared template registry.
+
+Run from the repository root:
+    PYTHONPATH=backend/src python3 backend/scripts/benchmark_prompt_rendering.py
+
+Compares compiling a fresh ``jinja2.Environment`` per render (the old
+behaviour of the prompt nodes) against ``airas.core.prompt_templates``, which
+compiles each prompt once. The fan-out case mirrors ``summarize_paper``
+rendering the same prompt for dozens of papers.
+"""
+
+import time
+from statistics import median
+
+from jinja2 import Environment
+
+from airas.core.prompt_templates import get_template, render_prompt
+from airas.usecases.retrieve.retrieve_paper_subgraph.prompt.summarize_paper_prompt import (
+    summarize_paper_prompt,
+)
+from airas.usecases.writers.write_subgraph.prompts.section_tips_prompt import (
+    section_tips_prompt,
+)
+from airas.usecases.writers.write_subgraph.prompts.write_prompt import write_prompt
+
+REPEATS = 5
+FAN_OUT = 50
+
+CASES = {
+    "summarize_paper": (summarize_paper_prompt, {"paper_text": "lorem ipsum " * 2000}),
+    "write_paper": (
+        write_prompt,
+        {"note": "lorem ipsum " * 5000, "tips_dict": section_tips_prompt},
+    ),
+}
+
+
+def _fresh_render(template: str, data: dict) -> str:
+    return Environment().from_string(template).render(data)
+
+
+def _time_fan_out(render, template: str, data: dict) -> float:
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        for _ in range(FAN_OUT):
+            render(template, data)
+        timings.append(time.perf_counter() - start)
+    return median(timings)
+
+
+def main() -> None:
+    print(f"{FAN_OUT} renders per run, median of {REPEATS} runs\n")
+    print(f"{'prompt':<20}{'fresh env (ms)':>16}{'cached (ms)':>14}{'speedup':>10}")
+    for name, (template, data) in CASES.items():
+        get_template(template)  # warm the registry, as after the first call
+        fresh = _time_fan_out(_fresh_render, template, data)
+        cached = _time_fan_out(render_prompt, template, data)
+        print(
+            f"{name:<20}{fresh * 1000:>16.2f}{cached * 1000:>14.2f}"
+            f"{fresh / cached:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
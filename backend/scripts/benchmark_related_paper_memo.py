@@ -0,0 +1,158 @@
+"""Benchmark related-paper retrieval across hypothesis refinement rounds.
+
+Run from the repository root:
+    PYTHONPATH=backend/src python3 backend/scripts/benchmark_related_paper_memo.py
+
+Runs GenerateHypothesisSubgraph for ROUNDS novelty evaluations against stub
+LLM, arXiv and PDF clients that sleep for a fixed latency and count calls.
+Each round retrieves PAPERS_PER_ROUND related titles, sliding the window by
+NEW_PAPERS_PER_ROUND so most titles repeat from the previous round. The
+"memo off" run retrieves every title every round; "memo on" only retrieves the
+titles not seen earlier in the run.
+"""
+
+import asyncio
+import time
+from collections import Counter
+
+import feedparser
+
+import airas.usecases.generators.generate_hypothesis_subgraph.generate_hypothesis_subgraph as subgraph_module
+from airas.core.types.arxiv import ArxivInfo
+from airas.core.types.research_hypothesis import (
+    HypothesisEvaluation,
+    ResearchHypothesis,
+)
+from airas.core.types.research_study import LLMExtractedInfo, MetaData, ResearchStudy
+from airas.usecases.generators.generate_hypothesis_subgraph.generate_hypothesis_subgraph import (
+    GenerateHypothesisSubgraph,
+    GenerateHypothesisSubgraphState,
+)
+
+ROUNDS = 5
+PAPERS_PER_ROUND = 10
+NEW_PAPERS_PER_ROUND = 2
+LATENCY_SECONDS = {"web_search": 0.05, "arxiv": 0.05, "pdf": 0.1, "llm": 0.02}
+
+TITLES = [
+    f"Related Paper {i}: Sparse Mixture Routing"
+    for i in range(PAPERS_PER_ROUND + NEW_PAPERS_PER_ROUND * ROUNDS)
+]
+CALLS: Counter[str] = Counter()
+
+
+def _arxiv_id(title: str) -> str:
+    return f"2401.{TITLES.index(title):05d}"
+
+
+async def _external_call(kind: str) -> None:
+    CALLS[kind] += 1
+    await asyncio.sleep(LATENCY_SECONDS[kind])
+
+
+class _StubLLMClient:
+    async def generate(self, message: str, llm_name, params=None, web_search=False):
+        await _external_call("web_search")
+        title = next(t for t in sorted(TITLES, key=len, reverse=True) if t in message)
+        return f'{{"arxiv_id": "{_arxiv_id(title)}"}}'
+
+    async def structured_outputs(
+        self, llm_name, message, data_model, params=None, web_search=False
+    ):
+        await _external_call("llm")
+        if data_model is HypothesisEvaluation:
+            # Never good enough to stop early, so every round runs.
+            return HypothesisEvaluation(
+                novelty_reason="stub",
+                novelty_score=5,
+                significance_reason="stub",
+                significance_score=5,
+            )
+        return ResearchHypothesis(
+            open_problems="stub",
+            method="stub",
+            experimental_setup="stub",
+            primary_metric="stub",
+            experimental_code="stub",
+            expected_result="stub",
+            expected_conclusion="stub",
+        )
+
+
+class _StubArxivClient:
+    async def aget_papers_by_ids(self, ids, **kwargs):
+        await _external_call("arxiv")
+        return {
+            arxiv_id: feedparser.FeedParserDict(
+                id=f"http://arxiv.org/abs/{arxiv_id}v1",
+                title=TITLES[int(arxiv_id.split(".")[1])],
+                authors=[],
+                published="2024-01-01",
+            )
+            for arxiv_id in ids
+        }
+
+
+async def _stub_retrieve_text_from_url(arxiv_info_list: list[ArxivInfo]) -> list[str]:
+    texts = []
+    for info in arxiv_info_list:
+        await _external_call("pdf")
+        texts.append(f"full text of {info.id}")
+    return texts
+
+
+class _BenchSubgraph(GenerateHypothesisSubgraph):
+    async def _retrieve_related_papers(
+        self, state: GenerateHypothesisSubgraphState
+    ) -> dict[str, list[ResearchStudy]]:
+        start = state["refine_iterations"] * NEW_PAPERS_PER_ROUND
+        return {
+            "related_research_study_list": [
+                ResearchStudy(
+                    title=title,
+                    full_text="",
+                    references=[],
+                    meta_data=MetaData(),
+                    llm_extracted_info=LLMExtractedInfo(),
+                )
+                for title in TITLES[start : start + PAPERS_PER_ROUND]
+            ]
+        }
+
+
+async def _run(memoize: bool) -> tuple[Counter[str], float]:
+    CALLS.clear()
+    subgraph = _BenchSubgraph(
+        arxiv_client=_StubArxivClient(),
+        ss_client=None,
+        llm_client=_StubLLMClient(),
+        refinement_rounds=ROUNDS - 1,
+        memoize_related_papers=memoize,
+    )
+    start = time.perf_counter()
+    await subgraph.build_graph().ainvoke(
+        {"research_topic": "sparse mixture routing", "research_study_list": []},
+        {"recursion_limit": 200},
+    )
+    return Counter(CALLS), time.perf_counter() - start
+
+
+async def main() -> None:
+    subgraph_module.retrieve_text_from_url = _stub_retrieve_text_from_url
+    print(
+        f"{ROUNDS} rounds, {PAPERS_PER_ROUND} related papers per round, "
+        f"{NEW_PAPERS_PER_ROUND} new per round\n"
+    )
+    kinds = list(LATENCY_SECONDS)
+    print(f"{'':<10}" + "".join(f"{k:>12}" for k in kinds) + f"{'wall (s)':>12}")
+    for label, memoize in (("memo off", False), ("memo on", True)):
+        calls, wall = await _run(memoize)
+        print(
+            f"{label:<10}"
+            + "".join(f"{calls[k]:>12}" for k in kinds)
+            + f"{wall:>12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,144 @@
+"""Benchmark the render cache and the batch chart/diagram MCP tools.
+
+Run from the repository root:
+    PYTHONPATH=backend/src python3 backend/scripts/benchmark_render_cache.py
+
+Diagrams are rendered against a local Kroki stand-in that answers every
+request after KROKI_LATENCY_SECONDS with a small SVG, so no diagram leaves
+the machine. Charts are rendered with vl-convert. Each workload is rendered
+one tool call at a time without the cache, then with the batch tool on a
+cold and on a warm cache (a temporary SQLite file).
+"""
+
+import asyncio
+import logging
+import os
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+NUM_CHARTS = 16
+NUM_DIAGRAMS = 32
+KROKI_LATENCY_SECONDS = 0.1
+_SVG = b'<svg xmlns="http://www.w3.org/2000/svg" width="10" height="10"/>'
+
+
+class _FakeKroki(BaseHTTPRequestHandler):
+    requests = 0
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers["Content-Length"]))
+        type(self).requests += 1
+        time.sleep(KROKI_LATENCY_SECONDS)
+        self.send_response(200)
+        self.send_header("Content-Type", "image/svg+xml")
+        self.send_header("Content-Length", str(len(_SVG)))
+        self.end_headers()
+        self.wfile.write(_SVG)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+class _Server(ThreadingHTTPServer):
+    # The default listen backlog (5) drops part of a burst of concurrent
+    # connections, which then retry after a second.
+    request_queue_size = 64
+
+
+def _chart_spec(i: int) -> dict:
+    return {
+        "$schema": "https://vega.github.io/schema/vega-lite/v5.json",
+        "data": {"values": [{"x": x, "y": (x * i) % 17} for x in range(200)]},
+        "mark": "line",
+        "encoding": {
+            "x": {"field": "x", "type": "quantitative"},
+            "y": {"field": "y", "type": "quantitative"},
+        },
+    }
+
+
+async def _timed(label: str, run, note=lambda: "") -> None:
+    start = time.perf_counter()
+    results = await run()
+    elapsed = time.perf_counter() - start
+    errors = [r["error"] for r in results if "error" in r]
+    if errors:
+        raise RuntimeError(errors[0])
+    cached = sum(r["cached"] for r in results)
+    print(f"{label:<44}{elapsed:>9.2f}{cached:>8}{note():>10}")
+
+
+async def _run(server, out: Path) -> None:
+    charts = [
+        {"vega_lite_spec": _chart_spec(i), "output_path": str(out / f"c{i}.svg")}
+        for i in range(NUM_CHARTS)
+    ]
+    diagrams = [
+        {
+            "diagram_type": "graphviz",
+            "diagram_source": f"digraph {{ a -> b{i} }}",
+            "output_path": str(out / f"d{i}.svg"),
+        }
+        for i in range(NUM_DIAGRAMS)
+    ]
+    kroki_requests = lambda: str(_FakeKroki.requests)  # noqa: E731
+
+    async def one_by_one_charts():
+        return [await server.render_chart(**chart) for chart in charts]
+
+    async def one_by_one_diagrams():
+        return [await server.render_diagram(**diagram) for diagram in diagrams]
+
+    print(f"{'workload':<44}{'wall (s)':>9}{'cached':>8}{'requests':>10}")
+    os.environ["ENABLE_RENDER_CACHE"] = "false"
+    server.shared_render_cache.cache_clear()
+    await _timed(f"{NUM_CHARTS} charts, render_chart, no cache", one_by_one_charts)
+    await _timed(
+        f"{NUM_DIAGRAMS} diagrams, render_diagram, no cache",
+        one_by_one_diagrams,
+        kroki_requests,
+    )
+
+    os.environ["ENABLE_RENDER_CACHE"] = "true"
+    server.shared_render_cache.cache_clear()
+    # Start the worker processes outside the timed runs.
+    await server.render_charts([{**charts[0], "output_path": str(out / "w.png")}])
+    server.shared_render_cache().clear()
+    for state in ("cold", "warm"):
+        await _timed(
+            f"{NUM_CHARTS} charts, render_charts, {state} cache",
+            lambda: server.render_charts(charts),
+        )
+    for state in ("cold", "warm"):
+        _FakeKroki.requests = 0
+        await _timed(
+            f"{NUM_DIAGRAMS} diagrams, render_diagrams, {state} cache",
+            lambda: server.render_diagrams(diagrams),
+            kroki_requests,
+        )
+
+
+def main() -> None:
+    kroki = _Server(("127.0.0.1", 0), _FakeKroki)
+    threading.Thread(target=kroki.serve_forever, daemon=True).start()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["KROKI_BASE_URL"] = f"http://127.0.0.1:{kroki.server_port}"
+        os.environ["AIRAS_RENDER_CACHE_PATH"] = str(Path(tmp) / "render.sqlite")
+        # Imported here so that spawned chart workers, which re-import this
+        # script, do not import the server.
+        import airas.mcp.server as server
+
+        logging.disable(logging.INFO)
+        print(
+            f"{os.cpu_count()} CPUs, Kroki stand-in with "
+            f"{KROKI_LATENCY_SECONDS * 1000:.0f} ms latency\n"
+        )
+        asyncio.run(_run(server, Path(tmp)))
+    kroki.shutdown()
+
+
+if __name__ == "__main__":
+    main()
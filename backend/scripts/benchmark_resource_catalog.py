@@ -0,0 +1,135 @@
+"""Benchmark the resource catalog against eagerly imported resource dicts.
+
+Run from the repository root:
+    PYTHONPATH=backend/src python3 backend/scripts/benchmark_resource_catalog.py
+
+Import time is measured in fresh interpreters, with and without compiled
+bytecode (a throwaway PYTHONPYCACHEPREFIX forces compiling from source, as on
+a fresh install). "eager" imports every resource module, which is what the
+retrieve nodes, the experimental-design nodes and the MCP server used to do
+at import time. Lookup latency compares a linear scan over every entry with
+RESOURCE_CATALOG.search, both with all sections already loaded; the "first
+query" row is a fresh process answering one query (index load, fingerprint
+check and the sections the answer lives in).
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from statistics import median
+
+from airas.resources.catalog import (
+    RESOURCE_CATALOG,
+    SECTIONS,
+    _entry_terms,
+    _load_section,
+    normalize_term,
+)
+
+RUNS = 15
+LOOKUPS = 2000
+QUERIES = {
+    "task=image-classification": {"task": "image-classification"},
+    "modality=text, kind=models": {"modality": "text", "kind": "models"},
+    "name=llama": {"name": "llama"},
+    "tag=vision (domain)": {"tag": "vision", "kind": "libraries"},
+}
+EAGER_IMPORT = "; ".join(
+    f"import airas.resources.{section.module}" for section in SECTIONS.values()
+)
+LAZY_IMPORT = "import airas.resources.catalog"
+# Already imported by the time anything in airas reads a resource; excluded
+# so that only the resource modules themselves are timed.
+PRELOADED = "import dataclasses, hashlib, importlib, json, logging, pathlib, re"
+FIRST_QUERY = (
+    "from airas.resources.catalog import RESOURCE_CATALOG; "
+    "RESOURCE_CATALOG.search(task='image-classification')"
+)
+
+
+def _run_python(code: str, pycache_prefix: str) -> float:
+    env = {**os.environ, "PYTHONPYCACHEPREFIX": pycache_prefix}
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    script = (
+        f"{PRELOADED}; import time; _t = time.perf_counter(); "
+        f"{code}; print(time.perf_counter() - _t)"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", script],
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+def _median_ms(code: str, cold: bool) -> float:
+    timings = []
+    with tempfile.TemporaryDirectory() as warm_prefix:
+        _run_python(code, warm_prefix)  # writes the bytecode the warm runs use
+        for _ in range(RUNS):
+            if cold:
+                with tempfile.TemporaryDirectory() as cold_prefix:
+                    timings.append(_run_python(code, cold_prefix))
+            else:
+                timings.append(_run_python(code, warm_prefix))
+    return median(timings) * 1000
+
+
+def _linear_scan(**filters: str) -> dict:
+    results = {}
+    for section in SECTIONS.values():
+        if "kind" in filters and section.kind != filters["kind"]:
+            continue
+        for name, entry in _load_section(section).items():
+            terms = _entry_terms(section, name, entry)
+            if all(
+                normalize_term(filters[field]) in field_terms
+                for field, field_terms in terms.items()
+                if field in filters
+            ):
+                results[name] = entry
+    return results
+
+
+def _median_us(fn, **filters: str) -> float:
+    timings = []
+    for _ in range(LOOKUPS):
+        start = time.perf_counter()
+        fn(**filters)
+        timings.append(time.perf_counter() - start)
+    return median(timings) * 1e6
+
+
+def main() -> None:
+    print(f"import time, median of {RUNS} fresh interpreters (ms)")
+    print(f"{'':<28}{'bytecode':>10}{'source':>10}")
+    for label, code in (
+        ("eager resource modules", EAGER_IMPORT),
+        ("airas.resources.catalog", LAZY_IMPORT),
+        ("catalog + first query", FIRST_QUERY),
+    ):
+        warm = _median_ms(code, cold=False)
+        cold = _median_ms(code, cold=True)
+        print(f"{label:<28}{warm:>10.1f}{cold:>10.1f}")
+
+    for section in SECTIONS.values():
+        _load_section(section)
+    print(f"\nlookup latency, median of {LOOKUPS} (µs)")
+    print(f"{'query':<30}{'results':>8}{'scan':>10}{'index':>10}")
+    for label, filters in QUERIES.items():
+        scanned = _linear_scan(**filters)
+        indexed = RESOURCE_CATALOG.search(**filters)
+        assert scanned == indexed, label
+        print(
+            f"{label:<30}{len(indexed):>8}"
+            f"{_median_us(_linear_scan, **filters):>10.1f}"
+            f"{_median_us(RESOURCE_CATALOG.search, **filters):>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
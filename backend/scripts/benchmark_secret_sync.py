@@ -0,0 +1,168 @@
+"""Benchmark Actions secret sync against a local GitHub API stub.
+
+Run from the repository root:
+    PYTHONPATH=backend/src python3 backend/scripts/benchmark_secret_sync.py
+
+The stub serves a repository public key, lists the repository's secrets and
+answers each secret PUT after PUT_LATENCY_SECONDS. It decrypts every upload
+with its private key, so after each step the script checks that the
+repository holds exactly the current values.
+
+Steps:
+- the previous serial sync, with no record;
+- a first sync;
+- a rerun with nothing changed;
+- a rerun after one value changed;
+- a rerun after a secret was deleted in the repository;
+- a rerun after the public key rotated.
+"""
+
+import asyncio
+import base64
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import httpx
+from nacl import public
+
+from airas.core.types.github import GitHubConfig
+from airas.infra.github_client import GithubClient
+from airas.infra.secret_sync_store import SecretSyncStore
+from airas.usecases.github.set_github_actions_secrets_subgraph.nodes.set_github_actions_secrets import (
+    set_github_actions_secrets,
+)
+
+NUM_SECRETS = 13
+PUT_LATENCY_SECONDS = 0.1
+SECRET_NAMES = [f"BENCH_SECRET_{i}" for i in range(NUM_SECRETS)]
+
+
+class _FakeGithub(BaseHTTPRequestHandler):
+    private_key = public.PrivateKey.generate()
+    key_id = "key-1"
+    # Secret name -> decrypted value, as the repository holds it.
+    secrets: dict[str, str] = {}
+    puts = 0
+
+    @classmethod
+    def rotate_key(cls, key_id: str) -> None:
+        cls.private_key = public.PrivateKey.generate()
+        cls.key_id = key_id
+
+    def _reply(self, status: int, body: dict | None = None) -> None:
+        data = json.dumps(body).encode() if body is not None else b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self) -> None:
+        if self.path.endswith("/actions/secrets/public-key"):
+            key = base64.b64encode(bytes(self.private_key.public_key)).decode()
+            self._reply(200, {"key_id": self.key_id, "key": key})
+        elif "/actions/secrets" in self.path:
+            names = sorted(self.secrets)
+            self._reply(
+                200,
+                {
+                    "total_count": len(names),
+                    "secrets": [{"name": name} for name in names],
+                },
+            )
+        else:
+            self._reply(404, {"message": "Not Found"})
+
+    def do_PUT(self) -> None:
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        time.sleep(PUT_LATENCY_SECONDS)
+        if body["key_id"] != self.key_id:
+            self._reply(422, {"message": "Bad key_id"})
+            return
+        sealed = base64.b64decode(body["encrypted_value"])
+        name = self.path.rsplit("/", 1)[1]
+        type(self).secrets[name] = (
+            public.SealedBox(self.private_key).decrypt(sealed).decode()
+        )
+        type(self).puts += 1
+        self._reply(201)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+class _Server(ThreadingHTTPServer):
+    # The default listen backlog (5) drops part of a burst of concurrent
+    # connections, which then retry after a second.
+    request_queue_size = 64
+
+
+async def _step(
+    label: str,
+    client: GithubClient,
+    sync_store: SecretSyncStore | None,
+    max_concurrency: int = 8,
+) -> None:
+    _FakeGithub.puts = 0
+    start = time.perf_counter()
+    ok = await set_github_actions_secrets(
+        github_config=GitHubConfig(
+            github_owner="o", repository_name="r", branch_name="main"
+        ),
+        github_client=client,
+        secret_names=SECRET_NAMES,
+        sync_store=sync_store,
+        max_concurrency=max_concurrency,
+    )
+    elapsed = time.perf_counter() - start
+    expected = {name: os.environ[name] for name in SECRET_NAMES}
+    if not ok or _FakeGithub.secrets != expected:
+        raise RuntimeError(f"{label}: repository secrets do not match")
+    print(f"{label:<34}{elapsed:>9.2f}{_FakeGithub.puts:>7}")
+
+
+async def _run(client: GithubClient, store_path: Path) -> None:
+    print(f"{'step':<34}{'wall (s)':>9}{'PUTs':>7}")
+    await _step("serial, no record (before)", client, None, max_concurrency=1)
+
+    _FakeGithub.secrets.clear()
+    store = SecretSyncStore(store_path)
+    await _step("first sync", client, store)
+    await _step("rerun, unchanged", client, store)
+
+    os.environ[SECRET_NAMES[0]] = "rotated-value"
+    await _step("rerun, one value changed", client, store)
+
+    del _FakeGithub.secrets[SECRET_NAMES[1]]
+    await _step("rerun, one deleted in repository", client, store)
+
+    _FakeGithub.rotate_key("key-2")
+    await _step("rerun, public key rotated", client, store)
+    await _step("rerun after rotation, unchanged", client, store)
+
+
+def main() -> None:
+    logging.disable(logging.WARNING)
+    for i, name in enumerate(SECRET_NAMES):
+        os.environ[name] = f"value-{i}"
+    server = _Server(("127.0.0.1", 0), _FakeGithub)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    with tempfile.TemporaryDirectory() as tmp:
+        client = GithubClient(
+            github_token="fake",
+            base_url=f"http://127.0.0.1:{server.server_port}",
+            async_session=httpx.AsyncClient(),
+        )
+        print(f"{NUM_SECRETS} secrets, {PUT_LATENCY_SECONDS * 1000:.0f} ms per PUT\n")
+        asyncio.run(_run(client, Path(tmp) / "secret_sync.sqlite"))
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Rebuild the inverted index of the curated resource catalog.
+
+Run from the repository root after editing anything under airas/resources:
+    PYTHONPATH=backend/src python3 backend/scripts/build_resource_catalog_index.py
+
+With --check, exits non-zero instead of writing when the index is out of date.
+A stale index still works (it is rebuilt in memory with a warning), but every
+process then pays for importing the whole catalog.
+"""
+
+import argparse
+import json
+import sys
+
+from airas.resources.catalog import INDEX_PATH, build_index
+
+
+def render(index: dict) -> str:
+    """JSON with one line per entry and per term, so rebuilds diff cleanly."""
+    entries = ",\n".join(f"  {json.dumps(entry)}" for entry in index["entries"])
+    fields = ",\n".join(
+        f"  {json.dumps(field)}: {{\n"
+        + ",\n".join(
+            f"   {json.dumps(term)}: {json.dumps(ids)}"
+            for term, ids in sorted(terms.items())
+        )
+        + "\n  }"
+        for field, terms in index["postings"].items()
+    )
+    return (
+        f'{{\n "fingerprint": {json.dumps(index["fingerprint"])},\n'
+        f' "entries": [\n{entries}\n ],\n "postings": {{\n{fields}\n }}\n}}\n'
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--check", action="store_true")
+    args = parser.parse_args()
+
+    rendered = render(build_index())
+    current = INDEX_PATH.read_text() if INDEX_PATH.exists() else ""
+    if rendered == current:
+        print(f"{INDEX_PATH.name} is up to date.")
+        return 0
+    if args.check:
+        print(f"{INDEX_PATH.name} is out of date; rebuild it with this script.")
+        return 1
+    INDEX_PATH.write_text(rendered)
+    print(f"Wrote {INDEX_PATH}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
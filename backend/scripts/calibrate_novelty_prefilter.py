@@ -0,0 +1,175 @@
+"""Calibrate the NoveltyPrefilter threshold for the default HashingEmbedder.
+
+Run from the repository root:
+    PYTHONPATH=backend/src python3 backend/scripts/calibrate_novelty_prefilter.py
+
+Five well-known papers are paired with three hypotheses each:
+- "restated": the paper's own method in slightly different framing, which
+  the prefilter should reject without an LLM call;
+- "paraphrased": the same idea in different words;
+- "related": a distinct follow-up idea in the same area.
+Only "restated" hypotheses should reach the threshold; paraphrases and
+follow-ups are left to the LLM evaluator. The script prints, for each label,
+the similarity range to the paper itself and the highest similarity to any
+other paper. It also prints the midpoint between the lowest "restated"
+score and the highest score of any other pair, which is the value of
+HASHING_EMBEDDER_THRESHOLD.
+"""
+
+import asyncio
+
+from airas.core.types.research_hypothesis import ResearchHypothesis
+from airas.core.types.research_study import (
+    LLMExtractedInfo,
+    MetaData,
+    ResearchStudy,
+)
+from airas.usecases.generators.generate_hypothesis_subgraph.novelty_prefilter import (
+    HASHING_EMBEDDER_THRESHOLD,
+    NoveltyPrefilter,
+)
+
+STUDIES = {  # key -> (title, main contributions and methodology)
+    "lora": (
+        "LoRA: Low-Rank Adaptation of Large Language Models",
+        "We freeze the pretrained model weights and inject trainable rank decomposition matrices into each layer of the Transformer architecture, greatly reducing the number of trainable parameters for downstream tasks. Low-rank adaptation matches full fine-tuning quality on GPT-3 with 10,000 times fewer trainable parameters and no additional inference latency.",
+    ),
+    "mixup": (
+        "mixup: Beyond Empirical Risk Minimization",
+        "We train a neural network on convex combinations of pairs of examples and their labels. Mixup regularizes the network to favor simple linear behavior in-between training examples, improves generalization on ImageNet and CIFAR, reduces memorization of corrupt labels and increases robustness to adversarial examples.",
+    ),
+    "dropout": (
+        "Dropout: A Simple Way to Prevent Neural Networks from Overfitting",
+        "The key idea is to randomly drop units along with their connections from the neural network during training. This prevents units from co-adapting too much. At test time a single unthinned network with smaller weights approximates averaging the predictions of many thinned networks.",
+    ),
+    "flash": (
+        "FlashAttention: Fast and Memory-Efficient Exact Attention with IO-Awareness",
+        "We propose an IO-aware exact attention algorithm that uses tiling to reduce the number of memory reads and writes between GPU high bandwidth memory and on-chip SRAM. It computes exact attention with fewer HBM accesses and speeds up Transformer training.",
+    ),
+    "ddpm": (
+        "Denoising Diffusion Probabilistic Models",
+        "We present high quality image synthesis results using diffusion probabilistic models, a class of latent variable models trained by optimizing a weighted variational bound connected to denoising score matching with Langevin dynamics. Samples are produced by iteratively denoising Gaussian noise.",
+    ),
+}
+
+HYPOTHESES = {  # (study, label) -> "open problems\nmethod"
+    (
+        "lora",
+        "restated",
+    ): "Full fine-tuning of large language models updates all parameters and is expensive to store per task.\nFreeze the pretrained model weights and inject trainable low-rank decomposition matrices into each Transformer layer so that only a small number of parameters are trained for downstream tasks, without additional inference latency.",
+    (
+        "lora",
+        "paraphrased",
+    ): "Adapting huge pretrained language models to each downstream task by updating every weight is costly in memory and storage.\nKeep the base network fixed and learn, for every layer, a pair of small low-rank matrices whose product is added to the original weight update; merge them after training so inference cost is unchanged.",
+    (
+        "lora",
+        "related",
+    ): "Low-rank adapters use the same rank in every layer even though layers differ in how much they need to change.\nAllocate the adapter rank per layer from the singular value spectrum of the gradient during a short warmup, pruning ranks in layers where the spectrum decays quickly.",
+    (
+        "mixup",
+        "restated",
+    ): "Empirical risk minimization lets neural networks memorize corrupt labels and behave erratically between training examples.\nTrain the neural network on convex combinations of pairs of examples and their labels so that it favors linear behavior in-between training examples, improving generalization and robustness to adversarial examples.",
+    (
+        "mixup",
+        "paraphrased",
+    ): "Networks trained with standard risk minimization overfit noisy labels and are brittle off the data manifold.\nBlend two random inputs with a Beta-distributed weight and blend their one-hot targets with the same weight, training on these interpolated samples as a data-independent regularizer.",
+    (
+        "mixup",
+        "related",
+    ): "Interpolation-based augmentation ignores which image regions carry the label, producing misleading mixed targets.\nUse saliency maps to choose the patches that are pasted between images and set the mixed label from the saliency mass each source contributes.",
+    (
+        "dropout",
+        "restated",
+    ): "Large neural networks overfit because units co-adapt.\nRandomly drop units along with their connections from the neural network during training to prevent co-adaptation, and at test time use a single network with smaller weights that approximates averaging many thinned networks.",
+    (
+        "dropout",
+        "paraphrased",
+    ): "Hidden units in deep networks learn to rely on each other, hurting generalization.\nDuring each training step, zero out a random subset of neurons with a fixed probability and rescale the remaining activations, so the model behaves like an ensemble of subnetworks evaluated together at inference.",
+    (
+        "dropout",
+        "related",
+    ): "A single fixed drop rate is suboptimal across layers and training phases.\nLearn per-layer drop probabilities with a concrete relaxation and anneal them with a schedule tied to the validation loss gap.",
+    (
+        "flash",
+        "restated",
+    ): "Exact attention is slow and memory hungry because of reads and writes to GPU high bandwidth memory.\nAn IO-aware exact attention algorithm that uses tiling to reduce memory reads and writes between HBM and on-chip SRAM, computing exact attention with fewer HBM accesses to speed up Transformer training.",
+    (
+        "flash",
+        "paraphrased",
+    ): "Self-attention wall-clock time is dominated by memory traffic rather than arithmetic.\nSplit queries, keys and values into blocks that fit in shared memory, compute the softmax incrementally with running maxima and sums, and never materialize the full attention matrix in device memory.",
+    (
+        "flash",
+        "related",
+    ): "Long-context attention kernels still waste compute on padded and masked blocks in variable-length batches.\nSchedule attention blocks by a sparsity map derived from the mask so that fully masked tiles are skipped and work is balanced across streaming multiprocessors.",
+    (
+        "ddpm",
+        "restated",
+    ): "Generating high quality images with likelihood-based models is hard.\nTrain diffusion probabilistic models, latent variable models optimized with a weighted variational bound connected to denoising score matching with Langevin dynamics, and produce samples by iteratively denoising Gaussian noise.",
+    (
+        "ddpm",
+        "paraphrased",
+    ): "Likelihood-based image generators lag behind GANs in sample quality.\nDefine a fixed Markov chain that gradually adds Gaussian noise to images and train a network to predict the added noise at each step; sample by running the learned reverse chain from pure noise.",
+    (
+        "ddpm",
+        "related",
+    ): "Diffusion samplers need hundreds of network evaluations per image.\nDistill a trained diffusion model into a student that matches two teacher steps with one, repeating the halving until sampling takes four steps.",
+}
+
+
+def _study(title: str, summary: str) -> ResearchStudy:
+    return ResearchStudy(
+        title=title,
+        full_text="",
+        references=[],
+        meta_data=MetaData(),
+        llm_extracted_info=LLMExtractedInfo(main_contributions=summary),
+    )
+
+
+def _hypothesis(text: str) -> ResearchHypothesis:
+    open_problems, method = text.split("\n", 1)
+    return ResearchHypothesis(
+        open_problems=open_problems,
+        method=method,
+        experimental_setup="",
+        primary_metric="",
+        experimental_code="",
+        expected_result="",
+        expected_conclusion="",
+    )
+
+
+async def main() -> None:
+    prefilter = NoveltyPrefilter()
+    studies = {key: _study(*paper) for key, paper in STUDIES.items()}
+    own: dict[str, list[float]] = {}
+    other: dict[str, list[float]] = {}
+    for (key, label), text in HYPOTHESES.items():
+        hypothesis = _hypothesis(text)
+        own_match = await prefilter.closest_study(hypothesis, [studies[key]])
+        other_match = await prefilter.closest_study(
+            hypothesis, [s for k, s in studies.items() if k != key]
+        )
+        assert own_match is not None and other_match is not None
+        own.setdefault(label, []).append(own_match[0])
+        other.setdefault(label, []).append(other_match[0])
+
+    print(f"{'hypothesis':<13}{'own paper':>16}{'other papers (max)':>21}")
+    for label in own:
+        print(
+            f"{label:<13}{min(own[label]):>8.3f} - {max(own[label]):.3f}"
+            f"{max(other[label]):>21.3f}"
+        )
+    lowest_duplicate = min(own["restated"])
+    highest_other = max(
+        max(v for label, values in own.items() if label != "restated" for v in values),
+        max(v for values in other.values() for v in values),
+    )
+    print(
+        f"\nsuggested threshold {(lowest_duplicate + highest_other) / 2:.2f} "
+        f"(HASHING_EMBEDDER_THRESHOLD = {HASHING_EMBEDDER_THRESHOLD})"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
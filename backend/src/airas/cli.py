@@ -6,9 +6,12 @@
 - `airas mcp`: run the MCP server explicitly.
 - `airas dashboard`: serve the web dashboard (FastAPI API + bundled
   frontend) on localhost.
+- `airas worker`: run a research worker that executes queued dashboard runs
+  (pair with `AIRAS_INLINE_WORKER=false` on the dashboard).
 """
 
 import argparse
+import asyncio
 import threading
 import webbrowser
 
@@ -35,6 +38,12 @@ def _run_dashboard(host: str, port: int, open_browser: bool) -> None:
     uvicorn.run("airas.dashboard.api.main:app", host=host, port=port)
 
 
+def _run_worker(concurrency: int | None) -> None:
+    from airas.dashboard.worker import serve
+
+    asyncio.run(serve(concurrency))
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(
         prog="airas",
@@ -58,10 +67,22 @@ def main() -> None:
         help="Do not open the dashboard in a browser",
     )
 
+    worker = subparsers.add_parser(
+        "worker", help="Run a worker for queued dashboard research runs"
+    )
+    worker.add_argument(
+        "--concurrency",
+        type=int,
+        default=None,
+        help="Jobs to run at once (default: AIRAS_WORKER_CONCURRENCY or 2)",
+    )
+
     args = parser.parse_args()
 
     if args.command == "dashboard":
         _run_dashboard(args.host, args.port, open_browser=not args.no_browser)
+    elif args.command == "worker":
+        _run_worker(args.concurrency)
     else:
         # No subcommand (or `mcp`): stdio MCP server, the historical default.
         _run_mcp()
@@ -4,96 +4,78 @@ from typing import TypeVar
 
 import httpx
 from dependency_injector import containers, providers
-from hishel import CacheOptions, SpecificationPolicy
-from hishel.httpx import AsyncCacheClient, SyncCacheClient
 
 from airas.infra.arxiv_client import ArxivClient
 from airas.infra.email_feedback_notifier import EmailFeedbackNotifier
 from airas.infra.github_client import GithubClient
+from airas.infra.hf_repo_cache import shared_hf_repo_cache
+from airas.infra.http_cache import HttpCache, shared_http_cache
+from airas.infra.http_session import create_async_session, create_sync_session
 from airas.infra.hugging_face_client import HuggingFaceClient
+from airas.infra.job_queue import DEFAULT_JOB_QUEUE_PATH, SqliteJobQueue
 from airas.infra.langchain_client import LangChainClient
 from airas.infra.langfuse_client import LangfuseClient
 from airas.infra.litellm_client import LiteLLMClient
 from airas.infra.openalex_client import OpenAlexClient
 from airas.infra.qdrant_client import QdrantClient
 from airas.infra.semantic_scholar_client import SemanticScholarClient
+from airas.infra.sqlite_database import DEFAULT_STORE_PATH
 from airas.usecases.autonomous_research.in_memory_e2e_research_service import (
     InMemoryE2EResearchService,
 )
+from airas.usecases.autonomous_research.sqlite_e2e_research_service import (
+    SqliteE2EResearchService,
+)
 from airas.usecases.feedback.feedback_service import FeedbackService
 from airas.usecases.retrieve.search_paper_titles_subgraph.nodes.search_paper_titles_from_airas_db import (
     AirasDbPaperSearchIndex,
 )
+from airas.usecases.verification.sqlite_verification_service import (
+    SqliteVerificationService,
+)
 from airas.usecases.verification.verification_service import VerificationService
 
 T = TypeVar("T")
 
 
-def init_sync_session() -> Generator[httpx.Client, None, None]:
-    enable_cache = os.getenv("ENABLE_HTTP_CACHE", "false").lower() == "true"
-
-    client: httpx.Client
-    if enable_cache:
-        policy = SpecificationPolicy(
-            cache_options=CacheOptions(
-                shared=False,
-                supported_methods=["GET"],
-                allow_stale=False,
-            )
-        )
-        client = SyncCacheClient(
-            follow_redirects=True,
-            policy=policy,
-        )
-    else:
-        client = httpx.Client(follow_redirects=True)
-
+def init_sync_session(
+    http_cache: HttpCache | None = None,
+) -> Generator[httpx.Client, None, None]:
+    client = create_sync_session(http_cache=http_cache)
     yield client
     client.close()
 
 
-async def init_async_session() -> AsyncGenerator[httpx.AsyncClient, None]:
-    enable_cache = os.getenv("ENABLE_HTTP_CACHE", "false").lower() == "true"
-
-    client: httpx.AsyncClient
-    if enable_cache:
-        policy = SpecificationPolicy(
-            cache_options=CacheOptions(
-                shared=False,
-                supported_methods=["GET"],
-                allow_stale=False,
-            )
-        )
-        client = AsyncCacheClient(
-            follow_redirects=True,
-            policy=policy,
-        )
-    else:
-        client = httpx.AsyncClient(follow_redirects=True)
-
+async def init_async_session(
+    http_cache: HttpCache | None = None,
+) -> AsyncGenerator[httpx.AsyncClient, None]:
+    client = create_async_session(http_cache=http_cache)
     yield client
     await client.aclose()
 
 
 # NOTE:  GitHub-specific sessions (no caching to avoid stale SHA conflicts)
+_GITHUB_TIMEOUT = httpx.Timeout(connect=10.0, read=60.0, write=120.0, pool=5.0)
+
+
 def init_github_sync_session() -> Generator[httpx.Client, None, None]:
-    timeout = httpx.Timeout(connect=10.0, read=60.0, write=120.0, pool=5.0)
-    client = httpx.Client(follow_redirects=True, timeout=timeout)
+    client = create_sync_session(timeout=_GITHUB_TIMEOUT)
     yield client
     client.close()
 
 
 async def init_github_async_session() -> AsyncGenerator[httpx.AsyncClient, None]:
-    timeout = httpx.Timeout(connect=10.0, read=60.0, write=120.0, pool=5.0)
-    client = httpx.AsyncClient(follow_redirects=True, timeout=timeout)
+    client = create_async_session(timeout=_GITHUB_TIMEOUT)
     yield client
     await client.aclose()
 
 
 class Container(containers.DeclarativeContainer):
     # --- HTTP Session ---
-    sync_session = providers.Resource(init_sync_session)
-    async_session = providers.Resource(init_async_session)
+    # On-disk cache for scholarly API GETs (opt in with ENABLE_HTTP_CACHE=true).
+    http_cache = providers.Callable(shared_http_cache)
+    sync_session = providers.Resource(init_sync_session, http_cache=http_cache)
+    async_session = providers.Resource(init_async_session, http_cache=http_cache)
 
     # GitHub-specific sessions (no caching)
     github_sync_session = providers.Resource(init_github_sync_session)
@@ -121,10 +103,13 @@ class Container(containers.DeclarativeContainer):
         sync_session=github_sync_session,  # Use non-cached session
         async_session=github_async_session,  # Use non-cached session
     )
+    # Hugging Face metadata and READMEs pinned to a commit sha (never stale).
+    hf_repo_cache = providers.Callable(shared_hf_repo_cache)
     hugging_face_client: providers.Factory[HuggingFaceClient] = providers.Factory(
         HuggingFaceClient,
         sync_session=sync_session,
         async_session=async_session,
+        repo_cache=hf_repo_cache,
     )
 
     # --- Academic Research APIs ---
@@ -137,13 +122,13 @@ class Container(containers.DeclarativeContainer):
         providers.Factory(
             SemanticScholarClient,
             sync_session=sync_session,
-            async_session=None,
+            async_session=async_session,
         )
     )
     openalex_client: providers.Factory[OpenAlexClient] = providers.Factory(
         OpenAlexClient,
         sync_session=sync_session,
-        async_session=None,
+        async_session=async_session,
     )
 
     # --- Vector Database ---
@@ -179,11 +164,35 @@ class Container(containers.DeclarativeContainer):
         notifiers=providers.Callable(_build_feedback_notifiers.__func__),
     )
 
+    ## --- Record Stores ---
+    # AIRAS_STORE=sqlite (default) persists sessions and research runs across
+    # restarts and shares them with `airas worker`; "memory" keeps them in-process.
+    store_backend = providers.Callable(
+        lambda: os.getenv("AIRAS_STORE", "sqlite").lower()
+    )
+    store_path = providers.Callable(os.getenv, "AIRAS_STORE_PATH", DEFAULT_STORE_PATH)
+
     ## --- Verification Service ---
-    verification_service = providers.Singleton(VerificationService)
+    verification_service = providers.Selector(
+        store_backend,
+        sqlite=providers.Singleton(SqliteVerificationService, path=store_path),
+        memory=providers.Singleton(VerificationService),
+    )
 
     ## ---  Autonomous Research Service ---
-    e2e_research_service = providers.Singleton(InMemoryE2EResearchService)
+    e2e_research_service = providers.Selector(
+        store_backend,
+        sqlite=providers.Singleton(SqliteE2EResearchService, path=store_path),
+        memory=providers.Singleton(InMemoryE2EResearchService),
+    )
+
+    ## --- Job Queue ---
+    job_queue: providers.Singleton[SqliteJobQueue] = providers.Singleton(
+        SqliteJobQueue,
+        path=providers.Callable(
+            os.getenv, "AIRAS_JOB_QUEUE_PATH", DEFAULT_JOB_QUEUE_PATH
+        ),
+    )
 
 
 container = Container()
@@ -0,0 +1,94 @@
+"""LangGraph checkpointers for resumable end-to-end research runs.
+
+The E2E graphs (``TopicOpenEndedResearch``, ``HypothesisDrivenResearch``) run
+for hours. Compiling them with a checkpointer persists the graph state after
+every node under ``thread_id=<task_id>``, so a run that crashed or was
+interrupted by a redeploy continues from the last completed node with::
+
+    async with open_checkpointer() as checkpointer:
+        graph = TopicOpenEndedResearch(...).build_graph(checkpointer=checkpointer)
+        await graph.ainvoke(None, checkpoint_config(task_id))
+
+Subgraphs invoked inside a node (e.g. ``ExperimentCycleGraph`` from
+``run_experiment_cycle``) inherit the parent's checkpointer, so an interrupted
+experiment cycle also resumes mid-cycle instead of regenerating code and
+re-running finished GitHub Actions jobs.
+
+The backend is selected with ``AIRAS_CHECKPOINTER``:
+
+- ``sqlite`` (default): ``AsyncSqliteSaver`` on ``AIRAS_CHECKPOINT_PATH``
+- ``memory``: process-local ``InMemorySaver``; survives failed runs but not
+  restarts
+- ``none``: checkpointing disabled
+"""
+
+import logging
+import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, Literal, cast, get_args
+from uuid import UUID
+
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.checkpoint.memory import InMemorySaver
+
+logger = logging.getLogger(__name__)
+
+CheckpointerBackend = Literal["sqlite", "memory", "none"]
+
+DEFAULT_CHECKPOINT_PATH = ".airas/checkpoints.sqlite"
+
+_MEMORY_SAVER = InMemorySaver()
+
+
+def _resolve_backend(backend: CheckpointerBackend | None) -> CheckpointerBackend:
+    value = backend or os.getenv("AIRAS_CHECKPOINTER", "sqlite").lower()
+    if value not in get_args(CheckpointerBackend):
+        raise ValueError(
+            f"Unsupported AIRAS_CHECKPOINTER: {value!r} "
+            f"(expected one of {get_args(CheckpointerBackend)})"
+        )
+    return cast(CheckpointerBackend, value)
+
+
+@asynccontextmanager
+async def open_checkpointer(
+    backend: CheckpointerBackend | None = None,
+    path: str | Path | None = None,
+) -> AsyncIterator[BaseCheckpointSaver | None]:
+    match _resolve_backend(backend):
+        case "none":
+            yield None
+        case "memory":
+            yield _MEMORY_SAVER
+        case "sqlite":
+            from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+
+            db_path = Path(
+                path or os.getenv("AIRAS_CHECKPOINT_PATH", DEFAULT_CHECKPOINT_PATH)
+            )
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            async with AsyncSqliteSaver.from_conn_string(str(db_path)) as saver:
+                yield saver
+
+
+def checkpoint_config(thread_id: str | UUID, **config: Any) -> dict[str, Any]:
+    configurable = {"thread_id": str(thread_id), **config.pop("configurable", {})}
+    return {**config, "configurable": configurable}
+
+
+async def has_checkpoint(
+    checkpointer: BaseCheckpointSaver | None, thread_id: str | UUID
+) -> bool:
+    if checkpointer is None:
+        return False
+    return await checkpointer.aget_tuple(checkpoint_config(thread_id)) is not None
+
+
+__all__ = [
+    "CheckpointerBackend",
+    "checkpoint_config",
+    "has_checkpoint",
+    "open_checkpointer",
+]
@@ -0,0 +1,91 @@
+"""Process-wide cache of compiled LangGraph subgraphs.
+
+Callers typically run ``SomeSubgraph(...).build_graph().ainvoke(...)``, which
+recompiles the ``StateGraph`` on every call — per request in the dashboard
+routes and per iteration in retry/polling loops. Subgraphs that inherit
+``CachedGraphMixin`` are compiled once per class and ``graph_cache_key()``,
+and the instance itself (its clients and settings) is handed to the nodes as
+LangGraph's runtime context, wrapped in a ``GraphContext``, instead of being
+baked into the compiled graph.
+
+Nodes of a cached subgraph must therefore resolve per-instance values through
+``from_runtime`` rather than ``self``::
+
+    @record_execution_time
+    async def _poll(
+        self, state: State, runtime: Runtime[GraphContext["PollSubgraph"]]
+    ) -> dict:
+        subgraph = self.from_runtime(runtime)
+        await subgraph.github_client.aget(...)
+
+``from_runtime`` falls back to ``self`` so that ``build_graph().ainvoke(...)``
+without a context keeps working.
+"""
+
+import threading
+from collections.abc import Hashable
+from dataclasses import dataclass
+from typing import Any, Generic, Self, TypeVar
+
+from langgraph.graph.state import CompiledStateGraph
+from langgraph.runtime import Runtime
+
+_COMPILED_GRAPHS: dict[tuple[type, Hashable], CompiledStateGraph] = {}
+_LOCK = threading.Lock()
+
+SubgraphT = TypeVar("SubgraphT")
+
+
+@dataclass(frozen=True)
+class GraphContext(Generic[SubgraphT]):
+    """Runtime context of one call: the subgraph instance that was invoked."""
+
+    subgraph: SubgraphT
+
+
+class CachedGraphMixin:
+    def build_graph(self) -> CompiledStateGraph:
+        raise NotImplementedError
+
+    def graph_cache_key(self) -> Hashable:
+        """Settings that change the graph topology; the default assumes none do."""
+        return ()
+
+    def from_runtime(self, runtime: Runtime[Any] | None) -> Self:
+        context = runtime.context if runtime is not None else None
+        if isinstance(context, GraphContext) and isinstance(
+            context.subgraph, type(self)
+        ):
+            return context.subgraph
+        return self
+
+    def compiled_graph(self) -> CompiledStateGraph:
+        key = (type(self), self.graph_cache_key())
+        graph = _COMPILED_GRAPHS.get(key)
+        if graph is None:
+            with _LOCK:
+                graph = _COMPILED_GRAPHS.get(key)
+                if graph is None:
+                    graph = self.build_graph()
+                    _COMPILED_GRAPHS[key] = graph
+        return graph
+
+    async def ainvoke(
+        self, input: dict[str, Any], config: dict | None = None
+    ) -> dict[str, Any]:
+        return await self.compiled_graph().ainvoke(
+            input, config, context=GraphContext(self)
+        )
+
+    def invoke(
+        self, input: dict[str, Any], config: dict | None = None
+    ) -> dict[str, Any]:
+        return self.compiled_graph().invoke(input, config, context=GraphContext(self))
+
+
+def clear_compiled_graph_cache() -> None:
+    with _LOCK:
+        _COMPILED_GRAPHS.clear()
+
+
+__all__ = ["CachedGraphMixin", "GraphContext", "clear_compiled_graph_cache"]
@@ -1,6 +1,4 @@
 import asyncio
-import time
-from copy import deepcopy
 from functools import wraps
 from logging import getLogger
 from typing import Callable
@@ -8,6 +6,8 @@ from typing import Callable
 from langgraph.types import Command
 from typing_extensions import Annotated, TypedDict
 
+from airas.core.tracing import TRACER
+
 logger = getLogger(__name__)
 
 
@@ -17,18 +17,13 @@ ExecutionTime = dict[str, list[float]]
 def merge_execution_time(
     left: ExecutionTime | None, right: ExecutionTime | None
 ) -> ExecutionTime:
-    merged = deepcopy(left) if left else {}
+    # Nodes report only their own new durations, so merging appends. Only the
+    # updated lists are copied; the rest are shared with the previous state.
+    merged = dict(left) if left else {}
     if not right:
         return merged
     for node, durations in right.items():
-        existing = merged.setdefault(node, [])
-        existing_len = len(existing)
-        new_len = len(durations)
-        if new_len >= existing_len:
-            existing.extend(durations[existing_len:])
-        else:
-            existing.clear()
-            existing.extend(durations)
+        merged[node] = [*merged.get(node, ()), *durations]
     return merged
 
 
@@ -36,42 +31,37 @@ class ExecutionTimeState(TypedDict):
     execution_time: Annotated[ExecutionTime, merge_execution_time]
 
 
+def _with_duration(result, key: str, duration: float):
+    update = {key: [duration]}
+    if isinstance(result, Command):
+        return Command(
+            update={**(result.update or {}), "execution_time": update},
+            goto=result.goto,
+        )
+    result["execution_time"] = update
+    return result
+
+
 def time_node(
     subgraph_name: str, node_name: str | None = None
 ) -> Callable[..., Callable[..., object]]:
     def decorator(func):
         actual_node = node_name or func.__name__
+        span_name = f"{subgraph_name}.{actual_node}"
+        attributes = {"airas.subgraph": subgraph_name, "airas.node": actual_node}
 
         if asyncio.iscoroutinefunction(func):
 
             @wraps(func)
             async def async_wrapper(self, state, *args, **kwargs):
-                header = f"[{subgraph_name}.{actual_node}]".ljust(40)
+                header = f"[{span_name}]".ljust(40)
                 logger.info(f"{header} Start")
-                start = time.time()
-
-                result = await func(self, state, *args, **kwargs)
-                end = time.time()
-                duration = round(end - start, 4)
-
-                execution_time = state.get("execution_time", {})
-                existing = execution_time.get(actual_node, [])
-                execution_time[actual_node] = [*existing, duration]
-
-                # Handle Command objects
-                if isinstance(result, Command):
-                    result = Command(
-                        update={
-                            **(result.update or {}),
-                            "execution_time": execution_time,
-                        },
-                        goto=result.goto,
-                    )
-                else:
-                    result["execution_time"] = execution_time
+                with TRACER.span(span_name, attributes=attributes) as span:
+                    result = await func(self, state, *args, **kwargs)
+                duration = round(span.duration, 4)
 
                 logger.info(f"{header} End    Execution Time: {duration:7.4f} seconds")
-                return result
+                return _with_duration(result, actual_node, duration)
 
             wrapper = async_wrapper
 
@@ -79,32 +69,14 @@ def time_node(
 
             @wraps(func)
             def sync_wrapper(self, state, *args, **kwargs):
-                header = f"[{subgraph_name}.{actual_node}]".ljust(40)
+                header = f"[{span_name}]".ljust(40)
                 logger.info(f"{header} Start")
-                start = time.time()
-
-                result = func(self, state, *args, **kwargs)
-                end = time.time()
-                duration = round(end - start, 4)
-
-                execution_time = state.get("execution_time", {})
-                existing = execution_time.get(actual_node, [])
-                execution_time[actual_node] = [*existing, duration]
-
-                # Handle Command objects
-                if isinstance(result, Command):
-                    result = Command(
-                        update={
-                            **(result.update or {}),
-                            "execution_time": execution_time,
-                        },
-                        goto=result.goto,
-                    )
-                else:
-                    result["execution_time"] = execution_time
+                with TRACER.span(span_name, attributes=attributes) as span:
+                    result = func(self, state, *args, **kwargs)
+                duration = round(span.duration, 4)
 
                 logger.info(f"{header} End    Execution Time: {duration:7.4f} seconds")
-                return result
+                return _with_duration(result, actual_node, duration)
 
             wrapper = sync_wrapper
 
@@ -114,26 +86,29 @@ def time_node(
 
 
 def time_subgraph(subgraph_name: str):
+    """Trace a whole subgraph run and add its total to the returned state."""
+
     def decorator(func):
+        key = f"__{subgraph_name}_total__"
+        attributes = {"airas.subgraph": subgraph_name}
+
         if asyncio.iscoroutinefunction(func):
 
             @wraps(func)
             async def async_wrapper(state, *args, **kwargs):
                 header = f"[{subgraph_name}]".ljust(40)
                 logger.info(f"{header} Start")
-                start = time.time()
-                result = await func(state, *args, **kwargs)
-                end = time.time()
-                duration = round(end - start, 4)
-
-                timings = state.get("execution_time", {})
-                key = f"__{subgraph_name}_total__"
-                existing = timings.get(key, [])
-                timings[key] = [*existing, duration]
-                state["execution_time"] = timings
+                with TRACER.span(subgraph_name, attributes=attributes) as span:
+                    result = await func(state, *args, **kwargs)
+                duration = round(span.duration, 4)
 
                 logger.info(f"{header} End    Execution Time: {duration:7.4f} seconds")
-                return result
+                return {
+                    **result,
+                    "execution_time": merge_execution_time(
+                        result.get("execution_time"), {key: [duration]}
+                    ),
+                }
 
             wrapper = async_wrapper
 
@@ -143,19 +118,17 @@ def time_subgraph(subgraph_name: str):
             def sync_wrapper(state, *args, **kwargs):
                 header = f"[{subgraph_name}]".ljust(40)
                 logger.info(f"{header} Start")
-                start = time.time()
-                result = func(state, *args, **kwargs)
-                end = time.time()
-                duration = round(end - start, 4)
-
-                timings = state.get("execution_time", {})
-                key = f"__{subgraph_name}_total__"
-                existing = timings.get(key, [])
-                timings[key] = [*existing, duration]
-                state["execution_time"] = timings
+                with TRACER.span(subgraph_name, attributes=attributes) as span:
+                    result = func(state, *args, **kwargs)
+                duration = round(span.duration, 4)
 
                 logger.info(f"{header} End    Execution Time: {duration:7.4f} seconds")
-                return result
+                return {
+                    **result,
+                    "execution_time": merge_execution_time(
+                        result.get("execution_time"), {key: [duration]}
+                    ),
+                }
 
             wrapper = sync_wrapper
 
@@ -0,0 +1,56 @@
+"""Shared registry of compiled Jinja prompt templates.
+
+Prompt nodes render module-level prompt constants on every call. Compiling a
+template is far more expensive than rendering it, so templates are compiled
+once per prompt string and reused across calls, subgraphs and threads.
+
+Set ``AIRAS_PRECOMPILE_PROMPTS=true`` to compile registered prompts at import
+time (see ``precompile_templates``) instead of on first use.
+"""
+
+import hashlib
+import os
+from collections.abc import Iterable
+from functools import lru_cache
+from typing import Any
+
+from jinja2 import Environment, Template
+
+PRECOMPILE_PROMPTS = os.getenv("AIRAS_PRECOMPILE_PROMPTS", "false").lower() == "true"
+
+# NOTE: Default Environment settings, identical to the per-call
+# `Environment().from_string(...)` the nodes used before.
+_ENV = Environment()
+
+# Prompts are module-level constants, so the cache stays small in practice; the
+# bound only protects against callers that build template strings dynamically.
+_MAX_CACHED_TEMPLATES = 512
+
+
+@lru_cache(maxsize=_MAX_CACHED_TEMPLATES)
+def get_template(source: str) -> Template:
+    return _ENV.from_string(source)
+
+
+def render_prompt(source: str, data: dict[str, Any] | None = None, **kwargs) -> str:
+    return get_template(source).render(data or {}, **kwargs)
+
+
+@lru_cache(maxsize=_MAX_CACHED_TEMPLATES)
+def prompt_hash(source: str) -> str:
+    """Stable identifier of a prompt template, e.g. for keying LLM response caches."""
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()[:16]
+
+
+def precompile_templates(sources: Iterable[str]) -> None:
+    for source in sources:
+        get_template(source)
+
+
+__all__ = [
+    "PRECOMPILE_PROMPTS",
+    "get_template",
+    "render_prompt",
+    "prompt_hash",
+    "precompile_templates",
+]
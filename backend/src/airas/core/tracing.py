@@ -0,0 +1,266 @@
+"""Lightweight tracing spans for graph nodes, LLM calls and HTTP requests.
+
+Spans are timed with the monotonic clock (wall-clock timestamps are derived
+from a single anchor taken when the span starts) and nest through a context
+variable: a node span is the parent of every LLM and HTTP span opened while
+the node runs, and of the node spans of any subgraph it invokes. Dashboard
+requests and worker jobs open the root span, so a whole research run forms
+one trace.
+
+Finished spans are exported in batches as OTLP/JSON, which the OpenTelemetry
+collector (``otlpjsonfile`` receiver, ``/v1/traces`` HTTP endpoint) and most
+tracing backends accept:
+
+- ``AIRAS_TRACING`` ("false" by default) turns span export on
+- ``AIRAS_TRACE_PATH`` JSON-lines file to append to (default
+  ``.airas/traces.jsonl``; empty disables the file)
+- ``AIRAS_TRACE_MAX_MB`` size at which the file is rotated to ``<path>.1``
+  (default 64), so at most two files are kept
+- ``OTEL_EXPORTER_OTLP_ENDPOINT`` collector base URL; spans are POSTed to
+  ``<endpoint>/v1/traces`` from a background thread
+"""
+
+import atexit
+import json
+import logging
+import os
+import secrets
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Literal, Protocol
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+SpanKind = Literal["internal", "server", "client"]
+
+_OTLP_KIND = {"internal": 1, "server": 2, "client": 3}
+_SERVICE_NAME = "airas"
+_EXPORT_BATCH_SIZE = 512
+
+
+@dataclass
+class Span:
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: str | None
+    kind: SpanKind = "internal"
+    attributes: dict[str, Any] = field(default_factory=dict)
+    start_unix_ns: int = field(default_factory=time.time_ns)
+    start_monotonic_ns: int = field(default_factory=time.monotonic_ns)
+    end_monotonic_ns: int | None = None
+    error: str | None = None
+
+    @property
+    def duration(self) -> float:
+        end = self.end_monotonic_ns or time.monotonic_ns()
+        return (end - self.start_monotonic_ns) / 1e9
+
+    @property
+    def end_unix_ns(self) -> int:
+        end = self.end_monotonic_ns or time.monotonic_ns()
+        return self.start_unix_ns + (end - self.start_monotonic_ns)
+
+    def set_attributes(self, **attributes: Any) -> None:
+        self.attributes.update({k: v for k, v in attributes.items() if v is not None})
+
+    def record_error(self, error: BaseException) -> None:
+        self.error = f"{type(error).__name__}: {error}"
+
+
+class SpanExporter(Protocol):
+    def export(self, spans: list[Span]) -> None: ...
+
+
+def to_otlp(spans: list[Span]) -> dict[str, Any]:
+    """Encode spans as an OTLP/JSON ``ExportTraceServiceRequest``."""
+    return {
+        "resourceSpans": [
+            {
+                "resource": {
+                    "attributes": _otlp_attributes({"service.name": _SERVICE_NAME})
+                },
+                "scopeSpans": [
+                    {
+                        "scope": {"name": __name__},
+                        "spans": [_otlp_span(span) for span in spans],
+                    }
+                ],
+            }
+        ]
+    }
+
+
+def _otlp_span(span: Span) -> dict[str, Any]:
+    encoded: dict[str, Any] = {
+        "traceId": span.trace_id,
+        "spanId": span.span_id,
+        "name": span.name,
+        "kind": _OTLP_KIND[span.kind],
+        "startTimeUnixNano": str(span.start_unix_ns),
+        "endTimeUnixNano": str(span.end_unix_ns),
+        "attributes": _otlp_attributes(span.attributes),
+        "status": {"code": 2, "message": span.error} if span.error else {"code": 1},
+    }
+    if span.parent_id:
+        encoded["parentSpanId"] = span.parent_id
+    return encoded
+
+
+def _otlp_attributes(attributes: dict[str, Any]) -> list[dict[str, Any]]:
+    def value(v: Any) -> dict[str, Any]:
+        if isinstance(v, bool):
+            return {"boolValue": v}
+        if isinstance(v, int):
+            return {"intValue": str(v)}
+        if isinstance(v, float):
+            return {"doubleValue": v}
+        return {"stringValue": str(v)}
+
+    return [{"key": k, "value": value(v)} for k, v in attributes.items()]
+
+
+class OtlpJsonFileExporter:
+    """Appends one OTLP/JSON export request per line.
+
+    Once the file reaches ``max_bytes`` it replaces ``<path>.1`` and a new file
+    is started.
+    """
+
+    def __init__(self, path: str | Path, max_bytes: int | None = None) -> None:
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    def export(self, spans: list[Span]) -> None:
+        line = json.dumps(to_otlp(spans), separators=(",", ":"))
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as f:
+                f.write(line + "\n")
+                size = f.tell()
+            if self.max_bytes is not None and size >= self.max_bytes:
+                self.path.replace(self.path.with_name(self.path.name + ".1"))
+
+
+class OtlpHttpExporter:
+    """POSTs OTLP/JSON to a collector without blocking the caller."""
+
+    def __init__(self, endpoint: str, timeout: float = 10.0) -> None:
+        self.url = f"{endpoint.rstrip('/')}/v1/traces"
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="airas-otlp"
+        )
+
+    def export(self, spans: list[Span]) -> None:
+        self._executor.submit(self._post, to_otlp(spans))
+
+    def _post(self, payload: dict[str, Any]) -> None:
+        # A plain client: the shared sessions would trace the export itself.
+        try:
+            httpx.post(self.url, json=payload, timeout=self.timeout)
+        except httpx.HTTPError as e:
+            logger.warning(f"Failed to export spans to {self.url}: {e}")
+
+
+class Tracer:
+    def __init__(self, exporters: list[SpanExporter] | None = None) -> None:
+        self._exporters = exporters
+        self._current: ContextVar[Span | None] = ContextVar(
+            "airas_current_span", default=None
+        )
+        self._lock = threading.Lock()
+        self._finished: list[Span] = []
+
+    @property
+    def exporters(self) -> list[SpanExporter]:
+        if self._exporters is None:
+            self._exporters = _exporters_from_env()
+        return self._exporters
+
+    def current_span(self) -> Span | None:
+        return self._current.get()
+
+    def start_span(
+        self,
+        name: str,
+        *,
+        kind: SpanKind = "internal",
+        attributes: dict[str, Any] | None = None,
+    ) -> Span:
+        """Start a child of the current span without making it current."""
+        parent = self._current.get()
+        return Span(
+            name=name,
+            trace_id=parent.trace_id if parent else secrets.token_hex(16),
+            span_id=secrets.token_hex(8),
+            parent_id=parent.span_id if parent else None,
+            kind=kind,
+            attributes=dict(attributes or {}),
+        )
+
+    def end_span(self, span: Span) -> None:
+        if span.end_monotonic_ns is not None:
+            return
+        span.end_monotonic_ns = time.monotonic_ns()
+        with self._lock:
+            self._finished.append(span)
+            full = len(self._finished) >= _EXPORT_BATCH_SIZE
+        if span.parent_id is None or full:
+            self.flush()
+
+    @contextmanager
+    def span(
+        self,
+        name: str,
+        *,
+        kind: SpanKind = "internal",
+        attributes: dict[str, Any] | None = None,
+    ) -> Iterator[Span]:
+        """Run the block inside a new span that is current for its duration."""
+        span = self.start_span(name, kind=kind, attributes=attributes)
+        token = self._current.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.record_error(e)
+            raise
+        finally:
+            self._current.reset(token)
+            self.end_span(span)
+
+    def flush(self) -> None:
+        with self._lock:
+            spans, self._finished = self._finished, []
+        if not spans:
+            return
+        for exporter in self.exporters:
+            try:
+                exporter.export(spans)
+            except Exception as e:
+                logger.warning(f"Failed to export {len(spans)} spans: {e}")
+
+
+def _exporters_from_env() -> list[SpanExporter]:
+    if os.getenv("AIRAS_TRACING", "false").lower() != "true":
+        return []
+    exporters: list[SpanExporter] = []
+    if path := os.getenv("AIRAS_TRACE_PATH", ".airas/traces.jsonl"):
+        max_bytes = int(os.getenv("AIRAS_TRACE_MAX_MB", "64")) * 1024 * 1024
+        exporters.append(OtlpJsonFileExporter(path, max_bytes=max_bytes))
+    if endpoint := os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT"):
+        exporters.append(OtlpHttpExporter(endpoint))
+    return exporters
+
+
+TRACER = Tracer()
+atexit.register(TRACER.flush)
@@ -0,0 +1,35 @@
+from datetime import datetime
+from enum import Enum
+from typing import Any
+from uuid import UUID, uuid4
+
+from pydantic import BaseModel, Field
+
+
+class JobStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+ACTIVE_JOB_STATUSES = (JobStatus.QUEUED, JobStatus.RUNNING)
+
+
+class JobModel(BaseModel):
+    id: UUID = Field(default_factory=uuid4)
+    kind: str
+    # Correlates jobs with the record they act on (e.g. an E2E task id).
+    key: str | None = None
+    payload: dict[str, Any] = Field(default_factory=dict)
+    status: JobStatus = JobStatus.QUEUED
+    attempts: int = 0
+    worker_id: str | None = None
+    cancel_requested: bool = False
+    error_message: str | None = None
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now().astimezone(),
+    )
+    heartbeat_at: datetime | None = None
+    finished_at: datetime | None = None
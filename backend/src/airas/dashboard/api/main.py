@@ -1,12 +1,16 @@
+import asyncio
 from contextlib import asynccontextmanager
 from pathlib import Path
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from fastapi.staticfiles import StaticFiles
 
 import airas.dashboard.api.routes.v1 as routes_v1
 from airas.container import Container
+from airas.core.tracing import TRACER
+from airas.dashboard.api.research_jobs import research_job_handlers
 from airas.dashboard.api.routes.v1 import (
     bibfile,
     code,
@@ -28,6 +32,12 @@ from airas.dashboard.api.routes.v1 import (
     topic_open_ended_research,
     verification,
 )
+from airas.dashboard.worker import (
+    JobWorker,
+    inline_worker_enabled,
+    worker_concurrency,
+)
+from airas.infra.http_telemetry import HTTP_TELEMETRY
 
 
 @asynccontextmanager
@@ -41,9 +51,22 @@ async def _lifespan(app: FastAPI):
     container.wire(packages=[routes_v1])
     await container.init_resources()
 
+    worker_task = None
+    if inline_worker_enabled():
+        worker = JobWorker(
+            container.job_queue(),
+            research_job_handlers(container),
+            concurrency=worker_concurrency(),
+        )
+        worker_task = asyncio.create_task(worker.run())
+
     try:
         yield
     finally:
+        if worker_task is not None:
+            worker.stop()
+            worker_task.cancel()
+            await asyncio.gather(worker_task, return_exceptions=True)
         await container.shutdown_resources()
         container.unwire()
 
@@ -60,6 +83,29 @@ def create_app() -> FastAPI:
     def health():
         return {"status": "ok"}
 
+    @application.get("/metrics", response_class=PlainTextResponse)
+    def metrics():
+        return PlainTextResponse(
+            HTTP_TELEMETRY.render_prometheus(),
+            media_type="text/plain; version=0.0.4",
+        )
+
+    @application.middleware("http")
+    async def trace_requests(request: Request, call_next):
+        # API requests are the root spans of the subgraph runs they trigger.
+        if not request.url.path.startswith("/airas/"):
+            return await call_next(request)
+        with TRACER.span(
+            f"{request.method} {request.url.path}",
+            kind="server",
+            attributes={"http.request.method": request.method},
+        ) as span:
+            response = await call_next(request)
+            if route := request.scope.get("route"):
+                span.name = f"{request.method} {route.path}"
+            span.set_attributes(**{"http.response.status_code": response.status_code})
+        return response
+
     application.add_middleware(
         CORSMiddleware,
         allow_origin_regex=r"http://(localhost|127\.0\.0\.1):\d+",
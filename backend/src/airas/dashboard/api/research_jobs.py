@@ -0,0 +1,440 @@
+"""Queue-backed execution of the end-to-end research workflows.
+
+The ``/run`` and ``/resume`` routes only enqueue a job; a ``JobWorker``
+(``airas.dashboard.worker``) claims it and calls the handler registered here,
+which rebuilds the clients from the container and streams the research graph.
+Because runs are checkpointed under their task id, a job that is retried after
+a worker crash or resumed after a failure continues from the last completed
+node.
+"""
+
+import logging
+import uuid
+from typing import Any
+
+from fastapi import HTTPException
+
+from airas.container import Container
+from airas.core.checkpointing import (
+    checkpoint_config,
+    has_checkpoint,
+    open_checkpointer,
+)
+from airas.core.types.e2e import E2EModel, Status
+from airas.core.types.github import GitHubConfig
+from airas.core.types.job import JobModel
+from airas.dashboard.api.dependencies import (
+    get_github_client,
+    get_github_owner,
+    get_langchain_client,
+    get_litellm_client,
+)
+from airas.dashboard.api.schemas.hypothesis_driven_research import (
+    HypothesisDrivenResearchRequestBody,
+)
+from airas.dashboard.api.schemas.topic_open_ended_research import (
+    TopicOpenEndedResearchRequestBody,
+)
+from airas.dashboard.worker import JobHandler
+from airas.infra.arxiv_client import ArxivClient
+from airas.infra.github_client import GithubClient
+from airas.infra.job_queue import JobQueueProtocol
+from airas.infra.langchain_client import LangChainClient
+from airas.infra.langfuse_client import LangfuseClient
+from airas.infra.litellm_client import LiteLLMClient
+from airas.usecases.autonomous_research.e2e_research_service_protocol import (
+    E2EResearchServiceProtocol,
+)
+from airas.usecases.autonomous_research.hypothesis_driven_research.hypothesis_driven_research import (
+    HypothesisDrivenResearch,
+)
+from airas.usecases.autonomous_research.topic_open_ended_research.topic_open_ended_research import (
+    TopicOpenEndedResearch,
+)
+from airas.usecases.retrieve.search_paper_titles_subgraph.nodes.search_paper_titles_from_airas_db import (
+    AirasDbPaperSearchIndex,
+)
+
+logger = logging.getLogger(__name__)
+
+TOPIC_OPEN_ENDED_RESEARCH_JOB = "topic_open_ended_research"
+HYPOTHESIS_DRIVEN_RESEARCH_JOB = "hypothesis_driven_research"
+
+
+def enqueue_research_job(
+    job_queue: JobQueueProtocol,
+    kind: str,
+    *,
+    task_id: uuid.UUID,
+    created_by: uuid.UUID,
+    github_owner: str,
+    request: TopicOpenEndedResearchRequestBody | HypothesisDrivenResearchRequestBody,
+) -> JobModel:
+    return job_queue.enqueue(
+        kind,
+        _job_payload(task_id, created_by, github_owner, request),
+        key=str(task_id),
+    )
+
+
+def _job_payload(
+    task_id: uuid.UUID,
+    created_by: uuid.UUID,
+    github_owner: str,
+    request: TopicOpenEndedResearchRequestBody | HypothesisDrivenResearchRequestBody,
+) -> dict[str, Any]:
+    return {
+        "task_id": str(task_id),
+        "created_by": str(created_by),
+        "github_owner": github_owner,
+        "request": request.model_dump(mode="json"),
+    }
+
+
+def _github_url(
+    github_owner: str,
+    request: TopicOpenEndedResearchRequestBody | HypothesisDrivenResearchRequestBody,
+) -> str:
+    return (
+        f"https://github.com/{github_owner}/"
+        f"{request.github_config.repository_name}/tree/"
+        f"{request.github_config.branch_name}"
+    )
+
+
+async def resume_research_job(
+    job_queue: JobQueueProtocol,
+    e2e_service: E2EResearchServiceProtocol,
+    kind: str,
+    *,
+    task_id: uuid.UUID,
+    created_by: uuid.UUID,
+    github_owner: str,
+    request: TopicOpenEndedResearchRequestBody | HypothesisDrivenResearchRequestBody,
+) -> JobModel:
+    async with open_checkpointer() as checkpointer:
+        if not await has_checkpoint(checkpointer, task_id):
+            raise HTTPException(
+                status_code=404, detail=f"No checkpoint found for task {task_id}"
+            )
+
+    try:
+        record: E2EModel | None = e2e_service.get(task_id)
+    except ValueError:
+        record = None
+    if record is not None and record.status == Status.COMPLETED:
+        raise HTTPException(
+            status_code=409, detail=f"Task {task_id} has already completed"
+        )
+
+    # Claiming the task and checking that no job holds it is one step, so two
+    # concurrent resumes cannot both run the same checkpoint thread.
+    job = job_queue.enqueue_if_idle(
+        kind,
+        _job_payload(task_id, created_by, github_owner, request),
+        key=str(task_id),
+    )
+    if job is None:
+        raise HTTPException(
+            status_code=409, detail=f"Task {task_id} is already queued or running"
+        )
+
+    if record is None:
+        # The record did not survive a restart; recreate it for status polling.
+        e2e_service.create(
+            id=task_id,
+            title="Untitled E2E Research Task",
+            created_by=created_by,
+            status=Status.PENDING,
+            github_url=_github_url(github_owner, request),
+        )
+    else:
+        e2e_service.update(id=task_id, status=Status.PENDING)
+    return job
+
+
+def cancel_research_job(
+    job_queue: JobQueueProtocol,
+    e2e_service: E2EResearchServiceProtocol,
+    task_id: uuid.UUID,
+) -> E2EModel:
+    if (job := job_queue.get_active(str(task_id))) is None:
+        raise HTTPException(
+            status_code=404, detail=f"No queued or running job for task {task_id}"
+        )
+    job_queue.request_cancel(job.id)
+    # A running job stops at its worker's next heartbeat; the graph keeps its
+    # checkpoint, so the task can still be resumed later.
+    return e2e_service.update(
+        id=task_id, status=Status.FAILED, error_message="Cancelled by user"
+    )
+
+
+async def resolve_search_backend(
+    container: Container, request: TopicOpenEndedResearchRequestBody
+) -> tuple[AirasDbPaperSearchIndex | None, Any | None]:
+    if request.search_method == "qdrant":
+        qdrant_client = container.qdrant_client()
+        if hasattr(qdrant_client, "__await__"):
+            qdrant_client = await qdrant_client
+        return None, qdrant_client
+    return container.airas_db_search_index(), None
+
+
+def _mark_failed(
+    e2e_service: E2EResearchServiceProtocol, task_id: uuid.UUID, exc: Exception
+) -> None:
+    error_msg = f"{type(exc).__name__}: {str(exc)}"
+    logger.exception(f"[Task {task_id}] Execution failed")
+
+    try:
+        e2e_service.update(id=task_id, status=Status.FAILED, error_message=error_msg)
+    except Exception:
+        logger.exception(
+            f"[Task {task_id}] CRITICAL: Failed to update status to FAILED. "
+            f"Task may remain in RUNNING state."
+        )
+
+
+async def execute_topic_open_ended_research(
+    task_id: uuid.UUID,
+    created_by: uuid.UUID,
+    request: TopicOpenEndedResearchRequestBody,
+    github_owner: str,
+    search_index: AirasDbPaperSearchIndex | None,
+    github_client: GithubClient,
+    arxiv_client: ArxivClient,
+    langchain_client: LangChainClient,
+    litellm_client: LiteLLMClient,
+    qdrant_client: Any | None,
+    langfuse_client: LangfuseClient,
+    e2e_service: E2EResearchServiceProtocol,
+) -> None:
+    try:
+        async with open_checkpointer() as checkpointer:
+            resume = await has_checkpoint(checkpointer, task_id)
+            logger.info(
+                f"[Task {task_id}] {'Resuming' if resume else 'Starting'} E2E execution"
+            )
+            if resume:
+                e2e_service.update(id=task_id, status=Status.RUNNING)
+
+            graph = TopicOpenEndedResearch(
+                github_client=github_client,
+                arxiv_client=arxiv_client,
+                langchain_client=langchain_client,
+                litellm_client=litellm_client,
+                qdrant_client=qdrant_client,
+                e2e_service=e2e_service,
+                compute_environment=request.compute_environment,
+                runner_config=request.runner_config,
+                wandb_config=request.wandb_config,
+                task_id=task_id,
+                created_by=created_by,
+                is_github_repo_private=request.is_github_repo_private,
+                search_method=request.search_method,
+                search_index=search_index,
+                collection_name=request.collection_name,
+                num_paper_search_queries=request.num_paper_search_queries,
+                papers_per_query=request.papers_per_query,
+                hypothesis_refinement_iterations=request.hypothesis_refinement_iterations,
+                num_experiment_models=request.num_experiment_models,
+                num_experiment_datasets=request.num_experiment_datasets,
+                num_comparison_methods=request.num_comparison_methods,
+                paper_content_refinement_iterations=request.paper_content_refinement_iterations,
+                latex_template_name=request.latex_template_name,
+                github_actions_agent=request.github_actions_agent,
+                llm_mapping=request.llm_mapping,
+            ).build_graph(checkpointer=checkpointer)
+
+            logger.info(f"[Task {task_id}] Streaming graph execution")
+
+            config = {"recursion_limit": 100, **checkpoint_config(task_id)}
+            if handler := langfuse_client.create_handler():
+                config["callbacks"] = [handler]
+
+            # A resumed run continues from the last checkpointed node.
+            graph_input = (
+                None
+                if resume
+                else {
+                    "task_id": task_id,
+                    "github_config": GitHubConfig(
+                        github_owner=github_owner,
+                        repository_name=request.github_config.repository_name,
+                        branch_name=request.github_config.branch_name,
+                    ),
+                    "research_topic": request.research_topic,
+                }
+            )
+
+            # NOTE:将来的にストリーミング UI に対応するためastreamで実装
+            async for chunk in graph.astream(graph_input, config=config):
+                for node_name, node_output in chunk.items():
+                    if not isinstance(node_output, dict):
+                        continue
+
+                    if "research_history" in node_output:
+                        logger.info(
+                            f"[Task {task_id}] Research history updated from node: {node_name}"
+                        )
+
+    except Exception as e:
+        _mark_failed(e2e_service, task_id, e)
+        raise
+
+
+async def execute_hypothesis_driven_research(
+    task_id: uuid.UUID,
+    created_by: uuid.UUID,
+    request: HypothesisDrivenResearchRequestBody,
+    github_owner: str,
+    github_client: GithubClient,
+    langchain_client: LangChainClient,
+    langfuse_client: LangfuseClient,
+    e2e_service: E2EResearchServiceProtocol,
+) -> None:
+    try:
+        async with open_checkpointer() as checkpointer:
+            resume = await has_checkpoint(checkpointer, task_id)
+            logger.info(
+                f"[Task {task_id}] {'Resuming' if resume else 'Starting'} "
+                f"HypothesisDrivenResearch execution"
+            )
+            if resume:
+                e2e_service.update(id=task_id, status=Status.RUNNING)
+
+            graph = HypothesisDrivenResearch(
+                github_client=github_client,
+                langchain_client=langchain_client,
+                e2e_service=e2e_service,
+                compute_environment=request.compute_environment,
+                runner_config=request.runner_config,
+                wandb_config=request.wandb_config,
+                task_id=task_id,
+                created_by=created_by,
+                is_github_repo_private=request.is_github_repo_private,
+                num_experiment_models=request.num_experiment_models,
+                num_experiment_datasets=request.num_experiment_datasets,
+                num_comparison_methods=request.num_comparison_methods,
+                paper_content_refinement_iterations=request.paper_content_refinement_iterations,
+                github_actions_agent=request.github_actions_agent,
+                latex_template_name=request.latex_template_name,
+                llm_mapping=request.llm_mapping,
+            ).build_graph(checkpointer=checkpointer)
+
+            logger.info(f"[Task {task_id}] Streaming graph execution")
+
+            config = {"recursion_limit": 100, **checkpoint_config(task_id)}
+            if handler := langfuse_client.create_handler():
+                config["callbacks"] = [handler]
+
+            # A resumed run continues from the last checkpointed node.
+            graph_input = (
+                None
+                if resume
+                else {
+                    "task_id": task_id,
+                    "github_config": GitHubConfig(
+                        github_owner=github_owner,
+                        repository_name=request.github_config.repository_name,
+                        branch_name=request.github_config.branch_name,
+                    ),
+                    "research_hypothesis": request.research_hypothesis,
+                    "research_topic": request.research_topic,
+                }
+            )
+
+            async for chunk in graph.astream(graph_input, config=config):
+                for node_name, node_output in chunk.items():
+                    if not isinstance(node_output, dict):
+                        continue
+
+                    if "research_history" in node_output:
+                        logger.info(
+                            f"[Task {task_id}] Research history updated from node: {node_name}"
+                        )
+
+    except Exception as e:
+        _mark_failed(e2e_service, task_id, e)
+        raise
+
+
+async def _github_client(container: Container) -> GithubClient:
+    return await get_github_client(
+        github_sync_session=container.github_sync_session(),
+        github_async_session=container.github_async_session(),
+    )
+
+
+def research_job_handlers(container: Container) -> dict[str, JobHandler]:
+    """Handlers for the E2E job kinds, resolving clients from ``container``.
+
+    Credentials are read from the environment (and ~/.airas/credentials.json)
+    when the job starts, exactly as the API dependencies do.
+    """
+
+    async def run_topic_open_ended_research(job: JobModel) -> None:
+        task_id = uuid.UUID(job.payload["task_id"])
+        e2e_service = container.e2e_research_service()
+        # Until execute_* takes over, a failure here must still fail the task,
+        # or its E2E record would stay PENDING.
+        try:
+            request = TopicOpenEndedResearchRequestBody.model_validate(
+                job.payload["request"]
+            )
+            github_owner = job.payload.get("github_owner") or get_github_owner()
+            search_index, qdrant_client = await resolve_search_backend(
+                container, request
+            )
+            github_client = await _github_client(container)
+            langchain_client = get_langchain_client(container.langchain_client)
+            litellm_client = get_litellm_client(container.litellm_client)
+        except Exception as e:
+            _mark_failed(e2e_service, task_id, e)
+            raise
+
+        await execute_topic_open_ended_research(
+            task_id=task_id,
+            created_by=uuid.UUID(job.payload["created_by"]),
+            request=request,
+            github_owner=github_owner,
+            search_index=search_index,
+            github_client=github_client,
+            arxiv_client=container.arxiv_client(),
+            langchain_client=langchain_client,
+            litellm_client=litellm_client,
+            qdrant_client=qdrant_client,
+            langfuse_client=container.langfuse_client(),
+            e2e_service=e2e_service,
+        )
+
+    async def run_hypothesis_driven_research(job: JobModel) -> None:
+        task_id = uuid.UUID(job.payload["task_id"])
+        e2e_service = container.e2e_research_service()
+        try:
+            request = HypothesisDrivenResearchRequestBody.model_validate(
+                job.payload["request"]
+            )
+            github_owner = job.payload.get("github_owner") or get_github_owner()
+            github_client = await _github_client(container)
+            langchain_client = get_langchain_client(container.langchain_client)
+        except Exception as e:
+            _mark_failed(e2e_service, task_id, e)
+            raise
+
+        await execute_hypothesis_driven_research(
+            task_id=task_id,
+            created_by=uuid.UUID(job.payload["created_by"]),
+            request=request,
+            github_owner=github_owner,
+            github_client=github_client,
+            langchain_client=langchain_client,
+            langfuse_client=container.langfuse_client(),
+            e2e_service=e2e_service,
+        )
+
+    return {
+        TOPIC_OPEN_ENDED_RESEARCH_JOB: run_topic_open_ended_research,
+        HYPOTHESIS_DRIVEN_RESEARCH_JOB: run_hypothesis_driven_research,
+    }
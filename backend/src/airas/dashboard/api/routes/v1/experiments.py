@@ -136,7 +136,7 @@ async def dispatch_sanity_check(
             f"Unsupported runner config type: {type(request.runner_config)}"
         )
 
-    result = await subgraph.build_graph().ainvoke(
+    result = await subgraph.ainvoke(
         {"github_config": request.github_config, "run_id": request.run_id},
         config=config,
     )
@@ -161,14 +161,10 @@ async def dispatch_experiment_validation(
     handler = langfuse_client.create_handler()
     config = {"callbacks": [handler]} if handler else {}
 
-    result = (
-        await DispatchExperimentValidationSubgraph(
-            github_client=github_client,
-            llm_mapping=request.llm_mapping,
-        )
-        .build_graph()
-        .ainvoke(request, config=config)
-    )
+    result = await DispatchExperimentValidationSubgraph(
+        github_client=github_client,
+        llm_mapping=request.llm_mapping,
+    ).ainvoke(request, config=config)
     return DispatchExperimentValidationResponseBody(
         dispatched=result["dispatched"],
         execution_time=result["execution_time"],
@@ -207,7 +203,7 @@ async def dispatch_main_experiment(
             f"Unsupported runner config type: {type(request.runner_config)}"
         )
 
-    result = await subgraph.build_graph().ainvoke(
+    result = await subgraph.ainvoke(
         {"github_config": request.github_config, "run_id": request.run_id},
         config=config,
     )
@@ -43,10 +43,8 @@ async def poll_github_actions(
     if handler := langfuse_client.create_handler():
         config["callbacks"] = [handler]
 
-    result = (
-        await PollGithubActionsSubgraph(github_client=github_client)
-        .build_graph()
-        .ainvoke(request, config=config)
+    result = await PollGithubActionsSubgraph(github_client=github_client).ainvoke(
+        request, config=config
     )
     return PollGithubActionsResponseBody(
         workflow_run_id=result["workflow_run_id"],
@@ -98,11 +96,9 @@ async def download_github_actions_artifacts(
     handler = langfuse_client.create_handler()
     config = {"callbacks": [handler]} if handler else {}
 
-    result = (
-        await DownloadGithubActionsArtifactsSubgraph(github_client=github_client)
-        .build_graph()
-        .ainvoke(request, config=config)
-    )
+    result = await DownloadGithubActionsArtifactsSubgraph(
+        github_client=github_client
+    ).ainvoke(request, config=config)
     return DownloadGithubActionsArtifactsResponseBody(
         artifact_data=result["artifact_data"],
         execution_time=result["execution_time"],
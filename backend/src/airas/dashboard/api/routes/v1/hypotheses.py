@@ -36,6 +36,7 @@ async def generate_hypotheses(
         await GenerateHypothesisSubgraphV0(
             langchain_client=langchain_client,
             refinement_rounds=request.refinement_rounds,
+            num_candidates=request.num_candidates,
             llm_mapping=request.llm_mapping,
         )
         .build_graph()
@@ -1,4 +1,3 @@
-import asyncio
 import logging
 import uuid
 from typing import Annotated
@@ -9,12 +8,15 @@ from langfuse import observe
 
 from airas.container import Container
 from airas.core.types.e2e import Status
-from airas.core.types.github import GitHubConfig
 from airas.dashboard.api.dependencies import (
     get_current_user_id,
-    get_github_client,
     get_github_owner,
-    get_langchain_client,
+)
+from airas.dashboard.api.research_jobs import (
+    HYPOTHESIS_DRIVEN_RESEARCH_JOB,
+    cancel_research_job,
+    enqueue_research_job,
+    resume_research_job,
 )
 from airas.dashboard.api.schemas.hypothesis_driven_research import (
     HypothesisDrivenResearchListItemResponse,
@@ -24,14 +26,10 @@ from airas.dashboard.api.schemas.hypothesis_driven_research import (
     HypothesisDrivenResearchStatusResponseBody,
     HypothesisDrivenResearchUpdateRequestBody,
 )
-from airas.infra.github_client import GithubClient
-from airas.infra.langchain_client import LangChainClient
-from airas.infra.langfuse_client import LangfuseClient
+from airas.infra.job_queue import JobQueueProtocol
 from airas.usecases.autonomous_research.e2e_research_service_protocol import (
     E2EResearchServiceProtocol,
-)
-from airas.usecases.autonomous_research.hypothesis_driven_research.hypothesis_driven_research import (
-    HypothesisDrivenResearch,
+    encode_e2e_cursor,
 )
 
 logger = logging.getLogger(__name__)
@@ -41,81 +39,6 @@ router = APIRouter(
 )
 
 
-async def _execute_hypothesis_driven_research(
-    task_id: uuid.UUID,
-    created_by: uuid.UUID,
-    request: HypothesisDrivenResearchRequestBody,
-    github_owner: str,
-    github_client: GithubClient,
-    langchain_client: LangChainClient,
-    langfuse_client: LangfuseClient,
-    e2e_service: E2EResearchServiceProtocol,
-) -> None:
-    try:
-        logger.info(f"[Task {task_id}] Starting HypothesisDrivenResearch execution")
-
-        graph = HypothesisDrivenResearch(
-            github_client=github_client,
-            langchain_client=langchain_client,
-            e2e_service=e2e_service,
-            compute_environment=request.compute_environment,
-            runner_config=request.runner_config,
-            wandb_config=request.wandb_config,
-            task_id=task_id,
-            created_by=created_by,
-            is_github_repo_private=request.is_github_repo_private,
-            num_experiment_models=request.num_experiment_models,
-            num_experiment_datasets=request.num_experiment_datasets,
-            num_comparison_methods=request.num_comparison_methods,
-            paper_content_refinement_iterations=request.paper_content_refinement_iterations,
-            github_actions_agent=request.github_actions_agent,
-            latex_template_name=request.latex_template_name,
-            llm_mapping=request.llm_mapping,
-        ).build_graph()
-
-        logger.info(f"[Task {task_id}] Streaming graph execution")
-
-        config = {"recursion_limit": 100}
-        if handler := langfuse_client.create_handler():
-            config["callbacks"] = [handler]
-
-        async for chunk in graph.astream(
-            {
-                "task_id": task_id,
-                "github_config": GitHubConfig(
-                    github_owner=github_owner,
-                    repository_name=request.github_config.repository_name,
-                    branch_name=request.github_config.branch_name,
-                ),
-                "research_hypothesis": request.research_hypothesis,
-                "research_topic": request.research_topic,
-            },
-            config=config,
-        ):
-            for node_name, node_output in chunk.items():
-                if not isinstance(node_output, dict):
-                    continue
-
-                if "research_history" in node_output:
-                    logger.info(
-                        f"[Task {task_id}] Research history updated from node: {node_name}"
-                    )
-
-    except Exception as e:
-        error_msg = f"{type(e).__name__}: {str(e)}"
-        logger.exception(f"[Task {task_id}] Execution failed")
-
-        try:
-            e2e_service.update(
-                id=task_id, status=Status.FAILED, error_message=error_msg
-            )
-        except Exception:
-            logger.exception(
-                f"[Task {task_id}] CRITICAL: Failed to update status to FAILED. "
-                f"Task may remain in RUNNING state."
-            )
-
-
 @router.post("/run", response_model=HypothesisDrivenResearchResponseBody)
 @inject
 @observe()
@@ -123,34 +46,81 @@ async def execute_hypothesis_driven_research(
     request: HypothesisDrivenResearchRequestBody,
     current_user_id: Annotated[uuid.UUID, Depends(get_current_user_id)],
     github_owner: Annotated[str, Depends(get_github_owner)],
-    github_client: Annotated[GithubClient, Depends(get_github_client)],
-    langchain_client: Annotated[LangChainClient, Depends(get_langchain_client)],
-    langfuse_client: Annotated[
-        LangfuseClient, Depends(Provide[Container.langfuse_client])
-    ],
     e2e_service: Annotated[
         E2EResearchServiceProtocol,
         Depends(Provide[Container.e2e_research_service]),
     ],
+    job_queue: Annotated[JobQueueProtocol, Depends(Provide[Container.job_queue])],
 ) -> HypothesisDrivenResearchResponseBody:
     task_id = uuid.uuid4()
 
-    asyncio.create_task(
-        _execute_hypothesis_driven_research(
-            task_id=task_id,
-            created_by=current_user_id,
-            request=request,
-            github_owner=github_owner,
-            github_client=github_client,
-            langchain_client=langchain_client,
-            langfuse_client=langfuse_client,
-            e2e_service=e2e_service,
-        )
+    e2e_service.create(
+        id=task_id,
+        title="Untitled E2E Research Task",
+        created_by=current_user_id,
+        status=Status.PENDING,
+    )
+    enqueue_research_job(
+        job_queue,
+        HYPOTHESIS_DRIVEN_RESEARCH_JOB,
+        task_id=task_id,
+        created_by=current_user_id,
+        github_owner=github_owner,
+        request=request,
     )
 
     return HypothesisDrivenResearchResponseBody(task_id=task_id)
 
 
+@router.post("/{task_id}/resume", response_model=HypothesisDrivenResearchResponseBody)
+@inject
+@observe()
+async def resume_hypothesis_driven_research(
+    task_id: uuid.UUID,
+    request: HypothesisDrivenResearchRequestBody,
+    current_user_id: Annotated[uuid.UUID, Depends(get_current_user_id)],
+    github_owner: Annotated[str, Depends(get_github_owner)],
+    e2e_service: Annotated[
+        E2EResearchServiceProtocol,
+        Depends(Provide[Container.e2e_research_service]),
+    ],
+    job_queue: Annotated[JobQueueProtocol, Depends(Provide[Container.job_queue])],
+) -> HypothesisDrivenResearchResponseBody:
+    """Continue a failed, cancelled or interrupted run from its last completed node.
+
+    The request body must match the one the task was started with; only the
+    graph state is checkpointed, not the run settings.
+    """
+    await resume_research_job(
+        job_queue,
+        e2e_service,
+        HYPOTHESIS_DRIVEN_RESEARCH_JOB,
+        task_id=task_id,
+        created_by=current_user_id,
+        github_owner=github_owner,
+        request=request,
+    )
+
+    return HypothesisDrivenResearchResponseBody(task_id=task_id)
+
+
+@router.post(
+    "/{task_id}/cancel", response_model=HypothesisDrivenResearchStatusResponseBody
+)
+@inject
+@observe()
+async def cancel_hypothesis_driven_research(
+    task_id: uuid.UUID,
+    e2e_service: Annotated[
+        E2EResearchServiceProtocol,
+        Depends(Provide[Container.e2e_research_service]),
+    ],
+    job_queue: Annotated[JobQueueProtocol, Depends(Provide[Container.job_queue])],
+) -> HypothesisDrivenResearchStatusResponseBody:
+    record = cancel_research_job(job_queue, e2e_service, task_id)
+    return HypothesisDrivenResearchStatusResponseBody.model_validate(record)
+
+
 @router.get(
     "/status/{task_id}", response_model=HypothesisDrivenResearchStatusResponseBody
 )
@@ -192,15 +162,24 @@ async def list_hypothesis_driven_research(
     ],
     offset: int = 0,
     limit: int | None = None,
+    cursor: str | None = None,
 ) -> HypothesisDrivenResearchListResponseBody:
-    records = e2e_service.list(offset=offset, limit=limit)
-    sorted_records = sorted(records, key=lambda record: record.created_at, reverse=True)
+    try:
+        records = e2e_service.list(offset=offset, limit=limit, cursor=cursor)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
 
+    next_cursor = (
+        encode_e2e_cursor(records[-1])
+        if limit is not None and records and len(records) == limit
+        else None
+    )
     return HypothesisDrivenResearchListResponseBody(
         items=[
             HypothesisDrivenResearchListItemResponse.model_validate(record)
-            for record in sorted_records
-        ]
+            for record in records
+        ],
+        next_cursor=next_cursor,
     )
 
 
@@ -224,6 +224,7 @@ async def generate_paper(
         await WriteSubgraph(
             langchain_client=langchain_client,
             paper_content_refinement_iterations=request.writing_refinement_rounds,
+            writing_mode=request.writing_mode,
             llm_mapping=request.llm_mapping,
         )
         .build_graph()
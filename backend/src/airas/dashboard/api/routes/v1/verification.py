@@ -39,7 +39,9 @@ from airas.usecases.assisted_research.generate_verification_method_subgraph.gene
 from airas.usecases.assisted_research.propose_verification_policy_subgraph.propose_verification_policy_subgraph import (
     ProposeVerificationPolicySubgraph,
 )
-from airas.usecases.verification.verification_service import VerificationService
+from airas.usecases.verification.verification_service_protocol import (
+    VerificationServiceProtocol,
+)
 
 router = APIRouter(prefix="/verification", tags=["verification"])
 
@@ -78,7 +80,7 @@ def create_session(
     request: VerificationSessionCreateRequest,
     current_user_id: Annotated[UUID, Depends(get_current_user_id)],
     verification_service: Annotated[
-        VerificationService,
+        VerificationServiceProtocol,
         Depends(Closing[Provide[Container.verification_service]]),
     ],
 ) -> VerificationSessionResponse:
@@ -93,7 +95,7 @@ def create_session(
 def list_sessions(
     current_user_id: Annotated[UUID, Depends(get_current_user_id)],
     verification_service: Annotated[
-        VerificationService,
+        VerificationServiceProtocol,
         Depends(Closing[Provide[Container.verification_service]]),
     ],
 ) -> VerificationSessionListResponse:
@@ -109,7 +111,7 @@ def get_session(
     verification_id: UUID,
     current_user_id: Annotated[UUID, Depends(get_current_user_id)],
     verification_service: Annotated[
-        VerificationService,
+        VerificationServiceProtocol,
         Depends(Closing[Provide[Container.verification_service]]),
     ],
 ) -> VerificationSessionResponse:
@@ -126,7 +128,7 @@ def update_session(
     request: VerificationSessionUpdateRequest,
     current_user_id: Annotated[UUID, Depends(get_current_user_id)],
     verification_service: Annotated[
-        VerificationService,
+        VerificationServiceProtocol,
         Depends(Closing[Provide[Container.verification_service]]),
     ],
 ) -> VerificationSessionResponse:
@@ -146,7 +148,7 @@ def delete_session(
     verification_id: UUID,
     current_user_id: Annotated[UUID, Depends(get_current_user_id)],
     verification_service: Annotated[
-        VerificationService,
+        VerificationServiceProtocol,
         Depends(Closing[Provide[Container.verification_service]]),
     ],
 ) -> None:
@@ -169,7 +171,7 @@ async def propose_policies(
         LangfuseClient, Depends(Provide[Container.langfuse_client])
     ],
     verification_service: Annotated[
-        VerificationService,
+        VerificationServiceProtocol,
         Depends(Closing[Provide[Container.verification_service]]),
     ],
 ) -> ProposePoliciesResponseBody:
@@ -230,7 +232,7 @@ async def generate_method(
         LangfuseClient, Depends(Provide[Container.langfuse_client])
     ],
     verification_service: Annotated[
-        VerificationService,
+        VerificationServiceProtocol,
         Depends(Closing[Provide[Container.verification_service]]),
     ],
 ) -> GenerateMethodResponseBody:
@@ -285,7 +287,7 @@ async def generate_experiment_code(
         LangfuseClient, Depends(Provide[Container.langfuse_client])
     ],
     verification_service: Annotated[
-        VerificationService,
+        VerificationServiceProtocol,
         Depends(Closing[Provide[Container.verification_service]]),
     ],
 ) -> GenerateExperimentCodeResponseBody:
@@ -1,8 +1,9 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from airas.core.types.research_hypothesis import ResearchHypothesis
 from airas.core.types.research_study import ResearchStudy
 from airas.usecases.generators.generate_hypothesis_subgraph.generate_hypothesis_subgraph_v0 import (
+    MAX_HYPOTHESIS_CANDIDATES,
     GenerateHypothesisSubgraphV0LLMMapping,
 )
 
@@ -11,6 +12,7 @@ class GenerateHypothesisSubgraphV0RequestBody(BaseModel):
     research_topic: str
     research_study_list: list[ResearchStudy]
     refinement_rounds: int
+    num_candidates: int = Field(default=1, ge=1, le=MAX_HYPOTHESIS_CANDIDATES)
     llm_mapping: GenerateHypothesisSubgraphV0LLMMapping | None = None
 
 
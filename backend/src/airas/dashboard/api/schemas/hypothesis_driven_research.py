@@ -67,6 +67,8 @@ class HypothesisDrivenResearchListItemResponse(BaseModel):
 
 class HypothesisDrivenResearchListResponseBody(BaseModel):
     items: list[HypothesisDrivenResearchListItemResponse]
+    # Pass back as `cursor` to fetch the next page; None on the last page.
+    next_cursor: str | None = None
 
 
 class HypothesisDrivenResearchUpdateRequestBody(BaseModel):
@@ -11,7 +11,10 @@ from airas.core.types.research_study import ResearchStudy
 from airas.usecases.retrieve.retrieve_paper_subgraph.retrieve_paper_subgraph import (
     RetrievePaperSubgraphLLMMapping,
 )
-from airas.usecases.writers.write_subgraph.write_subgraph import WriteLLMMapping
+from airas.usecases.writers.write_subgraph.write_subgraph import (
+    WriteLLMMapping,
+    WritingMode,
+)
 
 
 class SearchPaperTitlesRequestBody(BaseModel):
@@ -100,6 +103,7 @@ class WriteSubgraphRequestBody(BaseModel):
     research_study_list: list[ResearchStudy]
     references_bib: str
     writing_refinement_rounds: int = 2
+    writing_mode: WritingMode = "full_paper"
     llm_mapping: WriteLLMMapping | None = None
 
 
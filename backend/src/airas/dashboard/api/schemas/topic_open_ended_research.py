@@ -69,6 +69,8 @@ class TopicOpenEndedResearchListItemResponse(BaseModel):
 
 class TopicOpenEndedResearchListResponseBody(BaseModel):
     items: list[TopicOpenEndedResearchListItemResponse]
+    # Pass back as `cursor` to fetch the next page; None on the last page.
+    next_cursor: str | None = None
 
 
 class TopicOpenEndedResearchUpdateRequestBody(BaseModel):
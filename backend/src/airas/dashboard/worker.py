@@ -0,0 +1,166 @@
+"""Worker that executes queued research jobs.
+
+By default the dashboard API runs one ``JobWorker`` in its own process
+(``AIRAS_INLINE_WORKER``), which keeps single-machine setups working without
+extra processes. Set ``AIRAS_INLINE_WORKER=false`` and start one or more
+``airas worker`` processes to take the multi-hour research graphs off the
+API's event loop; every process sharing ``AIRAS_JOB_QUEUE_PATH`` draws from
+the same queue.
+
+While a job runs the worker renews its lease every ``heartbeat_interval``
+seconds. A cancellation request (or a lost lease) is observed on the next
+heartbeat and cancels the job's task. On shutdown, running jobs are handed
+back to the queue so another worker resumes them from their checkpoint.
+"""
+
+import asyncio
+import logging
+import os
+import signal
+import socket
+from collections.abc import Awaitable, Callable, Mapping
+from uuid import uuid4
+
+from airas.core.tracing import TRACER
+from airas.core.types.job import JobModel, JobStatus
+from airas.infra.job_queue import JobQueueProtocol
+
+logger = logging.getLogger(__name__)
+
+JobHandler = Callable[[JobModel], Awaitable[None]]
+
+DEFAULT_WORKER_CONCURRENCY = 2
+
+
+def inline_worker_enabled() -> bool:
+    return os.getenv("AIRAS_INLINE_WORKER", "true").lower() == "true"
+
+
+def worker_concurrency() -> int:
+    return int(os.getenv("AIRAS_WORKER_CONCURRENCY", DEFAULT_WORKER_CONCURRENCY))
+
+
+class JobWorker:
+    def __init__(
+        self,
+        queue: JobQueueProtocol,
+        handlers: Mapping[str, JobHandler],
+        concurrency: int = DEFAULT_WORKER_CONCURRENCY,
+        poll_interval: float = 2.0,
+        heartbeat_interval: float = 15.0,
+        worker_id: str | None = None,
+    ) -> None:
+        self.queue = queue
+        self.handlers = dict(handlers)
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.heartbeat_interval = heartbeat_interval
+        self.worker_id = (
+            worker_id or f"{socket.gethostname()}-{os.getpid()}-{uuid4().hex[:6]}"
+        )
+        self._stopping = asyncio.Event()
+
+    def stop(self) -> None:
+        self._stopping.set()
+
+    async def run(self) -> None:
+        logger.info(
+            f"[Worker {self.worker_id}] Serving {sorted(self.handlers)} "
+            f"with concurrency {self.concurrency}"
+        )
+        running: set[asyncio.Task] = set()
+        try:
+            while not self._stopping.is_set():
+                if len(running) < self.concurrency:
+                    job = await asyncio.to_thread(
+                        self.queue.claim, self.worker_id, list(self.handlers)
+                    )
+                    if job is not None:
+                        task = asyncio.create_task(self._execute(job))
+                        running.add(task)
+                        task.add_done_callback(running.discard)
+                        continue
+                try:
+                    await asyncio.wait_for(
+                        self._stopping.wait(), timeout=self.poll_interval
+                    )
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            for task in running:
+                task.cancel()
+            await asyncio.gather(*running, return_exceptions=True)
+            logger.info(f"[Worker {self.worker_id}] Stopped")
+
+    async def _run_traced(self, job: JobModel) -> None:
+        # The root span of the job's trace; every node span nests under it.
+        with TRACER.span(
+            f"job {job.kind}",
+            kind="server",
+            attributes={"airas.job.id": str(job.id), "airas.job.kind": job.kind},
+        ):
+            await self.handlers[job.kind](job)
+
+    async def _execute(self, job: JobModel) -> None:
+        logger.info(f"[Worker {self.worker_id}] Running {job.kind} job {job.id}")
+        task = asyncio.create_task(self._run_traced(job))
+        cancel_requested = False
+        try:
+            while True:
+                done, _ = await asyncio.wait({task}, timeout=self.heartbeat_interval)
+                if done:
+                    break
+                if not await asyncio.to_thread(
+                    self.queue.heartbeat, job.id, self.worker_id
+                ):
+                    logger.info(f"[Worker {self.worker_id}] Cancelling job {job.id}")
+                    cancel_requested = True
+                    task.cancel()
+            await task
+        except asyncio.CancelledError:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            if not cancel_requested:
+                # Worker shutdown: let another worker pick the job up again.
+                await asyncio.to_thread(self.queue.release, job.id, self.worker_id)
+                raise
+            await asyncio.to_thread(
+                self.queue.finish, job.id, self.worker_id, JobStatus.CANCELLED
+            )
+        except Exception as e:
+            logger.exception(f"[Worker {self.worker_id}] Job {job.id} failed")
+            await asyncio.to_thread(
+                self.queue.finish,
+                job.id,
+                self.worker_id,
+                JobStatus.FAILED,
+                f"{type(e).__name__}: {str(e)}",
+            )
+        else:
+            await asyncio.to_thread(
+                self.queue.finish, job.id, self.worker_id, JobStatus.SUCCEEDED
+            )
+            logger.info(f"[Worker {self.worker_id}] Job {job.id} succeeded")
+
+
+async def serve(concurrency: int | None = None) -> None:
+    """Run a standalone research worker until SIGINT/SIGTERM."""
+    from airas.container import Container
+    from airas.dashboard.api.research_jobs import research_job_handlers
+
+    container = Container()
+    await container.init_resources()
+    worker = JobWorker(
+        container.job_queue(),
+        research_job_handlers(container),
+        concurrency=concurrency or worker_concurrency(),
+    )
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, worker.stop)
+
+    try:
+        await worker.run()
+    finally:
+        await container.shutdown_resources()
@@ -1,10 +1,16 @@
 import asyncio
+import re
+import threading
+import time
+from collections import OrderedDict
 from logging import getLogger
 from typing import Any, Protocol, runtime_checkable
 
+import feedparser
 import httpx
 
 from airas.infra.base_http_client import BaseHTTPClient
+from airas.infra.politeness_scheduler import PolitenessScheduler
 from airas.infra.response_parser import ResponseParser
 from airas.infra.retry_policy import make_retry_policy, raise_for_status
 
@@ -12,6 +18,81 @@ logger = getLogger(__name__)
 
 ARXIV_RETRY = make_retry_policy()
 
+# arXiv asks API clients to leave about 3 seconds between requests.
+ARXIV_MIN_INTERVAL = 3.0
+# Ids per ``id_list`` query; keeps the query string well under URL limits.
+ARXIV_ID_BATCH_SIZE = 200
+
+_VERSIONED_ID = re.compile(r"^(?P<base>.+?)(?P<version>v\d+)?$")
+# New-style "2301.01234" / "0704.0001" and old-style "hep-th/9901001" or
+# "math.GT/0309136", each with an optional version.
+_ARXIV_ID = re.compile(
+    r"^(?:\d{4}\.\d{4,5}|[a-z]+(?:-[a-z]+)*(?:\.[A-Z]{2})?/\d{7})(?:v\d+)?$"
+)
+
+
+def is_arxiv_id(arxiv_id: str) -> bool:
+    return _ARXIV_ID.match(arxiv_id.strip()) is not None
+
+
+def split_arxiv_version(arxiv_id: str) -> tuple[str, str | None]:
+    """Split "1706.03762v7" into ("1706.03762", "v7"); old-style ids work too."""
+    match = _VERSIONED_ID.match(arxiv_id.strip())
+    if match is None:
+        return arxiv_id.strip(), None
+    return match["base"], match["version"]
+
+
+class ArxivMetadataCache:
+    """LRU of Atom entries keyed by versioned arXiv id.
+
+    A versioned id always names the same metadata, so those entries never go
+    stale. Requests without a version resolve through ``latest_ttl`` seconds of
+    remembered "latest version" so that new revisions are eventually seen.
+    """
+
+    def __init__(self, max_entries: int = 2048, latest_ttl: float = 86400.0):
+        self.max_entries = max_entries
+        self.latest_ttl = latest_ttl
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, feedparser.FeedParserDict] = OrderedDict()
+        self._latest: dict[str, tuple[str, float]] = {}
+
+    def get(self, arxiv_id: str) -> feedparser.FeedParserDict | None:
+        base, version = split_arxiv_version(arxiv_id)
+        with self._lock:
+            if version is None:
+                latest = self._latest.get(base)
+                if latest is None or time.monotonic() - latest[1] > self.latest_ttl:
+                    return None
+                key = latest[0]
+            else:
+                key = base + version
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(
+        self, versioned_id: str, entry: feedparser.FeedParserDict, *, latest: bool
+    ) -> None:
+        base, _ = split_arxiv_version(versioned_id)
+        with self._lock:
+            self._entries[versioned_id] = entry
+            self._entries.move_to_end(versioned_id)
+            if latest:
+                self._latest[base] = (versioned_id, time.monotonic())
+            while len(self._entries) > self.max_entries:
+                evicted, _ = self._entries.popitem(last=False)
+                evicted_base, _ = split_arxiv_version(evicted)
+                if self._latest.get(evicted_base, ("",))[0] == evicted:
+                    del self._latest[evicted_base]
+
+
+# Shared by every ArxivClient in the process unless one is injected.
+ARXIV_SCHEDULER = PolitenessScheduler(ARXIV_MIN_INTERVAL)
+ARXIV_METADATA_CACHE = ArxivMetadataCache()
+
 
 @runtime_checkable
 class ResponseParserProtocol(Protocol):
@@ -26,6 +107,8 @@ class ArxivClient(BaseHTTPClient):
         parser: ResponseParserProtocol | None = None,
         sync_session: httpx.Client | None = None,
         async_session: httpx.AsyncClient | None = None,
+        scheduler: PolitenessScheduler | None = None,
+        metadata_cache: ArxivMetadataCache | None = None,
     ):
         super().__init__(
             base_url=base_url,
@@ -34,6 +117,8 @@ class ArxivClient(BaseHTTPClient):
             async_session=async_session,
         )
         self._parser = parser or ResponseParser()
+        self._scheduler = scheduler or ARXIV_SCHEDULER
+        self._metadata_cache = metadata_cache or ARXIV_METADATA_CACHE
 
     def _build_search_query(
         self,
@@ -168,6 +253,7 @@ class ArxivClient(BaseHTTPClient):
             to_date=to_date,
             search_field=search_field,
         )
+        await self._scheduler.wait()
         response = await self.aget(path="query", params=params, timeout=timeout)
         raise_for_status(response, path="query")
 
@@ -201,11 +287,115 @@ class ArxivClient(BaseHTTPClient):
             "id_list": clean_id,
             "max_results": 1,
         }
+        await self._scheduler.wait()
         response = await self.aget(path="query", params=params, timeout=timeout)
         raise_for_status(response, path="query")
 
         return self._parser.parse(response, as_="xml")
 
+    @ARXIV_RETRY
+    async def _afetch_id_batch(
+        self, arxiv_ids: list[str], timeout: float
+    ) -> list[feedparser.FeedParserDict]:
+        params = {
+            "id_list": ",".join(arxiv_ids),
+            "max_results": len(arxiv_ids),
+        }
+        await self._scheduler.wait()
+        response = await self.aget(path="query", params=params, timeout=timeout)
+        raise_for_status(response, path="query")
+
+        return feedparser.parse(self._parser.parse(response, as_="xml")).entries
+
+    async def _afetch_ids(
+        self, arxiv_ids: list[str], timeout: float
+    ) -> list[feedparser.FeedParserDict]:
+        entries = await self._afetch_id_batch(arxiv_ids, timeout)
+        # Unknown or malformed ids come back as entries pointing at api/errors.
+        papers = [entry for entry in entries if "/abs/" in getattr(entry, "id", "")]
+        if papers or not entries or len(arxiv_ids) == 1:
+            return papers
+        # An id arXiv rejects can turn the whole query into a single error
+        # entry; fetch one by one so that only that id is lost.
+        logger.warning(
+            f"arXiv rejected a batch of {len(arxiv_ids)} ids; fetching them one by one"
+        )
+        return [
+            paper
+            for arxiv_id in arxiv_ids
+            for paper in await self._afetch_ids([arxiv_id], timeout)
+        ]
+
+    def get_papers_by_ids(
+        self,
+        arxiv_ids: list[str],
+        *,
+        batch_size: int = ARXIV_ID_BATCH_SIZE,
+        timeout: float = 30.0,
+    ) -> dict[str, feedparser.FeedParserDict]:
+        """Synchronous wrapper around ``aget_papers_by_ids``."""
+
+        return asyncio.run(
+            self.aget_papers_by_ids(arxiv_ids, batch_size=batch_size, timeout=timeout)
+        )
+
+    async def aget_papers_by_ids(
+        self,
+        arxiv_ids: list[str],
+        *,
+        batch_size: int = ARXIV_ID_BATCH_SIZE,
+        timeout: float = 30.0,
+    ) -> dict[str, feedparser.FeedParserDict]:
+        """
+        Fetch Atom entries for many arXiv IDs with ``id_list`` queries.
+
+        Cached entries are served locally; the rest are requested
+        ``batch_size`` at a time. Ids without a version resolve to the latest
+        version, versioned ids to that exact version.
+
+        Returns:
+            Requested id (stripped) -> Atom entry. Ids that are not arXiv ids
+            or that arXiv does not know are omitted.
+        """
+        requested: list[str] = []
+        for arxiv_id in dict.fromkeys(i.strip() for i in arxiv_ids if i.strip()):
+            if is_arxiv_id(arxiv_id):
+                requested.append(arxiv_id)
+            else:
+                logger.warning(f"Skipping malformed arXiv id: {arxiv_id!r}")
+        found: dict[str, feedparser.FeedParserDict] = {}
+        missing: list[str] = []
+        for arxiv_id in requested:
+            if (entry := self._metadata_cache.get(arxiv_id)) is not None:
+                found[arxiv_id] = entry
+            else:
+                missing.append(arxiv_id)
+
+        for start in range(0, len(missing), batch_size):
+            chunk = missing[start : start + batch_size]
+            entries: dict[str, feedparser.FeedParserDict] = {}
+            for entry in await self._afetch_ids(chunk, timeout):
+                versioned_id = entry.id.split("/abs/", 1)[1]
+                entries[versioned_id] = entry
+                entries.setdefault(split_arxiv_version(versioned_id)[0], entry)
+
+            for arxiv_id in chunk:
+                if (entry := entries.get(arxiv_id)) is None:
+                    continue
+                found[arxiv_id] = entry
+                self._metadata_cache.put(
+                    entry.id.split("/abs/", 1)[1],
+                    entry,
+                    latest=split_arxiv_version(arxiv_id)[1] is None,
+                )
+
+        logger.info(
+            f"arXiv metadata: {len(requested) - len(missing)} cached, "
+            f"{len(missing)} fetched in "
+            f"{-(-len(missing) // batch_size)} request(s)"
+        )
+        return found
+
 
 if __name__ == "__main__":
     import feedparser
@@ -237,3 +427,8 @@ if __name__ == "__main__":
     result4 = client.search_papers(title="transformer", author="Vaswani", max_results=1)
     feed4 = feedparser.parse(result4)
     print(f"   Found {len(feed4.entries)} papers")
+
+    # Example 5: Batch lookup by id
+    print("\n5. Batch lookup by id:")
+    result5 = client.get_papers_by_ids(["1706.03762", "1810.04805v2"])
+    print(f"   Titles: {[entry.title for entry in result5.values()]}")
@@ -1,11 +1,59 @@
+import asyncio
 import logging
+import threading
+from collections import Counter, defaultdict
+from weakref import WeakKeyDictionary
 
 import httpx
 
+from airas.infra.http_telemetry import HTTP_TELEMETRY
+
 logger = logging.getLogger(__name__)
 
 
+class CoalescingMetrics:
+    """Per-client counts of GETs issued and GETs served by an in-flight twin."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counts: defaultdict[str, Counter[str]] = defaultdict(Counter)
+
+    def record(self, client: str, *, coalesced: bool) -> None:
+        with self._lock:
+            self._counts[client]["requests"] += 1
+            if coalesced:
+                self._counts[client]["coalesced"] += 1
+
+    def snapshot(self) -> dict[str, dict[str, int]]:
+        with self._lock:
+            return {
+                client: {
+                    "requests": counts["requests"],
+                    "coalesced": counts["coalesced"],
+                }
+                for client, counts in self._counts.items()
+            }
+
+
+GET_COALESCING_METRICS = CoalescingMetrics()
+
+# Clients are built per call by the DI container, so in-flight GETs are tracked
+# per event loop rather than per client instance.
+_inflight_gets: WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[tuple, asyncio.Future[httpx.Response]]
+] = WeakKeyDictionary()
+
+
+def _consume_exception(future: asyncio.Future[httpx.Response]) -> None:
+    # Every waiter may have been cancelled; don't log "never retrieved".
+    if not future.cancelled():
+        future.exception()
+
+
 class BaseHTTPClient:
+    # Concurrent identical GETs share one request (single-flight).
+    coalesce_gets: bool = True
+
     def __init__(
         self,
         base_url: str,
@@ -77,6 +125,7 @@ class BaseHTTPClient:
             return response
         except Exception as e:
             logger.warning(f"[{self.__class__.__name__}] {method} {url}: {e}")
+            HTTP_TELEMETRY.record_error(url, e)
             raise
 
     async def arequest(
@@ -90,13 +139,50 @@ class BaseHTTPClient:
         timeout: float = 10.0,
         full_url: str | None = None,
     ) -> httpx.Response:
-        """Asynchronous HTTP request."""
+        """Asynchronous HTTP request.
+
+        A GET identical (URL, query and headers) to one already in flight on
+        the same session awaits that request's response instead of sending
+        its own.
+        """
         if full_url:
             url = full_url
         else:
             url = f"{self.base_url}/{path.lstrip('/')}"
         headers = {**self.default_headers, **(headers or {})}
 
+        if method.upper() != "GET" or not self.coalesce_gets:
+            return await self._asend(method, url, headers, params, json, timeout)
+
+        key = (
+            id(self.async_session),
+            str(httpx.URL(url, params=params)),
+            tuple(sorted((k.lower(), v) for k, v in headers.items())),
+        )
+        inflight = _inflight_gets.setdefault(asyncio.get_running_loop(), {})
+        future = inflight.get(key)
+        GET_COALESCING_METRICS.record(
+            self.__class__.__name__, coalesced=future is not None
+        )
+        if future is None:
+            future = asyncio.ensure_future(
+                self._asend(method, url, headers, params, json, timeout)
+            )
+            inflight[key] = future
+            future.add_done_callback(lambda _: inflight.pop(key, None))
+            future.add_done_callback(_consume_exception)
+        # Shielded so one caller's cancellation does not fail the others.
+        return await asyncio.shield(future)
+
+    async def _asend(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        params: dict | None,
+        json: dict | None,
+        timeout: float,
+    ) -> httpx.Response:
         try:
             response = await self.async_session.request(
                 method=method.upper(),
@@ -109,6 +195,7 @@ class BaseHTTPClient:
             return response
         except Exception as e:
             logger.warning(f"[{self.__class__.__name__}] {method} {url}: {e}")
+            HTTP_TELEMETRY.record_error(url, e)
             raise
 
     # Synchronous methods
@@ -1,8 +1,11 @@
 import asyncio
 import base64
+import hashlib
 import logging
+import time
+from collections.abc import Awaitable, Callable, Iterator
 from datetime import datetime, timezone
-from typing import Any, Literal, Protocol, runtime_checkable
+from typing import Any, Literal, Protocol, TypeVar, runtime_checkable
 
 import httpx
 from nacl import public
@@ -16,6 +19,7 @@ from tenacity import (
 
 from airas.core.logging_utils import setup_logging
 from airas.infra.base_http_client import BaseHTTPClient
+from airas.infra.http_telemetry import count_retries
 from airas.infra.response_parser import ResponseParser
 
 setup_logging()
@@ -36,13 +40,16 @@ class GithubClientRetryableError(GithubClientError): ...
 class GithubClientFatalError(GithubClientError): ...
 
 
+class GithubClientNotFoundError(GithubClientFatalError): ...
+
+
 DEFAULT_MAX_RETRIES = 10
 DEFAULT_INITIAL_WAIT = 1.0
 
 GITHUB_RETRY = retry(
     stop=stop_after_attempt(DEFAULT_MAX_RETRIES),
     wait=wait_exponential(multiplier=DEFAULT_INITIAL_WAIT),
-    before_sleep=before_sleep_log(logger, logging.WARNING),
+    before_sleep=count_retries(before_sleep_log(logger, logging.WARNING)),
     reraise=True,
     retry=(
         retry_if_exception_type(GithubClientRetryableError)
@@ -50,6 +57,70 @@ GITHUB_RETRY = retry(
     ),
 )
 
+# Readiness probes: GitHub applies writes (new repositories, refs, contents,
+# artifacts) asynchronously, so a read right after a write may not see it yet.
+# Rather than sleeping for a fixed time, probe with a short exponential backoff
+# and return as soon as the write is visible.
+READINESS_INITIAL_DELAY = 0.25
+READINESS_MAX_DELAY = 1.0
+READINESS_TIMEOUT = 30.0
+
+_T = TypeVar("_T")
+
+
+def git_blob_sha(content: str) -> str:
+    """The SHA GitHub reports for a file holding ``content``."""
+    data = content.encode("utf-8")
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
+def _backoff_delays(
+    timeout: float, initial_delay: float, max_delay: float
+) -> Iterator[float]:
+    """Delays before each further probe, never sleeping past ``timeout``."""
+    deadline = time.monotonic() + timeout
+    delay = initial_delay
+    while (remaining := deadline - time.monotonic()) > 0:
+        yield min(delay, remaining)
+        delay = min(delay * 2, max_delay)
+
+
+def wait_until(
+    probe: Callable[[], _T | None],
+    description: str,
+    timeout: float = READINESS_TIMEOUT,
+    initial_delay: float = READINESS_INITIAL_DELAY,
+    max_delay: float = READINESS_MAX_DELAY,
+) -> _T | None:
+    """Call ``probe`` until it returns a truthy value; ``None`` on timeout."""
+    if result := probe():
+        return result
+    for delay in _backoff_delays(timeout, initial_delay, max_delay):
+        time.sleep(delay)
+        if result := probe():
+            return result
+    logger.warning(f"Timed out after {timeout:.0f} s waiting for {description}")
+    return None
+
+
+async def await_until(
+    probe: Callable[[], Awaitable[_T | None]],
+    description: str,
+    timeout: float = READINESS_TIMEOUT,
+    initial_delay: float = READINESS_INITIAL_DELAY,
+    max_delay: float = READINESS_MAX_DELAY,
+) -> _T | None:
+    """Async ``wait_until``."""
+    if result := await probe():
+        return result
+    for delay in _backoff_delays(timeout, initial_delay, max_delay):
+        await asyncio.sleep(delay)
+        if result := await probe():
+            return result
+    logger.warning(f"Timed out after {timeout:.0f} s waiting for {description}")
+    return None
+
+
 # TODO: Raise exceptions for all error cases; let the caller handle failures.
 # TODO: Use an Enum for HTTP status codes and extract retry logic into a mixin for reuse across API clients.
 
@@ -167,7 +238,7 @@ class GithubClient(BaseHTTPClient):
                 return self._parser.parse(response, as_=as_)
             case 404:
                 logger.warning(f"Resource not found (404): {path}")
-                raise GithubClientFatalError(f"Resource not found (404): {path}")
+                raise GithubClientNotFoundError(f"Resource not found (404): {path}")
             case 403:
                 logger.error(f"Access forbidden (403): {path}")
                 raise GithubClientFatalError(f"Access forbidden (403): {path}")
@@ -969,6 +1040,89 @@ class GithubClient(BaseHTTPClient):
                 self._raise_for_status(response, path)
                 return False
 
+    @GITHUB_RETRY
+    async def aget_repository_public_key(
+        self,
+        github_owner: str,
+        repository_name: str,
+    ) -> dict[str, str] | None:
+        # https://docs.github.com/en/rest/actions/secrets#get-a-repository-public-key
+        path = f"/repos/{github_owner}/{repository_name}/actions/secrets/public-key"
+
+        response = await self.aget(path=path)
+        match response.status_code:
+            case 200:
+                logger.info(f"Successfully retrieved repository public key: {path}")
+                return self._parser.parse(response, as_="json")
+            case 404:
+                logger.error(f"Repository not found (404): {path}")
+                raise GithubClientFatalError(f"Repository not found (404): {path}")
+            case _:
+                self._raise_for_status(response, path)
+                return None
+
+    @GITHUB_RETRY
+    async def alist_repository_secret_names(
+        self,
+        github_owner: str,
+        repository_name: str,
+    ) -> set[str]:
+        # https://docs.github.com/en/rest/actions/secrets#list-repository-secrets
+        path = f"/repos/{github_owner}/{repository_name}/actions/secrets"
+        names: set[str] = set()
+        page = 1
+        while True:
+            response = await self.aget(
+                path=path, params={"per_page": 100, "page": page}
+            )
+            match response.status_code:
+                case 200:
+                    data = self._parser.parse(response, as_="json")
+                case 404:
+                    logger.error(f"Repository not found (404): {path}")
+                    raise GithubClientFatalError(f"Repository not found (404): {path}")
+                case _:
+                    self._raise_for_status(response, path)
+                    raise GithubClientFatalError(
+                        f"Unexpected response: {response.status_code}"
+                    )
+            names.update(secret["name"] for secret in data.get("secrets", []))
+            if len(names) >= data.get("total_count", 0) or not data.get("secrets"):
+                return names
+            page += 1
+
+    @GITHUB_RETRY
+    async def acreate_or_update_repository_secret(
+        self,
+        github_owner: str,
+        repository_name: str,
+        secret_name: str,
+        secret_value: str,
+        public_key_info: dict[str, str],
+    ) -> bool:
+        # https://docs.github.com/en/rest/actions/secrets#create-or-update-a-repository-secret
+        encrypted_value = self._encrypt_secret(public_key_info["key"], secret_value)
+
+        path = f"/repos/{github_owner}/{repository_name}/actions/secrets/{secret_name}"
+        payload = {
+            "encrypted_value": encrypted_value,
+            "key_id": public_key_info["key_id"],
+        }
+
+        response = await self.aput(path=path, json=payload)
+        match response.status_code:
+            case 201 | 204:
+                logger.info(
+                    f"Successfully created/updated repository secret: {secret_name}"
+                )
+                return True
+            case 404:
+                logger.error(f"Repository not found (404): {path}")
+                raise GithubClientFatalError(f"Repository not found (404): {path}")
+            case _:
+                self._raise_for_status(response, path)
+                return False
+
     # --------------------------------------------------
     # Async Branch Methods
     # --------------------------------------------------
@@ -1220,7 +1374,7 @@ class GithubClient(BaseHTTPClient):
                     return response.content
             case 404:
                 logger.warning(f"Resource not found (404): {path}")
-                raise GithubClientFatalError(f"Resource not found (404): {path}")
+                raise GithubClientNotFoundError(f"Resource not found (404): {path}")
             case 403:
                 logger.error(f"Access forbidden (403): {path}")
                 raise GithubClientFatalError(f"Access forbidden (403): {path}")
@@ -1237,6 +1391,7 @@ class GithubClient(BaseHTTPClient):
         branch_name: str,
         files: dict[str, str],  # path -> content
         commit_message: str,
+        deleted_paths: list[str] | None = None,
     ) -> bool:
         try:
             # Get current branch info
@@ -1259,7 +1414,7 @@ class GithubClient(BaseHTTPClient):
             blob_shas = await asyncio.gather(*blob_tasks)
 
             # Create tree entries
-            tree_entries = []
+            tree_entries: list[dict[str, str | None]] = []
             for i, (file_path, _) in enumerate(files.items()):
                 tree_entries.append(
                     {
@@ -1269,6 +1424,11 @@ class GithubClient(BaseHTTPClient):
                         "sha": blob_shas[i],
                     }
                 )
+            # A null sha removes the path from the base tree
+            for file_path in deleted_paths or []:
+                tree_entries.append(
+                    {"path": file_path, "mode": "100644", "type": "blob", "sha": None}
+                )
 
             # Create tree
             tree_sha = await self._acreate_tree(
@@ -1384,3 +1544,102 @@ class GithubClient(BaseHTTPClient):
             case _:
                 self._raise_for_status(response, path)
                 return False
+
+    # --------------------------------------------------
+    # Readiness (see wait_until)
+    # --------------------------------------------------
+
+    def wait_until_ref_exists(
+        self,
+        github_owner: str,
+        repository_name: str,
+        branch_name: str,
+        timeout: float = READINESS_TIMEOUT,
+    ) -> dict | None:
+        """The branch once it exists, e.g. after creating a repository."""
+        return wait_until(
+            lambda: self.get_branch(github_owner, repository_name, branch_name),
+            f"branch {github_owner}/{repository_name}@{branch_name}",
+            timeout=timeout,
+        )
+
+    async def await_until_ref_exists(
+        self,
+        github_owner: str,
+        repository_name: str,
+        branch_name: str,
+        timeout: float = READINESS_TIMEOUT,
+    ) -> dict | None:
+        return await await_until(
+            lambda: self.aget_branch(github_owner, repository_name, branch_name),
+            f"branch {github_owner}/{repository_name}@{branch_name}",
+            timeout=timeout,
+        )
+
+    async def _afile_sha(
+        self,
+        github_owner: str,
+        repository_name: str,
+        file_path: str,
+        branch_name: str,
+    ) -> str | None:
+        try:
+            content = await self.aget_repository_content(
+                github_owner, repository_name, file_path, branch_name
+            )
+        except GithubClientNotFoundError:
+            return None
+        return content.get("sha") if isinstance(content, dict) else None
+
+    async def await_until_file_sha(
+        self,
+        github_owner: str,
+        repository_name: str,
+        file_path: str,
+        blob_sha: str,
+        branch_name: str,
+        timeout: float = READINESS_TIMEOUT,
+    ) -> bool:
+        """Whether ``file_path`` on the branch reached the git blob ``blob_sha``."""
+
+        async def probe() -> bool:
+            sha = await self._afile_sha(
+                github_owner, repository_name, file_path, branch_name
+            )
+            return sha == blob_sha
+
+        return bool(
+            await await_until(
+                probe,
+                f"{github_owner}/{repository_name}@{branch_name}:{file_path} "
+                f"to reach {blob_sha[:7]}",
+                timeout=timeout,
+            )
+        )
+
+    async def await_until_artifact(
+        self,
+        github_owner: str,
+        repository_name: str,
+        workflow_run_id: int,
+        artifact_name: str,
+        timeout: float = READINESS_TIMEOUT,
+        initial_delay: float = READINESS_INITIAL_DELAY,
+        max_delay: float = READINESS_MAX_DELAY,
+    ) -> dict | None:
+        """The named artifact of a workflow run once it has been uploaded."""
+
+        async def probe() -> dict | None:
+            response = await self.alist_workflow_run_artifacts(
+                github_owner, repository_name, workflow_run_id
+            )
+            artifacts = (response or {}).get("artifacts", [])
+            return next((a for a in artifacts if a["name"] == artifact_name), None)
+
+        return await await_until(
+            probe,
+            f"artifact '{artifact_name}' of run {workflow_run_id}",
+            timeout=timeout,
+            initial_delay=initial_delay,
+            max_delay=max_delay,
+        )
@@ -0,0 +1,69 @@
+"""Persistent store for Hugging Face repo metadata and READMEs.
+
+Entries are keyed by (resource type, repo id, commit sha). A commit never
+changes, so an entry never goes stale and needs no TTL: a repo that moved on
+gets a new sha from the search endpoint and therefore a new key. That is what
+sets this store apart from ``HttpCache``, which keys on URLs whose content
+(``resolve/main/README.md``) changes underneath them. The entries live in a
+``SqliteBlobStore`` bounded by AIRAS_HF_REPO_CACHE_MAX_MB.
+"""
+
+import json
+import os
+from functools import cache
+from typing import Any
+
+from airas.infra.sqlite_blob_store import SqliteBlobStore
+
+DEFAULT_HF_REPO_CACHE_PATH = ".airas/hf_repo_cache.sqlite"
+DEFAULT_MAX_MB = 256
+
+
+class HuggingFaceRepoCache:
+    def __init__(self, blobs: SqliteBlobStore) -> None:
+        self.blobs = blobs
+
+    @staticmethod
+    def _key(column: str, kind: str, repo_id: str, sha: str) -> str:
+        return f"{column}:{kind}:{repo_id}@{sha}"
+
+    def _get(self, column: str, kind: str, repo_id: str, sha: str) -> str | None:
+        blob = self.blobs.get(self._key(column, kind, repo_id, sha))
+        return None if blob is None else blob.body.decode()
+
+    def _put(self, column: str, kind: str, repo_id: str, sha: str, value: str) -> None:
+        self.blobs.put(self._key(column, kind, repo_id, sha), column, value.encode())
+
+    def get_metadata(self, kind: str, repo_id: str, sha: str) -> dict[str, Any] | None:
+        raw = self._get("metadata", kind, repo_id, sha)
+        return None if raw is None else json.loads(raw)
+
+    def put_metadata(
+        self, kind: str, repo_id: str, sha: str, metadata: dict[str, Any]
+    ) -> None:
+        self._put("metadata", kind, repo_id, sha, json.dumps(metadata))
+
+    def get_readme(self, kind: str, repo_id: str, sha: str) -> str | None:
+        """The README at ``sha``; ``""`` records that the repo has none."""
+        return self._get("readme", kind, repo_id, sha)
+
+    def put_readme(self, kind: str, repo_id: str, sha: str, readme: str) -> None:
+        self._put("readme", kind, repo_id, sha, readme)
+
+    def stats(self) -> dict[str, Any]:
+        return self.blobs.stats()
+
+    def clear(self) -> None:
+        self.blobs.clear()
+
+
+@cache
+def shared_hf_repo_cache() -> HuggingFaceRepoCache | None:
+    """The process-wide store, or ``None`` unless ENABLE_HTTP_CACHE=true."""
+    if os.getenv("ENABLE_HTTP_CACHE", "false").lower() != "true":
+        return None
+    return HuggingFaceRepoCache(
+        SqliteBlobStore.from_env(
+            "AIRAS_HF_REPO_CACHE", DEFAULT_HF_REPO_CACHE_PATH, DEFAULT_MAX_MB
+        )
+    )
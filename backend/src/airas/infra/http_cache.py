@@ -0,0 +1,363 @@
+"""On-disk HTTP response cache for the scholarly APIs.
+
+Literature searches on the same topic repeat the same OpenAlex, Semantic
+Scholar, arXiv and Hugging Face queries over and over, and every cold start of
+the papers DB index downloads the same raw JSON files. ``CachingTransport`` /
+``AsyncCachingTransport`` sit under an httpx client and serve those GETs from a
+SQLite file shared by the dashboard, ``airas worker`` and the MCP server.
+
+Only hosts listed in the policy table are cached, each with its own TTL. Once
+an entry is older than its TTL it is still served for ``stale_while_revalidate``
+seconds while a background request refreshes it (conditionally, when the
+origin sent an ETag or Last-Modified). Responses live in a ``SqliteBlobStore``
+bounded by AIRAS_HTTP_CACHE_MAX_MB.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import cache
+from typing import Any
+
+import httpx
+
+from airas.infra.sqlite_blob_store import SqliteBlobStore
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HTTP_CACHE_PATH = ".airas/http_cache.sqlite"
+DEFAULT_MAX_MB = 512
+
+_HOUR = 3600.0
+_DAY = 24 * _HOUR
+
+
+@dataclass(frozen=True)
+class HostCachePolicy:
+    # Seconds a response is served without contacting the origin.
+    ttl: float
+    # Further seconds a stale response is served while it is refreshed.
+    stale_while_revalidate: float = 0.0
+
+
+DEFAULT_HOST_POLICIES: dict[str, HostCachePolicy] = {
+    "api.openalex.org": HostCachePolicy(
+        ttl=12 * _HOUR, stale_while_revalidate=7 * _DAY
+    ),
+    "api.semanticscholar.org": HostCachePolicy(
+        ttl=12 * _HOUR, stale_while_revalidate=7 * _DAY
+    ),
+    "export.arxiv.org": HostCachePolicy(ttl=_DAY, stale_while_revalidate=7 * _DAY),
+    "huggingface.co": HostCachePolicy(ttl=6 * _HOUR, stale_while_revalidate=_DAY),
+    # AIRAS papers DB (raw JSON files on GitHub).
+    "raw.githubusercontent.com": HostCachePolicy(
+        ttl=_DAY, stale_while_revalidate=30 * _DAY
+    ),
+}
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    status: int
+    headers: list[tuple[str, str]]
+    body: bytes
+    stored_at: float
+
+    def to_response(self, outcome: str) -> httpx.Response:
+        # The body is stored as received (still content-encoded), so the client
+        # decodes it exactly as it would a network response.
+        return httpx.Response(
+            self.status,
+            headers=self.headers,
+            stream=httpx.ByteStream(self.body),
+            extensions={"airas_cache": outcome},
+        )
+
+
+class HttpCacheMetrics:
+    """Per-host outcome counters for this process."""
+
+    OUTCOMES = ("hit", "stale", "miss", "revalidated", "evicted")
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counts: defaultdict[str, Counter[str]] = defaultdict(Counter)
+
+    def record(self, host: str, outcome: str, n: int = 1) -> None:
+        with self._lock:
+            self._counts[host][outcome] += n
+
+    def snapshot(self) -> dict[str, dict[str, int]]:
+        with self._lock:
+            return {
+                host: {outcome: counts[outcome] for outcome in self.OUTCOMES}
+                for host, counts in self._counts.items()
+            }
+
+
+class HttpCache:
+    def __init__(
+        self,
+        blobs: SqliteBlobStore,
+        *,
+        policies: dict[str, HostCachePolicy] | None = None,
+    ) -> None:
+        self.blobs = blobs
+        self.policies = DEFAULT_HOST_POLICIES if policies is None else policies
+        self.metrics = HttpCacheMetrics()
+
+    def policy_for(self, request: httpx.Request) -> HostCachePolicy | None:
+        if request.method != "GET":
+            return None
+        if "no-cache" in request.headers.get("Cache-Control", ""):
+            return None
+        return self.policies.get(request.url.host)
+
+    @staticmethod
+    def key_for(request: httpx.Request) -> str:
+        return hashlib.sha256(str(request.url).encode()).hexdigest()
+
+    def lookup(self, key: str) -> CachedResponse | None:
+        if (blob := self.blobs.get(key)) is None or blob.meta is None:
+            return None
+        meta = json.loads(blob.meta)
+        return CachedResponse(
+            status=meta["status"],
+            headers=[tuple(pair) for pair in meta["headers"]],
+            body=blob.body,
+            stored_at=blob.stored_at,
+        )
+
+    def store(self, key: str, host: str, response: httpx.Response, body: bytes) -> None:
+        if response.status_code != 200 or "no-store" in response.headers.get(
+            "Cache-Control", ""
+        ):
+            return
+        meta = {
+            "status": response.status_code,
+            "headers": response.headers.multi_items(),
+        }
+        for evicted_host in self.blobs.put(key, host, body, json.dumps(meta)):
+            self.metrics.record(evicted_host, "evicted")
+
+    def mark_revalidated(self, key: str) -> None:
+        self.blobs.refresh(key)
+
+    def stats(self) -> dict[str, Any]:
+        return {**self.blobs.stats(), "hosts": self.metrics.snapshot()}
+
+    def clear(self) -> None:
+        self.blobs.clear()
+
+
+def _conditional_headers(cached: CachedResponse) -> dict[str, str]:
+    headers = httpx.Headers(cached.headers)
+    validators: dict[str, str] = {}
+    if etag := headers.get("ETag"):
+        validators["If-None-Match"] = etag
+    if last_modified := headers.get("Last-Modified"):
+        validators["If-Modified-Since"] = last_modified
+    return validators
+
+
+def _revalidation_request(
+    request: httpx.Request, cached: CachedResponse | None
+) -> httpx.Request:
+    headers = httpx.Headers(request.headers)
+    if cached is not None:
+        headers.update(_conditional_headers(cached))
+    # Extensions carry the per-request timeout the client configured.
+    return httpx.Request(
+        request.method, request.url, headers=headers, extensions=request.extensions
+    )
+
+
+class CachingTransport(httpx.BaseTransport):
+    def __init__(
+        self, cache: HttpCache, transport: httpx.BaseTransport | None = None
+    ) -> None:
+        self.cache = cache
+        self._transport = transport or httpx.HTTPTransport()
+        self._executor = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="http-cache-revalidate"
+        )
+        self._revalidating: set[str] = set()
+        self._lock = threading.Lock()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        policy = self.cache.policy_for(request)
+        if policy is None:
+            return self._transport.handle_request(request)
+
+        host = request.url.host
+        key = self.cache.key_for(request)
+        cached = self.cache.lookup(key)
+        if cached is not None:
+            age = time.time() - cached.stored_at
+            if age < policy.ttl:
+                self.cache.metrics.record(host, "hit")
+                return cached.to_response("hit")
+            if age < policy.ttl + policy.stale_while_revalidate:
+                self.cache.metrics.record(host, "stale")
+                with self._lock:
+                    start = key not in self._revalidating
+                    self._revalidating.add(key)
+                if start:
+                    self._executor.submit(self._revalidate, request, key, cached)
+                return cached.to_response("stale")
+
+        self.cache.metrics.record(host, "miss")
+        return self._fetch(request, key, cached)
+
+    def _fetch(
+        self, request: httpx.Request, key: str, cached: CachedResponse | None
+    ) -> httpx.Response:
+        response = self._transport.handle_request(
+            _revalidation_request(request, cached)
+        )
+        if response.status_code == 304 and cached is not None:
+            response.close()
+            self.cache.mark_revalidated(key)
+            self.cache.metrics.record(request.url.host, "revalidated")
+            return cached.to_response("revalidated")
+
+        try:
+            # The transport-level stream yields the raw, still-encoded bytes.
+            body = b"".join(response.stream)
+        finally:
+            response.close()
+        self.cache.store(key, request.url.host, response, body)
+        return httpx.Response(
+            response.status_code,
+            headers=response.headers,
+            stream=httpx.ByteStream(body),
+            extensions={**response.extensions, "airas_cache": "miss"},
+        )
+
+    def _revalidate(
+        self, request: httpx.Request, key: str, cached: CachedResponse
+    ) -> None:
+        try:
+            self._fetch(request, key, cached).close()
+        except Exception as e:
+            logger.warning(f"Background revalidation of {request.url} failed: {e}")
+        finally:
+            with self._lock:
+                self._revalidating.discard(key)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._transport.close()
+
+
+class AsyncCachingTransport(httpx.AsyncBaseTransport):
+    def __init__(
+        self, cache: HttpCache, transport: httpx.AsyncBaseTransport | None = None
+    ) -> None:
+        self.cache = cache
+        self._transport = transport or httpx.AsyncHTTPTransport()
+        self._revalidating: dict[str, asyncio.Task[None]] = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        policy = self.cache.policy_for(request)
+        if policy is None:
+            return await self._transport.handle_async_request(request)
+
+        host = request.url.host
+        key = self.cache.key_for(request)
+        # SQLite reads of multi-megabyte bodies should not stall the event loop.
+        cached = await asyncio.to_thread(self.cache.lookup, key)
+        if cached is not None:
+            age = time.time() - cached.stored_at
+            if age < policy.ttl:
+                self.cache.metrics.record(host, "hit")
+                return cached.to_response("hit")
+            if age < policy.ttl + policy.stale_while_revalidate:
+                self.cache.metrics.record(host, "stale")
+                if key not in self._revalidating:
+                    task = asyncio.create_task(self._revalidate(request, key, cached))
+                    self._revalidating[key] = task
+                    task.add_done_callback(lambda _: self._revalidating.pop(key, None))
+                return cached.to_response("stale")
+
+        self.cache.metrics.record(host, "miss")
+        return await self._fetch(request, key, cached)
+
+    async def _fetch(
+        self, request: httpx.Request, key: str, cached: CachedResponse | None
+    ) -> httpx.Response:
+        response = await self._transport.handle_async_request(
+            _revalidation_request(request, cached)
+        )
+        if response.status_code == 304 and cached is not None:
+            await response.aclose()
+            await asyncio.to_thread(self.cache.mark_revalidated, key)
+            self.cache.metrics.record(request.url.host, "revalidated")
+            return cached.to_response("revalidated")
+
+        try:
+            body = b"".join([chunk async for chunk in response.stream])
+        finally:
+            await response.aclose()
+        await asyncio.to_thread(self.cache.store, key, request.url.host, response, body)
+        return httpx.Response(
+            response.status_code,
+            headers=response.headers,
+            stream=httpx.ByteStream(body),
+            extensions={**response.extensions, "airas_cache": "miss"},
+        )
+
+    async def _revalidate(
+        self, request: httpx.Request, key: str, cached: CachedResponse
+    ) -> None:
+        try:
+            await (await self._fetch(request, key, cached)).aclose()
+        except Exception as e:
+            logger.warning(f"Background revalidation of {request.url} failed: {e}")
+
+    async def aclose(self) -> None:
+        for task in list(self._revalidating.values()):
+            task.cancel()
+        await self._transport.aclose()
+
+
+def _policies_from_env() -> dict[str, HostCachePolicy]:
+    """Defaults merged with ``AIRAS_HTTP_CACHE_POLICIES``.
+
+    The variable holds JSON such as
+    ``{"api.openalex.org": {"ttl": 3600, "stale_while_revalidate": 86400}}``;
+    a ``null`` policy stops caching that host.
+    """
+    policies = dict(DEFAULT_HOST_POLICIES)
+    raw = os.getenv("AIRAS_HTTP_CACHE_POLICIES")
+    if not raw:
+        return policies
+    for host, policy in json.loads(raw).items():
+        if policy is None:
+            policies.pop(host, None)
+        else:
+            policies[host] = HostCachePolicy(**policy)
+    return policies
+
+
+@cache
+def shared_http_cache() -> HttpCache | None:
+    """The process-wide cache, or ``None`` unless ENABLE_HTTP_CACHE=true.
+
+    One instance per process keeps the metrics in one place.
+    """
+    if os.getenv("ENABLE_HTTP_CACHE", "false").lower() != "true":
+        return None
+    return HttpCache(
+        SqliteBlobStore.from_env(
+            "AIRAS_HTTP_CACHE", DEFAULT_HTTP_CACHE_PATH, DEFAULT_MAX_MB
+        ),
+        policies=_policies_from_env(),
+    )
@@ -0,0 +1,131 @@
+"""The one place AIRAS builds httpx sessions.
+
+Every session gets the same tuned connection pool, keep-alive expiry and
+HTTP/2 (negotiated through ALPN, so hosts that only speak HTTP/1.1 such as
+export.arxiv.org keep working), and optionally sits on top of the on-disk
+response cache. Code without an injected session should use
+``shared_async_session`` / ``shared_sync_session`` instead of opening a
+throwaway client, so repeated requests to the same host reuse connections and
+skip the TCP and TLS handshakes. Sessions also carry the telemetry event hooks
+from ``infra/http_telemetry.py``.
+
+Pool settings come from the environment:
+
+- ``AIRAS_HTTP_MAX_CONNECTIONS`` (default 100)
+- ``AIRAS_HTTP_MAX_KEEPALIVE_CONNECTIONS`` (default 20)
+- ``AIRAS_HTTP_KEEPALIVE_EXPIRY`` seconds (default 60)
+- ``AIRAS_HTTP2`` ("true" by default)
+"""
+
+import asyncio
+import os
+import threading
+from dataclasses import dataclass
+from functools import cache
+from typing import Any
+from weakref import WeakKeyDictionary
+
+import httpx
+
+from airas.infra.http_cache import (
+    AsyncCachingTransport,
+    CachingTransport,
+    HttpCache,
+    shared_http_cache,
+)
+from airas.infra.http_telemetry import (
+    ASYNC_EVENT_HOOKS,
+    SYNC_EVENT_HOOKS,
+    AsyncTracingTransport,
+    TracingTransport,
+)
+
+
+@dataclass(frozen=True)
+class SessionSettings:
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 60.0
+    http2: bool = True
+
+    @property
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+
+@cache
+def session_settings() -> SessionSettings:
+    return SessionSettings(
+        max_connections=int(os.getenv("AIRAS_HTTP_MAX_CONNECTIONS", "100")),
+        max_keepalive_connections=int(
+            os.getenv("AIRAS_HTTP_MAX_KEEPALIVE_CONNECTIONS", "20")
+        ),
+        keepalive_expiry=float(os.getenv("AIRAS_HTTP_KEEPALIVE_EXPIRY", "60")),
+        http2=os.getenv("AIRAS_HTTP2", "true").lower() == "true",
+    )
+
+
+def create_sync_session(
+    *,
+    http_cache: HttpCache | None = None,
+    settings: SessionSettings | None = None,
+    **kwargs: Any,
+) -> httpx.Client:
+    settings = settings or session_settings()
+    transport: httpx.BaseTransport = httpx.HTTPTransport(
+        http2=settings.http2, limits=settings.limits
+    )
+    if http_cache is not None:
+        transport = CachingTransport(http_cache, transport)
+    kwargs.setdefault("follow_redirects", True)
+    kwargs.setdefault("event_hooks", SYNC_EVENT_HOOKS)
+    return httpx.Client(transport=TracingTransport(transport), **kwargs)
+
+
+def create_async_session(
+    *,
+    http_cache: HttpCache | None = None,
+    settings: SessionSettings | None = None,
+    **kwargs: Any,
+) -> httpx.AsyncClient:
+    settings = settings or session_settings()
+    transport: httpx.AsyncBaseTransport = httpx.AsyncHTTPTransport(
+        http2=settings.http2, limits=settings.limits
+    )
+    if http_cache is not None:
+        transport = AsyncCachingTransport(http_cache, transport)
+    kwargs.setdefault("follow_redirects", True)
+    kwargs.setdefault("event_hooks", ASYNC_EVENT_HOOKS)
+    return httpx.AsyncClient(transport=AsyncTracingTransport(transport), **kwargs)
+
+
+_shared_sync_lock = threading.Lock()
+_shared_sync_session: httpx.Client | None = None
+# An AsyncClient's connection pool belongs to the loop that opened it, so the
+# dashboard loop and each worker thread's loop get their own shared session.
+_shared_async_sessions: WeakKeyDictionary[
+    asyncio.AbstractEventLoop, httpx.AsyncClient
+] = WeakKeyDictionary()
+
+
+def shared_sync_session() -> httpx.Client:
+    """Process-wide cached session for code without an injected one."""
+    global _shared_sync_session
+    with _shared_sync_lock:
+        if _shared_sync_session is None:
+            _shared_sync_session = create_sync_session(http_cache=shared_http_cache())
+        return _shared_sync_session
+
+
+def shared_async_session() -> httpx.AsyncClient:
+    """Cached session for the running event loop, for code without one injected."""
+    loop = asyncio.get_running_loop()
+    session = _shared_async_sessions.get(loop)
+    if session is None or session.is_closed:
+        session = create_async_session(http_cache=shared_http_cache())
+        _shared_async_sessions[loop] = session
+    return session
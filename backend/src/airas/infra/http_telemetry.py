@@ -0,0 +1,469 @@
+"""Client-side HTTP telemetry for every outbound session.
+
+Sessions built by ``infra/http_session.py`` carry httpx event hooks that record,
+per host and endpoint template, request latency histograms, status codes,
+bytes received and the rate-limit headroom reported by the upstream. The
+tenacity retry policies add retry counts. ``render_prometheus`` exposes it all
+(together with the response cache and GET coalescing counters) in the
+Prometheus text format, and ``summarize`` ranks upstreams by the wall time
+they consumed. Each request is also traced as a client span under the
+current node span (see ``core/tracing.py``). The span ends when the response
+body is closed, so nothing is buffered for it; ``TracingTransport`` ends it
+with an error when the request fails without a response.
+
+Endpoint templates replace ids, owners, repositories, paths and other
+unbounded segments with placeholders so that the label sets stay small.
+"""
+
+import re
+import threading
+from bisect import bisect_left
+from collections import defaultdict
+from collections.abc import AsyncIterator, Iterator
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+import httpx
+from tenacity import RetryCallState
+
+from airas.core.tracing import TRACER, Span
+from airas.infra.http_cache import shared_http_cache
+
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+_HOST_TEMPLATES: dict[str, list[tuple[re.Pattern[str], str]]] = {
+    "api.github.com": [
+        (re.compile(r"^/repos/[^/]+/[^/]+"), "/repos/{owner}/{repo}"),
+        (re.compile(r"/contents/.*$"), "/contents/{path}"),
+        (re.compile(r"/(branches|heads)/.*$"), r"/\1/{branch}"),
+        (re.compile(r"^/users/[^/]+"), "/users/{user}"),
+    ],
+    "raw.githubusercontent.com": [
+        (re.compile(r"^/[^/]+/[^/]+/[^/]+/.*$"), "/{owner}/{repo}/{ref}/{path}"),
+    ],
+    "huggingface.co": [
+        (re.compile(r"^/api/(models|datasets)/[^/]+/[^/]+"), r"/api/\1/{repo}"),
+        (re.compile(r"^/(datasets/)?[^/]+/[^/]+/resolve/.*$"), r"/\1{repo}/resolve"),
+    ],
+    "arxiv.org": [(re.compile(r"^/(pdf|abs)/.*$"), r"/\1/{id}")],
+    "api.semanticscholar.org": [
+        (re.compile(r"/paper/(?!search$|batch$)[^/]+"), "/paper/{id}"),
+    ],
+    "api.openalex.org": [(re.compile(r"^/(works|authors)/[^/]+"), r"/\1/{id}")],
+}
+_ID_SEGMENT = re.compile(
+    r"^(\d+|[0-9a-f]{7,40}|[0-9a-f-]{36}|\d{4}\.\d{4,5}(v\d+)?)$", re.IGNORECASE
+)
+
+
+def endpoint_template(url: httpx.URL) -> str:
+    path = url.path or "/"
+    for pattern, replacement in _HOST_TEMPLATES.get(url.host, []):
+        path = pattern.sub(replacement, path)
+    return "/".join(
+        "{id}" if _ID_SEGMENT.match(segment) else segment for segment in path.split("/")
+    )
+
+
+@dataclass
+class _Histogram:
+    buckets: list[int] = field(default_factory=lambda: [0] * len(LATENCY_BUCKETS))
+    count: int = 0
+    total: float = 0.0
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(LATENCY_BUCKETS, value)
+        if index < len(self.buckets):
+            self.buckets[index] += 1
+        self.count += 1
+        self.total += value
+
+
+class HttpTelemetry:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # (host, endpoint, method) -> latency histogram
+        self._latency: defaultdict[tuple[str, str, str], _Histogram] = defaultdict(
+            _Histogram
+        )
+        # (host, endpoint, method, status, cache outcome) -> responses
+        self._responses: defaultdict[tuple[str, str, str, str, str], int] = defaultdict(
+            int
+        )
+        # (host, endpoint) -> bytes received
+        self._bytes: defaultdict[tuple[str, str], int] = defaultdict(int)
+        # (host, error type) -> transport errors
+        self._errors: defaultdict[tuple[str, str], int] = defaultdict(int)
+        # (function, error type) -> retries
+        self._retries: defaultdict[tuple[str, str], int] = defaultdict(int)
+        # (host, resource) -> (remaining, limit)
+        self._rate_limits: dict[tuple[str, str], tuple[float, float | None]] = {}
+
+    def record_response(self, response: httpx.Response, elapsed: float) -> None:
+        request = response.request
+        host = request.url.host
+        endpoint = endpoint_template(request.url)
+        # Set by the response cache; hits and stale hits transfer nothing.
+        cache = response.extensions.get("airas_cache", "none")
+        if cache in ("hit", "stale"):
+            num_bytes = 0
+        else:
+            # Bytes the caller read off the stream, so unread bodies count as 0.
+            num_bytes = response.num_bytes_downloaded
+        with self._lock:
+            self._latency[(host, endpoint, request.method)].observe(elapsed)
+            status = str(response.status_code)
+            self._responses[(host, endpoint, request.method, status, cache)] += 1
+            self._bytes[(host, endpoint)] += num_bytes
+            remaining = response.headers.get(
+                "X-RateLimit-Remaining"
+            ) or response.headers.get("RateLimit-Remaining")
+            if remaining is not None:
+                limit = response.headers.get(
+                    "X-RateLimit-Limit"
+                ) or response.headers.get("RateLimit-Limit")
+                resource = response.headers.get("X-RateLimit-Resource", "default")
+                try:
+                    self._rate_limits[(host, resource)] = (
+                        float(remaining),
+                        float(limit) if limit is not None else None,
+                    )
+                except ValueError:
+                    pass
+
+    def record_error(self, url: str | httpx.URL, error: BaseException) -> None:
+        with self._lock:
+            self._errors[(httpx.URL(url).host, type(error).__name__)] += 1
+
+    def record_retry(self, retry_state: RetryCallState) -> None:
+        fn = retry_state.fn
+        name = getattr(fn, "__qualname__", repr(fn))
+        outcome = retry_state.outcome
+        error = (
+            type(outcome.exception()).__name__
+            if outcome is not None and outcome.failed
+            else "result"
+        )
+        with self._lock:
+            self._retries[(name, error)] += 1
+
+    def summarize(self, top: int = 15) -> dict[str, Any]:
+        """Per-host totals plus the endpoints that consumed the most time."""
+        with self._lock:
+            latency = {key: (h.count, h.total) for key, h in self._latency.items()}
+            bytes_ = dict(self._bytes)
+            errors = dict(self._errors)
+            retries = dict(self._retries)
+            rate_limits = dict(self._rate_limits)
+
+        hosts: defaultdict[str, dict[str, float]] = defaultdict(
+            lambda: {"requests": 0, "seconds": 0.0, "bytes": 0, "errors": 0}
+        )
+        for (host, _, _), (count, total) in latency.items():
+            hosts[host]["requests"] += count
+            hosts[host]["seconds"] += total
+        for (host, _), n in bytes_.items():
+            hosts[host]["bytes"] += n
+        for (host, _), n in errors.items():
+            hosts[host]["errors"] += n
+
+        endpoints = sorted(latency.items(), key=lambda item: -item[1][1])[:top]
+        return {
+            "hosts": dict(sorted(hosts.items(), key=lambda item: -item[1]["seconds"])),
+            "top_endpoints": [
+                {
+                    "host": host,
+                    "endpoint": endpoint,
+                    "method": method,
+                    "requests": count,
+                    "seconds": round(total, 3),
+                    "mean_seconds": round(total / count, 3) if count else 0.0,
+                }
+                for (host, endpoint, method), (count, total) in endpoints
+            ],
+            "retries": [
+                {"function": fn, "error": error, "count": n}
+                for (fn, error), n in sorted(retries.items(), key=lambda i: -i[1])
+            ],
+            "rate_limits": [
+                {"host": host, "resource": resource, "remaining": rem, "limit": lim}
+                for (host, resource), (rem, lim) in rate_limits.items()
+            ],
+        }
+
+    def render_prometheus(self) -> str:
+        # base_http_client records transport errors here; import lazily.
+        from airas.infra.base_http_client import GET_COALESCING_METRICS
+
+        with self._lock:
+            latency = {
+                key: (list(h.buckets), h.count, h.total)
+                for key, h in self._latency.items()
+            }
+            responses = dict(self._responses)
+            bytes_ = dict(self._bytes)
+            errors = dict(self._errors)
+            retries = dict(self._retries)
+            rate_limits = dict(self._rate_limits)
+
+        lines: list[str] = []
+
+        def family(name: str, kind: str, help_: str) -> None:
+            lines.append(f"# HELP {name} {help_}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        family(
+            "airas_http_request_duration_seconds",
+            "histogram",
+            "Outbound HTTP request latency.",
+        )
+        for (host, endpoint, method), (buckets, count, total) in latency.items():
+            labels = _labels(host=host, endpoint=endpoint, method=method)
+            cumulative = 0
+            for bound, n in zip(LATENCY_BUCKETS, buckets, strict=True):
+                cumulative += n
+                lines.append(
+                    "airas_http_request_duration_seconds_bucket"
+                    f"{_labels(host=host, endpoint=endpoint, method=method, le=bound)}"
+                    f" {cumulative}"
+                )
+            lines.append(
+                "airas_http_request_duration_seconds_bucket"
+                f"{_labels(host=host, endpoint=endpoint, method=method, le='+Inf')}"
+                f" {count}"
+            )
+            lines.append(f"airas_http_request_duration_seconds_sum{labels} {total}")
+            lines.append(f"airas_http_request_duration_seconds_count{labels} {count}")
+
+        family("airas_http_responses_total", "counter", "Responses by status code.")
+        for (host, endpoint, method, status, cache), n in responses.items():
+            labels = _labels(
+                host=host, endpoint=endpoint, method=method, status=status, cache=cache
+            )
+            lines.append(f"airas_http_responses_total{labels} {n}")
+
+        family("airas_http_response_bytes_total", "counter", "Response bytes received.")
+        for (host, endpoint), n in bytes_.items():
+            labels = _labels(host=host, endpoint=endpoint)
+            lines.append(f"airas_http_response_bytes_total{labels} {n}")
+
+        family(
+            "airas_http_transport_errors_total",
+            "counter",
+            "Requests that failed without a response.",
+        )
+        for (host, error), n in errors.items():
+            lines.append(
+                f"airas_http_transport_errors_total{_labels(host=host, error=error)} {n}"
+            )
+
+        family("airas_http_retries_total", "counter", "Retries by retry policy.")
+        for (fn, error), n in retries.items():
+            lines.append(
+                f"airas_http_retries_total{_labels(function=fn, error=error)} {n}"
+            )
+
+        family(
+            "airas_http_rate_limit_remaining",
+            "gauge",
+            "Last X-RateLimit-Remaining reported by the upstream.",
+        )
+        for (host, resource), (remaining, _) in rate_limits.items():
+            labels = _labels(host=host, resource=resource)
+            lines.append(f"airas_http_rate_limit_remaining{labels} {remaining}")
+        family(
+            "airas_http_rate_limit_limit",
+            "gauge",
+            "Last X-RateLimit-Limit reported by the upstream.",
+        )
+        for (host, resource), (_, limit) in rate_limits.items():
+            if limit is not None:
+                labels = _labels(host=host, resource=resource)
+                lines.append(f"airas_http_rate_limit_limit{labels} {limit}")
+
+        if (http_cache := shared_http_cache()) is not None:
+            family(
+                "airas_http_cache_events_total",
+                "counter",
+                "Response cache outcomes (hit, stale, miss, revalidated, evicted).",
+            )
+            for host, outcomes in http_cache.metrics.snapshot().items():
+                for outcome, n in outcomes.items():
+                    labels = _labels(host=host, outcome=outcome)
+                    lines.append(f"airas_http_cache_events_total{labels} {n}")
+
+        family(
+            "airas_http_coalesced_requests_total",
+            "counter",
+            "GETs served by an identical request already in flight.",
+        )
+        for client, counts in GET_COALESCING_METRICS.snapshot().items():
+            labels = _labels(client=client)
+            lines.append(
+                f"airas_http_coalesced_requests_total{labels} {counts['coalesced']}"
+            )
+
+        return "\n".join(lines) + "\n"
+
+
+def _labels(**labels: object) -> str:
+    def escape(value: object) -> str:
+        return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+    return "{" + ",".join(f'{k}="{escape(v)}"' for k, v in labels.items()) + "}"
+
+
+HTTP_TELEMETRY = HttpTelemetry()
+
+_SPAN = "airas_span"
+
+
+def count_retries(
+    before_sleep: Callable[[RetryCallState], None],
+) -> Callable[[RetryCallState], None]:
+    """Wrap a tenacity ``before_sleep`` callback so the retry is also counted."""
+
+    def _before_sleep(retry_state: RetryCallState) -> None:
+        HTTP_TELEMETRY.record_retry(retry_state)
+        before_sleep(retry_state)
+
+    return _before_sleep
+
+
+def _on_request(request: httpx.Request) -> None:
+    # A client span under the current node span; ended when the response body
+    # is closed, or by the tracing transport when no response arrives.
+    request.extensions[_SPAN] = TRACER.start_span(
+        f"{request.method} {request.url.host}",
+        kind="client",
+        attributes={
+            "http.request.method": request.method,
+            "server.address": request.url.host,
+            "url.template": endpoint_template(request.url),
+        },
+    )
+
+
+def _finish(response: httpx.Response) -> None:
+    span: Span | None = response.request.extensions.pop(_SPAN, None)
+    if span is None:
+        return
+    span.set_attributes(
+        **{
+            "http.response.status_code": response.status_code,
+            "airas.cache": response.extensions.get("airas_cache"),
+        }
+    )
+    if response.status_code >= 400 and span.error is None:
+        span.error = f"HTTP {response.status_code}"
+    TRACER.end_span(span)
+    HTTP_TELEMETRY.record_response(response, span.duration)
+
+
+def _fail(request: httpx.Request, error: BaseException) -> None:
+    span: Span | None = request.extensions.get(_SPAN)
+    if span is not None:
+        span.record_error(error)
+
+
+class _TracedStream(httpx.SyncByteStream):
+    """Ends the response's span once its body has been read or closed."""
+
+    def __init__(self, stream: httpx.SyncByteStream, response: httpx.Response):
+        self._stream = stream
+        self._response = response
+
+    def __iter__(self) -> Iterator[bytes]:
+        try:
+            yield from self._stream
+        except Exception as e:
+            _fail(self._response.request, e)
+            raise
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            _finish(self._response)
+
+
+class _AsyncTracedStream(httpx.AsyncByteStream):
+    def __init__(self, stream: httpx.AsyncByteStream, response: httpx.Response):
+        self._stream = stream
+        self._response = response
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        try:
+            async for chunk in self._stream:
+                yield chunk
+        except Exception as e:
+            _fail(self._response.request, e)
+            raise
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            _finish(self._response)
+
+
+def _on_response(response: httpx.Response) -> None:
+    # Ending the span when the body is closed makes the latency cover the whole
+    # body, without reading (and buffering) a body the caller may be streaming.
+    if isinstance(response.stream, httpx.SyncByteStream):
+        response.stream = _TracedStream(response.stream, response)
+
+
+async def _aon_request(request: httpx.Request) -> None:
+    _on_request(request)
+
+
+async def _aon_response(response: httpx.Response) -> None:
+    if isinstance(response.stream, httpx.AsyncByteStream):
+        response.stream = _AsyncTracedStream(response.stream, response)
+
+
+class TracingTransport(httpx.BaseTransport):
+    """Ends the request's span with an error when the transport raises.
+
+    httpx runs no event hook for a request that fails without a response.
+    """
+
+    def __init__(self, transport: httpx.BaseTransport) -> None:
+        self._transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        try:
+            return self._transport.handle_request(request)
+        except Exception as e:
+            _end_failed(request, e)
+            raise
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncTracingTransport(httpx.AsyncBaseTransport):
+    def __init__(self, transport: httpx.AsyncBaseTransport) -> None:
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        try:
+            return await self._transport.handle_async_request(request)
+        except Exception as e:
+            _end_failed(request, e)
+            raise
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def _end_failed(request: httpx.Request, error: BaseException) -> None:
+    span: Span | None = request.extensions.pop(_SPAN, None)
+    if span is not None:
+        span.record_error(error)
+        TRACER.end_span(span)
+
+
+SYNC_EVENT_HOOKS = {"request": [_on_request], "response": [_on_response]}
+ASYNC_EVENT_HOOKS = {"request": [_aon_request], "response": [_aon_response]}
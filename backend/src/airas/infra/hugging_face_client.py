@@ -1,10 +1,13 @@
+import asyncio
 import os
+from collections.abc import Sequence
 from logging import getLogger
 from typing import Any, Literal
 
 import httpx
 
 from airas.infra.base_http_client import BaseHTTPClient
+from airas.infra.hf_repo_cache import HuggingFaceRepoCache
 from airas.infra.response_parser import ResponseParser
 from airas.infra.retry_policy import make_retry_policy, raise_for_status
 
@@ -13,6 +16,43 @@ logger = getLogger(__name__)
 HF_RETRY = make_retry_policy()
 HF_RESOURCE_TYPE = Literal["models", "datasets"]
 
+# Fields requested through the search endpoint's ``expand`` parameter, so one
+# search call returns what a per-repo details call would. With ``expand`` the
+# Hub returns only these fields (plus ``id``).
+HF_SEARCH_EXPAND: dict[HF_RESOURCE_TYPE, tuple[str, ...]] = {
+    "models": (
+        "author",
+        "sha",
+        "createdAt",
+        "lastModified",
+        "private",
+        "gated",
+        "disabled",
+        "downloads",
+        "likes",
+        "siblings",
+        "cardData",
+        "tags",
+        "pipeline_tag",
+        "library_name",
+        "model-index",
+    ),
+    "datasets": (
+        "author",
+        "sha",
+        "createdAt",
+        "lastModified",
+        "private",
+        "gated",
+        "disabled",
+        "downloads",
+        "likes",
+        "siblings",
+        "cardData",
+        "tags",
+    ),
+}
+
 
 # https://huggingface.co/docs/hub/api
 class HuggingFaceClient(BaseHTTPClient):
@@ -22,6 +62,8 @@ class HuggingFaceClient(BaseHTTPClient):
         default_headers: dict[str, str] | None = None,
         sync_session: httpx.Client | None = None,
         async_session: httpx.AsyncClient | None = None,
+        hub_url: str = "https://huggingface.co",
+        repo_cache: HuggingFaceRepoCache | None = None,
     ):
         # HuggingFace API token is optional for public models/datasets
         api_key = os.getenv("HF_TOKEN")
@@ -38,6 +80,46 @@ class HuggingFaceClient(BaseHTTPClient):
             async_session=async_session,
         )
         self._parser = ResponseParser()
+        self.hub_url = hub_url.rstrip("/")
+        # Metadata and READMEs pinned to a commit sha (see hf_repo_cache).
+        self.repo_cache = repo_cache
+
+    @staticmethod
+    def _search_params(
+        search_query: str, limit: int, sort: str, expand: Sequence[str] | None
+    ) -> dict[str, Any]:
+        params: dict[str, Any] = {
+            "limit": limit,
+            "sort": sort,
+        }
+        if search_query:
+            params["search"] = search_query
+        if expand:
+            params["expand"] = list(expand)
+        return params
+
+    def _readme_url(
+        self, search_type: HF_RESOURCE_TYPE, item_id: str, revision: str
+    ) -> str:
+        prefix = "" if search_type == "models" else f"/{search_type}"
+        return f"{self.hub_url}{prefix}/{item_id}/resolve/{revision}/README.md"
+
+    def _parse_readme(
+        self, response: httpx.Response, search_type: HF_RESOURCE_TYPE, item_id: str
+    ) -> str:
+        if response.status_code == 404:
+            logger.warning(f"README not found for {search_type[:-1]}: {item_id}")
+            return ""
+
+        raise_for_status(response, path=f"get_{search_type[:-1]}_readme")
+        return response.text
+
+    def _remember_metadata(self, search_type: HF_RESOURCE_TYPE, items: Any) -> None:
+        if self.repo_cache is None:
+            return
+        for item in items if isinstance(items, list) else [items]:
+            if isinstance(item, dict) and item.get("id") and item.get("sha"):
+                self.repo_cache.put_metadata(search_type, item["id"], item["sha"], item)
 
     @HF_RETRY
     def search(
@@ -47,17 +129,15 @@ class HuggingFaceClient(BaseHTTPClient):
         limit: int = 10,
         sort: str = "downloads",
         timeout: float = 30.0,
+        expand: Sequence[str] | None = None,
     ) -> dict[str, Any]:
-        params = {
-            "limit": limit,
-            "sort": sort,
-        }
-        if search_query:
-            params["search"] = search_query
-
+        params = self._search_params(search_query, limit, sort, expand)
         response = self.get(path=f"/{search_type}", params=params, timeout=timeout)
         raise_for_status(response, path=f"search_{search_type}")
-        return self._parser.parse(response, as_="json")
+        results = self._parser.parse(response, as_="json")
+        if expand:
+            self._remember_metadata(search_type, results)
+        return results
 
     @HF_RETRY
     def get_details(
@@ -65,10 +145,18 @@ class HuggingFaceClient(BaseHTTPClient):
         search_type: HF_RESOURCE_TYPE,
         item_id: str,
         timeout: float = 30.0,
+        sha: str | None = None,
     ) -> dict[str, Any]:
+        if sha and self.repo_cache is not None:
+            if (
+                cached := self.repo_cache.get_metadata(search_type, item_id, sha)
+            ) is not None:
+                return cached
         response = self.get(path=f"/{search_type}/{item_id}", timeout=timeout)
         raise_for_status(response, path=f"get_{search_type[:-1]}_info")
-        return self._parser.parse(response, as_="json")
+        details = self._parser.parse(response, as_="json")
+        self._remember_metadata(search_type, details)
+        return details
 
     @HF_RETRY
     def get_readme(
@@ -76,22 +164,21 @@ class HuggingFaceClient(BaseHTTPClient):
         search_type: HF_RESOURCE_TYPE,
         item_id: str,
         timeout: float = 30.0,
+        sha: str | None = None,
     ) -> str:
-        if search_type == "models":
-            readme_url = f"https://huggingface.co/{item_id}/resolve/main/README.md"
-        else:  # datasets
-            readme_url = (
-                f"https://huggingface.co/{search_type}/{item_id}/resolve/main/README.md"
-            )
-
+        """README at commit ``sha`` (served from the repo cache), else at main."""
+        if sha and self.repo_cache is not None:
+            if (
+                cached := self.repo_cache.get_readme(search_type, item_id, sha)
+            ) is not None:
+                return cached
+
+        readme_url = self._readme_url(search_type, item_id, sha or "main")
         response = self.get(path="", full_url=readme_url, timeout=timeout)
-
-        if response.status_code == 404:
-            logger.warning(f"README not found for {search_type[:-1]}: {item_id}")
-            return ""
-
-        raise_for_status(response, path=f"get_{search_type[:-1]}_readme")
-        return response.text
+        readme = self._parse_readme(response, search_type, item_id)
+        if sha and self.repo_cache is not None:
+            self.repo_cache.put_readme(search_type, item_id, sha, readme)
+        return readme
 
     # Async methods
     @HF_RETRY
@@ -102,19 +189,17 @@ class HuggingFaceClient(BaseHTTPClient):
         limit: int = 10,
         sort: str = "downloads",
         timeout: float = 30.0,
+        expand: Sequence[str] | None = None,
     ) -> dict[str, Any]:
-        params = {
-            "limit": limit,
-            "sort": sort,
-        }
-        if search_query:
-            params["search"] = search_query
-
+        params = self._search_params(search_query, limit, sort, expand)
         response = await self.aget(
             path=f"/{search_type}", params=params, timeout=timeout
         )
         raise_for_status(response, path=f"search_{search_type}")
-        return self._parser.parse(response, as_="json")
+        results = self._parser.parse(response, as_="json")
+        if expand:
+            await asyncio.to_thread(self._remember_metadata, search_type, results)
+        return results
 
     @HF_RETRY
     async def aget_details(
@@ -122,10 +207,19 @@ class HuggingFaceClient(BaseHTTPClient):
         search_type: HF_RESOURCE_TYPE,
         item_id: str,
         timeout: float = 30.0,
+        sha: str | None = None,
     ) -> dict[str, Any]:
+        if sha and self.repo_cache is not None:
+            cached = await asyncio.to_thread(
+                self.repo_cache.get_metadata, search_type, item_id, sha
+            )
+            if cached is not None:
+                return cached
         response = await self.aget(path=f"/{search_type}/{item_id}", timeout=timeout)
         raise_for_status(response, path=f"get_{search_type[:-1]}_info")
-        return self._parser.parse(response, as_="json")
+        details = self._parser.parse(response, as_="json")
+        await asyncio.to_thread(self._remember_metadata, search_type, details)
+        return details
 
     @HF_RETRY
     async def aget_readme(
@@ -133,19 +227,21 @@ class HuggingFaceClient(BaseHTTPClient):
         search_type: HF_RESOURCE_TYPE,
         item_id: str,
         timeout: float = 30.0,
+        sha: str | None = None,
     ) -> str:
-        if search_type == "models":
-            readme_url = f"https://huggingface.co/{item_id}/resolve/main/README.md"
-        else:  # datasets
-            readme_url = (
-                f"https://huggingface.co/{search_type}/{item_id}/resolve/main/README.md"
+        """README at commit ``sha`` (served from the repo cache), else at main."""
+        if sha and self.repo_cache is not None:
+            cached = await asyncio.to_thread(
+                self.repo_cache.get_readme, search_type, item_id, sha
             )
+            if cached is not None:
+                return cached
 
+        readme_url = self._readme_url(search_type, item_id, sha or "main")
         response = await self.aget(path="", full_url=readme_url, timeout=timeout)
-
-        if response.status_code == 404:
-            logger.warning(f"README not found for {search_type[:-1]}: {item_id}")
-            return ""
-
-        raise_for_status(response, path=f"get_{search_type[:-1]}_readme")
-        return response.text
+        readme = self._parse_readme(response, search_type, item_id)
+        if sha and self.repo_cache is not None:
+            await asyncio.to_thread(
+                self.repo_cache.put_readme, search_type, item_id, sha, readme
+            )
+        return readme
@@ -0,0 +1,263 @@
+"""Durable job queue shared by the dashboard API and research workers.
+
+The API enqueues long-running jobs and returns immediately; workers (inside
+the API process or started separately with ``airas worker``) claim them,
+heartbeat while running and observe cancellation requests. A job whose worker
+stops heartbeating for ``lease_seconds`` is handed to another worker, up to
+``max_attempts`` times.
+
+``SqliteJobQueue`` is the default broker: a single SQLite file in WAL mode
+that every process on the host can share. Other brokers only need to
+implement ``JobQueueProtocol``.
+"""
+
+import json
+import sqlite3
+import time
+from collections.abc import Sequence
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Protocol, runtime_checkable
+from uuid import UUID
+
+from airas.core.types.job import ACTIVE_JOB_STATUSES, JobModel, JobStatus
+from airas.infra.sqlite_database import SqliteDatabase
+
+DEFAULT_JOB_QUEUE_PATH = ".airas/jobs.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    key TEXT,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    worker_id TEXT,
+    cancel_requested INTEGER NOT NULL DEFAULT 0,
+    error_message TEXT,
+    created_at REAL NOT NULL,
+    heartbeat_at REAL,
+    finished_at REAL
+);
+CREATE INDEX IF NOT EXISTS jobs_status_created_at ON jobs (status, created_at);
+CREATE INDEX IF NOT EXISTS jobs_key ON jobs (key);
+"""
+
+_ACTIVE = tuple(status.value for status in ACTIVE_JOB_STATUSES)
+
+
+@runtime_checkable
+class JobQueueProtocol(Protocol):
+    def enqueue(
+        self, kind: str, payload: dict[str, Any], *, key: str | None = None
+    ) -> JobModel: ...
+
+    def enqueue_if_idle(
+        self, kind: str, payload: dict[str, Any], *, key: str
+    ) -> JobModel | None: ...
+
+    def claim(self, worker_id: str, kinds: Sequence[str]) -> JobModel | None: ...
+
+    def heartbeat(self, id: UUID, worker_id: str) -> bool: ...
+
+    def finish(
+        self,
+        id: UUID,
+        worker_id: str,
+        status: JobStatus,
+        error_message: str | None = None,
+    ) -> None: ...
+
+    def release(self, id: UUID, worker_id: str) -> None: ...
+
+    def request_cancel(self, id: UUID) -> JobModel: ...
+
+    def get(self, id: UUID) -> JobModel: ...
+
+    def get_active(self, key: str) -> JobModel | None: ...
+
+
+def _to_datetime(value: float | None) -> datetime | None:
+    return datetime.fromtimestamp(value).astimezone() if value is not None else None
+
+
+def _row_to_job(row: sqlite3.Row) -> JobModel:
+    return JobModel(
+        id=UUID(row["id"]),
+        kind=row["kind"],
+        key=row["key"],
+        payload=json.loads(row["payload"]),
+        status=JobStatus(row["status"]),
+        attempts=row["attempts"],
+        worker_id=row["worker_id"],
+        cancel_requested=bool(row["cancel_requested"]),
+        error_message=row["error_message"],
+        created_at=_to_datetime(row["created_at"]),
+        heartbeat_at=_to_datetime(row["heartbeat_at"]),
+        finished_at=_to_datetime(row["finished_at"]),
+    )
+
+
+class SqliteJobQueue:
+    def __init__(
+        self,
+        path: str | Path = DEFAULT_JOB_QUEUE_PATH,
+        lease_seconds: float = 120.0,
+        max_attempts: int = 3,
+    ) -> None:
+        self.db = SqliteDatabase(path, _SCHEMA)
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+
+    def enqueue(
+        self, kind: str, payload: dict[str, Any], *, key: str | None = None
+    ) -> JobModel:
+        job = JobModel(kind=kind, key=key, payload=payload)
+        with self.db.connect() as conn:
+            conn.execute(
+                "INSERT INTO jobs (id, kind, key, payload, status, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                self._insert_params(job),
+            )
+        return job
+
+    def enqueue_if_idle(
+        self, kind: str, payload: dict[str, Any], *, key: str
+    ) -> JobModel | None:
+        """Enqueue unless a job with ``key`` is queued or running (then ``None``).
+
+        The check and the insert run in one write transaction, so of two
+        concurrent calls for the same key only one enqueues.
+        """
+        job = JobModel(kind=kind, key=key, payload=payload)
+        with self.db.transaction() as conn:
+            inserted = conn.execute(
+                "INSERT INTO jobs (id, kind, key, payload, status, created_at) "
+                "SELECT ?, ?, ?, ?, ?, ? WHERE NOT EXISTS "
+                "(SELECT 1 FROM jobs WHERE key = ? AND status IN (?, ?))",
+                (*self._insert_params(job), key, *_ACTIVE),
+            ).rowcount
+        return job if inserted else None
+
+    @staticmethod
+    def _insert_params(job: JobModel) -> tuple[Any, ...]:
+        return (
+            str(job.id),
+            job.kind,
+            job.key,
+            json.dumps(job.payload),
+            job.status.value,
+            job.created_at.timestamp(),
+        )
+
+    def _recover_stale(self, conn: sqlite3.Connection, now: float) -> None:
+        stale = (JobStatus.RUNNING.value, now - self.lease_seconds)
+        conn.execute(
+            "UPDATE jobs SET status = ?, finished_at = ?, worker_id = NULL "
+            "WHERE status = ? AND heartbeat_at < ? AND cancel_requested",
+            (JobStatus.CANCELLED.value, now, *stale),
+        )
+        conn.execute(
+            "UPDATE jobs SET status = ?, finished_at = ?, worker_id = NULL, "
+            "error_message = 'Worker stopped heartbeating' "
+            "WHERE status = ? AND heartbeat_at < ? AND attempts >= ?",
+            (JobStatus.FAILED.value, now, *stale, self.max_attempts),
+        )
+        conn.execute(
+            "UPDATE jobs SET status = ?, worker_id = NULL "
+            "WHERE status = ? AND heartbeat_at < ?",
+            (JobStatus.QUEUED.value, *stale),
+        )
+
+    def claim(self, worker_id: str, kinds: Sequence[str]) -> JobModel | None:
+        if not kinds:
+            return None
+        now = time.time()
+        placeholders = ", ".join("?" for _ in kinds)
+        with self.db.transaction() as conn:
+            self._recover_stale(conn, now)
+            row = conn.execute(
+                f"SELECT id FROM jobs WHERE status = ? AND kind IN ({placeholders}) "
+                "ORDER BY created_at LIMIT 1",
+                (JobStatus.QUEUED.value, *kinds),
+            ).fetchone()
+            if row is None:
+                return None
+            claimed = conn.execute(
+                "UPDATE jobs SET status = ?, worker_id = ?, heartbeat_at = ?, "
+                "attempts = attempts + 1 WHERE id = ? RETURNING *",
+                (JobStatus.RUNNING.value, worker_id, now, row["id"]),
+            ).fetchone()
+        return _row_to_job(claimed)
+
+    def heartbeat(self, id: UUID, worker_id: str) -> bool:
+        """Extend the lease; False means the worker should stop the job."""
+        with self.db.connect() as conn:
+            row = conn.execute(
+                "UPDATE jobs SET heartbeat_at = ? "
+                "WHERE id = ? AND worker_id = ? AND status = ? "
+                "RETURNING cancel_requested",
+                (time.time(), str(id), worker_id, JobStatus.RUNNING.value),
+            ).fetchone()
+        return row is not None and not row["cancel_requested"]
+
+    def finish(
+        self,
+        id: UUID,
+        worker_id: str,
+        status: JobStatus,
+        error_message: str | None = None,
+    ) -> None:
+        with self.db.connect() as conn:
+            conn.execute(
+                "UPDATE jobs SET status = ?, error_message = ?, finished_at = ?, "
+                "worker_id = NULL WHERE id = ? AND worker_id = ?",
+                (status.value, error_message, time.time(), str(id), worker_id),
+            )
+
+    def release(self, id: UUID, worker_id: str) -> None:
+        """Hand a running job back to the queue, e.g. on worker shutdown."""
+        with self.db.connect() as conn:
+            conn.execute(
+                "UPDATE jobs SET status = ?, worker_id = NULL "
+                "WHERE id = ? AND worker_id = ? AND status = ?",
+                (JobStatus.QUEUED.value, str(id), worker_id, JobStatus.RUNNING.value),
+            )
+
+    def request_cancel(self, id: UUID) -> JobModel:
+        """Cancel a queued job now, or flag a running one for its worker."""
+        with self.db.transaction() as conn:
+            conn.execute(
+                "UPDATE jobs SET status = ?, finished_at = ? "
+                "WHERE id = ? AND status = ?",
+                (
+                    JobStatus.CANCELLED.value,
+                    time.time(),
+                    str(id),
+                    JobStatus.QUEUED.value,
+                ),
+            )
+            row = conn.execute(
+                "UPDATE jobs SET cancel_requested = 1 WHERE id = ? RETURNING *",
+                (str(id),),
+            ).fetchone()
+        if row is None:
+            raise ValueError("job not found")
+        return _row_to_job(row)
+
+    def get(self, id: UUID) -> JobModel:
+        with self.db.connect() as conn:
+            row = conn.execute("SELECT * FROM jobs WHERE id = ?", (str(id),)).fetchone()
+        if row is None:
+            raise ValueError("job not found")
+        return _row_to_job(row)
+
+    def get_active(self, key: str) -> JobModel | None:
+        with self.db.connect() as conn:
+            row = conn.execute(
+                "SELECT * FROM jobs WHERE key = ? AND status IN (?, ?) "
+                "ORDER BY created_at DESC LIMIT 1",
+                (key, *_ACTIVE),
+            ).fetchone()
+        return _row_to_job(row) if row is not None else None
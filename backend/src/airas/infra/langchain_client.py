@@ -6,11 +6,12 @@ from typing import Any, get_args
 from botocore.config import Config
 from langchain_anthropic import ChatAnthropic
 from langchain_aws import ChatBedrockConverse
-from langchain_core.messages import BaseMessage, HumanMessage
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
 from langchain_core.messages.utils import trim_messages
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_openai import ChatOpenAI
 
+from airas.core.tracing import TRACER, Span
 from airas.core.types.llm_provider import LLMProvider
 from airas.infra.llm_provider_resolver import detect_available_providers
 from airas.infra.llm_specs import (
@@ -27,6 +28,7 @@ from airas.infra.llm_specs import (
     GoogleGenAIParams,
     LLMParams,
     OpenAIParams,
+    estimate_cost_usd,
     get_model_context_info,
 )
 from airas.infra.retry_policy import make_llm_retry_policy
@@ -36,6 +38,23 @@ logger = logging.getLogger(__name__)
 _LLM_RETRY = make_llm_retry_policy()
 
 
+def _record_usage(span: Span, llm_name: str, message: AIMessage | None) -> None:
+    usage = getattr(message, "usage_metadata", None)
+    if not usage:
+        return
+    input_tokens = usage.get("input_tokens", 0)
+    output_tokens = usage.get("output_tokens", 0)
+    span.set_attributes(
+        **{
+            "gen_ai.usage.input_tokens": input_tokens,
+            "gen_ai.usage.output_tokens": output_tokens,
+            "airas.llm.cost_usd": estimate_cost_usd(
+                llm_name, input_tokens, output_tokens
+            ),
+        }
+    )
+
+
 class MissingEnvironmentVariablesError(RuntimeError):
     def __init__(self, provider: LLMProvider, missing_vars: list[str]) -> None:
         self.provider = provider
@@ -265,7 +284,13 @@ class LangChainClient:
                 "Cannot proceed with an empty message after trimming."
             )
 
-        response = await model.ainvoke(trimmed_messages)
+        with TRACER.span(
+            f"llm {llm_name}",
+            kind="client",
+            attributes={"gen_ai.request.model": llm_name},
+        ) as span:
+            response = await model.ainvoke(trimmed_messages)
+            _record_usage(span, llm_name, response)
         content = response.content
 
         # When web_search is enabled, content may be a list of content blocks
@@ -328,11 +353,20 @@ class LangChainClient:
                 "Cannot proceed with an empty message after trimming."
             )
 
+        # include_raw keeps the AIMessage so its token usage can be traced.
         model_with_structure = model.with_structured_output(
-            schema=data_model, method="function_calling"
+            schema=data_model, method="function_calling", include_raw=True
         )
-        response = await model_with_structure.ainvoke(trimmed_messages)
-        return response
+        with TRACER.span(
+            f"llm {llm_name}",
+            kind="client",
+            attributes={"gen_ai.request.model": llm_name},
+        ) as span:
+            response = await model_with_structure.ainvoke(trimmed_messages)
+            _record_usage(span, llm_name, response["raw"])
+        if response["parsing_error"] is not None:
+            raise response["parsing_error"]
+        return response["parsed"]
 
     @property
     def available_providers(self) -> set[LLMProvider]:
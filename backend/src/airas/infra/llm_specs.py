@@ -178,3 +178,15 @@ def get_model_context_info(model_name: str) -> dict[str, int]:
         "max_input_tokens": 4096 if max_input is None else max_input,
         "max_output_tokens": 4096 if max_output is None else max_output,
     }
+
+
+def estimate_cost_usd(
+    model_name: str, input_tokens: int, output_tokens: int
+) -> float | None:
+    """Price a call from litellm's cost map; None for models it does not list."""
+    info = litellm.model_cost.get(model_name)
+    if not info:
+        return None
+    return input_tokens * (info.get("input_cost_per_token") or 0.0) + (
+        output_tokens * (info.get("output_cost_per_token") or 0.0)
+    )
@@ -1,10 +1,13 @@
+import asyncio
 import os
+from collections.abc import AsyncIterator
 from logging import getLogger
 from typing import Any, Protocol, runtime_checkable
 
 import httpx
 
 from airas.infra.base_http_client import BaseHTTPClient
+from airas.infra.politeness_scheduler import PolitenessScheduler
 from airas.infra.response_parser import ResponseParser
 from airas.infra.retry_policy import make_retry_policy, raise_for_status
 
@@ -12,6 +15,26 @@ logger = getLogger(__name__)
 
 OPENALEX_RETRY = make_retry_policy()
 
+# OpenAlex allows at most 10 requests per second per client. Shared by every
+# OpenAlexClient in the process unless one is injected, so concurrent searches
+# and harvests stay under the limit together.
+OPENALEX_MIN_INTERVAL = 0.1
+OPENALEX_SCHEDULER = PolitenessScheduler(OPENALEX_MIN_INTERVAL)
+
+# https://docs.openalex.org/api-entities/works/search-works
+DEFAULT_FIELDS = (
+    "id",
+    "doi",
+    "display_name",
+    "publication_year",
+    "publication_date",
+    "authorships",
+    "biblio",
+    "primary_location",
+    "referenced_works",
+    "related_works",
+)
+
 
 @runtime_checkable
 class ResponseParserProtocol(Protocol):
@@ -27,6 +50,7 @@ class OpenAlexClient(BaseHTTPClient):
         parser: ResponseParserProtocol | None = None,
         sync_session: httpx.Client | None = None,
         async_session: httpx.AsyncClient | None = None,
+        scheduler: PolitenessScheduler | None = None,
     ):
         api_key = os.getenv("OPENALEX_API_KEY")
         params_header = f"?api_key={api_key}" if api_key else ""
@@ -38,6 +62,7 @@ class OpenAlexClient(BaseHTTPClient):
         )
         self._parser = parser or ResponseParser()
         self._key_qs = params_header
+        self._scheduler = scheduler or OPENALEX_SCHEDULER
 
     @staticmethod
     def _build_year_filters(year: str | None) -> list[str]:
@@ -51,6 +76,53 @@ class OpenAlexClient(BaseHTTPClient):
             ]
         return [f"publication_year:{year}"]
 
+    def _search_params(
+        self,
+        query: str | None,
+        *,
+        title: str | None,
+        author: str | None,
+        year: str | None,
+        sort: str | None,
+        semantic: bool,
+        fields: tuple[str, ...] | None,
+    ) -> dict[str, Any]:
+        params: dict[str, Any] = {"select": ",".join(fields or DEFAULT_FIELDS)}
+
+        if semantic:
+            # AI-embedding search (https://api.openalex.org/works?search.semantic=).
+            # This is a paid operation and requires an API key.
+            api_key = os.getenv("OPENALEX_API_KEY")
+            if not api_key:
+                raise ValueError("OpenAlex semantic search requires OPENALEX_API_KEY.")
+            if not (query and query.strip()):
+                raise ValueError("'query' must be provided for semantic search")
+            params["search.semantic"] = query.strip()
+            params["api_key"] = api_key
+            year_filters = self._build_year_filters(year)
+            if year_filters:
+                params["filter"] = ",".join(year_filters)
+            return params
+
+        filters = []
+        if title or author:
+            if title and title.strip():
+                filters.append(f"display_name.search:{title.strip()}")
+            if author and author.strip():
+                filters.append(f"raw_author_name.search:{author.strip()}")
+        elif query and query.strip():
+            filters.append(f"default.search:{query.strip()}")
+        else:
+            raise ValueError("Either 'query' or 'title' must be provided")
+
+        filters.extend(self._build_year_filters(year))
+        params["filter"] = ",".join(filters)
+        if sort:
+            params["sort"] = sort
+        if self._key_qs:
+            params["api_key"] = os.getenv("OPENALEX_API_KEY")
+        return params
+
     @OPENALEX_RETRY
     def search_papers(
         self,
@@ -87,66 +159,120 @@ class OpenAlexClient(BaseHTTPClient):
             - If both query and title/author are provided, structured search (title/author) takes precedence
             - Either query OR title must be provided
         """
-        # https://docs.openalex.org/api-entities/works/search-works
-        DEFAULT_FIELDS = (
-            "id",
-            "doi",
-            "display_name",
-            "publication_year",
-            "publication_date",
-            "authorships",
-            "biblio",
-            "primary_location",
-            "referenced_works",
-            "related_works",
-        )
-
-        fields = fields or DEFAULT_FIELDS
-        per_page = max(1, min(per_page, 200))
-
         params: dict[str, Any] = {
             "page": page,
-            "per-page": per_page,
-            "select": ",".join(fields),
+            "per-page": max(1, min(per_page, 200)),
+            **self._search_params(
+                query,
+                title=title,
+                author=author,
+                year=year,
+                sort=sort,
+                semantic=semantic,
+                fields=fields,
+            ),
         }
 
-        if semantic:
-            # AI-embedding search (https://api.openalex.org/works?search.semantic=).
-            # This is a paid operation and requires an API key.
-            api_key = os.getenv("OPENALEX_API_KEY")
-            if not api_key:
-                raise ValueError("OpenAlex semantic search requires OPENALEX_API_KEY.")
-            if not (query and query.strip()):
-                raise ValueError("'query' must be provided for semantic search")
-            params["search.semantic"] = query.strip()
-            params["api_key"] = api_key
-            year_filters = self._build_year_filters(year)
-            if year_filters:
-                params["filter"] = ",".join(year_filters)
-        else:
-            filters = []
-            if title or author:
-                if title and title.strip():
-                    filters.append(f"display_name.search:{title.strip()}")
-                if author and author.strip():
-                    filters.append(f"raw_author_name.search:{author.strip()}")
-            elif query and query.strip():
-                filters.append(f"default.search:{query.strip()}")
-            else:
-                raise ValueError("Either 'query' or 'title' must be provided")
-
-            filters.extend(self._build_year_filters(year))
-            params["filter"] = ",".join(filters)
-            if sort:
-                params["sort"] = sort
-            if self._key_qs:
-                params["api_key"] = os.getenv("OPENALEX_API_KEY")
-
+        self._scheduler.wait_sync()
         path = "works"
         resp = self.get(path=path, params=params, timeout=timeout)
         raise_for_status(resp, path=path)
         return self._parser.parse(resp, as_="json")
 
+    @OPENALEX_RETRY
+    async def _aget_works_page(
+        self, params: dict[str, Any], timeout: float
+    ) -> dict[str, Any]:
+        await self._scheduler.wait()
+        path = "works"
+        resp = await self.aget(path=path, params=params, timeout=timeout)
+        raise_for_status(resp, path=path)
+        return self._parser.parse(resp, as_="json")
+
+    async def aiter_works(
+        self,
+        query: str | None = None,
+        *,
+        title: str | None = None,
+        author: str | None = None,
+        year: str | None = None,
+        max_results: int | None = None,
+        per_page: int = 200,
+        sort: str | None = "relevance_score:desc",
+        fields: tuple[str, ...] | None = None,
+        timeout: float = 30.0,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """
+        Yield pages of works matching a search, following OpenAlex cursors.
+
+        Cursor paging reaches past the 10,000-result limit of ``page`` paging
+        and needs no page arithmetic. Stops after ``max_results`` works (the
+        last page may run over) or when the results run out. Only ``fields``
+        are returned (``select``), so ask for just what the caller reads.
+        """
+        # https://docs.openalex.org/how-to-use-the-api/get-lists-of-entities/paging#cursor-paging
+        params = self._search_params(
+            query,
+            title=title,
+            author=author,
+            year=year,
+            sort=sort,
+            semantic=False,
+            fields=fields,
+        )
+        params["per-page"] = max(1, min(per_page, 200))
+        if max_results is not None:
+            params["per-page"] = max(1, min(params["per-page"], max_results))
+
+        cursor: str | None = "*"
+        fetched = 0
+        while cursor:
+            data = await self._aget_works_page({**params, "cursor": cursor}, timeout)
+            results = data.get("results", [])
+            if not results:
+                return
+            yield results
+            fetched += len(results)
+            if max_results is not None and fetched >= max_results:
+                return
+            cursor = data.get("meta", {}).get("next_cursor")
+
+    async def aharvest_works(
+        self,
+        queries: list[str],
+        *,
+        year: str | None = None,
+        max_results_per_query: int = 200,
+        fields: tuple[str, ...] | None = None,
+        max_concurrency: int = 4,
+    ) -> dict[str, list[dict[str, Any]]]:
+        """
+        Cursor-page through several searches concurrently.
+
+        Requests of all queries share the client's rate limiter. A query
+        whose search fails is logged and maps to the works fetched before the
+        failure, so one bad query does not cost the others.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def harvest(query: str) -> list[dict[str, Any]]:
+            works: list[dict[str, Any]] = []
+            async with semaphore:
+                try:
+                    async for page in self.aiter_works(
+                        query,
+                        year=year,
+                        max_results=max_results_per_query,
+                        fields=fields,
+                    ):
+                        works.extend(page)
+                except Exception as exc:
+                    logger.warning(f"OpenAlex harvest failed for '{query}': {exc}")
+            return works[:max_results_per_query]
+
+        harvested = await asyncio.gather(*(harvest(query) for query in queries))
+        return dict(zip(queries, harvested, strict=True))
+
 
 if __name__ == "__main__":
     client = OpenAlexClient()
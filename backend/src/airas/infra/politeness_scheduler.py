@@ -0,0 +1,36 @@
+"""Process-wide request spacing for APIs that ask clients to slow down.
+
+Some public APIs (arXiv asks for one request every ~3 seconds) are shared by
+several subgraphs that may run concurrently, on different event loops or in
+worker threads. A ``PolitenessScheduler`` hands out start slots at least
+``min_interval`` seconds apart to every caller in the process. Slots are
+reserved under a thread lock and waited for outside it, so the scheduler is
+safe to share across threads and event loops.
+"""
+
+import asyncio
+import threading
+import time
+
+
+class PolitenessScheduler:
+    def __init__(self, min_interval: float) -> None:
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def _reserve(self) -> float:
+        """Reserve the next free slot and return how long to wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.min_interval
+            return slot - now
+
+    async def wait(self) -> None:
+        if (delay := self._reserve()) > 0:
+            await asyncio.sleep(delay)
+
+    def wait_sync(self) -> None:
+        if (delay := self._reserve()) > 0:
+            time.sleep(delay)
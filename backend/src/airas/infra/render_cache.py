@@ -0,0 +1,45 @@
+"""Content-addressed on-disk cache for rendered charts and diagrams.
+
+Agents re-render the same Vega-Lite spec or diagram source many times while
+iterating on a paper (and every re-render of a Kroki diagram is a network
+round trip). Entries are keyed by a SHA-256 of the renderer, its version or
+endpoint, the output format and the canonical JSON of the input, so an
+identical spec is served from the SQLite file and any change to it (or to the
+renderer) is a different key. Renders live in a ``SqliteBlobStore`` bounded
+by AIRAS_RENDER_CACHE_MAX_MB, tagged with their renderer.
+"""
+
+import hashlib
+import json
+import os
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+from airas.infra.sqlite_blob_store import SqliteBlobStore
+
+# Per user rather than per working directory: the MCP server runs inside the
+# research repository, where a cache file could end up committed.
+DEFAULT_RENDER_CACHE_PATH = str(Path("~/.airas/render_cache.sqlite").expanduser())
+DEFAULT_MAX_MB = 256
+
+
+def render_key(renderer: str, output_format: str, source: Any) -> str:
+    """SHA-256 of a render request; ``renderer`` should carry its version."""
+    canonical = json.dumps(
+        [renderer, output_format, source],
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+@cache
+def shared_render_cache() -> SqliteBlobStore | None:
+    """The process-wide cache, or ``None`` when ENABLE_RENDER_CACHE=false."""
+    if os.getenv("ENABLE_RENDER_CACHE", "true").lower() != "true":
+        return None
+    return SqliteBlobStore.from_env(
+        "AIRAS_RENDER_CACHE", DEFAULT_RENDER_CACHE_PATH, DEFAULT_MAX_MB
+    )
@@ -14,6 +14,7 @@ from tenacity import (
 )
 from tenacity.wait import wait_base as WaitBase
 
+from airas.infra.http_telemetry import count_retries
 from airas.infra.response_parser import Response
 
 
@@ -53,7 +54,7 @@ def make_retry_policy(
         wait=wait,
         retry=retry_if_exception_type(retryable_exc),
         before=before_log(_LOGGER, logging.INFO),
-        before_sleep=before_sleep_log(_LOGGER, logging.WARNING),
+        before_sleep=count_retries(before_sleep_log(_LOGGER, logging.WARNING)),
         reraise=True,
     )
 
@@ -71,7 +72,7 @@ def make_llm_retry_policy(
             | retry_if_exception_type(retryable_exc)
         ),
         before=before_log(_LOGGER, logging.INFO),
-        before_sleep=before_sleep_log(_LOGGER, logging.WARNING),
+        before_sleep=count_retries(before_sleep_log(_LOGGER, logging.WARNING)),
         reraise=True,
     )
 
@@ -0,0 +1,104 @@
+"""Record of the GitHub Actions secret values already pushed to each repository.
+
+GitHub never returns a secret's value, so to tell whether a repository already
+holds the current value we remember what we pushed: an HMAC-SHA256 of the
+value under a random per-entry salt (never the value itself, and not a plain
+hash that could be matched across entries or against a list of candidates),
+together with the id of the repository public key it was encrypted for. A
+secret is unchanged when the value hashes to the recorded fingerprint under the
+same key id. When the repository's public key rotates, every recorded entry of
+that repository is dropped so that all secrets are pushed again.
+"""
+
+import hashlib
+import hmac
+import logging
+import os
+import secrets
+import time
+from functools import cache
+from pathlib import Path
+
+from airas.infra.sqlite_database import SqliteDatabase
+
+logger = logging.getLogger(__name__)
+
+# Per user, like credentials.json: the record belongs to the GitHub token in
+# use, not to whichever checkout the process was started from.
+DEFAULT_SECRET_SYNC_PATH = str(Path("~/.airas/secret_sync.sqlite").expanduser())
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS secret_sync (
+    repository TEXT NOT NULL,
+    secret_name TEXT NOT NULL,
+    key_id TEXT NOT NULL,
+    salt TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    synced_at REAL NOT NULL,
+    PRIMARY KEY (repository, secret_name)
+);
+"""
+
+
+def _fingerprint(salt: str, value: str) -> str:
+    return hmac.new(bytes.fromhex(salt), value.encode(), hashlib.sha256).hexdigest()
+
+
+class SecretSyncStore:
+    def __init__(self, path: str | Path = DEFAULT_SECRET_SYNC_PATH) -> None:
+        self.db = SqliteDatabase(path, _SCHEMA)
+
+    def unchanged(
+        self, repository: str, key_id: str, values: dict[str, str]
+    ) -> set[str]:
+        """Names in ``values`` already pushed to ``repository`` with that value.
+
+        Forgets the repository when it was synced under another public key.
+        """
+        with self.db.transaction() as conn:
+            rows = conn.execute(
+                "SELECT secret_name, key_id, salt, fingerprint FROM secret_sync "
+                "WHERE repository = ?",
+                (repository,),
+            ).fetchall()
+            if any(row["key_id"] != key_id for row in rows):
+                logger.info(
+                    f"Public key of {repository} rotated; resyncing all secrets"
+                )
+                conn.execute(
+                    "DELETE FROM secret_sync WHERE repository = ?", (repository,)
+                )
+                return set()
+        return {
+            row["secret_name"]
+            for row in rows
+            if row["secret_name"] in values
+            and hmac.compare_digest(
+                row["fingerprint"],
+                _fingerprint(row["salt"], values[row["secret_name"]]),
+            )
+        }
+
+    def record(self, repository: str, key_id: str, values: dict[str, str]) -> None:
+        """Remember that ``values`` were pushed under the public key ``key_id``."""
+        now = time.time()
+        rows = []
+        for secret_name, value in values.items():
+            salt = secrets.token_hex(16)
+            rows.append(
+                (repository, secret_name, key_id, salt, _fingerprint(salt, value), now)
+            )
+        with self.db.transaction() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO secret_sync "
+                "(repository, secret_name, key_id, salt, fingerprint, synced_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+
+
+@cache
+def shared_secret_sync_store() -> SecretSyncStore | None:
+    """The process-wide store, or ``None`` when AIRAS_SECRET_SYNC_PATH is empty."""
+    path = os.getenv("AIRAS_SECRET_SYNC_PATH", DEFAULT_SECRET_SYNC_PATH)
+    return SecretSyncStore(path) if path else None
@@ -12,6 +12,33 @@ logger = getLogger(__name__)
 
 SEMANTIC_SCHOLAR_RETRY = make_retry_policy()
 
+# Upper bound on ids per ``POST /paper/batch`` request.
+BATCH_MAX_IDS = 500
+
+SEARCH_DEFAULT_FIELDS = (
+    "paperId",
+    "title",
+    "abstract",
+    "year",
+    "authors",
+    "venue",
+    "citationCount",
+    "referenceCount",
+    "references",
+    "citations",
+    "externalIds",
+)
+PAPER_DEFAULT_FIELDS = (
+    "paperId",
+    "title",
+    "abstract",
+    "year",
+    "authors",
+    "venue",
+    "externalIds",
+    "openAccessPdf",
+)
+
 
 @runtime_checkable
 class ResponseParserProtocol(Protocol):
@@ -43,56 +70,19 @@ class SemanticScholarClient(BaseHTTPClient):
         )
         self._parser = parser or ResponseParser()
 
-    @SEMANTIC_SCHOLAR_RETRY
-    def search_papers(
-        self,
-        query: str | None = None,
+    @staticmethod
+    def _build_search_params(
+        query: str | None,
         *,
-        title: str | None = None,
-        author: str | None = None,
-        year: str | None = None,
-        venue: str | None = None,
-        limit: int = 20,
-        offset: int = 0,
-        fields: tuple[str, ...] | None = None,
-        timeout: float = 30.0,
+        title: str | None,
+        author: str | None,
+        year: str | None,
+        venue: str | None,
+        limit: int,
+        offset: int,
+        fields: tuple[str, ...] | None,
     ) -> dict[str, Any]:
-        """
-        Search papers using Semantic Scholar API with flexible search options.
-
-        Args:
-            query: Free-text search query
-            title: Title-specific search
-            author: Author name search
-            year: Publication year filter
-            venue: Venue/journal filter
-            limit: Maximum number of results to return (1-100)
-            offset: Starting index for pagination
-            fields: Fields to include in response
-            timeout: Request timeout in seconds
-
-        Returns:
-            Dictionary containing search results
-
-        Note:
-            - If title/author are provided, structured search takes precedence over general query
-            - Either query OR title must be provided
-        """
-        DEFAULT_FIELDS = (
-            "paperId",
-            "title",
-            "abstract",
-            "year",
-            "authors",
-            "venue",
-            "citationCount",
-            "referenceCount",
-            "references",
-            "citations",
-            "externalIds",
-        )
-
-        fields = fields or DEFAULT_FIELDS
+        fields = fields or SEARCH_DEFAULT_FIELDS
         limit = max(1, min(limit, 100))
 
         search_parts = []
@@ -131,11 +121,106 @@ class SemanticScholarClient(BaseHTTPClient):
         if filters:
             params["query"] = f"{search_query} {' '.join(filters)}"
 
+        return params
+
+    @staticmethod
+    def _arxiv_path(arxiv_id: str) -> str:
+        if not arxiv_id.strip():
+            raise ValueError("arxiv_id must be provided")
+
+        return f"paper/ARXIV:{arxiv_id.strip().split('v')[0]}"
+
+    @staticmethod
+    def _doi_path(doi: str) -> str:
+        if not doi.strip():
+            raise ValueError("doi must be provided")
+
+        return f"paper/DOI:{doi.strip()}"
+
+    @staticmethod
+    def _batch_chunks(ids: list[str]) -> list[list[str]]:
+        return [ids[i : i + BATCH_MAX_IDS] for i in range(0, len(ids), BATCH_MAX_IDS)]
+
+    @SEMANTIC_SCHOLAR_RETRY
+    def search_papers(
+        self,
+        query: str | None = None,
+        *,
+        title: str | None = None,
+        author: str | None = None,
+        year: str | None = None,
+        venue: str | None = None,
+        limit: int = 20,
+        offset: int = 0,
+        fields: tuple[str, ...] | None = None,
+        timeout: float = 30.0,
+    ) -> dict[str, Any]:
+        """
+        Search papers using Semantic Scholar API with flexible search options.
+
+        Args:
+            query: Free-text search query
+            title: Title-specific search
+            author: Author name search
+            year: Publication year filter
+            venue: Venue/journal filter
+            limit: Maximum number of results to return (1-100)
+            offset: Starting index for pagination
+            fields: Fields to include in response
+            timeout: Request timeout in seconds
+
+        Returns:
+            Dictionary containing search results
+
+        Note:
+            - If title/author are provided, structured search takes precedence over general query
+            - Either query OR title must be provided
+        """
+        params = self._build_search_params(
+            query,
+            title=title,
+            author=author,
+            year=year,
+            venue=venue,
+            limit=limit,
+            offset=offset,
+            fields=fields,
+        )
         path = "paper/search"
         resp = self.get(path=path, params=params, timeout=timeout)
         raise_for_status(resp, path=path)
         return self._parser.parse(resp, as_="json")
 
+    @SEMANTIC_SCHOLAR_RETRY
+    async def asearch_papers(
+        self,
+        query: str | None = None,
+        *,
+        title: str | None = None,
+        author: str | None = None,
+        year: str | None = None,
+        venue: str | None = None,
+        limit: int = 20,
+        offset: int = 0,
+        fields: tuple[str, ...] | None = None,
+        timeout: float = 30.0,
+    ) -> dict[str, Any]:
+        """Asynchronous counterpart of ``search_papers``."""
+        params = self._build_search_params(
+            query,
+            title=title,
+            author=author,
+            year=year,
+            venue=venue,
+            limit=limit,
+            offset=offset,
+            fields=fields,
+        )
+        path = "paper/search"
+        resp = await self.aget(path=path, params=params, timeout=timeout)
+        raise_for_status(resp, path=path)
+        return self._parser.parse(resp, as_="json")
+
     @SEMANTIC_SCHOLAR_RETRY
     def get_paper_by_arxiv_id(
         self,
@@ -155,33 +240,27 @@ class SemanticScholarClient(BaseHTTPClient):
         Returns:
             Dictionary containing paper details
         """
-        if not arxiv_id.strip():
-            raise ValueError("arxiv_id must be provided")
-
-        clean_id = arxiv_id.strip().split("v")[0]
-
-        DEFAULT_FIELDS = (
-            "paperId",
-            "title",
-            "abstract",
-            "year",
-            "authors",
-            "venue",
-            "externalIds",
-            "openAccessPdf",
-        )
-
-        fields = fields or DEFAULT_FIELDS
-
-        path = f"paper/ARXIV:{clean_id}"
-        params: dict[str, Any] = {
-            "fields": ",".join(fields),
-        }
-
+        path = self._arxiv_path(arxiv_id)
+        params = {"fields": ",".join(fields or PAPER_DEFAULT_FIELDS)}
         resp = self.get(path=path, params=params, timeout=timeout)
         raise_for_status(resp, path=path)
         return self._parser.parse(resp, as_="json")
 
+    @SEMANTIC_SCHOLAR_RETRY
+    async def aget_paper_by_arxiv_id(
+        self,
+        arxiv_id: str,
+        *,
+        fields: tuple[str, ...] | None = None,
+        timeout: float = 30.0,
+    ) -> dict[str, Any]:
+        """Asynchronously get paper details by arXiv ID."""
+        path = self._arxiv_path(arxiv_id)
+        params = {"fields": ",".join(fields or PAPER_DEFAULT_FIELDS)}
+        resp = await self.aget(path=path, params=params, timeout=timeout)
+        raise_for_status(resp, path=path)
+        return self._parser.parse(resp, as_="json")
+
     @SEMANTIC_SCHOLAR_RETRY
     def get_paper_by_doi(
         self,
@@ -201,31 +280,92 @@ class SemanticScholarClient(BaseHTTPClient):
         Returns:
             Dictionary containing paper details
         """
-        if not doi.strip():
-            raise ValueError("doi must be provided")
-
-        DEFAULT_FIELDS = (
-            "paperId",
-            "title",
-            "abstract",
-            "year",
-            "authors",
-            "venue",
-            "externalIds",
-            "openAccessPdf",
-        )
+        path = self._doi_path(doi)
+        params = {"fields": ",".join(fields or PAPER_DEFAULT_FIELDS)}
+        resp = self.get(path=path, params=params, timeout=timeout)
+        raise_for_status(resp, path=path)
+        return self._parser.parse(resp, as_="json")
 
-        fields = fields or DEFAULT_FIELDS
+    @SEMANTIC_SCHOLAR_RETRY
+    async def aget_paper_by_doi(
+        self,
+        doi: str,
+        *,
+        fields: tuple[str, ...] | None = None,
+        timeout: float = 30.0,
+    ) -> dict[str, Any]:
+        """Asynchronously get paper details by DOI."""
+        path = self._doi_path(doi)
+        params = {"fields": ",".join(fields or PAPER_DEFAULT_FIELDS)}
+        resp = await self.aget(path=path, params=params, timeout=timeout)
+        raise_for_status(resp, path=path)
+        return self._parser.parse(resp, as_="json")
 
-        path = f"paper/DOI:{doi.strip()}"
-        params: dict[str, Any] = {
-            "fields": ",".join(fields),
-        }
+    @SEMANTIC_SCHOLAR_RETRY
+    def _post_batch(
+        self, ids: list[str], fields: str, timeout: float
+    ) -> list[dict[str, Any] | None]:
+        path = "paper/batch"
+        resp = self.post(
+            path=path, params={"fields": fields}, json={"ids": ids}, timeout=timeout
+        )
+        raise_for_status(resp, path=path)
+        return self._parser.parse(resp, as_="json")
 
-        resp = self.get(path=path, params=params, timeout=timeout)
+    @SEMANTIC_SCHOLAR_RETRY
+    async def _apost_batch(
+        self, ids: list[str], fields: str, timeout: float
+    ) -> list[dict[str, Any] | None]:
+        path = "paper/batch"
+        resp = await self.apost(
+            path=path, params={"fields": fields}, json={"ids": ids}, timeout=timeout
+        )
         raise_for_status(resp, path=path)
         return self._parser.parse(resp, as_="json")
 
+    def get_papers_batch(
+        self,
+        ids: list[str],
+        *,
+        fields: tuple[str, ...] | None = None,
+        timeout: float = 60.0,
+    ) -> list[dict[str, Any] | None]:
+        """
+        Look up many papers with ``POST /paper/batch``.
+
+        Args:
+            ids: Paper ids in any form the API accepts, e.g. "ARXIV:1706.03762",
+                "DOI:10.18653/v1/N18-3011" or a Semantic Scholar paper id
+            fields: Fields to include in response
+            timeout: Request timeout in seconds, per batch of ``BATCH_MAX_IDS``
+
+        Returns:
+            One entry per input id, in input order; ``None`` where the paper
+            is unknown to Semantic Scholar
+        """
+        joined_fields = ",".join(fields or PAPER_DEFAULT_FIELDS)
+        return [
+            paper
+            for chunk in self._batch_chunks(ids)
+            for paper in self._post_batch(chunk, joined_fields, timeout)
+        ]
+
+    async def aget_papers_batch(
+        self,
+        ids: list[str],
+        *,
+        fields: tuple[str, ...] | None = None,
+        timeout: float = 60.0,
+    ) -> list[dict[str, Any] | None]:
+        """Asynchronous counterpart of ``get_papers_batch``."""
+        joined_fields = ",".join(fields or PAPER_DEFAULT_FIELDS)
+        # Batches run one after another: the API rate-limits per request, and
+        # a single batch already covers every caller in this code base.
+        results: list[dict[str, Any] | None] = []
+        for chunk in self._batch_chunks(ids):
+            results.extend(await self._apost_batch(chunk, joined_fields, timeout))
+        return results
+
 
 if __name__ == "__main__":
     client = SemanticScholarClient()
@@ -251,3 +391,10 @@ if __name__ == "__main__":
     print("\n4. Title + Author search:")
     result4 = client.search_papers(title="transformer", author="Vaswani", limit=1)
     print(f"   Found {len(result4.get('data', []))} papers")
+
+    # Example 5: Batch lookup
+    print("\n5. Batch lookup:")
+    result5 = client.get_papers_batch(
+        ["ARXIV:1706.03762", "DOI:10.18653/v1/N18-3011"], fields=("title",)
+    )
+    print(f"   Titles: {[p.get('title') if p else None for p in result5]}")
@@ -0,0 +1,122 @@
+"""Size-bounded SQLite blob store behind the on-disk caches.
+
+Each entry is an opaque body under a string key, labelled with a ``tag`` (the
+host, the renderer, ...) and an optional ``meta`` string the owner interprets.
+The file is bounded by ``max_bytes`` and evicts least recently used entries
+first; a single body larger than an eighth of the bound is not stored.
+"""
+
+import os
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Self
+
+from airas.infra.sqlite_database import SqliteDatabase
+
+_MB = 1024 * 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS blobs (
+    key TEXT PRIMARY KEY,
+    tag TEXT NOT NULL,
+    meta TEXT,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    stored_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS blobs_accessed_at ON blobs (accessed_at);
+"""
+
+
+@dataclass(frozen=True)
+class Blob:
+    body: bytes
+    tag: str
+    meta: str | None
+    stored_at: float
+
+
+class SqliteBlobStore:
+    def __init__(self, path: str | Path, max_bytes: int) -> None:
+        self.db = SqliteDatabase(path, _SCHEMA)
+        self.max_bytes = max_bytes
+
+    @classmethod
+    def from_env(cls, prefix: str, default_path: str, default_max_mb: int) -> Self:
+        """Store at ``<prefix>_PATH`` bounded by ``<prefix>_MAX_MB`` megabytes."""
+        return cls(
+            os.getenv(f"{prefix}_PATH", default_path),
+            max_bytes=int(os.getenv(f"{prefix}_MAX_MB", str(default_max_mb))) * _MB,
+        )
+
+    def get(self, key: str) -> Blob | None:
+        with self.db.connect() as conn:
+            row = conn.execute(
+                "UPDATE blobs SET accessed_at = ? WHERE key = ? "
+                "RETURNING body, tag, meta, stored_at",
+                (time.time(), key),
+            ).fetchone()
+        if row is None:
+            return None
+        return Blob(
+            body=row["body"],
+            tag=row["tag"],
+            meta=row["meta"],
+            stored_at=row["stored_at"],
+        )
+
+    def put(
+        self, key: str, tag: str, body: bytes, meta: str | None = None
+    ) -> list[str]:
+        """Store ``body`` under ``key``; returns the tags of the evicted entries."""
+        if len(body) > self.max_bytes // 8:
+            return []
+        now = time.time()
+        with self.db.transaction() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO blobs "
+                "(key, tag, meta, body, size, stored_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, tag, meta, sqlite3.Binary(body), len(body), now, now),
+            )
+            return self._evict(conn)
+
+    def refresh(self, key: str) -> None:
+        """Restart the age of ``key`` (the origin confirmed it is current)."""
+        with self.db.connect() as conn:
+            conn.execute(
+                "UPDATE blobs SET stored_at = ? WHERE key = ?", (time.time(), key)
+            )
+
+    def _evict(self, conn: sqlite3.Connection) -> list[str]:
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[0]
+        if total <= self.max_bytes:
+            return []
+        # Free down to 90% so that eviction does not run on every store.
+        excess = total - int(self.max_bytes * 0.9)
+        evicted: list[tuple[str, str]] = []
+        for row in conn.execute(
+            "SELECT key, tag, size FROM blobs ORDER BY accessed_at"
+        ):
+            if excess <= 0:
+                break
+            evicted.append((row["key"], row["tag"]))
+            excess -= row["size"]
+        conn.executemany(
+            "DELETE FROM blobs WHERE key = ?", [(key,) for key, _ in evicted]
+        )
+        return [tag for _, tag in evicted]
+
+    def stats(self) -> dict[str, Any]:
+        with self.db.connect() as conn:
+            row = conn.execute(
+                "SELECT COUNT(*) AS entries, COALESCE(SUM(size), 0) AS bytes FROM blobs"
+            ).fetchone()
+        return {**dict(row), "max_bytes": self.max_bytes}
+
+    def clear(self) -> None:
+        with self.db.connect() as conn:
+            conn.execute("DELETE FROM blobs")
@@ -0,0 +1,56 @@
+"""Shared plumbing for the SQLite-backed stores (job queue, E2E records, ...).
+
+Every store keeps its data in a single SQLite file in WAL mode so readers never
+block the writer and several processes on the host (the dashboard and
+``airas worker``) can share it.
+"""
+
+import sqlite3
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+DEFAULT_STORE_PATH = ".airas/airas.sqlite"
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def to_epoch_us(value: datetime) -> int:
+    """Exact integer microseconds, so keyset cursors round-trip losslessly."""
+    return (value - _EPOCH) // timedelta(microseconds=1)
+
+
+def from_epoch_us(value: int) -> datetime:
+    return (_EPOCH + timedelta(microseconds=value)).astimezone()
+
+
+class SqliteDatabase:
+    def __init__(self, path: str | Path, schema: str) -> None:
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(schema)
+
+    @contextmanager
+    def connect(self) -> Iterator[sqlite3.Connection]:
+        # One short-lived connection per operation keeps the stores safe to use
+        # from worker threads (asyncio.to_thread) and from several processes.
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        with self.connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
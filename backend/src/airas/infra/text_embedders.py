@@ -0,0 +1,67 @@
+"""Pluggable text embedding backends.
+
+``HashingEmbedder`` needs no model or network: it hashes word unigrams and
+bigrams into a fixed number of signed buckets, so the same text always maps
+to the same vector (across processes too, unlike ``hash()``). It is meant for
+cheap lexical near-duplicate checks and offline runs. ``LiteLLMEmbedder``
+adapts any embedding model served through ``LiteLLMClient``.
+
+All backends return L2-normalized vectors, so cosine similarity is a dot
+product.
+"""
+
+import math
+import re
+from hashlib import blake2b
+from typing import Protocol, runtime_checkable
+
+from airas.infra.litellm_client import LiteLLMClient
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+@runtime_checkable
+class TextEmbedder(Protocol):
+    async def embed(self, texts: list[str]) -> list[list[float]]: ...
+
+
+def _normalize(vector: list[float]) -> list[float]:
+    norm = math.sqrt(sum(v * v for v in vector))
+    return [v / norm for v in vector] if norm else vector
+
+
+def cosine_similarity(a: list[float], b: list[float]) -> float:
+    """Cosine similarity of two L2-normalized vectors."""
+    return sum(x * y for x, y in zip(a, b, strict=True))
+
+
+class HashingEmbedder:
+    def __init__(self, dimensions: int = 1024) -> None:
+        self.dimensions = dimensions
+
+    def _embed_one(self, text: str) -> list[float]:
+        tokens = _TOKEN.findall(text.lower())
+        features = tokens + [
+            f"{a} {b}" for a, b in zip(tokens, tokens[1:], strict=False)
+        ]
+        vector = [0.0] * self.dimensions
+        for feature in features:
+            digest = blake2b(feature.encode(), digest_size=8).digest()
+            bucket = int.from_bytes(digest[:7], "little") % self.dimensions
+            vector[bucket] += 1.0 if digest[7] & 1 else -1.0
+        return _normalize(vector)
+
+    async def embed(self, texts: list[str]) -> list[list[float]]:
+        return [self._embed_one(text) for text in texts]
+
+
+class LiteLLMEmbedder:
+    def __init__(self, litellm_client: LiteLLMClient, model: str) -> None:
+        self.litellm_client = litellm_client
+        self.model = model
+
+    async def embed(self, texts: list[str]) -> list[list[float]]:
+        if not texts:
+            return []
+        vectors = await self.litellm_client.embedding(texts=texts, model=self.model)
+        return [_normalize(vector) for vector in vectors]
@@ -0,0 +1,20 @@
+"""Vega-Lite rendering with vl-convert.
+
+Kept free of other airas imports: it is what the process-pool workers of the
+MCP ``render_charts`` tool import to render.
+"""
+
+import vl_convert as vlc
+
+VEGA_LITE_RENDERER = f"vl-convert/{vlc.__version__}"
+
+
+def render_vega_lite(vega_lite_spec: dict, output_format: str) -> bytes:
+    """Render a spec to ``pdf``, ``svg`` or ``png`` bytes."""
+    if output_format == "pdf":
+        return vlc.vegalite_to_pdf(vega_lite_spec)
+    if output_format == "svg":
+        return vlc.vegalite_to_svg(vega_lite_spec).encode("utf-8")
+    if output_format == "png":
+        return vlc.vegalite_to_png(vega_lite_spec)
+    raise ValueError(f"Unsupported output format: {output_format}")
@@ -1,6 +1,9 @@
 import os
+from collections.abc import Iterator
 from logging import getLogger
+from typing import Any
 
+import pandas as pd
 import wandb
 from wandb.errors import CommError
 
@@ -13,6 +16,8 @@ WANDB_RETRY = make_retry_policy(
     retryable_exc=(CommError, ConnectionError, TimeoutError),
 )
 
+DEFAULT_HISTORY_SAMPLES = 500
+
 
 class WandbClient:
     def __init__(self):
@@ -21,11 +26,32 @@ class WandbClient:
         self.api = wandb.Api()
 
     @WANDB_RETRY
-    def retrieve_run_metrics(self, entity: str, project: str, run_id: str):
+    def retrieve_run_metrics(
+        self,
+        entity: str,
+        project: str,
+        run_id: str,
+        keys: list[str] | None = None,
+        samples: int = DEFAULT_HISTORY_SAMPLES,
+    ) -> pd.DataFrame:
+        # W&B downsamples server-side to `samples` rows, so long runs don't pull
+        # every logged step; use iter_run_history for the full resolution.
         run = self.api.run(f"{entity}/{project}/{run_id}")
-        metrics_dataframe = run.history()
+        metrics_dataframe = run.history(samples=samples, keys=keys, pandas=True)
         return metrics_dataframe
 
+    def iter_run_history(
+        self,
+        entity: str,
+        project: str,
+        run_id: str,
+        keys: list[str] | None = None,
+        page_size: int = 1000,
+    ) -> Iterator[dict[str, Any]]:
+        """Stream every logged row page by page instead of loading it at once."""
+        run = self.api.run(f"{entity}/{project}/{run_id}")
+        yield from run.scan_history(keys=keys, page_size=page_size)
+
 
 if __name__ == "__main__":
     client = WandbClient()
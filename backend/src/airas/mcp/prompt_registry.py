@@ -21,8 +21,11 @@ instead of replaying the backend's iteration loop.
 import json
 from typing import Any
 
-from jinja2 import Environment
-
+from airas.core.prompt_templates import (
+    PRECOMPILE_PROMPTS,
+    precompile_templates,
+    render_prompt,
+)
 from airas.core.types.experiment_code import ExperimentCode
 from airas.core.types.experiment_history import ExperimentHistory
 from airas.core.types.experimental_design import (
@@ -33,10 +36,7 @@ from airas.core.types.experimental_results import ExperimentalResults
 from airas.core.types.paper import PaperContent
 from airas.core.types.research_hypothesis import ResearchHypothesis
 from airas.core.types.research_study import ResearchStudy
-from airas.resources.datasets.prompt_engineering_datasets import (
-    PROMPT_ENGINEERING_DATASETS,
-)
-from airas.resources.models.llm_api_models import LLM_API_MODELS
+from airas.resources.catalog import RESOURCE_CATALOG
 from airas.usecases.analyzers.analyze_experiment_subgraph.nodes.analyze_experiment import (
     LLMOutput as AnalyzeExperimentOutput,
 )
@@ -77,8 +77,21 @@ GENERATION_STEPS = (
 )
 
 
+if PRECOMPILE_PROMPTS:
+    precompile_templates(
+        [
+            generate_queries_prompt,
+            generate_simple_hypothesis_prompt,
+            generate_experimental_design_prompt,
+            analyze_experiment_prompt,
+            write_prompt,
+            convert_to_latex_prompt,
+        ]
+    )
+
+
 def _render(template: str, data: dict[str, Any]) -> str:
-    return Environment().from_string(template).render(data)
+    return render_prompt(template, data)
 
 
 def _research_queries(inputs: dict[str, Any]) -> dict[str, Any]:
@@ -132,9 +145,13 @@ def _experimental_design(inputs: dict[str, Any]) -> dict[str, Any]:
                 inputs["research_hypothesis"]
             ),
             "compute_environment": compute_environment,
-            "model_list": json.dumps(LLM_API_MODELS, indent=4, ensure_ascii=False),
+            "model_list": json.dumps(
+                RESOURCE_CATALOG.section("llm_api_models"), indent=4, ensure_ascii=False
+            ),
             "dataset_list": json.dumps(
-                PROMPT_ENGINEERING_DATASETS, indent=4, ensure_ascii=False
+                RESOURCE_CATALOG.section("prompt_engineering_datasets"),
+                indent=4,
+                ensure_ascii=False,
             ),
             "num_models_to_use": inputs.get("num_models_to_use", 2),
             "num_datasets_to_use": inputs.get("num_datasets_to_use", 2),
@@ -16,17 +16,18 @@ Run locally:
 
 import asyncio
 import logging
+import multiprocessing
 import os
 import webbrowser
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache
 from io import BytesIO
 from pathlib import Path
-from typing import Any, Literal
+from typing import TYPE_CHECKING, Any, Literal
 from urllib.parse import urlencode
 
-import httpx
-import vl_convert as vlc
 from mcp.server.fastmcp import FastMCP
-from PIL import Image
 from pydantic import BaseModel
 
 from airas.cli import DEFAULT_DASHBOARD_PORT
@@ -56,140 +57,136 @@ from airas.dashboard.launcher import (
 from airas.dashboard.launcher import (
     stop_dashboard as stop_dashboard_process,
 )
-from airas.infra.aixs_client import AixsClient
-from airas.infra.arxiv_client import ArxivClient
-from airas.infra.github_client import GithubClient
-from airas.infra.kroki_client import KrokiClient
-from airas.infra.langchain_client import (
-    PROVIDER_REQUIRED_ENV_VARS,
-    LangChainClient,
-)
-from airas.infra.llm_provider_resolver import detect_available_providers
-from airas.infra.openalex_client import OpenAlexClient
-from airas.infra.retry_policy import HTTPClientFatalError, HTTPClientRetryableError
-from airas.infra.semantic_scholar_client import SemanticScholarClient
-from airas.mcp.prompt_registry import build_generation_prompt
-from airas.resources.libraries.library_docs import LIBRARY_DOCS
-from airas.usecases.analyzers.analyze_experiment_subgraph.analyze_experiment_subgraph import (
-    AnalyzeExperimentSubgraph,
-)
-from airas.usecases.executors.dispatch_experiment_on_aixs_subgraph.dispatch_experiment_on_aixs_subgraph import (
-    DispatchExperimentOnAixsSubgraph,
-)
-from airas.usecases.executors.dispatch_experiment_on_static_runner_subgraph.dispatch_experiment_on_static_runner_subgraph import (
-    DispatchExperimentOnStaticRunnerSubgraph,
-)
-from airas.usecases.executors.fetch_experiment_results_subgraph.fetch_experiment_results_subgraph import (
-    FetchExperimentResultsSubgraph,
-)
-from airas.usecases.generators.generate_experimental_design_subgraph.generate_experimental_design_subgraph import (
-    GenerateExperimentalDesignSubgraph,
-)
-from airas.usecases.generators.generate_hypothesis_subgraph.generate_hypothesis_subgraph_v0 import (
-    GenerateHypothesisSubgraphV0,
-)
-from airas.usecases.generators.generate_queries_subgraph.generate_queries_subgraph import (
-    GenerateQueriesSubgraph,
-)
-from airas.usecases.github.download_github_actions_artifacts_subgraph.download_github_actions_artifacts_subgraph import (
-    DownloadGithubActionsArtifactsSubgraph,
-)
-from airas.usecases.github.github_download_subgraph import GithubDownloadSubgraph
-from airas.usecases.github.github_upload_subgraph import GithubUploadSubgraph
-from airas.usecases.github.prepare_repository_subgraph.prepare_repository_subgraph import (
-    PrepareRepositorySubgraph,
-)
-from airas.usecases.publication.compile_latex_subgraph.compile_latex_subgraph import (
-    CompileLatexSubgraph,
-)
-from airas.usecases.publication.generate_latex_subgraph.generate_latex_subgraph import (
-    GenerateLatexSubgraph,
-)
-from airas.usecases.retrieve.fetch_paper_fulltext_subgraph.fetch_paper_fulltext_subgraph import (
-    FetchPaperFulltextSubgraph,
-)
-from airas.usecases.retrieve.retrieve_datasets_subgraph.retrieve_datasets_subgraph import (
-    RetrieveDatasetsSubgraph,
-)
-from airas.usecases.retrieve.retrieve_models_subgraph.retrieve_models_subgraph import (
-    RetrieveModelsSubgraph,
-)
-from airas.usecases.retrieve.retrieve_paper_subgraph.retrieve_paper_subgraph import (
-    RetrievePaperSubgraph,
-)
-from airas.usecases.retrieve.search_paper_titles_subgraph.nodes.search_paper_titles_from_airas_db import (
-    AirasDbPaperSearchIndex,
-)
-from airas.usecases.retrieve.search_papers_subgraph.search_papers_subgraph import (
-    SearchPapersSubgraph,
-)
-from airas.usecases.writers.generate_bibfile_subgraph.generate_bibfile_subgraph import (
-    GenerateBibfileSubgraph,
-)
-from airas.usecases.writers.write_subgraph.write_subgraph import WriteSubgraph
+from airas.infra.render_cache import render_key, shared_render_cache
+from airas.resources.catalog import RESOURCE_CATALOG, ResourceKind
+
+if TYPE_CHECKING:
+    import httpx
+
+    from airas.infra.aixs_client import AixsClient
+    from airas.infra.arxiv_client import ArxivClient
+    from airas.infra.github_client import GithubClient
+    from airas.infra.kroki_client import KrokiClient
+    from airas.infra.langchain_client import LangChainClient
+    from airas.infra.openalex_client import OpenAlexClient
+    from airas.infra.semantic_scholar_client import SemanticScholarClient
+    from airas.usecases.retrieve.search_paper_titles_subgraph.nodes.search_paper_titles_from_airas_db import (
+        AirasDbPaperSearchIndex,
+    )
 
 logger = logging.getLogger(__name__)
 
+# Tools are registered from their signatures and docstrings alone. Subgraphs,
+# API clients, HTTP sessions and the paper search index (together several
+# seconds of imports, mostly LangChain/LiteLLM) are imported or built on the
+# first call of a tool that needs them, so the stdio handshake is not kept
+# waiting on them.
 mcp = FastMCP("airas")
 
-# BM25 index over the AIRAS papers DB; built lazily on first search and
-# reused for the lifetime of the server process.
-_search_index = AirasDbPaperSearchIndex()
+# Upper bound on vl-convert worker processes for render_charts.
+MAX_CHART_WORKERS = 8
+
+
+@cache
+def _search_index() -> "AirasDbPaperSearchIndex":
+    """BM25 index over the AIRAS papers DB, reused for the server's lifetime."""
+    from airas.usecases.retrieve.search_paper_titles_subgraph.nodes.search_paper_titles_from_airas_db import (
+        AirasDbPaperSearchIndex,
+    )
+
+    return AirasDbPaperSearchIndex()
+
 
 # Process-lifetime HTTP sessions (the stdio server exits with the client,
 # so these are closed by process teardown).
-_GITHUB_TIMEOUT = httpx.Timeout(connect=10.0, read=60.0, write=120.0, pool=5.0)
-_github_sync_session = httpx.Client(follow_redirects=True, timeout=_GITHUB_TIMEOUT)
-_github_async_session = httpx.AsyncClient(
-    follow_redirects=True, timeout=_GITHUB_TIMEOUT
-)
-_sync_session = httpx.Client(follow_redirects=True)
-_async_session = httpx.AsyncClient(follow_redirects=True)
+@cache
+def _github_sessions() -> tuple["httpx.Client", "httpx.AsyncClient"]:
+    import httpx
+
+    from airas.infra.http_session import create_async_session, create_sync_session
+
+    timeout = httpx.Timeout(connect=10.0, read=60.0, write=120.0, pool=5.0)
+    return create_sync_session(timeout=timeout), create_async_session(timeout=timeout)
+
+
+@cache
+def _sessions() -> tuple["httpx.Client", "httpx.AsyncClient"]:
+    from airas.infra.http_cache import shared_http_cache
+    from airas.infra.http_session import create_async_session, create_sync_session
 
+    # The response cache is shared with the dashboard (see infra/http_cache.py).
+    http_cache = shared_http_cache()
+    return (
+        create_sync_session(http_cache=http_cache),
+        create_async_session(http_cache=http_cache),
+    )
+
+
+def _github_client() -> "GithubClient":
+    from airas.infra.github_client import GithubClient
 
-def _github_client() -> GithubClient:
     refresh_environment()
     token = os.getenv("GH_PERSONAL_ACCESS_TOKEN", "")
     if not token:
         raise RuntimeError(
             f"GH_PERSONAL_ACCESS_TOKEN is not configured. {SETUP_INSTRUCTIONS}"
         )
+    sync_session, async_session = _github_sessions()
     return GithubClient(
         github_token=token,
-        sync_session=_github_sync_session,
-        async_session=_github_async_session,
+        sync_session=sync_session,
+        async_session=async_session,
     )
 
 
-def _aixs_client() -> AixsClient:
+def _aixs_client() -> "AixsClient":
+    from airas.infra.aixs_client import AixsClient
+
     refresh_environment()
     if not os.getenv("AIXS_API_KEY"):
         raise RuntimeError(f"AIXS_API_KEY is not configured. {SETUP_INSTRUCTIONS}")
-    return AixsClient(sync_session=_sync_session, async_session=_async_session)
+    sync_session, async_session = _sessions()
+    return AixsClient(sync_session=sync_session, async_session=async_session)
+
 
+def _kroki_client() -> "KrokiClient":
+    from airas.infra.kroki_client import KrokiClient
 
-def _kroki_client() -> KrokiClient:
     refresh_environment()
-    return KrokiClient(sync_session=_sync_session, async_session=_async_session)
+    sync_session, async_session = _sessions()
+    return KrokiClient(sync_session=sync_session, async_session=async_session)
+
 
+def _arxiv_client() -> "ArxivClient":
+    from airas.infra.arxiv_client import ArxivClient
 
-def _arxiv_client() -> ArxivClient:
-    return ArxivClient(sync_session=_sync_session, async_session=_async_session)
+    sync_session, async_session = _sessions()
+    return ArxivClient(sync_session=sync_session, async_session=async_session)
 
 
-def _openalex_client() -> OpenAlexClient:
+def _openalex_client() -> "OpenAlexClient":
+    from airas.infra.openalex_client import OpenAlexClient
+
     refresh_environment()  # OPENALEX_API_KEY is optional
-    return OpenAlexClient(sync_session=_sync_session, async_session=_async_session)
+    sync_session, async_session = _sessions()
+    return OpenAlexClient(sync_session=sync_session, async_session=async_session)
+
 
+def _semantic_scholar_client() -> "SemanticScholarClient":
+    from airas.infra.semantic_scholar_client import SemanticScholarClient
 
-def _semantic_scholar_client() -> SemanticScholarClient:
     refresh_environment()  # SEMANTIC_SCHOLAR_API_KEY is optional
-    return SemanticScholarClient(
-        sync_session=_sync_session, async_session=_async_session
-    )
+    sync_session, async_session = _sessions()
+    return SemanticScholarClient(sync_session=sync_session, async_session=async_session)
 
 
-def _langchain_client() -> LangChainClient:
+def _langchain_client() -> "LangChainClient":
+    from airas.infra.langchain_client import (
+        PROVIDER_REQUIRED_ENV_VARS,
+        LangChainClient,
+    )
+    from airas.infra.llm_provider_resolver import detect_available_providers
+
     refresh_environment()
     if not detect_available_providers(PROVIDER_REQUIRED_ENV_VARS):
         raise RuntimeError(
@@ -233,6 +230,8 @@ def get_generation_prompt(step: str, inputs: dict[str, Any]) -> dict[str, Any]:
     exactly the data format to produce in one pass, and a `flow` note on
     how the output feeds the next step.
     """
+    from airas.mcp.prompt_registry import build_generation_prompt
+
     return build_generation_prompt(step, inputs)
 
 
@@ -249,6 +248,10 @@ async def generate_research_queries(
     `get_generation_prompt(step="research_queries", ...)` and author the
     queries yourself.
     """
+    from airas.usecases.generators.generate_queries_subgraph.generate_queries_subgraph import (
+        GenerateQueriesSubgraph,
+    )
+
     result = (
         await GenerateQueriesSubgraph(
             llm_client=_langchain_client(),
@@ -301,6 +304,10 @@ async def search_papers(
     `retrieve_papers`, or an arxiv_id / doi / pdf_url to
     `fetch_paper_fulltext`.
     """
+    from airas.usecases.retrieve.search_papers_subgraph.search_papers_subgraph import (
+        SearchPapersSubgraph,
+    )
+
     refresh_environment()
     selected_sources = _parse_paper_sources(sources)
     if search_mode == "semantic":
@@ -319,7 +326,7 @@ async def search_papers(
             openalex_client=_openalex_client(),
             semantic_scholar_client=_semantic_scholar_client(),
             arxiv_client=_arxiv_client(),
-            airas_db_search_index=_search_index,
+            airas_db_search_index=_search_index(),
         )
         .build_graph()
         .ainvoke(
@@ -353,6 +360,10 @@ async def fetch_paper_fulltext(
     (no legal open-access PDF found, abstract returned instead), or
     "not_found". No API keys required.
     """
+    from airas.usecases.retrieve.fetch_paper_fulltext_subgraph.fetch_paper_fulltext_subgraph import (
+        FetchPaperFulltextSubgraph,
+    )
+
     if not (arxiv_id or doi or pdf_url):
         raise ValueError("One of arxiv_id, doi, or pdf_url must be provided.")
     refresh_environment()
@@ -379,6 +390,10 @@ async def retrieve_papers(paper_titles: list[str]) -> list[dict[str, Any]]:
     objects can be passed to `generate_hypothesis` as `research_study_list`.
     Requires GH_PERSONAL_ACCESS_TOKEN and an LLM provider API key.
     """
+    from airas.usecases.retrieve.retrieve_paper_subgraph.retrieve_paper_subgraph import (
+        RetrievePaperSubgraph,
+    )
+
     result = (
         await RetrievePaperSubgraph(
             langchain_client=_langchain_client(),
@@ -397,20 +412,35 @@ async def generate_hypothesis(
     research_topic: str,
     research_study_list: list[dict[str, Any]],
     refinement_rounds: int = 1,
+    num_candidates: int = 1,
 ) -> dict[str, Any]:
     """Generate a novel research hypothesis from a topic and related studies (backend LLM).
 
     `research_study_list` should be the output of `retrieve_papers`. Higher
     `refinement_rounds` improves quality at the cost of more LLM calls.
+    `num_candidates` > 1 drafts that many hypotheses concurrently and only
+    refines the best-scoring one, which often reaches a strong hypothesis in
+    fewer sequential rounds (at most 8 candidates).
     Requires an LLM provider API key — without one, use
     `get_generation_prompt(step="hypothesis", ...)` and author the
     hypothesis yourself.
     """
+    from airas.usecases.generators.generate_hypothesis_subgraph.generate_hypothesis_subgraph_v0 import (
+        MAX_HYPOTHESIS_CANDIDATES,
+        GenerateHypothesisSubgraphV0,
+    )
+
+    if not 1 <= num_candidates <= MAX_HYPOTHESIS_CANDIDATES:
+        raise ValueError(
+            f"num_candidates must be between 1 and {MAX_HYPOTHESIS_CANDIDATES}"
+        )
+
     studies = [ResearchStudy.model_validate(study) for study in research_study_list]
     result = (
         await GenerateHypothesisSubgraphV0(
             langchain_client=_langchain_client(),
             refinement_rounds=refinement_rounds,
+            num_candidates=num_candidates,
         )
         .build_graph()
         .ainvoke(
@@ -444,6 +474,10 @@ async def generate_experimental_design(
     `get_generation_prompt(step="experimental_design", ...)` and author the
     design yourself.
     """
+    from airas.usecases.generators.generate_experimental_design_subgraph.generate_experimental_design_subgraph import (
+        GenerateExperimentalDesignSubgraph,
+    )
+
     env = ComputeEnvironment.model_validate(compute_environment or {})
     result = (
         await GenerateExperimentalDesignSubgraph(
@@ -473,6 +507,10 @@ async def retrieve_models(model_subfield: ModelSubfield) -> dict[str, Any]:
     "multi_modal_models", "llm_api_models". Returns model configurations
     usable in an experimental design. No API keys required.
     """
+    from airas.usecases.retrieve.retrieve_models_subgraph.retrieve_models_subgraph import (
+        RetrieveModelsSubgraph,
+    )
+
     result = (
         await RetrieveModelsSubgraph()
         .build_graph()
@@ -489,6 +527,10 @@ async def retrieve_datasets(dataset_subfield: DatasetSubfield) -> dict[str, Any]
     "prompt_engineering_datasets". Returns dataset configurations usable in
     an experimental design. No API keys required.
     """
+    from airas.usecases.retrieve.retrieve_datasets_subgraph.retrieve_datasets_subgraph import (
+        RetrieveDatasetsSubgraph,
+    )
+
     result = (
         await RetrieveDatasetsSubgraph()
         .build_graph()
@@ -519,34 +561,68 @@ def get_library_docs(
     No API keys required.
     """
     if library is not None:
-        entry = LIBRARY_DOCS.get(library)
+        entry = RESOURCE_CATALOG.get(library, kind="libraries")
         if entry is None:
             return {
                 "error": f"Unknown library: {library!r}.",
-                "available": sorted(LIBRARY_DOCS),
+                "available": sorted(RESOURCE_CATALOG.search(kind="libraries")),
             }
         return dict(entry)
+    # Library categories are catalog sections; domains are indexed as tags,
+    # which also match categories and ignore case, so the domain is compared
+    # exactly as well.
     listing = {
         name: {
             "description": e["description"],
             "domain": e["domain"],
             "category": e["category"],
         }
-        for name, e in LIBRARY_DOCS.items()
-        if (domain is None or e["domain"] == domain)
-        and (category is None or e["category"] == category)
+        for name, e in RESOURCE_CATALOG.search(
+            kind="libraries", section=category, tag=domain
+        ).items()
+        if domain is None or e["domain"] == domain
     }
     if not listing:
+        libraries = RESOURCE_CATALOG.entries("libraries").values()
         return {
             "error": f"No libraries match domain={domain!r}, category={category!r}.",
-            "available_domains": sorted({e["domain"] for e in LIBRARY_DOCS.values()}),
-            "available_categories": sorted(
-                {e["category"] for e in LIBRARY_DOCS.values()}
-            ),
+            "available_domains": sorted({e["domain"] for e in libraries}),
+            "available_categories": sorted({e["category"] for e in libraries}),
         }
     return listing
 
 
+@mcp.tool()
+def search_resources(
+    kind: ResourceKind | None = None,
+    name: str | None = None,
+    task: str | None = None,
+    modality: str | None = None,
+    tag: str | None = None,
+) -> dict[str, Any]:
+    """Search the curated datasets, models and libraries by indexed fields.
+
+    Every given filter must match. `name` matches whole words of a resource
+    name ("llama 4" finds the Llama 4 models); `task` is a task type such as
+    "image-classification" or "text-generation"; `modality` is an input or
+    output modality ("text", "image", "embeddings", ...); `tag` is a
+    dependent package, or a library domain or category. Matching ignores
+    case and treats "_", "-" and spaces alike. Returns the full entries keyed
+    by name; `retrieve_models` / `retrieve_datasets` list a whole subfield
+    instead. No API keys required.
+    """
+    results = RESOURCE_CATALOG.search(
+        kind=kind, name=name, task=task, modality=modality, tag=tag
+    )
+    if not results:
+        return {
+            "error": "No resources match the given filters.",
+            "available_tasks": RESOURCE_CATALOG.terms("task"),
+            "available_modalities": RESOURCE_CATALOG.terms("modality"),
+        }
+    return results
+
+
 # --- Experiment repository & execution (GitHub Actions) ---
 
 
@@ -563,6 +639,10 @@ async def prepare_repository(
     working branch. Run this once before `dispatch_code_generation`.
     Requires GH_PERSONAL_ACCESS_TOKEN.
     """
+    from airas.usecases.github.prepare_repository_subgraph.prepare_repository_subgraph import (
+        PrepareRepositorySubgraph,
+    )
+
     config = GitHubConfig(
         github_owner=github_owner,
         repository_name=repository_name,
@@ -614,6 +694,13 @@ async def dispatch_experiment(
     passed directly; for "github_actions" the workflow-dispatch API returns
     no id, so discover the run id with `get_workflow_runs` first.
     """
+    from airas.usecases.executors.dispatch_experiment_on_aixs_subgraph.dispatch_experiment_on_aixs_subgraph import (
+        DispatchExperimentOnAixsSubgraph,
+    )
+    from airas.usecases.executors.dispatch_experiment_on_static_runner_subgraph.dispatch_experiment_on_static_runner_subgraph import (
+        DispatchExperimentOnStaticRunnerSubgraph,
+    )
+
     if backend == "aixs":
         run_stage = RunStage.SANITY if workflow == "sanity_check" else RunStage.FULL
         aixs_result = (
@@ -646,23 +733,19 @@ async def dispatch_experiment(
         if workflow == "sanity_check"
         else "run_main_experiment.yml"
     )
-    result = (
-        await DispatchExperimentOnStaticRunnerSubgraph(
-            github_client=_github_client(),
-            workflow_file=workflow_file,
-            runner_label=runner_label or ["ubuntu-latest"],
-        )
-        .build_graph()
-        .ainvoke(
-            {
-                "github_config": GitHubConfig(
-                    github_owner=github_owner,
-                    repository_name=repository_name,
-                    branch_name=branch_name,
-                ),
-                "run_id": run_id,
-            }
-        )
+    result = await DispatchExperimentOnStaticRunnerSubgraph(
+        github_client=_github_client(),
+        workflow_file=workflow_file,
+        runner_label=runner_label or ["ubuntu-latest"],
+    ).ainvoke(
+        {
+            "github_config": GitHubConfig(
+                github_owner=github_owner,
+                repository_name=repository_name,
+                branch_name=branch_name,
+            ),
+            "run_id": run_id,
+        }
     )
     return {"dispatched": result["dispatched"], "backend": "github_actions"}
 
@@ -687,6 +770,11 @@ async def get_experiment_run_status(
     them — use stderr to diagnose execution errors and fix the experiment
     code locally.
     """
+    from airas.infra.retry_policy import (
+        HTTPClientFatalError,
+        HTTPClientRetryableError,
+    )
+
     if log_tail_lines <= 0:
         raise ValueError("log_tail_lines must be a positive integer")
     log_tail_lines = min(log_tail_lines, 10_000)
@@ -796,6 +884,10 @@ async def fetch_experiment_results(
     can be passed to `analyze_experiment` as `experimental_results`.
     Requires GH_PERSONAL_ACCESS_TOKEN.
     """
+    from airas.usecases.executors.fetch_experiment_results_subgraph.fetch_experiment_results_subgraph import (
+        FetchExperimentResultsSubgraph,
+    )
+
     result = (
         await FetchExperimentResultsSubgraph(github_client=_github_client())
         .build_graph()
@@ -824,19 +916,21 @@ async def download_workflow_artifacts(
     `workflow_run_id` comes from `get_workflow_runs`. Useful for inspecting
     logs and outputs of a specific run. Requires GH_PERSONAL_ACCESS_TOKEN.
     """
-    result = (
-        await DownloadGithubActionsArtifactsSubgraph(github_client=_github_client())
-        .build_graph()
-        .ainvoke(
-            {
-                "github_config": GitHubConfig(
-                    github_owner=github_owner,
-                    repository_name=repository_name,
-                    branch_name=branch_name,
-                ),
-                "workflow_run_id": workflow_run_id,
-            }
-        )
+    from airas.usecases.github.download_github_actions_artifacts_subgraph.download_github_actions_artifacts_subgraph import (
+        DownloadGithubActionsArtifactsSubgraph,
+    )
+
+    result = await DownloadGithubActionsArtifactsSubgraph(
+        github_client=_github_client()
+    ).ainvoke(
+        {
+            "github_config": GitHubConfig(
+                github_owner=github_owner,
+                repository_name=repository_name,
+                branch_name=branch_name,
+            ),
+            "workflow_run_id": workflow_run_id,
+        }
     )
     return _dump(result["artifact_data"])
 
@@ -859,6 +953,10 @@ async def analyze_experiment(
     `get_generation_prompt(step="experiment_analysis", ...)` and write the
     analysis yourself.
     """
+    from airas.usecases.analyzers.analyze_experiment_subgraph.analyze_experiment_subgraph import (
+        AnalyzeExperimentSubgraph,
+    )
+
     result = (
         await AnalyzeExperimentSubgraph(
             langchain_client=_langchain_client(),
@@ -900,6 +998,10 @@ async def upload_research_history(
     accumulated history lets you resume work in a later session with
     `download_research_history`. Requires GH_PERSONAL_ACCESS_TOKEN.
     """
+    from airas.usecases.github.github_upload_subgraph import (
+        GithubUploadSubgraph,
+    )
+
     result = (
         await GithubUploadSubgraph(_github_client())
         .build_graph()
@@ -929,6 +1031,10 @@ async def download_research_history(
     Restores the state saved by `upload_research_history` so a research
     session can continue where it left off. Requires GH_PERSONAL_ACCESS_TOKEN.
     """
+    from airas.usecases.github.github_download_subgraph import (
+        GithubDownloadSubgraph,
+    )
+
     result = (
         await GithubDownloadSubgraph(_github_client())
         .build_graph()
@@ -954,6 +1060,8 @@ def _resolve_render_output(output_path: str) -> tuple[Path, str]:
 
 
 def _png_to_pdf(png: bytes) -> bytes:
+    from PIL import Image
+
     buffer = BytesIO()
     with Image.open(BytesIO(png)) as image:
         if image.mode != "RGB":
@@ -968,6 +1076,94 @@ def _png_to_pdf(png: bytes) -> bytes:
     return buffer.getvalue()
 
 
+@cache
+def _chart_pool() -> ProcessPoolExecutor:
+    # Workers are spawned rather than forked from this threaded process
+    # that runs an event loop; they start on the first batch and are kept.
+    return ProcessPoolExecutor(
+        max_workers=min(os.cpu_count() or 1, MAX_CHART_WORKERS),
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+
+# A render request: (renderer with version or endpoint, output format, source,
+# function producing the bytes). The first three make up the cache key.
+_RenderJob = tuple[str, str, Any, Callable[[], Awaitable[bytes]]]
+
+
+async def _cached_render(job: _RenderJob) -> tuple[bytes, bool]:
+    renderer, output_format, source, render = job
+    render_cache = shared_render_cache()
+    if render_cache is None:
+        return await render(), False
+    key = render_key(renderer, output_format, source)
+    if (blob := await asyncio.to_thread(render_cache.get, key)) is not None:
+        return blob.body, True
+    data = await render()
+    await asyncio.to_thread(render_cache.put, key, renderer, data, output_format)
+    return data, False
+
+
+def _write_render(path: Path, data: bytes, cached: bool) -> dict[str, Any]:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return {"output_path": str(path), "bytes_written": len(data), "cached": cached}
+
+
+def _render_error(output_path: str, error: Exception) -> dict[str, Any]:
+    return {"output_path": output_path, "error": f"{type(error).__name__}: {error}"}
+
+
+async def _render_batch(
+    outputs: list[tuple[str, Callable[[str], _RenderJob]]],
+) -> list[dict[str, Any]]:
+    """Render every (output_path, job factory) pair, each distinct job once.
+
+    A failing item is reported in its result instead of failing the batch.
+    """
+    renders: dict[str, asyncio.Future[tuple[bytes, bool]]] = {}
+    pending: list[tuple[str, Path, asyncio.Future] | dict[str, Any]] = []
+    for output_path, make_job in outputs:
+        try:
+            path, suffix = _resolve_render_output(output_path)
+            job = make_job(suffix)
+        except Exception as e:
+            pending.append(_render_error(output_path, e))
+            continue
+        key = render_key(*job[:3])
+        if key not in renders:
+            renders[key] = asyncio.ensure_future(_cached_render(job))
+        pending.append((output_path, path, renders[key]))
+
+    results: list[dict[str, Any]] = []
+    for item in pending:
+        if isinstance(item, dict):
+            results.append(item)
+            continue
+        output_path, path, render = item
+        try:
+            results.append(_write_render(path, *(await render)))
+        except Exception as e:
+            results.append(_render_error(output_path, e))
+    return results
+
+
+def _chart_job(
+    vega_lite_spec: dict[str, Any],
+    suffix: str,
+    pool: ProcessPoolExecutor | None = None,
+) -> _RenderJob:
+    from airas.infra.vega_lite_renderer import VEGA_LITE_RENDERER, render_vega_lite
+
+    async def render() -> bytes:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            pool, render_vega_lite, vega_lite_spec, suffix
+        )
+
+    return VEGA_LITE_RENDERER, suffix, vega_lite_spec, render
+
+
 @mcp.tool()
 async def render_chart(
     vega_lite_spec: dict[str, Any],
@@ -982,19 +1178,70 @@ async def render_chart(
     push — the LaTeX build collects every `*.pdf` under
     `.research/results/`. `output_path` must end with .pdf, .svg, or .png.
     Rendering runs in-process (vl-convert); no data leaves the machine and
-    no API keys are required.
+    no API keys are required. An identical spec rendered before is served
+    from the local render cache (`cached` in the result). To render
+    several charts, use `render_charts`.
     """
     path, suffix = _resolve_render_output(output_path)
-    if suffix == "pdf":
-        data = await asyncio.to_thread(vlc.vegalite_to_pdf, vega_lite_spec)
-    elif suffix == "svg":
-        svg = await asyncio.to_thread(vlc.vegalite_to_svg, vega_lite_spec)
-        data = svg.encode("utf-8")
-    else:
-        data = await asyncio.to_thread(vlc.vegalite_to_png, vega_lite_spec)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_bytes(data)
-    return {"output_path": str(path), "bytes_written": len(data)}
+    data, cached = await _cached_render(_chart_job(vega_lite_spec, suffix))
+    return _write_render(path, data, cached)
+
+
+@mcp.tool()
+async def render_charts(charts: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Render several Vega-Lite specs to chart files in one call.
+
+    Each item of `charts` is {"vega_lite_spec": {...}, "output_path": "..."}
+    with the same meaning as in `render_chart`. Charts missing from the
+    local render cache are rendered in parallel worker processes, and
+    identical specs are rendered once. Results come back in input order;
+    an item that fails carries an `error` instead of failing the batch.
+    """
+    pool = _chart_pool()
+    return await _render_batch(
+        [
+            (
+                chart.get("output_path", ""),
+                lambda suffix, chart=chart: _chart_job(
+                    chart["vega_lite_spec"], suffix, pool
+                ),
+            )
+            for chart in charts
+        ]
+    )
+
+
+def _diagram_job(
+    client: "KrokiClient",
+    diagram_type: str,
+    diagram_source: str,
+    suffix: str,
+    limit: asyncio.Semaphore | None = None,
+) -> _RenderJob:
+    async def fetch(output_format: str) -> bytes:
+        if limit is None:
+            return await client.arender(diagram_type, diagram_source, output_format)
+        async with limit:
+            return await client.arender(diagram_type, diagram_source, output_format)
+
+    async def render() -> bytes:
+        import vl_convert as vlc
+
+        if suffix != "pdf":
+            return await fetch(suffix)
+        svg = await fetch("svg")
+        if b"<foreignObject" in svg:
+            # HTML-in-SVG labels (mermaid etc.) are dropped by the local
+            # SVG-to-PDF converter, so rasterize via Kroki's PNG instead.
+            return await asyncio.to_thread(_png_to_pdf, await fetch("png"))
+        return await asyncio.to_thread(vlc.svg_to_pdf, svg.decode("utf-8"))
+
+    return (
+        f"kroki:{client.base_url}",
+        suffix,
+        {"diagram_type": diagram_type, "diagram_source": diagram_source},
+        render,
+    )
 
 
 @mcp.tool()
@@ -1017,24 +1264,48 @@ async def render_diagram(
     prefer "graphviz" / "plantuml" when you want vector text. Rendering uses
     the public https://kroki.io by default — set KROKI_BASE_URL to a
     self-hosted instance to keep unpublished diagrams private. No API keys
-    required.
+    required. An identical diagram rendered before is served from the
+    local render cache (`cached` in the result) without a request. To
+    render several diagrams, use `render_diagrams`.
     """
     path, suffix = _resolve_render_output(output_path)
+    job = _diagram_job(_kroki_client(), diagram_type, diagram_source, suffix)
+    data, cached = await _cached_render(job)
+    return _write_render(path, data, cached)
+
+
+@mcp.tool()
+async def render_diagrams(
+    diagrams: list[dict[str, Any]],
+    max_concurrency: int = 8,
+) -> list[dict[str, Any]]:
+    """Render several text diagrams to files via Kroki in one call.
+
+    Each item of `diagrams` is {"diagram_type": "...", "diagram_source":
+    "...", "output_path": "..."} with the same meaning as in
+    `render_diagram`. Diagrams missing from the local render cache are
+    requested from Kroki concurrently (at most `max_concurrency` requests
+    in flight), and identical diagrams are rendered once. Results come
+    back in input order; an item that fails carries an `error` instead of
+    failing the batch.
+    """
     client = _kroki_client()
-    if suffix == "pdf":
-        svg = await client.arender(diagram_type, diagram_source, "svg")
-        if b"<foreignObject" in svg:
-            # HTML-in-SVG labels (mermaid etc.) are dropped by the local
-            # SVG-to-PDF converter, so rasterize via Kroki's PNG instead.
-            png = await client.arender(diagram_type, diagram_source, "png")
-            data = await asyncio.to_thread(_png_to_pdf, png)
-        else:
-            data = await asyncio.to_thread(vlc.svg_to_pdf, svg.decode("utf-8"))
-    else:
-        data = await client.arender(diagram_type, diagram_source, suffix)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_bytes(data)
-    return {"output_path": str(path), "bytes_written": len(data)}
+    limit = asyncio.Semaphore(max_concurrency)
+    return await _render_batch(
+        [
+            (
+                diagram.get("output_path", ""),
+                lambda suffix, diagram=diagram: _diagram_job(
+                    client,
+                    diagram["diagram_type"],
+                    diagram["diagram_source"],
+                    suffix,
+                    limit,
+                ),
+            )
+            for diagram in diagrams
+        ]
+    )
 
 
 # --- Paper writing & publication ---
@@ -1048,6 +1319,10 @@ async def generate_bibfile(research_study_list: list[dict[str, Any]]) -> str:
     the .bib content used by `generate_paper` and `generate_latex`.
     No API keys required.
     """
+    from airas.usecases.writers.generate_bibfile_subgraph.generate_bibfile_subgraph import (
+        GenerateBibfileSubgraph,
+    )
+
     studies = [ResearchStudy.model_validate(study) for study in research_study_list]
     result = (
         await GenerateBibfileSubgraph()
@@ -1065,20 +1340,27 @@ async def generate_paper(
     research_study_list: list[dict[str, Any]],
     references_bib: str,
     writing_refinement_rounds: int = 2,
+    writing_mode: Literal["full_paper", "section_parallel"] = "full_paper",
 ) -> dict[str, Any]:
     """Write the paper content from the completed research (backend LLM).
 
     Takes the hypothesis, experiment history, experiment code, related
     studies, and the BibTeX file (from `generate_bibfile`), and produces
     structured paper content (title, abstract, sections). Pass the result
-    to `generate_latex`. Requires an LLM provider API key — without one, use
+    to `generate_latex`. `writing_mode="section_parallel"` writes and refines
+    the sections concurrently, which is considerably faster. Requires an LLM provider API key — without one, use
     `get_generation_prompt(step="paper_writing", ...)` and author the paper
     yourself in one pass with the same curated prompt.
     """
+    from airas.usecases.writers.write_subgraph.write_subgraph import (
+        WriteSubgraph,
+    )
+
     result = (
         await WriteSubgraph(
             langchain_client=_langchain_client(),
             paper_content_refinement_iterations=writing_refinement_rounds,
+            writing_mode=writing_mode,
         )
         .build_graph()
         .ainvoke(
@@ -1117,6 +1399,10 @@ async def generate_latex(
     `get_generation_prompt(step="latex_conversion", ...)` and do the
     conversion yourself with the template from your local clone.
     """
+    from airas.usecases.publication.generate_latex_subgraph.generate_latex_subgraph import (
+        GenerateLatexSubgraph,
+    )
+
     result = (
         await GenerateLatexSubgraph(
             langchain_client=_langchain_client(),
@@ -1153,6 +1439,10 @@ async def compile_latex(
     `paper_url` (when available); track the run with `get_workflow_runs`.
     Requires GH_PERSONAL_ACCESS_TOKEN.
     """
+    from airas.usecases.publication.compile_latex_subgraph.compile_latex_subgraph import (
+        CompileLatexSubgraph,
+    )
+
     result = (
         await CompileLatexSubgraph(
             github_client=_github_client(),
@@ -1273,6 +1563,27 @@ def stop_dashboard() -> dict[str, Any]:
     return stop_dashboard_process()
 
 
+@mcp.tool()
+def get_http_diagnostics(top: int = 15) -> dict[str, Any]:
+    """Report how this MCP server's outbound HTTP calls have been performing.
+
+    Returns per-host request counts, time spent, bytes received and transport
+    errors (slowest hosts first), the `top` endpoints by total latency,
+    retries per client method, the last rate-limit headroom reported by each
+    upstream (e.g. GitHub's X-RateLimit-Remaining) and response cache
+    statistics. Useful when a tool is slow or failing to tell whether an
+    upstream is throttling. Counters cover this server process since it
+    started. No API keys required.
+    """
+    from airas.infra.http_cache import shared_http_cache
+    from airas.infra.http_telemetry import HTTP_TELEMETRY
+
+    diagnostics = HTTP_TELEMETRY.summarize(top=top)
+    if (http_cache := shared_http_cache()) is not None:
+        diagnostics["http_cache"] = http_cache.stats()
+    return diagnostics
+
+
 # --- Prompts (guided workflows for MCP clients) ---
 
 
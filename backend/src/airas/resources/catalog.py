@@ -0,0 +1,326 @@
+"""Lazily loaded, indexed catalog of the curated datasets, models and libraries.
+
+Each section of the catalog is one resource module (e.g. ``image_datasets`` is
+``datasets/image_dataset.py``) and is imported the first time it is read, so
+importing ``airas`` no longer pays for every large literal up front.
+
+Lookups by name, task, modality or tag go through an inverted index that is
+prebuilt into ``catalog_index.json`` by ``scripts/build_resource_catalog_index.py``;
+only the sections holding matching entries are imported. The index records a
+fingerprint of the section sources. When a module was edited without
+rebuilding it, the index is rebuilt in memory (importing every section) and a
+warning says so, so a stale file never returns wrong results.
+"""
+
+import hashlib
+import importlib
+import json
+import logging
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
+from typing import Any, Literal
+
+logger = logging.getLogger(__name__)
+
+ResourceKind = Literal["datasets", "models", "libraries"]
+IndexField = Literal["name", "task", "modality", "tag"]
+
+_RESOURCES_DIR = Path(__file__).parent
+INDEX_PATH = _RESOURCES_DIR / "catalog_index.json"
+
+
+@dataclass(frozen=True)
+class CatalogSection:
+    kind: ResourceKind
+    # Module under airas.resources and the dict it defines.
+    module: str
+    attribute: str
+    # Modalities implied by the section for entries that do not list their own.
+    modalities: tuple[str, ...] = ()
+
+    @property
+    def path(self) -> Path:
+        return _RESOURCES_DIR.joinpath(*self.module.split(".")).with_suffix(".py")
+
+
+# (domain, category) pairs; each is libraries/<domain>/<category>.py defining
+# <CATEGORY>_LIBRARIES. To add a category, add its module and list it here.
+_LIBRARY_CATEGORIES = [
+    ("foundations", "core"),
+    ("foundations", "jax_ecosystem"),
+    ("llm", "fine_tuning"),
+    ("llm", "post_training"),
+    ("llm", "architecture_research"),
+    ("llm", "tokenization"),
+    ("llm", "evaluation"),
+    ("llm", "orchestration"),
+    ("llm", "structured_output"),
+    ("llm", "rag_retrieval"),
+    ("llm", "safety"),
+    ("llm", "nlp"),
+    ("systems", "distributed_training"),
+    ("systems", "gpu_computing"),
+    ("systems", "inference_serving"),
+    ("systems", "model_compression"),
+    ("systems", "data_processing"),
+    ("systems", "experiment_tracking"),
+    ("statistics", "statistical_analysis"),
+    ("statistics", "bayesian_inference"),
+    ("statistics", "survival_analysis"),
+    ("statistics", "experimental_design"),
+    ("statistics", "causal_inference"),
+    ("statistics", "time_series"),
+    ("statistics", "spatial_statistics"),
+    ("machine_learning", "statistical_ml"),
+    ("machine_learning", "recommender_systems"),
+    ("machine_learning", "anomaly_detection"),
+    ("machine_learning", "hyperparameter_optimization"),
+    ("decision_science", "mathematical_optimization"),
+    ("decision_science", "decision_making"),
+    ("embodied_ai", "reinforcement_learning"),
+    ("embodied_ai", "simulation"),
+    ("embodied_ai", "vla"),
+    ("embodied_ai", "world_models"),
+    ("perception", "vision"),
+    ("perception", "vision_language"),
+    ("perception", "audio"),
+    ("interpretability", "mechanistic"),
+    ("interpretability", "explainable_ai"),
+    ("graphs", "network_analysis"),
+    ("graphs", "graph_learning"),
+    ("science", "bioinformatics"),
+    ("science", "medical"),
+    ("science", "chemistry_materials"),
+    ("science", "physics"),
+    ("science", "quantum_computing"),
+]
+
+# Section names of datasets and models match DatasetSubfield / ModelSubfield.
+SECTIONS: dict[str, CatalogSection] = {
+    "language_model_fine_tuning_datasets": CatalogSection(
+        "datasets",
+        "datasets.language_model_fine_tuning_dataset",
+        "LANGUAGE_MODEL_FINE_TUNING_DATASETS",
+        modalities=("text",),
+    ),
+    "image_datasets": CatalogSection(
+        "datasets", "datasets.image_dataset", "IMAGES_DATASETS", modalities=("image",)
+    ),
+    "prompt_engineering_datasets": CatalogSection(
+        "datasets",
+        "datasets.prompt_engineering_datasets",
+        "PROMPT_ENGINEERING_DATASETS",
+        modalities=("text",),
+    ),
+    "transformer_decoder_based_models": CatalogSection(
+        "models",
+        "models.transformer_decoder_based_models",
+        "TRANSFORMER_DECODER_BASED_MODELS",
+    ),
+    "image_models": CatalogSection("models", "models.image_model", "IMAGE_MODELS"),
+    "multi_modal_models": CatalogSection(
+        "models", "models.multi_modal_model", "MULTI_MODAL_MODELS"
+    ),
+    "llm_api_models": CatalogSection(
+        "models", "models.llm_api_models", "LLM_API_MODELS"
+    ),
+    **{
+        category: CatalogSection(
+            "libraries",
+            f"libraries.{domain}.{category}",
+            f"{category.upper()}_LIBRARIES",
+        )
+        for domain, category in _LIBRARY_CATEGORIES
+    },
+}
+
+
+# Words of a name; version numbers such as 4.1 stay whole.
+_NAME_WORD = re.compile(r"[a-z0-9]+(?:\.[0-9]+)?")
+
+
+def normalize_term(term: str) -> str:
+    """``Image Classification``, ``image_classification`` -> ``image-classification``."""
+    return re.sub(r"[\s_]+", "-", term.strip().lower())
+
+
+def _name_terms(name: str) -> set[str]:
+    normalized = normalize_term(name)
+    return {normalized, *_NAME_WORD.findall(normalized)}
+
+
+def _as_list(value: Any) -> list[str]:
+    if isinstance(value, str):
+        return [value]
+    if isinstance(value, list):
+        return [v for v in value if isinstance(v, str)]
+    return []
+
+
+def _entry_terms(
+    section: CatalogSection, name: str, entry: dict[str, Any]
+) -> dict[IndexField, set[str]]:
+    modalities = _as_list(entry.get("input_modalities")) + _as_list(
+        entry.get("output_modalities")
+    )
+    tags = [
+        *_as_list(entry.get("dependent_packages")),
+        *_as_list(entry.get("domain")),
+        *_as_list(entry.get("category")),
+    ]
+    return {
+        "name": _name_terms(name),
+        "task": {normalize_term(t) for t in _as_list(entry.get("task_type"))},
+        "modality": {normalize_term(m) for m in modalities or section.modalities},
+        "tag": {normalize_term(t) for t in tags},
+    }
+
+
+def _load_section(section: CatalogSection) -> dict[str, Any]:
+    module = importlib.import_module(f"airas.resources.{section.module}")
+    return getattr(module, section.attribute)
+
+
+def sources_fingerprint(sections: dict[str, CatalogSection] = SECTIONS) -> str:
+    digest = hashlib.sha256()
+    for name, section in sections.items():
+        digest.update(f"{name}:{section.module}:{section.attribute}\n".encode())
+        digest.update(section.path.read_bytes())
+    return digest.hexdigest()
+
+
+def build_index(sections: dict[str, CatalogSection] = SECTIONS) -> dict[str, Any]:
+    """Import every section and build the serialisable index.
+
+    ``entries`` lists ``[section, name]`` pairs in catalog order; postings
+    refer to them by position.
+    """
+    entries: list[list[str]] = []
+    postings: dict[str, dict[str, list[int]]] = {
+        field: {} for field in ("name", "task", "modality", "tag")
+    }
+    for section_name, section in sections.items():
+        for name, entry in _load_section(section).items():
+            entry_id = len(entries)
+            entries.append([section_name, name])
+            for field, terms in _entry_terms(section, name, entry).items():
+                for term in terms:
+                    postings[field].setdefault(term, []).append(entry_id)
+    return {
+        "fingerprint": sources_fingerprint(sections),
+        "entries": entries,
+        "postings": postings,
+    }
+
+
+class ResourceCatalog:
+    def __init__(
+        self,
+        sections: dict[str, CatalogSection] = SECTIONS,
+        index_path: Path = INDEX_PATH,
+    ) -> None:
+        self.sections = sections
+        self.index_path = index_path
+        self._loaded: dict[str, dict[str, Any]] = {}
+
+    def section(self, section_name: str) -> dict[str, Any]:
+        """All entries of one section, e.g. ``section("image_datasets")``."""
+        if section_name not in self._loaded:
+            self._loaded[section_name] = _load_section(self.sections[section_name])
+        return self._loaded[section_name]
+
+    def entries(self, kind: ResourceKind) -> dict[str, Any]:
+        """All entries of one kind, in catalog order."""
+        merged: dict[str, Any] = {}
+        for section_name, section in self.sections.items():
+            if section.kind != kind:
+                continue
+            for name, entry in self.section(section_name).items():
+                if name in merged:
+                    raise ValueError(f"Duplicate {kind} name: {name}")
+                merged[name] = entry
+        return merged
+
+    @cached_property
+    def _index(self) -> dict[str, Any]:
+        try:
+            index = json.loads(self.index_path.read_text())
+            if index["fingerprint"] == sources_fingerprint(self.sections):
+                return index
+            reason = "is out of date"
+        except FileNotFoundError:
+            reason = "is missing"
+        logger.warning(
+            f"{self.index_path.name} {reason}; rebuilding it in memory. "
+            "Run backend/scripts/build_resource_catalog_index.py to refresh it."
+        )
+        return build_index(self.sections)
+
+    def terms(self, field: IndexField) -> list[str]:
+        """Indexed values of a field, e.g. every known task."""
+        return sorted(self._index["postings"][field])
+
+    def _postings(self, field: IndexField, value: str) -> set[int]:
+        postings = self._index["postings"][field]
+        if field != "name":
+            return set(postings.get(normalize_term(value), ()))
+        # Every word of a name query must match (``llama 4`` finds Llama-4-*).
+        words = _NAME_WORD.findall(normalize_term(value))
+        if not words:
+            return set()
+        return set.intersection(*(set(postings.get(word, ())) for word in words))
+
+    def _resolve(self, entry_ids: Iterable[int]) -> dict[str, Any]:
+        entries = self._index["entries"]
+        results: dict[str, Any] = {}
+        for entry_id in sorted(entry_ids):
+            section_name, name = entries[entry_id]
+            results[name] = self.section(section_name)[name]
+        return results
+
+    def get(self, name: str, kind: ResourceKind | None = None) -> dict[str, Any] | None:
+        """The entry called ``name`` (case and ``_``/``-``/space insensitive)."""
+        normalized = normalize_term(name)
+        for entry_id in sorted(self._index["postings"]["name"].get(normalized, ())):
+            section_name, entry_name = self._index["entries"][entry_id]
+            if normalize_term(entry_name) != normalized:
+                continue
+            if kind is None or self.sections[section_name].kind == kind:
+                return self.section(section_name)[entry_name]
+        return None
+
+    def search(
+        self,
+        *,
+        kind: ResourceKind | None = None,
+        section: str | None = None,
+        name: str | None = None,
+        task: str | None = None,
+        modality: str | None = None,
+        tag: str | None = None,
+    ) -> dict[str, Any]:
+        """Entries matching every given filter, in catalog order."""
+        entries = self._index["entries"]
+        matches: set[int] = set(range(len(entries)))
+        for field, value in (
+            ("name", name),
+            ("task", task),
+            ("modality", modality),
+            ("tag", tag),
+        ):
+            if value is not None:
+                matches &= self._postings(field, value)
+        if section is not None or kind is not None:
+            matches = {
+                i
+                for i in matches
+                if (section is None or entries[i][0] == section)
+                and (kind is None or self.sections[entries[i][0]].kind == kind)
+            }
+        return self._resolve(matches)
+
+
+RESOURCE_CATALOG = ResourceCatalog()
@@ -3,6 +3,7 @@
 # be required for visual content extraction.)
 
 import logging
+from typing import Any
 
 from langgraph.graph import END, START, StateGraph
 from pydantic import BaseModel
@@ -20,6 +21,7 @@ from airas.infra.langchain_client import LangChainClient
 from airas.usecases.analyzers.analyze_experiment_subgraph.nodes.analyze_experiment import (
     analyze_experiment,
 )
+from airas.usecases.analyzers.nodes.summarize_metrics import summarize_metrics
 
 setup_logging()
 logger = logging.getLogger(__name__)
@@ -47,7 +49,7 @@ class AnalyzeExperimentSubgraphState(
     AnalyzeExperimentSubgraphOutputState,
     total=False,
 ):
-    pass
+    metrics_summary: dict[str, Any] | None
 
 
 class AnalyzeExperimentSubgraph:
@@ -59,6 +61,13 @@ class AnalyzeExperimentSubgraph:
         self.llm_mapping = llm_mapping or AnalyzeExperimentLLMMapping()
         self.langchain_client = langchain_client
 
+    @record_execution_time
+    def _summarize_metrics(
+        self, state: AnalyzeExperimentSubgraphState
+    ) -> dict[str, dict[str, Any] | None]:
+        metrics_summary = summarize_metrics(state["experimental_results"].metrics_data)
+        return {"metrics_summary": metrics_summary}
+
     @record_execution_time
     async def _analyze_experiment(
         self, state: AnalyzeExperimentSubgraphState
@@ -70,6 +79,7 @@ class AnalyzeExperimentSubgraph:
             experimental_design=state["experimental_design"],
             experiment_code=state["experiment_code"],
             experimental_results=state["experimental_results"],
+            metrics_summary=state.get("metrics_summary"),
         )
         experimental_analysis = ExperimentalAnalysis(analysis_report=analysis_report)
         return {"experimental_analysis": experimental_analysis}
@@ -81,9 +91,11 @@ class AnalyzeExperimentSubgraph:
             output_schema=AnalyzeExperimentSubgraphOutputState,
         )
 
+        graph_builder.add_node("summarize_metrics", self._summarize_metrics)
         graph_builder.add_node("analyze_experiment", self._analyze_experiment)
 
-        graph_builder.add_edge(START, "analyze_experiment")
+        graph_builder.add_edge(START, "summarize_metrics")
+        graph_builder.add_edge("summarize_metrics", "analyze_experiment")
         graph_builder.add_edge("analyze_experiment", END)
 
         return graph_builder.compile()
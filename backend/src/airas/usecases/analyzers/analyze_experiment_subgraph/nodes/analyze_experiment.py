@@ -1,9 +1,10 @@
 from logging import getLogger
+from typing import Any
 
-from jinja2 import Environment
 from pydantic import BaseModel
 
 from airas.core.llm_config import NodeLLMConfig
+from airas.core.prompt_templates import get_template
 from airas.core.types.experiment_code import ExperimentCode
 from airas.core.types.experimental_design import ExperimentalDesign
 from airas.core.types.experimental_results import ExperimentalResults
@@ -27,9 +28,9 @@ async def analyze_experiment(
     experimental_design: ExperimentalDesign,
     experiment_code: ExperimentCode,
     experimental_results: ExperimentalResults,
+    metrics_summary: dict[str, Any] | None = None,
 ) -> str:
-    env = Environment()
-    template = env.from_string(analyze_experiment_prompt)
+    template = get_template(analyze_experiment_prompt)
 
     messages = template.render(
         {
@@ -37,6 +38,7 @@ async def analyze_experiment(
             "experimental_design": experimental_design,
             "experiment_code": experiment_code,
             "experimental_results": experimental_results,
+            "metrics_summary": metrics_summary,
         }
     )
     output = await langchain_client.structured_outputs(
@@ -71,7 +71,27 @@ Your task is to analyze the experimental results and generate a comprehensive an
 
 # Experimental Results
 {% if experimental_results %}
-{% if experimental_results.metrics_data %}
+{% if metrics_summary %}
+{% if metrics_summary.comparison_table %}
+## Comparison Table
+Values are final/scalar metrics; seed repeats are pooled as mean ± 95% CI.
+{{ metrics_summary.comparison_table }}
+{% endif %}
+
+## Metrics Summary
+Per-run scalar metrics and training curves (downsampled; "final", "best", "min", "max" are computed from the full curve).
+{{ metrics_summary.runs | tojson }}
+{% if metrics_summary.seed_groups %}
+
+## Seed Statistics
+{{ metrics_summary.seed_groups | tojson }}
+{% endif %}
+{% if metrics_summary.comparison %}
+
+## Aggregated Comparison
+{{ metrics_summary.comparison | tojson }}
+{% endif %}
+{% elif experimental_results.metrics_data %}
 ## Metrics Data
 {{ experimental_results.metrics_data | tojson(indent=2) }}
 {% endif %}
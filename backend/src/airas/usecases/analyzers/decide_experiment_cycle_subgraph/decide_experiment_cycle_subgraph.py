@@ -1,4 +1,5 @@
 import logging
+from typing import Any
 
 from langgraph.graph import END, START, StateGraph
 from pydantic import BaseModel
@@ -16,12 +17,15 @@ from airas.infra.langchain_client import LangChainClient
 from airas.usecases.analyzers.decide_experiment_cycle_subgraph.nodes.decide_experiment_cycle import (
     decide_experiment_cycle,
 )
+from airas.usecases.analyzers.nodes.summarize_metrics import summarize_metrics
 
 setup_logging()
 logger = logging.getLogger(__name__)
 
 record_execution_time = lambda f: time_node("decide_experiment_cycle_subgraph")(f)  # noqa: E731
 
+DECISION_CURVE_POINTS = 8
+
 
 class DecideExperimentCycleLLMMapping(BaseModel):
     decide_experiment_cycle: NodeLLMConfig = DEFAULT_NODE_LLM_CONFIG[
@@ -41,8 +45,10 @@ class DecideExperimentCycleSubgraphOutputState(ExecutionTimeState):
 class DecideExperimentCycleSubgraphState(
     DecideExperimentCycleSubgraphInputState,
     DecideExperimentCycleSubgraphOutputState,
+    total=False,
 ):
-    pass
+    # One entry per cycle in experiment_history.cycles
+    metrics_summaries: list[dict[str, Any] | None]
 
 
 class DecideExperimentCycleSubgraph:
@@ -54,6 +60,23 @@ class DecideExperimentCycleSubgraph:
         self.langchain_client = langchain_client
         self.llm_mapping = llm_mapping or DecideExperimentCycleLLMMapping()
 
+    @record_execution_time
+    def _summarize_metrics(
+        self, state: DecideExperimentCycleSubgraphState
+    ) -> dict[str, list[dict[str, Any] | None]]:
+        # The decision looks across every cycle, so curves get a smaller budget
+        # than in AnalyzeExperimentSubgraph.
+        metrics_summaries = [
+            summarize_metrics(
+                cycle.experimental_results.metrics_data,
+                max_curve_points=DECISION_CURVE_POINTS,
+            )
+            if cycle.experimental_results
+            else None
+            for cycle in state["experiment_history"].cycles
+        ]
+        return {"metrics_summaries": metrics_summaries}
+
     @record_execution_time
     async def _decide_experiment_cycle(
         self, state: DecideExperimentCycleSubgraphState
@@ -63,6 +86,7 @@ class DecideExperimentCycleSubgraph:
             llm_client=self.langchain_client,
             research_hypothesis=state["research_hypothesis"],
             experiment_history=state["experiment_history"],
+            metrics_summaries=state.get("metrics_summaries"),
         )
         return {"experiment_cycle_decision": decision}
 
@@ -73,9 +97,11 @@ class DecideExperimentCycleSubgraph:
             output_schema=DecideExperimentCycleSubgraphOutputState,
         )
 
+        graph_builder.add_node("summarize_metrics", self._summarize_metrics)
         graph_builder.add_node("decide_experiment_cycle", self._decide_experiment_cycle)
 
-        graph_builder.add_edge(START, "decide_experiment_cycle")
+        graph_builder.add_edge(START, "summarize_metrics")
+        graph_builder.add_edge("summarize_metrics", "decide_experiment_cycle")
         graph_builder.add_edge("decide_experiment_cycle", END)
 
         return graph_builder.compile()
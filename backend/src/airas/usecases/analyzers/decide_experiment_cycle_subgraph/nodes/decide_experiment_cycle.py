@@ -1,8 +1,8 @@
 import logging
-
-from jinja2 import Environment
+from typing import Any
 
 from airas.core.llm_config import NodeLLMConfig
+from airas.core.prompt_templates import get_template
 from airas.core.types.experiment_history import (
     ExperimentCycleDecision,
     ExperimentHistory,
@@ -21,14 +21,14 @@ async def decide_experiment_cycle(
     llm_client: LangChainClient,
     research_hypothesis: ResearchHypothesis,
     experiment_history: ExperimentHistory,
+    metrics_summaries: list[dict[str, Any] | None] | None = None,
 ) -> ExperimentCycleDecision:
-    env = Environment()
-
-    template = env.from_string(decide_experiment_cycle_prompt)
+    template = get_template(decide_experiment_cycle_prompt)
 
     data = {
         "research_hypothesis": research_hypothesis,
         "experiment_history": experiment_history,
+        "metrics_summaries": metrics_summaries or [],
     }
     messages = template.render(data)
     output = await llm_client.structured_outputs(
@@ -23,7 +23,12 @@ Based on the full experiment history and the latest analysis, decide whether to:
   - Evaluation metrics: {% for m in cycle.experimental_design.evaluation_metrics %}{{ m.name }}{% if not loop.last %}, {% endif %}{% endfor %}
 {% if cycle.experimental_results %}- Results:
   {% if cycle.experimental_results.stdout %}  - Stdout (summary): {{ cycle.experimental_results.stdout[:500] }}{% endif %}
-  {% if cycle.experimental_results.metrics_data %}  - Metrics: {{ cycle.experimental_results.metrics_data }}{% endif %}
+  {% set summary = metrics_summaries[loop.index0] if loop.index0 < metrics_summaries | length else none %}
+  {% if summary %}{% if summary.comparison_table %}  - Comparison (final/scalar values, seeds pooled as mean ± 95% CI):
+{{ summary.comparison_table }}
+{% endif %}  - Metrics summary: {{ summary.runs | tojson }}{% if summary.comparison %}
+  - Aggregated comparison: {{ summary.comparison | tojson }}{% endif %}
+  {% elif cycle.experimental_results.metrics_data %}  - Metrics: {{ cycle.experimental_results.metrics_data }}{% endif %}
 {% endif %}
 {% if cycle.experimental_analysis %}- Analysis: {{ cycle.experimental_analysis.analysis_report }}
 {% endif %}
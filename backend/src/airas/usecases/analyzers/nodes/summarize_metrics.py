@@ -0,0 +1,256 @@
+"""Compact summary of ``ExperimentalResults.metrics_data`` for LLM prompts.
+
+Runs write arbitrary ``metrics.json`` files, often with full per-step training
+curves. Rendering them verbatim into the analysis prompts wastes tokens and,
+once the context window is exceeded, silently drops results. This module
+reduces every run to its scalar metrics plus LTTB-downsampled curves, pools
+runs that differ only by seed into mean / std / 95% confidence intervals, and
+renders a markdown comparison table across runs.
+"""
+
+import math
+import re
+from collections import defaultdict
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_MAX_CURVE_POINTS = 20
+MAX_TABLE_COLUMNS = 12
+MAX_STRING_LENGTH = 200
+
+# "<run>-seed1", "<run>_seed_2" are treated as repeats of "<run>". Only an
+# explicit seed token counts: "vit_s16" and "vit_s32" are different runs.
+_SEED_SUFFIX = re.compile(r"[-_]seed[-_]?\d+$", re.IGNORECASE)
+_LOWER_IS_BETTER = re.compile(
+    r"loss|error|err\b|perplexity|ppl|mse|mae|rmse|wer|cer|latency|time",
+    re.IGNORECASE,
+)
+_STEP_COLUMNS = ("step", "_step", "global_step", "epoch", "iteration", "iter")
+# Name of a run's metric when metrics.json holds a bare number or list.
+_VALUE_KEY = "value"
+
+# Two-sided 95% Student-t critical values by degrees of freedom.
+_T_95 = {
+    1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776, 5: 2.571, 6: 2.447, 7: 2.365,
+    8: 2.306, 9: 2.262, 10: 2.228, 11: 2.201, 12: 2.179, 13: 2.160, 14: 2.145,
+    15: 2.131, 16: 2.120, 17: 2.110, 18: 2.101, 19: 2.093, 20: 2.086,
+    25: 2.060, 30: 2.042,
+}  # fmt: skip
+
+
+def lttb(points: np.ndarray, n_out: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets downsampling of an (n, 2) array."""
+    n = len(points)
+    if n_out >= n or n_out < 3:
+        return points
+
+    sampled = [points[0]]
+    bucket_size = (n - 2) / (n_out - 2)
+    anchor = 0
+    for i in range(n_out - 2):
+        start = int(i * bucket_size) + 1
+        end = int((i + 1) * bucket_size) + 1
+        next_end = max(min(int((i + 2) * bucket_size) + 1, n), end + 1)
+        next_avg = points[end:next_end].mean(axis=0)
+
+        bucket = points[start:end]
+        a = points[anchor]
+        areas = np.abs(
+            (a[0] - next_avg[0]) * (bucket[:, 1] - a[1])
+            - (a[0] - bucket[:, 0]) * (next_avg[1] - a[1])
+        )
+        anchor = start + int(np.argmax(areas))
+        sampled.append(points[anchor])
+    sampled.append(points[-1])
+    return np.asarray(sampled)
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, int | float) and not isinstance(value, bool)
+
+
+def _round(value: float) -> float:
+    return float(f"{value:.6g}")
+
+
+def _curve(x: np.ndarray, y: np.ndarray) -> np.ndarray | None:
+    """(n, 2) points with NaN / inf dropped; ``None`` below two points."""
+    mask = np.isfinite(x) & np.isfinite(y)
+    if mask.sum() < 2:
+        return None
+    return np.column_stack([x[mask], y[mask]])
+
+
+def _records_to_curves(prefix: str, records: list[dict]) -> dict[str, np.ndarray]:
+    frame = pd.DataFrame.from_records(records)
+    step = next((c for c in _STEP_COLUMNS if c in frame.columns), None)
+    x = (
+        pd.to_numeric(frame[step], errors="coerce")
+        if step
+        else pd.Series(range(len(frame)))
+    )
+    curves: dict[str, np.ndarray] = {}
+    for column in frame.columns:
+        if column == step:
+            continue
+        y = pd.to_numeric(frame[column], errors="coerce")
+        points = _curve(x.to_numpy(float), y.to_numpy(float))
+        if points is not None:
+            curves[f"{prefix}{column}"] = points
+    return curves
+
+
+def _flatten(
+    value: Any,
+    prefix: str,
+    scalars: dict[str, Any],
+    curves: dict[str, np.ndarray],
+) -> None:
+    name = prefix.rstrip(".") or _VALUE_KEY
+    if isinstance(value, dict):
+        for key, item in value.items():
+            _flatten(item, f"{prefix}{key}.", scalars, curves)
+    elif isinstance(value, list) and len(value) >= 2 and all(map(_is_number, value)):
+        y = np.asarray(value, dtype=float)
+        if (points := _curve(np.arange(len(y), dtype=float), y)) is not None:
+            curves[name] = points
+    elif isinstance(value, list) and value and all(isinstance(v, dict) for v in value):
+        curves.update(_records_to_curves(prefix, value))
+    elif _is_number(value):
+        if math.isfinite(value):
+            scalars[name] = _round(value)
+    elif isinstance(value, str | bool) or value is None:
+        scalars[name] = value[:MAX_STRING_LENGTH] if isinstance(value, str) else value
+    elif isinstance(value, list):
+        # Short heterogeneous lists (labels, class names, ...) are kept as is.
+        scalars[name] = str(value)[:MAX_STRING_LENGTH]
+
+
+def _summarize_curve(name: str, points: np.ndarray, max_points: int) -> dict:
+    y = points[:, 1]
+    lower_is_better = bool(_LOWER_IS_BETTER.search(name))
+    return {
+        "final": _round(y[-1]),
+        "best": _round(y.min() if lower_is_better else y.max()),
+        "min": _round(y.min()),
+        "max": _round(y.max()),
+        "n_points": len(points),
+        "curve": [[_round(x_), _round(y_)] for x_, y_ in lttb(points, max_points)],
+    }
+
+
+def _summarize_run(metrics: Any, max_points: int) -> dict[str, Any]:
+    scalars: dict[str, Any] = {}
+    curves: dict[str, np.ndarray] = {}
+    _flatten(metrics, "", scalars, curves)
+    summary: dict[str, Any] = {"scalars": scalars}
+    if curves:
+        summary["curves"] = {
+            name: _summarize_curve(name, points, max_points)
+            for name, points in curves.items()
+        }
+    return summary
+
+
+def _numeric_values(run_summary: dict[str, Any]) -> dict[str, float]:
+    """Scalar metrics plus each curve's final value, for cross-run comparison."""
+    values = {k: v for k, v in run_summary["scalars"].items() if _is_number(v)}
+    for name, curve in run_summary.get("curves", {}).items():
+        values.setdefault(f"{name} (final)", curve["final"])
+    return values
+
+
+def _confidence_interval(samples: list[float]) -> dict[str, float]:
+    array = np.asarray(samples, dtype=float)
+    n = len(array)
+    std = float(array.std(ddof=1))
+    dof = n - 1
+    t = _T_95.get(dof) or (
+        _T_95[max(k for k in _T_95 if k <= dof)] if dof < 30 else 1.96
+    )
+    return {
+        "mean": _round(float(array.mean())),
+        "std": _round(std),
+        "ci95": _round(t * std / math.sqrt(n)),
+        "n": n,
+    }
+
+
+def _seed_groups(run_ids: list[str]) -> dict[str, list[str]]:
+    groups: dict[str, list[str]] = defaultdict(list)
+    for run_id in run_ids:
+        groups[_SEED_SUFFIX.sub("", run_id)].append(run_id)
+    return {name: members for name, members in groups.items() if len(members) > 1}
+
+
+def _format_cell(value: float | dict | None) -> str:
+    if value is None:
+        return "-"
+    if isinstance(value, dict):
+        return f"{value['mean']:.4g} ± {value['ci95']:.2g} (n={value['n']})"
+    return f"{value:.4g}"
+
+
+def _comparison_table(rows: dict[str, dict[str, float | dict]]) -> str | None:
+    if len(rows) < 2:
+        return None
+    column_counts = pd.Series(
+        [column for row in rows.values() for column in row]
+    ).value_counts(sort=False)
+    columns = [c for c, count in column_counts.items() if count >= 2]
+    columns = columns[:MAX_TABLE_COLUMNS]
+    if not columns:
+        return None
+
+    lines = [
+        "| run | " + " | ".join(columns) + " |",
+        "|---" * (len(columns) + 1) + "|",
+    ]
+    for name, row in rows.items():
+        cells = [_format_cell(row.get(column)) for column in columns]
+        lines.append(f"| {name} | " + " | ".join(cells) + " |")
+    return "\n".join(lines)
+
+
+def summarize_metrics(
+    metrics_data: dict[str, Any] | None,
+    max_curve_points: int = DEFAULT_MAX_CURVE_POINTS,
+) -> dict[str, Any] | None:
+    if not metrics_data:
+        return None
+
+    run_metrics = {k: v for k, v in metrics_data.items() if k != "comparison"}
+    runs = {
+        run_id: _summarize_run(metrics, max_curve_points)
+        for run_id, metrics in run_metrics.items()
+    }
+    values = {run_id: _numeric_values(summary) for run_id, summary in runs.items()}
+
+    seed_groups: dict[str, Any] = {}
+    rows: dict[str, dict[str, float | dict]] = {}
+    grouped_runs: set[str] = set()
+    for group, members in _seed_groups(list(runs)).items():
+        metric_names = set.intersection(*(set(values[m]) for m in members))
+        pooled = {
+            name: _confidence_interval([values[m][name] for m in members])
+            for name in sorted(metric_names)
+        }
+        seed_groups[group] = {"runs": members, "metrics": pooled}
+        rows[group] = pooled
+        grouped_runs.update(members)
+    for run_id in runs:
+        if run_id not in grouped_runs:
+            rows[run_id] = values[run_id]
+
+    summary: dict[str, Any] = {"runs": runs}
+    if seed_groups:
+        summary["seed_groups"] = seed_groups
+    if table := _comparison_table(rows):
+        summary["comparison_table"] = table
+    if "comparison" in metrics_data:
+        summary["comparison"] = _summarize_run(
+            metrics_data["comparison"], max_curve_points
+        )
+    return summary
@@ -1,4 +1,3 @@
-import asyncio
 import logging
 
 from langgraph.graph import END, START, StateGraph
@@ -29,8 +28,10 @@ def record_execution_time(f):
 # Since the Cloudflare Tunnel URL is generated shortly after the workflow starts,
 # polling for the artifact here avoids an extra round-trip from the caller.
 
-_ARTIFACT_POLL_INTERVAL_SECONDS = 10
-_ARTIFACT_MAX_ATTEMPTS = 12  # max ~120s; process normally completes in ~50s
+_ARTIFACT_TIMEOUT_SECONDS = 120  # process normally completes in ~50s
+# Probes start this far apart and back off to at most the max interval.
+_ARTIFACT_POLL_INITIAL_SECONDS = 1
+_ARTIFACT_POLL_MAX_SECONDS = 5
 _ARTIFACT_NAME = "tunnel-url"
 
 
@@ -128,39 +129,33 @@ class DispatchInteractiveRepoAgentSubgraph:
             f"Polling for session URL artifact (workflow_run_id={workflow_run_id})"
         )
 
-        for attempt in range(1, _ARTIFACT_MAX_ATTEMPTS + 1):
-            artifacts_response = await self.github_client.alist_workflow_run_artifacts(
+        target = await self.github_client.await_until_artifact(
+            github_owner=github_config.github_owner,
+            repository_name=github_config.repository_name,
+            workflow_run_id=workflow_run_id,
+            artifact_name=_ARTIFACT_NAME,
+            timeout=_ARTIFACT_TIMEOUT_SECONDS,
+            initial_delay=_ARTIFACT_POLL_INITIAL_SECONDS,
+            max_delay=_ARTIFACT_POLL_MAX_SECONDS,
+        )
+        if target is not None:
+            artifact_id: int = target["id"]
+            logger.info(
+                f"Artifact '{_ARTIFACT_NAME}' found (id={artifact_id}), downloading..."
+            )
+            artifact_data = await download_and_parse_artifact_by_id(
+                github_client=self.github_client,
                 github_owner=github_config.github_owner,
                 repository_name=github_config.repository_name,
-                workflow_run_id=workflow_run_id,
+                artifact_id=artifact_id,
             )
-
-            artifacts = (artifacts_response or {}).get("artifacts", [])
-            target = next((a for a in artifacts if a["name"] == _ARTIFACT_NAME), None)
-            if target is not None:
-                artifact_id: int = target["id"]
-                logger.info(
-                    f"Artifact '{_ARTIFACT_NAME}' found (attempt {attempt}, id={artifact_id}), downloading..."
-                )
-                artifact_data = await download_and_parse_artifact_by_id(
-                    github_client=self.github_client,
-                    github_owner=github_config.github_owner,
-                    repository_name=github_config.repository_name,
-                    artifact_id=artifact_id,
-                )
-                logger.info(
-                    "Session URL retrieved"
-                )  # URL intentionally omitted to avoid leaking session access
-                return {"artifact_data": artifact_data}
-
             logger.info(
-                f"Artifact '{_ARTIFACT_NAME}' not yet available "
-                f"(attempt {attempt}/{_ARTIFACT_MAX_ATTEMPTS})"
-            )
-            await asyncio.sleep(_ARTIFACT_POLL_INTERVAL_SECONDS)
+                "Session URL retrieved"
+            )  # URL intentionally omitted to avoid leaking session access
+            return {"artifact_data": artifact_data}
 
         logger.error(
-            f"Session URL artifact not found after {_ARTIFACT_MAX_ATTEMPTS} attempts"
+            f"Session URL artifact not found after {_ARTIFACT_TIMEOUT_SECONDS} s"
         )
         return {"artifact_data": {}}
 
@@ -1,9 +1,25 @@
+import base64
+from datetime import datetime
 from typing import Any, Protocol, runtime_checkable
 from uuid import UUID
 
 from airas.core.types.e2e import E2EModel, Status, StepType
 
 
+def encode_e2e_cursor(record: E2EModel) -> str:
+    """Opaque keyset cursor pointing just past ``record`` in ``list`` order."""
+    raw = f"{record.created_at.isoformat()}|{record.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_e2e_cursor(cursor: str) -> tuple[datetime, UUID]:
+    try:
+        created_at, id = base64.urlsafe_b64decode(cursor).decode().split("|")
+        return datetime.fromisoformat(created_at), UUID(id)
+    except Exception as e:
+        raise ValueError("invalid cursor") from e
+
+
 @runtime_checkable
 class E2EResearchServiceProtocol(Protocol):
     def create(
@@ -33,7 +49,21 @@ class E2EResearchServiceProtocol(Protocol):
 
     def get(self, id: UUID) -> E2EModel: ...
 
-    def list(self, *, offset: int = 0, limit: int | None = None) -> list[E2EModel]: ...
+    def list(
+        self,
+        *,
+        offset: int = 0,
+        limit: int | None = None,
+        cursor: str | None = None,
+        created_by: UUID | None = None,
+        status: Status | None = None,
+    ) -> list[E2EModel]:
+        """Return records newest first, without their ``result`` payload.
+
+        Prefer ``cursor`` (from ``encode_e2e_cursor`` on the last item of the
+        previous page) over ``offset``; it stays O(page size) on large stores.
+        """
+        ...
 
     def delete(self, id: UUID) -> None: ...
 
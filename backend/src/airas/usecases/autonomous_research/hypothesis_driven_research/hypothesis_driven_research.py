@@ -3,6 +3,7 @@ from typing import Any
 from uuid import UUID
 
 from langgraph.graph import END, START, StateGraph
+from langgraph.types import Checkpointer
 from pydantic import BaseModel
 from typing_extensions import TypedDict
 
@@ -233,6 +234,8 @@ class HypothesisDrivenResearch:
         self, state: HypothesisDrivenResearchState
     ) -> dict[str, Any]:
         logger.info("=== Run Experiment Cycle ===")
+        # Compiled without its own checkpointer so that it inherits this graph's
+        # and a resumed run continues mid-cycle.
         result = (
             await ExperimentCycleGraph(
                 github_client=self.github_client,
@@ -410,7 +413,7 @@ class HypothesisDrivenResearch:
             "research_history": state.get("research_history"),
         }
 
-    def build_graph(self):
+    def build_graph(self, checkpointer: Checkpointer = None):
         graph_builder = StateGraph(
             HypothesisDrivenResearchState,
             input_schema=HypothesisDrivenResearchInputState,
@@ -448,4 +451,4 @@ class HypothesisDrivenResearch:
         graph_builder.add_edge("run_latex", "finalize")
         graph_builder.add_edge("finalize", END)
 
-        return graph_builder.compile()
+        return graph_builder.compile(checkpointer=checkpointer)
@@ -3,6 +3,9 @@ from typing import Any
 from uuid import UUID
 
 from airas.core.types.e2e import E2EModel, Status, StepType
+from airas.usecases.autonomous_research.e2e_research_service_protocol import (
+    decode_e2e_cursor,
+)
 
 
 class InMemoryE2EResearchService:
@@ -75,12 +78,35 @@ class InMemoryE2EResearchService:
             raise ValueError("e2e result not found")
         return e2e
 
-    def list(self, *, offset: int = 0, limit: int | None = None) -> list[E2EModel]:
-        items = list(self._store.values())
+    def list(
+        self,
+        *,
+        offset: int = 0,
+        limit: int | None = None,
+        cursor: str | None = None,
+        created_by: UUID | None = None,
+        status: Status | None = None,
+    ) -> list[E2EModel]:
+        items = sorted(
+            self._store.values(),
+            key=lambda e2e: (e2e.created_at, str(e2e.id)),
+            reverse=True,
+        )
+        if created_by is not None:
+            items = [e2e for e2e in items if e2e.created_by == created_by]
+        if status is not None:
+            items = [e2e for e2e in items if e2e.status == status]
+        if cursor is not None:
+            created_at, id = decode_e2e_cursor(cursor)
+            items = [
+                e2e
+                for e2e in items
+                if (e2e.created_at, str(e2e.id)) < (created_at, str(id))
+            ]
         items = items[offset:]
         if limit is not None:
             items = items[:limit]
-        return items
+        return [e2e.model_copy(update={"result": {}}) for e2e in items]
 
     def delete(self, id: UUID) -> None:
         if id not in self._store:
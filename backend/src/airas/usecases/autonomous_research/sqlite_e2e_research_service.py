@@ -0,0 +1,217 @@
+import json
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+from uuid import UUID
+
+from pydantic_core import to_json
+
+from airas.core.types.e2e import E2EModel, Status, StepType
+from airas.infra.sqlite_database import (
+    DEFAULT_STORE_PATH,
+    SqliteDatabase,
+    from_epoch_us,
+    to_epoch_us,
+)
+from airas.usecases.autonomous_research.e2e_research_service_protocol import (
+    decode_e2e_cursor,
+)
+
+# `result` grows to megabytes of research history, so it lives in its own table
+# and list pages only ever read the narrow metadata rows.
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS e2e_records (
+    id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    created_by TEXT NOT NULL,
+    status TEXT NOT NULL,
+    current_step TEXT,
+    error_message TEXT,
+    github_url TEXT,
+    created_at INTEGER NOT NULL,
+    last_updated_at INTEGER NOT NULL,
+    schema_version INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS e2e_records_created_at
+    ON e2e_records (created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS e2e_records_created_by
+    ON e2e_records (created_by, created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS e2e_records_status
+    ON e2e_records (status, created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS e2e_records_last_updated_at
+    ON e2e_records (last_updated_at);
+CREATE TABLE IF NOT EXISTS e2e_results (
+    id TEXT PRIMARY KEY,
+    result TEXT NOT NULL
+);
+"""
+
+_METADATA_COLUMNS = (
+    "id, title, created_by, status, current_step, error_message, github_url, "
+    "created_at, last_updated_at, schema_version"
+)
+
+
+def _row_to_e2e(row: sqlite3.Row, result: dict[str, Any] | None = None) -> E2EModel:
+    return E2EModel(
+        id=UUID(row["id"]),
+        title=row["title"],
+        created_by=UUID(row["created_by"]),
+        status=Status(row["status"]),
+        current_step=StepType(row["current_step"]) if row["current_step"] else None,
+        error_message=row["error_message"],
+        result=result or {},
+        github_url=row["github_url"],
+        created_at=from_epoch_us(row["created_at"]),
+        last_updated_at=from_epoch_us(row["last_updated_at"]),
+        schema_version=row["schema_version"],
+    )
+
+
+class SqliteE2EResearchService:
+    def __init__(self, path: str | Path = DEFAULT_STORE_PATH) -> None:
+        self.db = SqliteDatabase(path, _SCHEMA)
+
+    def create(
+        self,
+        id: UUID,
+        *,
+        title: str,
+        created_by: UUID,
+        status: Status = Status.PENDING,
+        current_step: StepType | None = None,
+        error_message: str | None = None,
+        result: dict[str, Any] | None = None,
+        github_url: str | None = None,
+    ) -> E2EModel:
+        # The API creates a PENDING record before the workflow's own create
+        # node runs, so re-creating an id overwrites it but keeps created_at.
+        now = to_epoch_us(datetime.now().astimezone())
+        with self.db.transaction() as conn:
+            row = conn.execute(
+                f"INSERT INTO e2e_records ({_METADATA_COLUMNS}) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 1) "
+                "ON CONFLICT (id) DO UPDATE SET title = excluded.title, "
+                "created_by = excluded.created_by, status = excluded.status, "
+                "current_step = excluded.current_step, "
+                "error_message = excluded.error_message, "
+                "github_url = excluded.github_url, "
+                "last_updated_at = excluded.last_updated_at "
+                "RETURNING *",
+                (
+                    str(id),
+                    title,
+                    str(created_by),
+                    status.value,
+                    current_step.value if current_step else None,
+                    error_message,
+                    github_url,
+                    now,
+                    now,
+                ),
+            ).fetchone()
+            conn.execute(
+                "INSERT OR REPLACE INTO e2e_results (id, result) VALUES (?, ?)",
+                (str(id), to_json(result or {}).decode()),
+            )
+        return _row_to_e2e(row, result)
+
+    def update(
+        self,
+        id: UUID,
+        *,
+        title: str | None = None,
+        status: Status | None = None,
+        current_step: StepType | None = None,
+        error_message: str | None = None,
+        result: dict[str, Any] | None = None,
+        github_url: str | None = None,
+    ) -> E2EModel:
+        updates: dict[str, Any] = {
+            "title": title,
+            "status": status.value if status is not None else None,
+            "current_step": current_step.value if current_step is not None else None,
+            "error_message": error_message,
+            "github_url": github_url,
+        }
+        updates = {
+            column: value for column, value in updates.items() if value is not None
+        }
+        updates["last_updated_at"] = to_epoch_us(datetime.now().astimezone())
+        assignments = ", ".join(f"{column} = ?" for column in updates)
+
+        with self.db.transaction() as conn:
+            row = conn.execute(
+                f"UPDATE e2e_records SET {assignments} WHERE id = ? RETURNING *",
+                (*updates.values(), str(id)),
+            ).fetchone()
+            if row is None:
+                raise ValueError("e2e result not found")
+            if result is not None:
+                conn.execute(
+                    "INSERT OR REPLACE INTO e2e_results (id, result) VALUES (?, ?)",
+                    (str(id), to_json(result).decode()),
+                )
+            else:
+                result = self._load_result(conn, id)
+        return _row_to_e2e(row, result)
+
+    def get(self, id: UUID) -> E2EModel:
+        with self.db.connect() as conn:
+            row = conn.execute(
+                "SELECT * FROM e2e_records WHERE id = ?", (str(id),)
+            ).fetchone()
+            if row is None:
+                raise ValueError("e2e result not found")
+            return _row_to_e2e(row, self._load_result(conn, id))
+
+    def list(
+        self,
+        *,
+        offset: int = 0,
+        limit: int | None = None,
+        cursor: str | None = None,
+        created_by: UUID | None = None,
+        status: Status | None = None,
+    ) -> list[E2EModel]:
+        clauses: list[str] = []
+        params: list[Any] = []
+        if created_by is not None:
+            clauses.append("created_by = ?")
+            params.append(str(created_by))
+        if status is not None:
+            clauses.append("status = ?")
+            params.append(status.value)
+        if cursor is not None:
+            created_at, last_id = decode_e2e_cursor(cursor)
+            clauses.append("(created_at, id) < (?, ?)")
+            params.extend([to_epoch_us(created_at), str(last_id)])
+        where = f"WHERE {' AND '.join(clauses)} " if clauses else ""
+
+        with self.db.connect() as conn:
+            rows = conn.execute(
+                f"SELECT {_METADATA_COLUMNS} FROM e2e_records {where}"
+                "ORDER BY created_at DESC, id DESC LIMIT ? OFFSET ?",
+                (*params, limit if limit is not None else -1, offset),
+            ).fetchall()
+        return [_row_to_e2e(row) for row in rows]
+
+    def delete(self, id: UUID) -> None:
+        with self.db.transaction() as conn:
+            deleted = conn.execute(
+                "DELETE FROM e2e_records WHERE id = ?", (str(id),)
+            ).rowcount
+            if not deleted:
+                raise ValueError("e2e result not found")
+            conn.execute("DELETE FROM e2e_results WHERE id = ?", (str(id),))
+
+    def close(self) -> None:
+        pass
+
+    @staticmethod
+    def _load_result(conn: sqlite3.Connection, id: UUID) -> dict[str, Any]:
+        row = conn.execute(
+            "SELECT result FROM e2e_results WHERE id = ?", (str(id),)
+        ).fetchone()
+        return json.loads(row["result"]) if row is not None else {}
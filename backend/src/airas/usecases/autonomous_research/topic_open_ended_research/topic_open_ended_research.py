@@ -3,6 +3,7 @@ from typing import Any
 from uuid import UUID
 
 from langgraph.graph import END, START, StateGraph
+from langgraph.types import Checkpointer
 from pydantic import BaseModel
 from typing_extensions import TypedDict
 
@@ -396,6 +397,8 @@ class TopicOpenEndedResearch:
         self, state: TopicOpenEndedResearchState
     ) -> dict[str, Any]:
         logger.info("=== Run Experiment Cycle ===")
+        # Compiled without its own checkpointer so that it inherits this graph's
+        # and a resumed run continues mid-cycle.
         result = (
             await ExperimentCycleGraph(
                 github_client=self.github_client,
@@ -573,7 +576,7 @@ class TopicOpenEndedResearch:
             "research_history": state.get("research_history"),
         }
 
-    def build_graph(self):
+    def build_graph(self, checkpointer: Checkpointer = None):
         graph_builder = StateGraph(
             TopicOpenEndedResearchState,
             input_schema=TopicOpenEndedResearchInputState,
@@ -617,7 +620,7 @@ class TopicOpenEndedResearch:
         graph_builder.add_edge("run_latex", "finalize")
         graph_builder.add_edge("finalize", END)
 
-        return graph_builder.compile()
+        return graph_builder.compile(checkpointer=checkpointer)
 
 
 if __name__ == "__main__":
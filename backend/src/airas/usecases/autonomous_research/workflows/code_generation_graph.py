@@ -181,13 +181,11 @@ class CodeGenerationGraph:
         self, state: CodeGenerationGraphState
     ) -> dict[str, Any]:
         logger.info("Polling code generation workflow...")
-        result = (
-            await PollGithubActionsSubgraph(github_client=self.github_client)
-            .build_graph()
-            .ainvoke(
-                {"github_config": state["github_config"]},
-                {"recursion_limit": _STANDARD_WORKFLOW_RECURSION_LIMIT},
-            )
+        result = await PollGithubActionsSubgraph(
+            github_client=self.github_client
+        ).ainvoke(
+            {"github_config": state["github_config"]},
+            {"recursion_limit": _STANDARD_WORKFLOW_RECURSION_LIMIT},
         )
 
         status = result.get("status")
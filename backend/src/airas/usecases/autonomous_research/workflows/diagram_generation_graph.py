@@ -91,13 +91,11 @@ class DiagramGenerationGraph:
     ) -> dict[str, Any]:
         logger.info("Polling diagram generation workflow...")
 
-        poll_result = (
-            await PollGithubActionsSubgraph(github_client=self.github_client)
-            .build_graph()
-            .ainvoke(
-                {"github_config": state["github_config"]},
-                {"recursion_limit": _STANDARD_WORKFLOW_RECURSION_LIMIT},
-            )
+        poll_result = await PollGithubActionsSubgraph(
+            github_client=self.github_client
+        ).ainvoke(
+            {"github_config": state["github_config"]},
+            {"recursion_limit": _STANDARD_WORKFLOW_RECURSION_LIMIT},
         )
 
         workflow_run_id = poll_result.get("workflow_run_id")
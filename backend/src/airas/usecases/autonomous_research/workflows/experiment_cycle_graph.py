@@ -21,6 +21,7 @@ import logging
 from typing import Any
 
 from langgraph.graph import END, START, StateGraph
+from langgraph.types import Checkpointer
 from pydantic import BaseModel
 from typing_extensions import TypedDict
 
@@ -569,7 +570,7 @@ class ExperimentCycleGraph:
     # =======================================================================
     # Build Graph
     # =======================================================================
-    def build_graph(self):
+    def build_graph(self, checkpointer: Checkpointer = None):
         graph_builder = StateGraph(
             ExperimentCycleGraphState,
             input_schema=ExperimentCycleGraphInputState,
@@ -653,7 +654,7 @@ class ExperimentCycleGraph:
         # Finalize
         graph_builder.add_edge("finalize", END)
 
-        return graph_builder.compile()
+        return graph_builder.compile(checkpointer=checkpointer)
 
 
 if __name__ == "__main__":
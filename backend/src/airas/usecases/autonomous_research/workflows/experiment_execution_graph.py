@@ -226,6 +226,39 @@ class ExperimentExecutionGraph:
             branch_name=main_experiment_branch_name,
         )
 
+        # NOTE: Subgraphs are created once per branch; their compiled graphs are
+        # shared process-wide, so retries do not recompile anything.
+        dispatch_subgraph: (
+            DispatchExperimentOnStaticRunnerSubgraph
+            | DispatchExperimentOnEphemeralCloudSubgraph
+        )
+        if isinstance(self.runner_config, StaticRunnerConfig):
+            dispatch_subgraph = DispatchExperimentOnStaticRunnerSubgraph(
+                github_client=self.github_client,
+                run_stage=self.run_stage,
+                runner_label=self.runner_config.runner_label,
+            )
+        elif isinstance(self.runner_config, EphemeralCloudRunnerConfig):
+            dispatch_subgraph = DispatchExperimentOnEphemeralCloudSubgraph(
+                github_client=self.github_client,
+                run_stage=self.run_stage,
+                cloud_provider=self.runner_config.cloud_provider,
+                gpu_instance_type=self.runner_config.gpu_instance_type,
+                max_instance_hours=self.runner_config.max_instance_hours,
+            )
+        else:
+            raise TypeError(
+                f"Unsupported runner config type: {type(self.runner_config)}"
+            )
+        poll_subgraph = PollGithubActionsSubgraph(github_client=self.github_client)
+        validation_subgraph = DispatchExperimentValidationSubgraph(
+            github_client=self.github_client,
+            llm_mapping=self.llm_mapping,
+        )
+        download_subgraph = DownloadGithubActionsArtifactsSubgraph(
+            github_client=self.github_client
+        )
+
         retry_count = 0
         artifact_data: dict = {}
 
@@ -235,25 +268,7 @@ class ExperimentExecutionGraph:
                 f"=== Dispatch Main Experiment for branch={main_experiment_branch_name}, run_id={run_id} "
                 f"(attempt {retry_count + 1}/{_MAX_RETRY_GITHUB_ACTIONS_VALIDATION}) ==="
             )
-            if isinstance(self.runner_config, StaticRunnerConfig):
-                dispatch_subgraph = DispatchExperimentOnStaticRunnerSubgraph(
-                    github_client=self.github_client,
-                    run_stage=self.run_stage,
-                    runner_label=self.runner_config.runner_label,
-                )
-            elif isinstance(self.runner_config, EphemeralCloudRunnerConfig):
-                dispatch_subgraph = DispatchExperimentOnEphemeralCloudSubgraph(
-                    github_client=self.github_client,
-                    run_stage=self.run_stage,
-                    cloud_provider=self.runner_config.cloud_provider,
-                    gpu_instance_type=self.runner_config.gpu_instance_type,
-                    max_instance_hours=self.runner_config.max_instance_hours,
-                )
-            else:
-                raise TypeError(
-                    f"Unsupported runner config type: {type(self.runner_config)}"
-                )
-            dispatch_result = await dispatch_subgraph.build_graph().ainvoke(
+            dispatch_result = await dispatch_subgraph.ainvoke(
                 {"github_config": branch_config, "run_id": run_id}
             )
             if not dispatch_result.get("dispatched", False):
@@ -269,13 +284,9 @@ class ExperimentExecutionGraph:
             logger.info(
                 f"Polling main experiment workflow for branch={main_experiment_branch_name}..."
             )
-            poll_result = (
-                await PollGithubActionsSubgraph(github_client=self.github_client)
-                .build_graph()
-                .ainvoke(
-                    {"github_config": branch_config},
-                    {"recursion_limit": _STANDARD_WORKFLOW_RECURSION_LIMIT},
-                )
+            poll_result = await poll_subgraph.ainvoke(
+                {"github_config": branch_config},
+                {"recursion_limit": _STANDARD_WORKFLOW_RECURSION_LIMIT},
             )
             workflow_run_id = poll_result.get("workflow_run_id")
             logger.info(
@@ -290,25 +301,18 @@ class ExperimentExecutionGraph:
             logger.info(
                 f"Dispatching validation for main experiment (branch={main_experiment_branch_name})..."
             )
-            validation_dispatch_result = (
-                await DispatchExperimentValidationSubgraph(
-                    github_client=self.github_client,
-                    llm_mapping=self.llm_mapping,
-                )
-                .build_graph()
-                .ainvoke(
-                    {
-                        "github_config": branch_config,
-                        "research_topic": state["research_topic"],
-                        "run_id": run_id,
-                        "workflow_run_id": workflow_run_id,
-                        "run_stage": self.run_stage.value,
-                        "research_hypothesis": state["research_hypothesis"],
-                        "experimental_design": state["experimental_design"],
-                        "wandb_config": self.wandb_config,
-                        "github_actions_agent": self.github_actions_agent,
-                    }
-                )
+            validation_dispatch_result = await validation_subgraph.ainvoke(
+                {
+                    "github_config": branch_config,
+                    "research_topic": state["research_topic"],
+                    "run_id": run_id,
+                    "workflow_run_id": workflow_run_id,
+                    "run_stage": self.run_stage.value,
+                    "research_hypothesis": state["research_hypothesis"],
+                    "experimental_design": state["experimental_design"],
+                    "wandb_config": self.wandb_config,
+                    "github_actions_agent": self.github_actions_agent,
+                }
             )
             if not validation_dispatch_result.get("dispatched", False):
                 error_msg = f"Failed to dispatch validation for main experiment (branch={main_experiment_branch_name})"
@@ -323,13 +327,9 @@ class ExperimentExecutionGraph:
             logger.info(
                 f"Polling validation for main experiment (branch={main_experiment_branch_name})..."
             )
-            validation_poll_result = (
-                await PollGithubActionsSubgraph(github_client=self.github_client)
-                .build_graph()
-                .ainvoke(
-                    {"github_config": branch_config},
-                    {"recursion_limit": _STANDARD_WORKFLOW_RECURSION_LIMIT},
-                )
+            validation_poll_result = await poll_subgraph.ainvoke(
+                {"github_config": branch_config},
+                {"recursion_limit": _STANDARD_WORKFLOW_RECURSION_LIMIT},
             )
             validation_workflow_run_id = validation_poll_result.get("workflow_run_id")
             logger.info(
@@ -346,17 +346,11 @@ class ExperimentExecutionGraph:
             logger.info(
                 f"Downloading artifact from main experiment validation (branch={main_experiment_branch_name})..."
             )
-            artifact_result = (
-                await DownloadGithubActionsArtifactsSubgraph(
-                    github_client=self.github_client
-                )
-                .build_graph()
-                .ainvoke(
-                    {
-                        "github_config": branch_config,
-                        "workflow_run_id": validation_workflow_run_id,
-                    }
-                )
+            artifact_result = await download_subgraph.ainvoke(
+                {
+                    "github_config": branch_config,
+                    "workflow_run_id": validation_workflow_run_id,
+                }
             )
             artifact_data = artifact_result.get("artifact_data", {})
             if not artifact_data:
@@ -133,13 +133,9 @@ class LaTeXGraph:
     @record_execution_time
     async def _poll_compile_latex(self, state: LaTeXGraphState) -> dict[str, Any]:
         logger.info("=== Poll Compile LaTeX Workflow ===")
-        await (
-            PollGithubActionsSubgraph(github_client=self.github_client)
-            .build_graph()
-            .ainvoke(
-                {"github_config": state["github_config"]},
-                {"recursion_limit": _LATEX_COMPILATION_RECURSION_LIMIT},
-            )
+        await PollGithubActionsSubgraph(github_client=self.github_client).ainvoke(
+            {"github_config": state["github_config"]},
+            {"recursion_limit": _LATEX_COMPILATION_RECURSION_LIMIT},
         )
         return {}
 
@@ -195,7 +195,7 @@ class SanityCheckGraph:
             raise TypeError(
                 f"Unsupported runner config type: {type(self.runner_config)}"
             )
-        dispatch_result = await dispatch_subgraph.build_graph().ainvoke(
+        dispatch_result = await dispatch_subgraph.ainvoke(
             {"github_config": state["github_config"], "run_id": current_run_id}
         )
 
@@ -217,13 +217,11 @@ class SanityCheckGraph:
         current_run_id = state.get("run_ids", [])[current_index]
         logger.info(f"Polling sanity workflow for run_id={current_run_id}...")
 
-        poll_result = (
-            await PollGithubActionsSubgraph(github_client=self.github_client)
-            .build_graph()
-            .ainvoke(
-                {"github_config": state["github_config"]},
-                {"recursion_limit": _STANDARD_WORKFLOW_RECURSION_LIMIT},
-            )
+        poll_result = await PollGithubActionsSubgraph(
+            github_client=self.github_client
+        ).ainvoke(
+            {"github_config": state["github_config"]},
+            {"recursion_limit": _STANDARD_WORKFLOW_RECURSION_LIMIT},
         )
 
         workflow_run_id = poll_result.get("workflow_run_id")
@@ -243,25 +241,21 @@ class SanityCheckGraph:
             f"Dispatching validation for sanity workflow (run_id={current_run_id})..."
         )
 
-        validation_dispatch_result = (
-            await DispatchExperimentValidationSubgraph(
-                github_client=self.github_client,
-                llm_mapping=self.llm_mapping,
-            )
-            .build_graph()
-            .ainvoke(
-                {
-                    "github_config": state["github_config"],
-                    "research_topic": state["research_topic"],
-                    "run_id": current_run_id,
-                    "workflow_run_id": state.get("sanity_workflow_run_id"),
-                    "run_stage": "sanity",
-                    "research_hypothesis": state["research_hypothesis"],
-                    "experimental_design": state["experimental_design"],
-                    "wandb_config": self.wandb_config,
-                    "github_actions_agent": self.github_actions_agent,
-                }
-            )
+        validation_dispatch_result = await DispatchExperimentValidationSubgraph(
+            github_client=self.github_client,
+            llm_mapping=self.llm_mapping,
+        ).ainvoke(
+            {
+                "github_config": state["github_config"],
+                "research_topic": state["research_topic"],
+                "run_id": current_run_id,
+                "workflow_run_id": state.get("sanity_workflow_run_id"),
+                "run_stage": "sanity",
+                "research_hypothesis": state["research_hypothesis"],
+                "experimental_design": state["experimental_design"],
+                "wandb_config": self.wandb_config,
+                "github_actions_agent": self.github_actions_agent,
+            }
         )
 
         if not validation_dispatch_result.get("dispatched", False):
@@ -282,13 +276,11 @@ class SanityCheckGraph:
             f"Polling validation for sanity workflow (run_id={current_run_id})..."
         )
 
-        validation_poll_result = (
-            await PollGithubActionsSubgraph(github_client=self.github_client)
-            .build_graph()
-            .ainvoke(
-                {"github_config": state["github_config"]},
-                {"recursion_limit": _STANDARD_WORKFLOW_RECURSION_LIMIT},
-            )
+        validation_poll_result = await PollGithubActionsSubgraph(
+            github_client=self.github_client
+        ).ainvoke(
+            {"github_config": state["github_config"]},
+            {"recursion_limit": _STANDARD_WORKFLOW_RECURSION_LIMIT},
         )
 
         validation_workflow_run_id = validation_poll_result.get("workflow_run_id")
@@ -311,17 +303,13 @@ class SanityCheckGraph:
             f"Downloading artifact from sanity validation workflow (run_id={current_run_id})..."
         )
 
-        artifact_result = (
-            await DownloadGithubActionsArtifactsSubgraph(
-                github_client=self.github_client
-            )
-            .build_graph()
-            .ainvoke(
-                {
-                    "github_config": state["github_config"],
-                    "workflow_run_id": state.get("sanity_validation_workflow_run_id"),
-                }
-            )
+        artifact_result = await DownloadGithubActionsArtifactsSubgraph(
+            github_client=self.github_client
+        ).ainvoke(
+            {
+                "github_config": state["github_config"],
+                "workflow_run_id": state.get("sanity_validation_workflow_run_id"),
+            }
         )
 
         if not (artifact_data := artifact_result.get("artifact_data", {})):
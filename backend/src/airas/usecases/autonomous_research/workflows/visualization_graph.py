@@ -183,13 +183,11 @@ class VisualizationGraph:
     async def _poll_visualization(self, state: VisualizationState) -> dict[str, Any]:
         logger.info("Polling visualization workflow...")
 
-        poll_result = (
-            await PollGithubActionsSubgraph(github_client=self.github_client)
-            .build_graph()
-            .ainvoke(
-                {"github_config": state["github_config"]},
-                {"recursion_limit": _STANDARD_WORKFLOW_RECURSION_LIMIT},
-            )
+        poll_result = await PollGithubActionsSubgraph(
+            github_client=self.github_client
+        ).ainvoke(
+            {"github_config": state["github_config"]},
+            {"recursion_limit": _STANDARD_WORKFLOW_RECURSION_LIMIT},
         )
 
         workflow_run_id = poll_result.get("workflow_run_id")
@@ -207,25 +205,21 @@ class VisualizationGraph:
     ) -> dict[str, Any]:
         logger.info("Dispatching validation for visualization workflow...")
 
-        validation_dispatch_result = (
-            await DispatchExperimentValidationSubgraph(
-                github_client=self.github_client,
-                llm_mapping=self.llm_mapping,
-            )
-            .build_graph()
-            .ainvoke(
-                {
-                    "github_config": state["github_config"],
-                    "research_topic": state["research_topic"],
-                    "run_id": None,
-                    "workflow_run_id": state.get("visualization_workflow_run_id"),
-                    "run_stage": "visualization",
-                    "research_hypothesis": state["research_hypothesis"],
-                    "experimental_design": state["experimental_design"],
-                    "wandb_config": self.wandb_config,
-                    "github_actions_agent": self.github_actions_agent,
-                }
-            )
+        validation_dispatch_result = await DispatchExperimentValidationSubgraph(
+            github_client=self.github_client,
+            llm_mapping=self.llm_mapping,
+        ).ainvoke(
+            {
+                "github_config": state["github_config"],
+                "research_topic": state["research_topic"],
+                "run_id": None,
+                "workflow_run_id": state.get("visualization_workflow_run_id"),
+                "run_stage": "visualization",
+                "research_hypothesis": state["research_hypothesis"],
+                "experimental_design": state["experimental_design"],
+                "wandb_config": self.wandb_config,
+                "github_actions_agent": self.github_actions_agent,
+            }
         )
 
         if not validation_dispatch_result.get("dispatched", False):
@@ -242,13 +236,11 @@ class VisualizationGraph:
     ) -> dict[str, Any]:
         logger.info("Polling validation for visualization workflow...")
 
-        validation_poll_result = (
-            await PollGithubActionsSubgraph(github_client=self.github_client)
-            .build_graph()
-            .ainvoke(
-                {"github_config": state["github_config"]},
-                {"recursion_limit": _STANDARD_WORKFLOW_RECURSION_LIMIT},
-            )
+        validation_poll_result = await PollGithubActionsSubgraph(
+            github_client=self.github_client
+        ).ainvoke(
+            {"github_config": state["github_config"]},
+            {"recursion_limit": _STANDARD_WORKFLOW_RECURSION_LIMIT},
         )
 
         validation_workflow_run_id = validation_poll_result.get("workflow_run_id")
@@ -268,19 +260,15 @@ class VisualizationGraph:
     ) -> dict[str, Any]:
         logger.info("Downloading artifact from visualization validation workflow...")
 
-        artifact_result = (
-            await DownloadGithubActionsArtifactsSubgraph(
-                github_client=self.github_client
-            )
-            .build_graph()
-            .ainvoke(
-                {
-                    "github_config": state["github_config"],
-                    "workflow_run_id": state.get(
-                        "visualization_validation_workflow_run_id"
-                    ),
-                }
-            )
+        artifact_result = await DownloadGithubActionsArtifactsSubgraph(
+            github_client=self.github_client
+        ).ainvoke(
+            {
+                "github_config": state["github_config"],
+                "workflow_run_id": state.get(
+                    "visualization_validation_workflow_run_id"
+                ),
+            }
         )
 
         if not (artifact_data := artifact_result.get("artifact_data", {})):
@@ -1,8 +1,8 @@
 from logging import getLogger
 
-from jinja2 import Environment
 from pydantic import BaseModel
 
+from airas.core.prompt_templates import get_template
 from airas.core.types.research_hypothesis import (
     ExperimentEvaluation,
     ResearchHypothesis,
@@ -25,8 +25,7 @@ def evaluate_experimental_consistency(
     consistency_score_threshold: int = 7,
     client: LangChainClient | None = None,
 ) -> ResearchHypothesis:
-    env = Environment()
-    template = env.from_string(prompt_template)
+    template = get_template(prompt_template)
 
     if (
         not new_method.experimental_design
@@ -1,8 +1,8 @@
 from logging import getLogger
 
-from jinja2 import Environment
 from pydantic import BaseModel
 
+from airas.core.prompt_templates import get_template
 from airas.core.types.github import GitHubRepositoryInfo
 from airas.core.types.paper import PaperContent, PaperReviewScores
 from airas.infra.langchain_client import LangChainClient
@@ -25,8 +25,7 @@ async def review_paper(
     github_repository_info: GitHubRepositoryInfo | None = None,
     client: LangChainClient | None = None,
 ) -> dict[str, PaperReviewScores]:
-    env = Environment()
-    template = env.from_string(prompt_template)
+    template = get_template(prompt_template)
 
     # Dynamically extract all fields from PaperContent and make them available for template
     paper_data = paper_content.model_dump()
@@ -1,8 +1,10 @@
 import logging
 
 from langgraph.graph import END, START, StateGraph
+from langgraph.runtime import Runtime
 from typing_extensions import TypedDict
 
+from airas.core.compiled_graph import CachedGraphMixin, GraphContext
 from airas.core.execution_timers import ExecutionTimeState, time_node
 from airas.core.logging_utils import setup_logging
 from airas.core.types.experiment_history import RunStage
@@ -38,7 +40,7 @@ class DispatchExperimentOnEphemeralCloudSubgraphState(
     pass
 
 
-class DispatchExperimentOnEphemeralCloudSubgraph:
+class DispatchExperimentOnEphemeralCloudSubgraph(CachedGraphMixin):
     def __init__(
         self,
         github_client: GithubClient,
@@ -55,30 +57,33 @@ class DispatchExperimentOnEphemeralCloudSubgraph:
 
     @record_execution_time
     async def _dispatch_experiment_on_ephemeral_cloud(
-        self, state: DispatchExperimentOnEphemeralCloudSubgraphState
+        self,
+        state: DispatchExperimentOnEphemeralCloudSubgraphState,
+        runtime: Runtime[GraphContext["DispatchExperimentOnEphemeralCloudSubgraph"]],
     ) -> dict[str, bool]:
+        subgraph = self.from_runtime(runtime)
         github_config = state["github_config"]
         run_id = state["run_id"]
 
         logger.info(
             f"Dispatching {_CLOUD_RUNNER_WORKFLOW_FILE} via ephemeral cloud runner for run_id={run_id} "
             f"on branch '{github_config.branch_name}' "
-            f"(provider={self.cloud_provider}, instance={self.gpu_instance_type})"
+            f"(provider={subgraph.cloud_provider}, instance={subgraph.gpu_instance_type})"
         )
 
         inputs = {
             "run_id": run_id,
             "branch_name": github_config.branch_name,
-            "cloud_provider": self.cloud_provider,
-            "gpu_instance_type": self.gpu_instance_type,
-            "max_instance_hours": str(self.max_instance_hours),
+            "cloud_provider": subgraph.cloud_provider,
+            "gpu_instance_type": subgraph.gpu_instance_type,
+            "max_instance_hours": str(subgraph.max_instance_hours),
         }
 
-        if self.run_stage is not None:
-            inputs["mode"] = self.run_stage.value
+        if subgraph.run_stage is not None:
+            inputs["mode"] = subgraph.run_stage.value
 
         success = await dispatch_workflow(
-            self.github_client,
+            subgraph.github_client,
             github_config.github_owner,
             github_config.repository_name,
             github_config.branch_name,
@@ -102,6 +107,7 @@ class DispatchExperimentOnEphemeralCloudSubgraph:
             DispatchExperimentOnEphemeralCloudSubgraphState,
             input_schema=DispatchExperimentOnEphemeralCloudSubgraphInputState,
             output_schema=DispatchExperimentOnEphemeralCloudSubgraphOutputState,
+            context_schema=GraphContext,
         )
 
         graph_builder.add_node(
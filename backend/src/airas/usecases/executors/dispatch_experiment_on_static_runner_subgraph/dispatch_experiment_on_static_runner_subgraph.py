@@ -2,8 +2,10 @@ import json
 import logging
 
 from langgraph.graph import END, START, StateGraph
+from langgraph.runtime import Runtime
 from typing_extensions import TypedDict
 
+from airas.core.compiled_graph import CachedGraphMixin, GraphContext
 from airas.core.execution_timers import ExecutionTimeState, time_node
 from airas.core.logging_utils import setup_logging
 from airas.core.types.experiment_history import RunStage
@@ -36,7 +38,7 @@ class DispatchExperimentOnStaticRunnerSubgraphState(
     pass
 
 
-class DispatchExperimentOnStaticRunnerSubgraph:
+class DispatchExperimentOnStaticRunnerSubgraph(CachedGraphMixin):
     def __init__(
         self,
         github_client: GithubClient,
@@ -51,40 +53,45 @@ class DispatchExperimentOnStaticRunnerSubgraph:
 
     @record_execution_time
     async def _dispatch_experiment_on_static_runner(
-        self, state: DispatchExperimentOnStaticRunnerSubgraphState
+        self,
+        state: DispatchExperimentOnStaticRunnerSubgraphState,
+        runtime: Runtime[GraphContext["DispatchExperimentOnStaticRunnerSubgraph"]],
     ) -> dict[str, bool]:
+        subgraph = self.from_runtime(runtime)
         github_config = state["github_config"]
         run_id = state["run_id"]
 
         logger.info(
-            f"Dispatching {self.workflow_file} for run_id={run_id} on branch '{github_config.branch_name}' "
-            f"with runner_label={self.runner_label}"
+            f"Dispatching {subgraph.workflow_file} for run_id={run_id} on branch '{github_config.branch_name}' "
+            f"with runner_label={subgraph.runner_label}"
         )
 
         inputs = {
             "branch_name": github_config.branch_name,
             "run_id": run_id,
-            "runner_label": json.dumps(self.runner_label),
+            "runner_label": json.dumps(subgraph.runner_label),
         }
 
-        if self.run_stage is not None:
-            inputs["mode"] = self.run_stage.value
+        if subgraph.run_stage is not None:
+            inputs["mode"] = subgraph.run_stage.value
 
         success = await dispatch_workflow(
-            self.github_client,
+            subgraph.github_client,
             github_config.github_owner,
             github_config.repository_name,
             github_config.branch_name,
-            self.workflow_file,
+            subgraph.workflow_file,
             inputs,
         )
 
         if success:
             logger.info(
-                f"Dispatch successful: {self.workflow_file} for run_id={run_id}"
+                f"Dispatch successful: {subgraph.workflow_file} for run_id={run_id}"
             )
         else:
-            logger.error(f"Dispatch failed: {self.workflow_file} for run_id={run_id}")
+            logger.error(
+                f"Dispatch failed: {subgraph.workflow_file} for run_id={run_id}"
+            )
 
         return {"dispatched": success}
 
@@ -93,6 +100,7 @@ class DispatchExperimentOnStaticRunnerSubgraph:
             DispatchExperimentOnStaticRunnerSubgraphState,
             input_schema=DispatchExperimentOnStaticRunnerSubgraphInputState,
             output_schema=DispatchExperimentOnStaticRunnerSubgraphOutputState,
+            context_schema=GraphContext,
         )
 
         graph_builder.add_node(
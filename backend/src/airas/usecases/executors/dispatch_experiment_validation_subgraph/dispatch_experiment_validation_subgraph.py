@@ -1,9 +1,11 @@
 import logging
 
 from langgraph.graph import END, START, StateGraph
+from langgraph.runtime import Runtime
 from pydantic import BaseModel
 from typing_extensions import TypedDict
 
+from airas.core.compiled_graph import CachedGraphMixin, GraphContext
 from airas.core.execution_timers import ExecutionTimeState, time_node
 from airas.core.llm_config import DEFAULT_NODE_LLM_CONFIG, NodeLLMConfig
 from airas.core.logging_utils import setup_logging
@@ -53,7 +55,7 @@ class DispatchExperimentValidationSubgraphState(
     pass
 
 
-class DispatchExperimentValidationSubgraph:
+class DispatchExperimentValidationSubgraph(CachedGraphMixin):
     def __init__(
         self,
         github_client: GithubClient,
@@ -66,8 +68,11 @@ class DispatchExperimentValidationSubgraph:
 
     @record_execution_time
     async def _dispatch_experiment_validation(
-        self, state: DispatchExperimentValidationSubgraphState
+        self,
+        state: DispatchExperimentValidationSubgraphState,
+        runtime: Runtime[GraphContext["DispatchExperimentValidationSubgraph"]],
     ) -> dict[str, bool]:
+        subgraph = self.from_runtime(runtime)
         github_config = state["github_config"]
         research_topic = state["research_topic"]
         run_id = state.get("run_id")
@@ -96,7 +101,7 @@ class DispatchExperimentValidationSubgraph:
             "experimental_design": experimental_design.model_dump_json(),
             "wandb_config": wandb_config.model_dump_json(),
             "github_actions_agent": github_actions_agent,
-            "model_name": self.llm_mapping.dispatch_experiment_validation.llm_name,
+            "model_name": subgraph.llm_mapping.dispatch_experiment_validation.llm_name,
         }
 
         # Only add run_id if it's provided
@@ -104,11 +109,11 @@ class DispatchExperimentValidationSubgraph:
             inputs["run_id"] = run_id
 
         success = await dispatch_workflow(
-            self.github_client,
+            subgraph.github_client,
             github_config.github_owner,
             github_config.repository_name,
             github_config.branch_name,
-            self.workflow_file,
+            subgraph.workflow_file,
             inputs,
         )
 
@@ -138,6 +143,7 @@ class DispatchExperimentValidationSubgraph:
             DispatchExperimentValidationSubgraphState,
             input_schema=DispatchExperimentValidationSubgraphInputState,
             output_schema=DispatchExperimentValidationSubgraphOutputState,
+            context_schema=GraphContext,
         )
 
         graph_builder.add_node(
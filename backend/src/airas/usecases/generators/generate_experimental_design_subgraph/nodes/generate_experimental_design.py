@@ -1,10 +1,10 @@
 import json
 import logging
 
-from jinja2 import Environment
 from pydantic import BaseModel
 
 from airas.core.llm_config import NodeLLMConfig
+from airas.core.prompt_templates import get_template
 from airas.core.types.experimental_design import (
     ComputeEnvironment,
     EvaluationMetric,
@@ -13,10 +13,7 @@ from airas.core.types.experimental_design import (
 )
 from airas.core.types.research_hypothesis import ResearchHypothesis
 from airas.infra.langchain_client import LangChainClient
-from airas.resources.datasets.prompt_engineering_datasets import (
-    PROMPT_ENGINEERING_DATASETS,
-)
-from airas.resources.models.llm_api_models import LLM_API_MODELS
+from airas.resources.catalog import RESOURCE_CATALOG
 from airas.usecases.generators.generate_experimental_design_subgraph.prompts.generate_experimental_design_prompt import (
     generate_experimental_design_prompt,
 )
@@ -42,18 +39,20 @@ async def generate_experimental_design(
     num_datasets_to_use: int,
     num_comparative_methods: int,
 ) -> ExperimentalDesign:
-    env = Environment()
-
-    template = env.from_string(generate_experimental_design_prompt)
+    template = get_template(generate_experimental_design_prompt)
 
     # TODO: Also pass the list of objective functions
     # TODO: Handling cases where selection from a list is mandatory
     data = {
         "research_hypothesis": research_hypothesis,
         "compute_environment": compute_environment,
-        "model_list": json.dumps(LLM_API_MODELS, indent=4, ensure_ascii=False),
+        "model_list": json.dumps(
+            RESOURCE_CATALOG.section("llm_api_models"), indent=4, ensure_ascii=False
+        ),
         "dataset_list": json.dumps(
-            PROMPT_ENGINEERING_DATASETS, indent=4, ensure_ascii=False
+            RESOURCE_CATALOG.section("prompt_engineering_datasets"),
+            indent=4,
+            ensure_ascii=False,
         ),
         "num_models_to_use": num_models_to_use,
         "num_datasets_to_use": num_datasets_to_use,
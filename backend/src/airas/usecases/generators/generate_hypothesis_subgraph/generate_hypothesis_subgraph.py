@@ -7,7 +7,7 @@ from typing_extensions import TypedDict
 
 from airas.core.base import BaseSubgraph
 from airas.core.execution_timers import ExecutionTimeState, time_node
-from airas.core.llm_config import DEFAULT_NODE_LLMS
+from airas.core.llm_config import DEFAULT_NODE_LLM_CONFIG, NodeLLMConfig
 from airas.core.logging_utils import setup_logging
 from airas.core.types.arxiv import ArxivInfo
 from airas.core.types.research_hypothesis import EvaluatedHypothesis, ResearchHypothesis
@@ -25,6 +25,15 @@ from airas.usecases.generators.generate_hypothesis_subgraph.nodes.generate_hypot
 from airas.usecases.generators.generate_hypothesis_subgraph.nodes.refine_hypothesis import (
     refine_hypothesis,
 )
+from airas.usecases.generators.generate_hypothesis_subgraph.novelty_prefilter import (
+    NoveltyPrefilter,
+    novelty_prefilter_from_env,
+)
+from airas.usecases.generators.generate_hypothesis_subgraph.related_paper_memo import (
+    RelatedPaperMemo,
+    remember,
+    resolve,
+)
 from airas.usecases.retrieve.retrieve_paper_subgraph.nodes.retrieve_text_from_url import (
     retrieve_text_from_url,
 )
@@ -48,12 +57,12 @@ record_execution_time = lambda f: time_node("generate_hypothesis_subgraph")(f)
 
 
 class GenerateHypothesisSubgraphLLMMapping(BaseModel):
-    generate_hypothesis: LLM_MODELS = DEFAULT_NODE_LLMS["generate_hypothesis"]
-    evaluate_novelty_and_significance: LLM_MODELS = DEFAULT_NODE_LLMS[
+    generate_hypothesis: NodeLLMConfig = DEFAULT_NODE_LLM_CONFIG["generate_hypothesis"]
+    evaluate_novelty_and_significance: NodeLLMConfig = DEFAULT_NODE_LLM_CONFIG[
         "evaluate_novelty_and_significance"
     ]
-    refine_hypothesis: LLM_MODELS = DEFAULT_NODE_LLMS["refine_hypothesis"]
-    search_arxiv_id_from_title: LLM_MODELS = DEFAULT_NODE_LLMS[
+    refine_hypothesis: NodeLLMConfig = DEFAULT_NODE_LLM_CONFIG["refine_hypothesis"]
+    search_arxiv_id_from_title: NodeLLMConfig = DEFAULT_NODE_LLM_CONFIG[
         "search_arxiv_id_from_title"
     ]
     embedding_model: LLM_MODELS = "gemini-embedding-001"
@@ -66,6 +75,7 @@ class GenerateHypothesisSubgraphInputState(TypedDict):
 
 class GenerateHypothesisSubgraphHiddenState(TypedDict):
     related_research_study_list: list[ResearchStudy]
+    related_paper_memo: RelatedPaperMemo
     refine_iterations: int
     evaluated_hypothesis_history: list[EvaluatedHypothesis]
 
@@ -98,6 +108,8 @@ class GenerateHypothesisSubgraph(BaseSubgraph):
         refinement_rounds: int = 2,
         paper_provider: str = "arxiv",
         num_retrieve_related_papers: int = 10,
+        memoize_related_papers: bool = True,
+        novelty_prefilter: NoveltyPrefilter | None = None,
     ):
         self.arxiv_client = arxiv_client
         self.ss_client = ss_client
@@ -123,13 +135,17 @@ class GenerateHypothesisSubgraph(BaseSubgraph):
         self.refinement_rounds = refinement_rounds
         self.paper_provider = paper_provider
         self.num_retrieve_related_papers = num_retrieve_related_papers
+        self.memoize_related_papers = memoize_related_papers
+        # Off unless AIRAS_NOVELTY_PREFILTER=true; see novelty_prefilter.py.
+        self.novelty_prefilter = novelty_prefilter or novelty_prefilter_from_env()
 
     @record_execution_time
     def _initialize(
         self, state: GenerateHypothesisSubgraphState
-    ) -> dict[str, list[EvaluatedHypothesis] | int]:
+    ) -> dict[str, list[EvaluatedHypothesis] | RelatedPaperMemo | int]:
         return {
             "evaluated_hypothesis_history": [],
+            "related_paper_memo": {},
             "refine_iterations": 0,
         }
 
@@ -139,7 +155,7 @@ class GenerateHypothesisSubgraph(BaseSubgraph):
         self, state: GenerateHypothesisSubgraphState
     ) -> dict[str, ResearchHypothesis]:
         research_hypothesis = await generate_hypothesis(
-            llm_name=self.llm_mapping.generate_hypothesis,
+            llm_config=self.llm_mapping.generate_hypothesis,
             llm_client=self.llm_client,
             research_topic=state["research_topic"],
             research_study_list=state["research_study_list"],
@@ -174,25 +190,26 @@ class GenerateHypothesisSubgraph(BaseSubgraph):
         _ = state
         return {"related_research_study_list": []}
 
+    # Each refinement round retrieves related papers again, and most of them
+    # were already retrieved in an earlier round. The steps below only search
+    # and fetch studies missing from the run's related_paper_memo.
     @record_execution_time
     async def _search_arxiv_id_from_title(
         self, state: GenerateHypothesisSubgraphState
     ) -> dict[str, list[ResearchStudy]]:
-        related_research_study_list = cast(
-            list[ResearchStudy], state.get("related_research_study_list", [])
+        related_research_study_list, pending_studies = resolve(
+            state["related_paper_memo"], state.get("related_research_study_list", [])
         )
-        if not related_research_study_list:
+        if not pending_studies:
             return {"related_research_study_list": related_research_study_list}
 
         arxiv_id_list = await search_arxiv_id_from_title(
-            llm_name=self.llm_mapping.search_arxiv_id_from_title,
+            llm_config=self.llm_mapping.search_arxiv_id_from_title,
             llm_client=self.llm_client,
             prompt_template=openai_websearch_arxiv_ids_prompt,
-            paper_titles=[study.title for study in related_research_study_list],
+            paper_titles=[study.title for study in pending_studies],
         )
-        for study, arxiv_id in zip(
-            related_research_study_list, arxiv_id_list, strict=False
-        ):
+        for study, arxiv_id in zip(pending_studies, arxiv_id_list, strict=False):
             study.meta_data.arxiv_id = arxiv_id
         return {"related_research_study_list": related_research_study_list}
 
@@ -200,12 +217,10 @@ class GenerateHypothesisSubgraph(BaseSubgraph):
     async def _search_arxiv_by_id(
         self, state: GenerateHypothesisSubgraphState
     ) -> dict[str, list[ResearchStudy]]:
-        related_research_study_list = cast(
-            list[ResearchStudy], state.get("related_research_study_list", [])
+        related_research_study_list, pending_studies = resolve(
+            state["related_paper_memo"], state.get("related_research_study_list", [])
         )
-        arxiv_id_list = [
-            study.meta_data.arxiv_id or "" for study in related_research_study_list
-        ]
+        arxiv_id_list = [study.meta_data.arxiv_id or "" for study in pending_studies]
         if not arxiv_id_list:
             return {"related_research_study_list": related_research_study_list}
 
@@ -213,9 +228,7 @@ class GenerateHypothesisSubgraph(BaseSubgraph):
             arxiv_client=self.arxiv_client,
             arxiv_id_list=arxiv_id_list,
         )
-        for study, arxiv_info in zip(
-            related_research_study_list, arxiv_info_list, strict=False
-        ):
+        for study, arxiv_info in zip(pending_studies, arxiv_info_list, strict=False):
             study.meta_data.arxiv_id = arxiv_info.id
             study.meta_data.authors = arxiv_info.authors
             study.meta_data.published_date = arxiv_info.published_date
@@ -224,21 +237,26 @@ class GenerateHypothesisSubgraph(BaseSubgraph):
         return {"related_research_study_list": related_research_study_list}
 
     @record_execution_time
-    def _search_ss_by_id(
+    async def _search_ss_by_id(
         self, state: GenerateHypothesisSubgraphState
     ) -> dict[str, list[ResearchStudy]]:
-        related_research_study_list = search_ss_by_id(
-            ss_client=self.ss_client,
-            research_study_list=state["related_research_study_list"],
+        related_research_study_list, pending_studies = resolve(
+            state["related_paper_memo"], state.get("related_research_study_list", [])
         )
+        if pending_studies:
+            await search_ss_by_id(
+                ss_client=self.ss_client,
+                research_study_list=pending_studies,
+            )
         return {"related_research_study_list": related_research_study_list}
 
     @record_execution_time
     async def _retrieve_text_from_url(
         self, state: GenerateHypothesisSubgraphState
-    ) -> dict[str, list[ResearchStudy]]:
-        related_research_study_list = cast(
-            list[ResearchStudy], state.get("related_research_study_list", [])
+    ) -> dict[str, list[ResearchStudy] | RelatedPaperMemo]:
+        memo = state["related_paper_memo"]
+        related_research_study_list, pending_studies = resolve(
+            memo, state.get("related_research_study_list", [])
         )
         arxiv_info_list: list[ArxivInfo] = [
             ArxivInfo(
@@ -251,17 +269,22 @@ class GenerateHypothesisSubgraph(BaseSubgraph):
                 doi=study.meta_data.doi,
                 affiliation=None,
             )
-            for study in related_research_study_list
+            for study in pending_studies
         ]
         arxiv_full_text_list = await retrieve_text_from_url(
             arxiv_info_list=arxiv_info_list,
         )
         for study, full_text in zip(
-            related_research_study_list, arxiv_full_text_list, strict=False
+            pending_studies, arxiv_full_text_list, strict=False
         ):
             if full_text:
                 study.full_text = full_text
-        return {"related_research_study_list": related_research_study_list}
+        if self.memoize_related_papers:
+            memo = remember(memo, pending_studies)
+        return {
+            "related_research_study_list": related_research_study_list,
+            "related_paper_memo": memo,
+        }
 
     def select_provider(self, state: GenerateHypothesisSubgraphState) -> str:
         if self.paper_provider == "semantic_scholar":
@@ -285,8 +308,9 @@ class GenerateHypothesisSubgraph(BaseSubgraph):
             research_study_list=state["research_study_list"]
             + state.get("related_research_study_list", []),
             research_hypothesis=state["research_hypothesis"],
-            llm_name=self.llm_mapping.evaluate_novelty_and_significance,
+            llm_config=self.llm_mapping.evaluate_novelty_and_significance,
             llm_client=self.llm_client,
+            novelty_prefilter=self.novelty_prefilter,
         )
         return {
             "evaluated_hypothesis_history": state["evaluated_hypothesis_history"]
@@ -311,7 +335,7 @@ class GenerateHypothesisSubgraph(BaseSubgraph):
         self, state: GenerateHypothesisSubgraphState
     ) -> dict[str, ResearchHypothesis | int]:
         refined_hypothesis = await refine_hypothesis(
-            llm_name=self.llm_mapping.refine_hypothesis,
+            llm_config=self.llm_mapping.refine_hypothesis,
             llm_client=self.llm_client,
             research_topic=state["research_topic"],
             evaluated_hypothesis_history=state["evaluated_hypothesis_history"],
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from typing import cast
 
@@ -8,7 +9,11 @@ from typing_extensions import TypedDict
 from airas.core.execution_timers import ExecutionTimeState, time_node
 from airas.core.llm_config import DEFAULT_NODE_LLM_CONFIG, NodeLLMConfig
 from airas.core.logging_utils import setup_logging
-from airas.core.types.research_hypothesis import EvaluatedHypothesis, ResearchHypothesis
+from airas.core.types.research_hypothesis import (
+    EvaluatedHypothesis,
+    HypothesisEvaluation,
+    ResearchHypothesis,
+)
 from airas.core.types.research_study import ResearchStudy
 from airas.infra.langchain_client import LangChainClient
 from airas.usecases.generators.generate_hypothesis_subgraph.nodes.evaluate_novelty_and_significance import (
@@ -20,12 +25,19 @@ from airas.usecases.generators.generate_hypothesis_subgraph.nodes.generate_hypot
 from airas.usecases.generators.generate_hypothesis_subgraph.nodes.refine_hypothesis import (
     refine_hypothesis,
 )
+from airas.usecases.generators.generate_hypothesis_subgraph.novelty_prefilter import (
+    NoveltyPrefilter,
+    novelty_prefilter_from_env,
+)
 
 setup_logging()
 logger = logging.getLogger(__name__)
 
 record_execution_time = lambda f: time_node("generate_hypothesis_subgraph")(f)  # noqa: E731
 
+# Each candidate costs a draft and an evaluation LLM call.
+MAX_HYPOTHESIS_CANDIDATES = 8
+
 
 class GenerateHypothesisSubgraphV0LLMMapping(BaseModel):
     generate_hypothesis: NodeLLMConfig = DEFAULT_NODE_LLM_CONFIG["generate_hypothesis"]
@@ -51,16 +63,32 @@ class GenerateHypothesisSubgraphV0State(
     evaluated_hypothesis_history: list[EvaluatedHypothesis]
 
 
+def _candidate_score(candidate: EvaluatedHypothesis) -> tuple[int, int]:
+    """Novelty + significance, then novelty, as rated by the evaluator."""
+    evaluation = cast(HypothesisEvaluation, candidate.evaluation)
+    return (
+        evaluation.novelty_score + evaluation.significance_score,
+        evaluation.novelty_score,
+    )
+
+
 class GenerateHypothesisSubgraphV0:
     def __init__(
         self,
         langchain_client: LangChainClient,
         llm_mapping: GenerateHypothesisSubgraphV0LLMMapping | None = None,
         refinement_rounds: int = 2,
+        num_candidates: int = 1,
+        max_concurrency: int = 4,
+        novelty_prefilter: NoveltyPrefilter | None = None,
     ):
         self.langchain_client = langchain_client
         self.llm_mapping = llm_mapping or GenerateHypothesisSubgraphV0LLMMapping()
         self.refinement_rounds = refinement_rounds
+        self.num_candidates = num_candidates
+        self.max_concurrency = max_concurrency
+        # Off unless AIRAS_NOVELTY_PREFILTER=true; see novelty_prefilter.py.
+        self.novelty_prefilter = novelty_prefilter or novelty_prefilter_from_env()
 
     @record_execution_time
     def _initialize(
@@ -83,6 +111,57 @@ class GenerateHypothesisSubgraphV0:
         )
         return {"research_hypothesis": research_hypothesis}
 
+    # Instead of improving one hypothesis round by round, draft several at
+    # once and only refine the strongest. Every candidate is scored by the
+    # same evaluator; the best score wins (the earlier draft on ties) and its
+    # evaluation seeds the refinement history.
+    @record_execution_time
+    async def _generate_hypothesis_candidates(
+        self, state: GenerateHypothesisSubgraphV0State
+    ) -> dict[str, ResearchHypothesis | list[EvaluatedHypothesis]]:
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def _draft_and_evaluate() -> EvaluatedHypothesis:
+            async with semaphore:
+                research_hypothesis = await generate_hypothesis(
+                    llm_config=self.llm_mapping.generate_hypothesis,
+                    llm_client=self.langchain_client,
+                    research_topic=state["research_topic"],
+                    research_study_list=state["research_study_list"],
+                )
+                return await evaluate_novelty_and_significance(
+                    research_topic=state["research_topic"],
+                    research_study_list=state["research_study_list"],
+                    research_hypothesis=research_hypothesis,
+                    llm_config=self.llm_mapping.evaluate_novelty_and_significance,
+                    llm_client=self.langchain_client,
+                    novelty_prefilter=self.novelty_prefilter,
+                )
+
+        results = await asyncio.gather(
+            *(_draft_and_evaluate() for _ in range(self.num_candidates)),
+            return_exceptions=True,
+        )
+        candidates = [r for r in results if isinstance(r, EvaluatedHypothesis)]
+        if not candidates:
+            raise next(r for r in results if isinstance(r, BaseException))
+        if len(candidates) < len(results):
+            logger.warning(
+                f"{len(results) - len(candidates)} of {len(results)} hypothesis "
+                "candidates failed; selecting among the rest."
+            )
+
+        winner = max(candidates, key=_candidate_score)
+        logger.info(
+            f"Selected hypothesis candidate with novelty "
+            f"{winner.evaluation.novelty_score} and significance "
+            f"{winner.evaluation.significance_score} out of {len(candidates)}."
+        )
+        return {
+            "research_hypothesis": winner.hypothesis,
+            "evaluated_hypothesis_history": [winner],
+        }
+
     @record_execution_time
     async def _evaluate_novelty_and_significance(
         self, state: GenerateHypothesisSubgraphV0State
@@ -93,6 +172,7 @@ class GenerateHypothesisSubgraphV0:
             research_hypothesis=state.get("research_hypothesis"),
             llm_config=self.llm_mapping.evaluate_novelty_and_significance,
             llm_client=self.langchain_client,
+            novelty_prefilter=self.novelty_prefilter,
         )
         return {
             "evaluated_hypothesis_history": state["evaluated_hypothesis_history"]
@@ -142,7 +222,6 @@ class GenerateHypothesisSubgraphV0:
             output_schema=GenerateHypothesisSubgraphV0OutputState,
         )
         graph_builder.add_node("initialize", self._initialize)
-        graph_builder.add_node("generate_hypothesis", self._generate_hypothesis)
         graph_builder.add_node(
             "evaluate_novelty_and_significance", self._evaluate_novelty_and_significance
         )
@@ -150,10 +229,25 @@ class GenerateHypothesisSubgraphV0:
         graph_builder.add_node("finalize_hypothesis", self._finalize_hypothesis)
 
         graph_builder.add_edge(START, "initialize")
-        graph_builder.add_edge("initialize", "generate_hypothesis")
-        graph_builder.add_edge(
-            "generate_hypothesis", "evaluate_novelty_and_significance"
-        )
+        if self.num_candidates > 1:
+            graph_builder.add_node(
+                "generate_hypothesis_candidates", self._generate_hypothesis_candidates
+            )
+            graph_builder.add_edge("initialize", "generate_hypothesis_candidates")
+            graph_builder.add_conditional_edges(
+                "generate_hypothesis_candidates",
+                self._should_refine_iteration,
+                {
+                    "end": "finalize_hypothesis",
+                    "regenerate": "refine_hypothesis",
+                },
+            )
+        else:
+            graph_builder.add_node("generate_hypothesis", self._generate_hypothesis)
+            graph_builder.add_edge("initialize", "generate_hypothesis")
+            graph_builder.add_edge(
+                "generate_hypothesis", "evaluate_novelty_and_significance"
+            )
         graph_builder.add_conditional_edges(
             "evaluate_novelty_and_significance",
             self._should_refine_iteration,
@@ -1,6 +1,5 @@
-from jinja2 import Environment
-
 from airas.core.llm_config import NodeLLMConfig
+from airas.core.prompt_templates import get_template
 from airas.core.types.research_hypothesis import (
     EvaluatedHypothesis,
     HypothesisEvaluation,
@@ -8,6 +7,9 @@ from airas.core.types.research_hypothesis import (
 )
 from airas.core.types.research_study import ResearchStudy
 from airas.infra.langchain_client import LangChainClient
+from airas.usecases.generators.generate_hypothesis_subgraph.novelty_prefilter import (
+    NoveltyPrefilter,
+)
 from airas.usecases.generators.generate_hypothesis_subgraph.prompts.evaluate_novelty_and_significance_prompt import (
     evaluate_novelty_and_significance_prompt,
 )
@@ -19,10 +21,18 @@ async def evaluate_novelty_and_significance(
     research_hypothesis: ResearchHypothesis,
     llm_config: NodeLLMConfig,
     llm_client: LangChainClient,
+    novelty_prefilter: NoveltyPrefilter | None = None,
 ) -> EvaluatedHypothesis:
-    env = Environment()
+    if novelty_prefilter is not None and (
+        evaluation := await novelty_prefilter.check(
+            research_hypothesis, research_study_list
+        )
+    ):
+        return EvaluatedHypothesis(
+            hypothesis=research_hypothesis, evaluation=evaluation
+        )
 
-    template = env.from_string(evaluate_novelty_and_significance_prompt)
+    template = get_template(evaluate_novelty_and_significance_prompt)
     data = {
         "research_topic": research_topic,
         "research_study_list": [
@@ -1,8 +1,7 @@
 from logging import getLogger
 
-from jinja2 import Environment
-
 from airas.core.llm_config import NodeLLMConfig
+from airas.core.prompt_templates import get_template
 from airas.core.types.research_hypothesis import ResearchHypothesis
 from airas.core.types.research_study import ResearchStudy
 from airas.infra.langchain_client import LangChainClient
@@ -22,11 +21,9 @@ async def generate_hypothesis(
     research_topic: str,
     research_study_list: list[ResearchStudy],
 ) -> ResearchHypothesis:
-    env = Environment()
-
     # NOTE: Simplified the experiment's difficulty level.
-    # template = env.from_string(generate_hypothesis_prompt)
-    template = env.from_string(generate_simple_hypothesis_prompt)
+    # template = get_template(generate_hypothesis_prompt)
+    template = get_template(generate_simple_hypothesis_prompt)
     data = {
         "research_topic": research_topic,
         "research_study_list": [
@@ -1,6 +1,5 @@
-from jinja2 import Environment
-
 from airas.core.llm_config import NodeLLMConfig
+from airas.core.prompt_templates import get_template
 from airas.core.types.research_hypothesis import (
     EvaluatedHypothesis,
     ResearchHypothesis,
@@ -19,8 +18,6 @@ async def refine_hypothesis(
     evaluated_hypothesis_history: list[EvaluatedHypothesis],
     research_study_list: list[ResearchStudy],
 ) -> ResearchHypothesis:
-    env = Environment()
-
     if not evaluated_hypothesis_history:
         raise ValueError(
             "evaluated_hypothesis_history must contain at least one hypothesis"
@@ -28,7 +25,7 @@ async def refine_hypothesis(
 
     latest = evaluated_hypothesis_history[-1]
 
-    template = env.from_string(refine_hypothesis_prompt)
+    template = get_template(refine_hypothesis_prompt)
     data = {
         "research_topic": research_topic,
         "current_hypothesis": latest.hypothesis.to_formatted_json(),
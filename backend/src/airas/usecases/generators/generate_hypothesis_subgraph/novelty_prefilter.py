@@ -0,0 +1,134 @@
+import os
+from logging import getLogger
+
+from airas.core.types.research_hypothesis import (
+    HypothesisEvaluation,
+    ResearchHypothesis,
+)
+from airas.core.types.research_study import ResearchStudy
+from airas.infra.text_embedders import (
+    HashingEmbedder,
+    TextEmbedder,
+    cosine_similarity,
+)
+
+logger = getLogger(__name__)
+
+# Stand-in for an abstract when no contributions or methods were extracted.
+_FULL_TEXT_CHARS = 2000
+
+# Measured with scripts/calibrate_novelty_prefilter.py: HashingEmbedder scores
+# near-verbatim restatements of a study at 0.56-0.76 and paraphrases or
+# related but distinct ideas at 0.32 or below. Being lexical, it only catches
+# restatements; an embedding model needs its own calibrated threshold.
+HASHING_EMBEDDER_THRESHOLD = 0.44
+
+
+def _hypothesis_text(research_hypothesis: ResearchHypothesis) -> str:
+    return f"{research_hypothesis.open_problems}\n{research_hypothesis.method}"
+
+
+def _study_text(research_study: ResearchStudy) -> str:
+    info = research_study.llm_extracted_info
+    summary = "\n".join(
+        part for part in (info.main_contributions, info.methodology) if part
+    )
+    return (
+        f"{research_study.title}\n"
+        f"{summary or research_study.full_text[:_FULL_TEXT_CHARS]}"
+    ).strip()
+
+
+class NoveltyPrefilter:
+    """Rejects near-duplicates of related work before any LLM evaluation.
+
+    The hypothesis and every related study are embedded; when the closest
+    study's cosine similarity reaches ``threshold``, ``check`` returns a
+    minimal evaluation naming that study instead of ``None``. Embeddings are
+    cached by text, so related studies are embedded once per run even though
+    every refinement round is checked against them.
+
+    ``threshold`` depends on the embedder, so it must be given with a custom
+    one; the default ``HashingEmbedder`` uses ``HASHING_EMBEDDER_THRESHOLD``.
+    """
+
+    def __init__(
+        self, embedder: TextEmbedder | None = None, threshold: float | None = None
+    ) -> None:
+        if threshold is None:
+            if embedder is not None:
+                raise ValueError(
+                    "threshold must be calibrated for the embedder it is used with"
+                )
+            threshold = HASHING_EMBEDDER_THRESHOLD
+        self.embedder = embedder or HashingEmbedder()
+        self.threshold = threshold
+        self._embeddings: dict[str, list[float]] = {}
+
+    async def _embed(self, texts: list[str]) -> list[list[float]]:
+        missing = list(dict.fromkeys(t for t in texts if t not in self._embeddings))
+        if missing:
+            vectors = await self.embedder.embed(missing)
+            self._embeddings.update(zip(missing, vectors, strict=True))
+        return [self._embeddings[t] for t in texts]
+
+    async def closest_study(
+        self,
+        research_hypothesis: ResearchHypothesis,
+        research_study_list: list[ResearchStudy],
+    ) -> tuple[float, ResearchStudy] | None:
+        """Cosine similarity to, and the study most similar to, the hypothesis."""
+        studies = [(s, text) for s in research_study_list if (text := _study_text(s))]
+        if not studies:
+            return None
+
+        hypothesis_vector, *study_vectors = await self._embed(
+            [_hypothesis_text(research_hypothesis)] + [text for _, text in studies]
+        )
+        return max(
+            (
+                (cosine_similarity(hypothesis_vector, vector), study)
+                for (study, _), vector in zip(studies, study_vectors, strict=True)
+            ),
+            key=lambda pair: pair[0],
+        )
+
+    async def check(
+        self,
+        research_hypothesis: ResearchHypothesis,
+        research_study_list: list[ResearchStudy],
+    ) -> HypothesisEvaluation | None:
+        match = await self.closest_study(research_hypothesis, research_study_list)
+        if match is None or match[0] < self.threshold:
+            return None
+        similarity, closest = match
+
+        logger.info(
+            f"Hypothesis is a near-duplicate of '{closest.title}' "
+            f"(cosine similarity {similarity:.3f}); skipping LLM evaluation."
+        )
+        return HypothesisEvaluation(
+            novelty_reason=(
+                f"The method closely restates existing work: '{closest.title}' "
+                f"(embedding cosine similarity {similarity:.2f}). Differentiate "
+                "the approach from it."
+            ),
+            novelty_score=1,
+            significance_reason=(
+                "Not evaluated because the hypothesis duplicates existing work."
+            ),
+            significance_score=1,
+        )
+
+
+def novelty_prefilter_from_env() -> NoveltyPrefilter | None:
+    """A prefilter when AIRAS_NOVELTY_PREFILTER=true, otherwise ``None``.
+
+    AIRAS_NOVELTY_PREFILTER_THRESHOLD overrides the calibrated threshold.
+    """
+    if os.getenv("AIRAS_NOVELTY_PREFILTER", "false").lower() != "true":
+        return None
+    threshold = os.getenv("AIRAS_NOVELTY_PREFILTER_THRESHOLD")
+    return NoveltyPrefilter(
+        threshold=float(threshold) if threshold else HASHING_EMBEDDER_THRESHOLD
+    )
@@ -0,0 +1,47 @@
+import string
+
+from airas.core.types.research_study import ResearchStudy
+from airas.infra.arxiv_client import split_arxiv_version
+
+# Related studies already searched and fetched in this run, under every key
+# that identifies them (normalized title and unversioned arXiv id).
+RelatedPaperMemo = dict[str, ResearchStudy]
+
+_PUNCTUATION = str.maketrans("", "", string.punctuation)
+
+
+def _memo_keys(research_study: ResearchStudy) -> list[str]:
+    keys = []
+    if title := "".join(research_study.title.lower().translate(_PUNCTUATION).split()):
+        keys.append(f"title:{title}")
+    meta_data = research_study.meta_data
+    if meta_data and (arxiv_id := (meta_data.arxiv_id or "").strip()):
+        keys.append(f"arxiv:{split_arxiv_version(arxiv_id)[0]}")
+    return keys
+
+
+def lookup(
+    memo: RelatedPaperMemo, research_study: ResearchStudy
+) -> ResearchStudy | None:
+    return next((memo[key] for key in _memo_keys(research_study) if key in memo), None)
+
+
+def resolve(
+    memo: RelatedPaperMemo, research_study_list: list[ResearchStudy]
+) -> tuple[list[ResearchStudy], list[ResearchStudy]]:
+    """Swap in memoized studies; also return the ones still to be retrieved.
+
+    Run again after every step that fills in identifiers, since a study may
+    only match the memo once its arXiv id is known.
+    """
+    resolved = [lookup(memo, study) or study for study in research_study_list]
+    return resolved, [study for study in resolved if lookup(memo, study) is None]
+
+
+def remember(
+    memo: RelatedPaperMemo, research_study_list: list[ResearchStudy]
+) -> RelatedPaperMemo:
+    return {
+        **memo,
+        **{key: study for study in research_study_list for key in _memo_keys(study)},
+    }
@@ -1,7 +1,7 @@
-from jinja2 import Environment
 from pydantic import BaseModel
 
 from airas.core.llm_config import NodeLLMConfig
+from airas.core.prompt_templates import get_template
 from airas.infra.langchain_client import LangChainClient
 
 # def _build_generated_query_model(n_queries: int) -> type[BaseModel]:
@@ -25,8 +25,7 @@ async def generate_queries(
         "n_queries": num_paper_search_queries,
     }
 
-    env = Environment()
-    template = env.from_string(prompt_template)
+    template = get_template(prompt_template)
     messages = template.render(data)
 
     # DynamicLLMOutput = _build_generated_query_model(num_paper_search_queries)
@@ -1,8 +1,10 @@
 import logging
 
 from langgraph.graph import END, START, StateGraph
+from langgraph.runtime import Runtime
 from typing_extensions import TypedDict
 
+from airas.core.compiled_graph import CachedGraphMixin, GraphContext
 from airas.core.execution_timers import ExecutionTimeState, time_node
 from airas.core.logging_utils import setup_logging
 from airas.core.types.github import GitHubConfig
@@ -32,7 +34,7 @@ class DownloadGithubActionsArtifactsState(
     pass
 
 
-class DownloadGithubActionsArtifactsSubgraph:
+class DownloadGithubActionsArtifactsSubgraph(CachedGraphMixin):
     def __init__(
         self,
         github_client: GithubClient,
@@ -41,10 +43,12 @@ class DownloadGithubActionsArtifactsSubgraph:
 
     @record_execution_time
     async def _download_and_parse_artifact_node(
-        self, state: DownloadGithubActionsArtifactsState
+        self,
+        state: DownloadGithubActionsArtifactsState,
+        runtime: Runtime[GraphContext["DownloadGithubActionsArtifactsSubgraph"]],
     ) -> dict[str, dict]:
         artifact_data = await download_and_parse_artifact(
-            github_client=self.github_client,
+            github_client=self.from_runtime(runtime).github_client,
             github_config=state["github_config"],
             workflow_run_id=state["workflow_run_id"],
         )
@@ -55,6 +59,7 @@ class DownloadGithubActionsArtifactsSubgraph:
             DownloadGithubActionsArtifactsState,
             input_schema=DownloadGithubActionsArtifactsInputState,
             output_schema=DownloadGithubActionsArtifactsOutputState,
+            context_schema=GraphContext,
         )
 
         graph_builder.add_node(
@@ -34,14 +34,13 @@ class GithubDownloadSubgraphState(
 
 class GithubDownloadSubgraph:
     def __init__(self, github_client: GithubClient):
-        self.research_file_path = ".research/research_history.json"
         self.github_client = github_client
 
     @record_execution_time
-    def _download_history(
+    async def _download_history(
         self, state: GithubDownloadSubgraphState
     ) -> dict[str, ResearchHistory]:
-        research_history = github_download(
+        research_history = await github_download(
             github_config=state["github_config"],
             github_client=self.github_client,
         )
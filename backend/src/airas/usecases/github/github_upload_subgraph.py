@@ -9,9 +9,13 @@ from airas.core.logging_utils import setup_logging
 from airas.core.types.github import GitHubConfig
 from airas.core.types.research_history import ResearchHistory
 from airas.infra.github_client import GithubClient
-from airas.usecases.github.nodes.github_download import github_download
 from airas.usecases.github.nodes.github_upload import github_upload
 from airas.usecases.github.nodes.merge_history import merge_history
+from airas.usecases.github.nodes.research_history_shards import (
+    HISTORY_DIR,
+    download_legacy_history,
+    list_remote_files,
+)
 
 setup_logging()
 logger = logging.getLogger(__name__)
@@ -33,47 +37,58 @@ class GithubUploadSubgraphState(
     GithubUploadOutputState,
     total=False,
 ):
-    downloaded_history: ResearchHistory
+    remote_shards: dict[str, str]
+    has_legacy_file: bool
 
 
 class GithubUploadSubgraph:
     def __init__(self, github_client: GithubClient):
-        self.research_file_path = ".research/research_history.json"
         self.github_client = github_client
 
     @record_execution_time
-    def _download_history(
+    async def _list_remote_shards(
         self, state: GithubUploadSubgraphState
-    ) -> dict[str, ResearchHistory]:
-        downloaded_history = github_download(
-            github_config=state["github_config"],
-            github_client=self.github_client,
-            file_path=self.research_file_path,
+    ) -> dict[str, dict[str, str] | bool]:
+        remote_shards = await list_remote_files(
+            state["github_config"], self.github_client, HISTORY_DIR
         )
-        return {"downloaded_history": downloaded_history}
+        return {"remote_shards": remote_shards, "has_legacy_file": False}
 
     @record_execution_time
-    def _merge_history(
+    async def _migrate_legacy_history(
         self, state: GithubUploadSubgraphState
-    ) -> dict[str, ResearchHistory]:
+    ) -> dict[str, ResearchHistory | bool]:
+        # Branches written before sharding: carry the old fields over once and
+        # drop the single-file history in the same commit.
+        legacy_history = await download_legacy_history(
+            state["github_config"], self.github_client
+        )
+        if legacy_history is None:
+            return {"has_legacy_file": False}
         merged_history = merge_history(
-            old=state["downloaded_history"],
+            old=legacy_history,
             new=state["research_history"],
         )
-        return {"research_history": merged_history}
+        return {"research_history": merged_history, "has_legacy_file": True}
+
+    def _route_after_listing(self, state: GithubUploadSubgraphState) -> str:
+        return "upload_history" if state["remote_shards"] else "migrate_legacy_history"
 
     @record_execution_time
-    def _upload_history(self, state: GithubUploadSubgraphState) -> dict[str, bool]:
+    async def _upload_history(
+        self, state: GithubUploadSubgraphState
+    ) -> dict[str, bool]:
         default_commit_message = (
             f"Update research history at {datetime.now().isoformat()}"
         )
 
-        is_github_upload = github_upload(
+        is_github_upload = await github_upload(
             github_config=state["github_config"],
             github_client=self.github_client,
             research_history=state["research_history"],
-            file_path=self.research_file_path,
-            commit_message=state.get("commit_message", default_commit_message),
+            remote_shards=state["remote_shards"],
+            commit_message=state.get("commit_message") or default_commit_message,
+            remove_legacy_file=state.get("has_legacy_file", False),
         )
         return {"is_github_upload": is_github_upload}
 
@@ -83,12 +98,16 @@ class GithubUploadSubgraph:
             input_schema=GithubUploadInputState,
             output_schema=GithubUploadOutputState,
         )
-        sg.add_node("download_history", self._download_history)
-        sg.add_node("merge_history", self._merge_history)
+        sg.add_node("list_remote_shards", self._list_remote_shards)
+        sg.add_node("migrate_legacy_history", self._migrate_legacy_history)
         sg.add_node("upload_history", self._upload_history)
 
-        sg.add_edge(START, "download_history")
-        sg.add_edge("download_history", "merge_history")
-        sg.add_edge("merge_history", "upload_history")
+        sg.add_edge(START, "list_remote_shards")
+        sg.add_conditional_edges(
+            "list_remote_shards",
+            self._route_after_listing,
+            ["migrate_legacy_history", "upload_history"],
+        )
+        sg.add_edge("migrate_legacy_history", "upload_history")
         sg.add_edge("upload_history", END)
         return sg.compile()
@@ -1,58 +1,40 @@
-import json
 import logging
 
-import httpx
+from pydantic import ValidationError
 
 from airas.core.types.github import GitHubConfig
 from airas.core.types.research_history import ResearchHistory
 from airas.infra.github_client import GithubClient
+from airas.usecases.github.nodes.research_history_shards import (
+    HISTORY_DIR,
+    download_legacy_history,
+    download_shards,
+    list_remote_files,
+)
 
 logger = logging.getLogger(__name__)
 
 
-def github_download(
+async def github_download(
     github_config: GitHubConfig,
     github_client: GithubClient,
-    file_path: str = ".research/research_history.json",
 ) -> ResearchHistory:
     logger.info(
-        f"[GitHub I/O] Download: {github_config.github_owner}/{github_config.repository_name}@{github_config.branch_name}:{file_path}"
+        f"[GitHub I/O] Download: {github_config.github_owner}/{github_config.repository_name}@{github_config.branch_name}:{HISTORY_DIR}"
     )
 
+    remote_shards = await list_remote_files(github_config, github_client, HISTORY_DIR)
     try:
-        blob = github_client.get_repository_content(
-            github_owner=github_config.github_owner,
-            repository_name=github_config.repository_name,
-            file_path=file_path,
-            branch_name=github_config.branch_name,
+        if remote_shards:
+            return await download_shards(github_config, github_client, remote_shards)
+        legacy = await download_legacy_history(github_config, github_client)
+    except ValidationError as e:
+        logger.warning(
+            f"Failed to convert to ResearchHistory: {e}, returning empty ResearchHistory"
         )
+        return ResearchHistory()
 
-        download_url = blob.get("download_url")
-        if not download_url:
-            logger.error("No download_url available for file")
-            return ResearchHistory()
-
-        logger.info(f"Downloading file directly: {download_url}")
-        with httpx.Client() as client:
-            response = client.get(download_url)
-            response.raise_for_status()
-            raw = response.content
-
-        if not raw:
-            logger.warning("Raw content is empty, returning empty ResearchHistory")
-            return ResearchHistory()
-
-        # Parse JSON and convert to ResearchHistory
-        try:
-            decoded_dict = json.loads(raw)
-            research_history = ResearchHistory.model_validate(decoded_dict)
-            return research_history
-        except Exception as e:
-            logger.warning(
-                f"Failed to convert to ResearchHistory: {e}, returning empty ResearchHistory"
-            )
-            return ResearchHistory()
-
-    except FileNotFoundError as e:
-        logger.error(f"State file not found – returning empty ResearchHistory: {e}")
+    if legacy is None:
+        logger.warning("No research history found, returning empty ResearchHistory")
         return ResearchHistory()
+    return legacy
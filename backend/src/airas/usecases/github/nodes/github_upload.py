@@ -1,43 +1,66 @@
-import json
 import logging
-import time
 
 from airas.core.types.github import GitHubConfig
 from airas.core.types.research_history import ResearchHistory
-from airas.infra.github_client import GithubClient
+from airas.infra.github_client import GithubClient, git_blob_sha
+from airas.usecases.github.nodes.research_history_shards import (
+    HISTORY_DIR,
+    LEGACY_HISTORY_PATH,
+    serialize_shards,
+)
 
 logger = logging.getLogger(__name__)
 
 
-def github_upload(
+async def github_upload(
     github_config: GitHubConfig,
     github_client: GithubClient,
     research_history: ResearchHistory,
-    file_path: str = ".research/research_history.json",
+    remote_shards: dict[str, str],
     commit_message: str = "Update history via github_upload",
-    wait_seconds: float = 3.0,
+    remove_legacy_file: bool = False,
+    propagation_timeout: float = 30.0,
 ) -> bool:
     logger.info(
-        f"[GitHub I/O] Upload: {github_config.github_owner}/{github_config.repository_name}@{github_config.branch_name}:{file_path}"
+        f"[GitHub I/O] Upload: {github_config.github_owner}/{github_config.repository_name}@{github_config.branch_name}:{HISTORY_DIR}"
     )
-    # Convert ResearchHistory to dict for JSON serialization with datetime handling
-    research_history_dict = research_history.model_dump(exclude_none=True, mode="json")
+    # Only shards whose content hash differs from the branch are uploaded.
+    changed_shards = {
+        path: content
+        for path, content in serialize_shards(research_history).items()
+        if remote_shards.get(path) != git_blob_sha(content)
+    }
+    deleted_paths = [LEGACY_HISTORY_PATH] if remove_legacy_file else []
+    if not changed_shards and not deleted_paths:
+        logger.info("Research history unchanged, skipping commit")
+        return True
 
-    ok_json = github_client.commit_file_bytes(
+    logger.info(
+        f"Committing {len(changed_shards)} changed shard(s): {sorted(changed_shards)}"
+    )
+    ok = await github_client.acommit_multiple_files(
         github_owner=github_config.github_owner,
         repository_name=github_config.repository_name,
         branch_name=github_config.branch_name,
-        file_path=file_path,
-        file_content=json.dumps(
-            research_history_dict, ensure_ascii=False, indent=2
-        ).encode("utf-8", errors="replace"),
+        files=changed_shards,
         commit_message=commit_message,
+        deleted_paths=deleted_paths or None,
     )
-    if ok_json:
+    if ok:
         print(
-            f"Check here：https://github.com/{github_config.github_owner}/{github_config.repository_name}/blob/{github_config.branch_name}/{file_path}"
+            f"Check here：https://github.com/{github_config.github_owner}/{github_config.repository_name}/tree/{github_config.branch_name}/{HISTORY_DIR}"
         )
 
-    if wait_seconds > 0:
-        time.sleep(wait_seconds)
-    return ok_json
+    if ok and changed_shards and propagation_timeout > 0:
+        # All shards land in one commit, so once one of them is served at its
+        # new content the branch is up to date and a download reads it back.
+        path, content = next(iter(changed_shards.items()))
+        await github_client.await_until_file_sha(
+            github_owner=github_config.github_owner,
+            repository_name=github_config.repository_name,
+            file_path=path,
+            blob_sha=git_blob_sha(content),
+            branch_name=github_config.branch_name,
+            timeout=propagation_timeout,
+        )
+    return ok
@@ -1,5 +1,3 @@
-from copy import deepcopy
-
 from airas.core.types.research_history import ResearchHistory
 
 
@@ -7,13 +5,11 @@ def merge_history(
     old: ResearchHistory | None,
     new: ResearchHistory,
 ) -> ResearchHistory:
+    # model_dump already returns fresh containers, so no copy is needed.
     old_dict = old.model_dump(exclude_none=True) if old else {}
     new_dict = new.model_dump(exclude_none=True)
 
-    merged_dict = deepcopy(old_dict)
-    merged_dict.update(new_dict)
-
-    return ResearchHistory.model_validate(merged_dict)
+    return ResearchHistory.model_validate({**old_dict, **new_dict})
 
 
 if __name__ == "__main__":
@@ -0,0 +1,124 @@
+"""Field-level storage of ResearchHistory on a GitHub branch.
+
+Each non-empty ResearchHistory field is stored as its own JSON shard under
+``HISTORY_DIR``. The git blob SHA of a shard is a hash of its content, so
+comparing the SHA computed locally with the one GitHub lists for the
+directory tells us which shards changed (upload) and which ones we have
+already seen (download) without transferring them.
+
+Repositories written before sharding keep the whole history in
+``LEGACY_HISTORY_PATH``; it is read as a fallback and replaced by shards on
+the next upload.
+"""
+
+import asyncio
+import json
+import logging
+from collections import OrderedDict
+from typing import Any
+
+from airas.core.types.github import GitHubConfig
+from airas.core.types.research_history import ResearchHistory
+from airas.infra.github_client import GithubClient, GithubClientNotFoundError
+
+logger = logging.getLogger(__name__)
+
+HISTORY_DIR = ".research/history"
+LEGACY_HISTORY_PATH = ".research/research_history.json"
+
+_MAX_CACHED_SHARDS = 256
+# blob SHA -> parsed shard value. Blobs are immutable, so entries never go stale.
+_shard_cache: OrderedDict[str, Any] = OrderedDict()
+
+
+def shard_path(field: str) -> str:
+    return f"{HISTORY_DIR}/{field}.json"
+
+
+def serialize_shards(research_history: ResearchHistory) -> dict[str, str]:
+    """Map shard path -> JSON content for every field that is set."""
+    return {
+        shard_path(field): json.dumps(value, ensure_ascii=False, indent=2)
+        for field, value in research_history.model_dump(
+            exclude_none=True, mode="json"
+        ).items()
+    }
+
+
+async def list_remote_files(
+    github_config: GitHubConfig, github_client: GithubClient, directory: str
+) -> dict[str, str]:
+    """Map path -> blob SHA for the files in ``directory`` (empty if missing)."""
+    try:
+        entries = await github_client.aget_repository_content(
+            github_owner=github_config.github_owner,
+            repository_name=github_config.repository_name,
+            file_path=directory,
+            branch_name=github_config.branch_name,
+        )
+    except GithubClientNotFoundError:
+        return {}
+    if not isinstance(entries, list):
+        return {}
+    return {
+        entry["path"]: entry["sha"] for entry in entries if entry.get("type") == "file"
+    }
+
+
+async def _fetch_json(
+    github_config: GitHubConfig,
+    github_client: GithubClient,
+    file_path: str,
+    blob_sha: str | None = None,
+) -> Any:
+    if blob_sha is not None and blob_sha in _shard_cache:
+        _shard_cache.move_to_end(blob_sha)
+        return _shard_cache[blob_sha]
+
+    raw = await github_client.aget_repository_content(
+        github_owner=github_config.github_owner,
+        repository_name=github_config.repository_name,
+        file_path=file_path,
+        branch_name=github_config.branch_name,
+        as_="bytes",
+    )
+    value = json.loads(raw)
+
+    if blob_sha is not None:
+        _shard_cache[blob_sha] = value
+        if len(_shard_cache) > _MAX_CACHED_SHARDS:
+            _shard_cache.popitem(last=False)
+    return value
+
+
+async def download_shards(
+    github_config: GitHubConfig,
+    github_client: GithubClient,
+    remote_shards: dict[str, str],
+) -> ResearchHistory:
+    shards = {
+        field: (path, blob_sha)
+        for path, blob_sha in remote_shards.items()
+        if (field := path.removeprefix(f"{HISTORY_DIR}/").removesuffix(".json"))
+        in ResearchHistory.model_fields
+    }
+    values = await asyncio.gather(
+        *(
+            _fetch_json(github_config, github_client, path, blob_sha)
+            for path, blob_sha in shards.values()
+        )
+    )
+    return ResearchHistory.model_validate(dict(zip(shards, values, strict=True)))
+
+
+async def download_legacy_history(
+    github_config: GitHubConfig, github_client: GithubClient
+) -> ResearchHistory | None:
+    try:
+        decoded = await _fetch_json(github_config, github_client, LEGACY_HISTORY_PATH)
+    except GithubClientNotFoundError:
+        return None
+    except json.JSONDecodeError as e:
+        logger.warning(f"Failed to parse {LEGACY_HISTORY_PATH}: {e}")
+        return None
+    return ResearchHistory.model_validate(decoded)
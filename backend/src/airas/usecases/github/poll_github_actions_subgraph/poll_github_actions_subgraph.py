@@ -4,9 +4,11 @@ import time
 from typing import Literal
 
 from langgraph.graph import END, START, StateGraph
+from langgraph.runtime import Runtime
 from langgraph.types import Command
 from typing_extensions import TypedDict
 
+from airas.core.compiled_graph import CachedGraphMixin, GraphContext
 from airas.core.execution_timers import ExecutionTimeState, time_node
 from airas.core.logging_utils import setup_logging
 from airas.core.types.github import (
@@ -54,7 +56,7 @@ class PollGithubActionsState(
     poll_count: int
 
 
-class PollGithubActionsSubgraph:
+class PollGithubActionsSubgraph(CachedGraphMixin):
     def __init__(
         self,
         github_client: GithubClient,
@@ -82,9 +84,14 @@ class PollGithubActionsSubgraph:
         )
 
     @record_execution_time
-    async def _poll_workflow_status(self, state: PollGithubActionsState) -> Command:
+    async def _poll_workflow_status(
+        self,
+        state: PollGithubActionsState,
+        runtime: Runtime[GraphContext["PollGithubActionsSubgraph"]],
+    ) -> Command:
+        subgraph = self.from_runtime(runtime)
         elapsed_time = time.time() - state["start_time"]
-        if elapsed_time > self.timeout_sec:
+        if elapsed_time > subgraph.timeout_sec:
             logger.error(f"Workflow polling timed out after {elapsed_time:.2f} seconds")
             return Command(
                 update={
@@ -100,7 +107,7 @@ class PollGithubActionsSubgraph:
 
         workflow_runs_response = await get_workflow_runs(
             github_config=state["github_config"],
-            github_client=self.github_client,
+            github_client=subgraph.github_client,
         )
 
         workflow_run_id, status, conclusion = get_latest_workflow_status(
@@ -184,27 +191,32 @@ class PollGithubActionsSubgraph:
 
     @record_execution_time
     async def _log_workflow_failure_details(
-        self, state: PollGithubActionsState
+        self,
+        state: PollGithubActionsState,
+        runtime: Runtime[GraphContext["PollGithubActionsSubgraph"]],
     ) -> Command:
+        subgraph = self.from_runtime(runtime)
         workflow_run_id = state["workflow_run_id"]
 
         await log_workflow_failure_details(
             workflow_run_id=workflow_run_id,
             github_config=state["github_config"],
-            github_client=self.github_client,
+            github_client=subgraph.github_client,
         )
 
         return Command(goto=END)
 
     @record_execution_time
     async def _sleep_and_retry(
-        self, _state: PollGithubActionsState
+        self,
+        _state: PollGithubActionsState,
+        runtime: Runtime[GraphContext["PollGithubActionsSubgraph"]],
     ) -> Command[Literal["poll_workflow_status"]]:
-        await asyncio.sleep(self.poll_interval_sec)
+        await asyncio.sleep(self.from_runtime(runtime).poll_interval_sec)
         return Command(goto="poll_workflow_status")
 
     def build_graph(self):
-        graph_builder = StateGraph(PollGithubActionsState)
+        graph_builder = StateGraph(PollGithubActionsState, context_schema=GraphContext)
 
         graph_builder.add_node("initialize", self._initialize)
         graph_builder.add_node("poll_workflow_status", self._poll_workflow_status)
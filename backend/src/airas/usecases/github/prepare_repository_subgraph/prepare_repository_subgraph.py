@@ -1,5 +1,4 @@
 import logging
-import time
 from typing import Literal
 
 from langgraph.graph import END, START, StateGraph
@@ -95,13 +94,19 @@ class PrepareRepositorySubgraph:
             template_repo=self.template_repo,
             is_github_repo_private=self.is_github_repo_private,
         )
+        # GitHub populates a repository generated from a template
+        # asynchronously; continue as soon as its main branch is visible.
+        self.github_client.wait_until_ref_exists(
+            github_owner=state["github_config"].github_owner,
+            repository_name=state["github_config"].repository_name,
+            branch_name="main",
+        )
         return {"is_repository_from_template": is_repository_from_template}
 
     @record_execution_time
     def _check_branch_existence(
         self, state: PrepareRepositoryState
     ) -> Command[Literal["retrieve_main_branch_sha", "finalize_state"]]:
-        time.sleep(5)
         target_branch_sha = check_branch_existence(
             github_config=state["github_config"],
             github_client=self.github_client,
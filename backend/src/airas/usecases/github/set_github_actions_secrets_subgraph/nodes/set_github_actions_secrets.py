@@ -1,59 +1,104 @@
+import asyncio
 import logging
 import os
 
 from airas.core.types.github import GitHubConfig
 from airas.infra.github_client import GithubClient, GithubClientError
+from airas.infra.secret_sync_store import SecretSyncStore
 
 logger = logging.getLogger(__name__)
 
 
-def set_github_actions_secrets(
+async def set_github_actions_secrets(
     github_config: GitHubConfig,
     github_client: GithubClient,
     secret_names: list[str],
+    sync_store: SecretSyncStore | None = None,
+    max_concurrency: int = 8,
 ) -> bool:
+    repository = f"{github_config.github_owner}/{github_config.repository_name}"
     try:
         # Get repository public key once for all secrets
-        public_key_info = github_client.get_repository_public_key(
+        public_key_info = await github_client.aget_repository_public_key(
             github_owner=github_config.github_owner,
             repository_name=github_config.repository_name,
         )
         if not public_key_info:
-            logger.error(
-                f"Failed to get public key for repository {github_config.github_owner}/{github_config.repository_name}"
-            )
+            logger.error(f"Failed to get public key for repository {repository}")
             return False
 
-        success_count = 0
+        values: dict[str, str] = {}
         for secret_name in secret_names:
-            token_value = os.getenv(secret_name)
-            if not token_value:
+            if token_value := os.getenv(secret_name):
+                values[secret_name] = token_value
+            else:
                 logger.warning(
                     f"Token '{secret_name}' not found in environment variables, skipping"
                 )
-                continue
-
-            logger.info(f"Token '{secret_name}' retrieved from environment variables")
 
-            success = github_client.create_or_update_repository_secret(
-                github_owner=github_config.github_owner,
-                repository_name=github_config.repository_name,
-                secret_name=secret_name,
-                secret_value=token_value,
-                public_key_info=public_key_info,
+        # Secrets pushed before with the same value under the same public key
+        # are skipped, unless they have since been deleted from the repository.
+        unchanged: set[str] = set()
+        if sync_store is not None and values:
+            unchanged = await asyncio.to_thread(
+                sync_store.unchanged, repository, public_key_info["key_id"], values
             )
+            if unchanged:
+                unchanged &= await github_client.alist_repository_secret_names(
+                    github_owner=github_config.github_owner,
+                    repository_name=github_config.repository_name,
+                )
+        if unchanged:
+            logger.info(f"Secrets unchanged in {repository}: {sorted(unchanged)}")
+
+        semaphore = asyncio.Semaphore(max_concurrency)
 
-            if success:
-                logger.info(
-                    f"Successfully set GitHub Actions secret '{secret_name}' for {github_config.github_owner}/{github_config.repository_name}"
+        async def push(secret_name: str, secret_value: str) -> bool:
+            async with semaphore:
+                success = await github_client.acreate_or_update_repository_secret(
+                    github_owner=github_config.github_owner,
+                    repository_name=github_config.repository_name,
+                    secret_name=secret_name,
+                    secret_value=secret_value,
+                    public_key_info=public_key_info,
                 )
-                success_count += 1
-            else:
+            if not success:
                 logger.error(
-                    f"Failed to set GitHub Actions secret '{secret_name}' for {github_config.github_owner}/{github_config.repository_name}"
+                    f"Failed to set GitHub Actions secret '{secret_name}' for {repository}"
                 )
+                return False
+            logger.info(
+                f"Successfully set GitHub Actions secret '{secret_name}' for {repository}"
+            )
+            return True
 
-        logger.info(f"Successfully set {success_count}/{len(secret_names)} secrets")
+        changed = {n: v for n, v in values.items() if n not in unchanged}
+        # One failed push must not drop the others before they are recorded,
+        # or the next sync pushes them again.
+        results = await asyncio.gather(
+            *(
+                push(secret_name, secret_value)
+                for secret_name, secret_value in changed.items()
+            ),
+            return_exceptions=True,
+        )
+        pushed = {
+            n: v
+            for (n, v), ok in zip(changed.items(), results, strict=True)
+            if ok is True
+        }
+        if sync_store is not None and pushed:
+            await asyncio.to_thread(
+                sync_store.record, repository, public_key_info["key_id"], pushed
+            )
+        if errors := [r for r in results if isinstance(r, BaseException)]:
+            raise errors[0]
+
+        success_count = len(unchanged) + len(pushed)
+        logger.info(
+            f"Successfully set {success_count}/{len(secret_names)} secrets "
+            f"({len(pushed)} pushed, {len(unchanged)} unchanged)"
+        )
         return success_count > 0
 
     except GithubClientError as e:
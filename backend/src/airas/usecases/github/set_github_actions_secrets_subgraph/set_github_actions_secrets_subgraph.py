@@ -7,6 +7,7 @@ from airas.core.execution_timers import ExecutionTimeState, time_node
 from airas.core.logging_utils import setup_logging
 from airas.core.types.github import GitHubConfig
 from airas.infra.github_client import GithubClient
+from airas.infra.secret_sync_store import SecretSyncStore, shared_secret_sync_store
 from airas.usecases.github.set_github_actions_secrets_subgraph.nodes.set_github_actions_secrets import (
     set_github_actions_secrets,
 )
@@ -38,6 +39,7 @@ class SetGithubActionsSecretsSubgraph:
         github_client: GithubClient,
         secret_names: list[str]
         | None = None,  # None syncs the default set; the dashboard passes one name
+        sync_store: SecretSyncStore | None = None,
     ):
         self.secret_names = secret_names or [
             "OPENAI_API_KEY",
@@ -55,9 +57,12 @@ class SetGithubActionsSecretsSubgraph:
             "AWS_SECRET_ACCESS_KEY",
         ]
         self.github_client = github_client
+        # Remembers what was pushed so unchanged secrets are not re-uploaded;
+        # defaults to the store configured by AIRAS_SECRET_SYNC_PATH.
+        self.sync_store = sync_store or shared_secret_sync_store()
 
     @record_execution_time
-    def _set_github_actions_secrets(
+    async def _set_github_actions_secrets(
         self, state: SetGithubActionsSecretsState
     ) -> dict[str, bool]:
         if not self.secret_names:
@@ -66,10 +71,11 @@ class SetGithubActionsSecretsSubgraph:
             )
             return {"secrets_set": False}
 
-        success = set_github_actions_secrets(
+        success = await set_github_actions_secrets(
             github_config=state["github_config"],
             github_client=self.github_client,
             secret_names=self.secret_names,
+            sync_store=self.sync_store,
         )
         return {"secrets_set": success}
 
@@ -1,7 +1,7 @@
 from airas.core.types.research_session import ResearchSession
-from jinja2 import Environment
 from pydantic import BaseModel
 
+from airas.core.prompt_templates import get_template
 from airas.core.types.paper import PaperContent
 from airas.infra.langchain_client import LangChainClient
 from airas.infra.llm_specs import LLM_MODELS
@@ -42,8 +42,7 @@ async def convert_to_html(
         "image_file_name_list": image_file_name_list,
     }
 
-    env = Environment()
-    template = env.from_string(prompt_template)
+    template = get_template(prompt_template)
     messages = template.render(data)
 
     output = await llm_client.structured_outputs(
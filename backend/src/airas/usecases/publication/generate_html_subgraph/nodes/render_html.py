@@ -1,6 +1,6 @@
 import logging
 
-from jinja2 import Environment
+from airas.core.prompt_templates import get_template
 
 logger = logging.getLogger(__name__)
 
@@ -79,8 +79,7 @@ def render_html(paper_content_html: str) -> str:
 </body>
 </html>"""
 
-    env = Environment()
-    template = env.from_string(base_template)
+    template = get_template(base_template)
     full_html = template.render(content=paper_content_html)
 
     return full_html
@@ -1,8 +1,7 @@
 from logging import getLogger
 
-from jinja2 import Environment
-
 from airas.core.llm_config import NodeLLMConfig
+from airas.core.prompt_templates import get_template
 from airas.core.types.paper import PaperContent
 from airas.infra.langchain_client import LangChainClient
 from airas.usecases.publication.generate_latex_subgraph.prompts.convert_to_latex_prompt import (
@@ -20,8 +19,6 @@ async def convert_to_latex(
     latex_template_text: str | None = None,
     figures_dir: str = "images",
 ) -> PaperContent:
-    env = Environment()
-
     data = {
         "figures_dir": figures_dir,
         "latex_template_text": latex_template_text,
@@ -33,8 +30,7 @@ async def convert_to_latex(
         ],
     }
 
-    env = Environment()
-    template = env.from_string(convert_to_latex_prompt)
+    template = get_template(convert_to_latex_prompt)
     messages = template.render(data)
 
     output = await langchain_client.structured_outputs(
@@ -1,5 +1,4 @@
 import logging
-import time
 
 from airas.core.types.research_session import ResearchSession
 from langgraph.graph import END, START, StateGraph
@@ -9,7 +8,7 @@ from airas.core.base import BaseSubgraph
 from airas.core.execution_timers import ExecutionTimeState, time_node
 from airas.core.logging_utils import setup_logging
 from airas.core.types.github import GitHubRepositoryInfo
-from airas.infra.github_client import GithubClient
+from airas.infra.github_client import GithubClient, git_blob_sha
 from airas.usecases.publication.publish_html_subgraph.nodes.prepare_images_for_html import (
     prepare_images_for_html,
 )
@@ -68,7 +67,17 @@ class PublishHtmlSubgraph(BaseSubgraph):
     async def _prepare_images_for_html(
         self, state: PublishHtmlSubgraphState
     ) -> dict[str, str]:
-        time.sleep(3)  # NOTE: Wait for GitHub changes to propagate.
+        # The workflow reads the HTML from gh-pages; start it once the upload
+        # is visible there (a failed upload never will be).
+        github_repository = state["github_repository_info"]
+        if state["html_upload"]:
+            await self.github_client.await_until_file_sha(
+                github_owner=github_repository.github_owner,
+                repository_name=github_repository.repository_name,
+                file_path=f"branches/{github_repository.branch_name}/index.html",
+                blob_sha=git_blob_sha(state["full_html"]),
+                branch_name="gh-pages",
+            )
         github_pages_url = await prepare_images_for_html(
             github_repository=state["github_repository_info"],
             research_session=state["research_session"],
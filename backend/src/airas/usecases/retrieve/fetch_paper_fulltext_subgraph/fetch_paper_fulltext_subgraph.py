@@ -1,4 +1,3 @@
-import asyncio
 import logging
 from typing import Literal, Optional
 
@@ -18,6 +17,8 @@ logger = logging.getLogger(__name__)
 subgraph_name = "fetch_paper_fulltext_subgraph"
 record_execution_time = lambda f: time_node(subgraph_name)(f)  # noqa: E731
 
+_DOI_LOOKUP_FIELDS = ("abstract", "externalIds", "openAccessPdf")
+
 FulltextStatus = Literal["fulltext", "abstract_only", "not_found"]
 
 
@@ -76,12 +77,15 @@ class FetchPaperFulltextSubgraph:
             }
         if doi:
             try:
-                paper = await asyncio.to_thread(
-                    self.semantic_scholar_client.get_paper_by_doi, doi
+                [paper] = await self.semantic_scholar_client.aget_papers_batch(
+                    [f"DOI:{doi}"], fields=_DOI_LOOKUP_FIELDS
                 )
             except Exception as e:
                 logger.warning(f"Semantic Scholar DOI lookup failed for {doi}: {e}")
                 return {"resolved_pdf_url": None, "resolved_from": None}
+            if paper is None:
+                logger.info(f"DOI {doi} not found on Semantic Scholar")
+                return {"resolved_pdf_url": None, "resolved_from": None}
 
             open_access_pdf = (paper.get("openAccessPdf") or {}).get("url")
             external = paper.get("externalIds") or {}
@@ -1,7 +1,7 @@
 from airas.core.types.research_session import ResearchSession
-from jinja2 import Environment
 from pydantic import BaseModel
 
+from airas.core.prompt_templates import get_template
 from airas.infra.langchain_client import LangChainClient
 from airas.infra.llm_specs import LLM_MODELS
 from airas.usecases.retrieve.retrieve_hugging_face_subgraph.prompt.extract_code_in_readme_prompt import (
@@ -29,8 +29,7 @@ async def extract_code_in_readme(
     ):
         return research_session
 
-    env = Environment()
-    template = env.from_string(extract_code_in_readme_prompt)
+    template = get_template(extract_code_in_readme_prompt)
     for huggingface_data in experimental_design.external_resources.hugging_face.models:
         if huggingface_data.readme == "":
             huggingface_data.extracted_code = ""
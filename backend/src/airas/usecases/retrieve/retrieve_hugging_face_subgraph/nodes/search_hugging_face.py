@@ -12,6 +12,7 @@ from airas.core.types.hugging_face import (
 )
 from airas.infra.hugging_face_client import (
     HF_RESOURCE_TYPE,
+    HF_SEARCH_EXPAND,
     HuggingFaceClient,
 )
 
@@ -23,6 +24,8 @@ async def search_hugging_face(
     research_session: ResearchSession,
     max_results_per_search: int = 20,
     include_gated: bool = False,
+    readme_shortlist_size: int = 5,
+    max_concurrent_readmes: int = 8,
 ) -> HuggingFace:
     if not research_session.current_iteration:
         logger.warning("No current_iteration found in research_session")
@@ -53,9 +56,17 @@ async def search_hugging_face(
     models_list: list[HuggingFaceResource] = []
     datasets_list: list[HuggingFaceResource] = []
 
+    # Bounds README downloads across all queries, not per query.
+    readme_semaphore = asyncio.Semaphore(max_concurrent_readmes)
     tasks = [
         _search_resources(
-            hf_client, search_type, query, max_results_per_search, include_gated
+            hf_client,
+            search_type,
+            query,
+            max_results_per_search,
+            include_gated,
+            readme_shortlist_size,
+            readme_semaphore,
         )
         for search_type, query in search_tasks
     ]
@@ -87,14 +98,18 @@ async def _search_resources(
     search_type: HF_RESOURCE_TYPE,
     query: str,
     max_results: int,
-    include_gated: bool = False,
+    include_gated: bool,
+    readme_shortlist_size: int,
+    readme_semaphore: asyncio.Semaphore,
 ) -> list[HuggingFaceResource]:
     try:
+        # One call: the expand fields carry everything a details call would.
         search_response = await hf_client.asearch(
             search_type=search_type,
             search_query=query,
             limit=max_results,
             sort="downloads",
+            expand=HF_SEARCH_EXPAND[search_type],
         )
 
         if not search_response or not isinstance(search_response, list):
@@ -103,80 +118,88 @@ async def _search_resources(
 
         logger.info(f"Found {len(search_response)} {search_type} for query: {query}")
 
-        enrich_tasks = [
-            _enrich_resource(hf_client, search_type, resource, include_gated)
+        candidates = [
+            hf_resource
             for resource in search_response
+            if (hf_resource := _to_accessible_resource(resource, include_gated))
         ]
-
-        enriched_results = await asyncio.gather(*enrich_tasks, return_exceptions=True)
-
-        final_resources = []
-        for i, result in enumerate(enriched_results):
-            if isinstance(result, Exception):
-                resource_id = search_response[i].get("id", "unknown")
-                logger.warning(f"Enrichment task failed for {resource_id}: {result}")
-            elif result is not None:
-                final_resources.append(result)
-
-        return final_resources
+        return await _attach_readmes(
+            hf_client,
+            search_type,
+            candidates,
+            readme_shortlist_size,
+            readme_semaphore,
+        )
 
     except Exception as e:
         logger.error(f"Critical error during search for {search_type} '{query}': {e}")
         return []
 
 
-async def _enrich_resource(
-    hf_client: HuggingFaceClient,
-    search_type: HF_RESOURCE_TYPE,
-    resource: dict[str, Any],
-    include_gated: bool = False,
+def _to_accessible_resource(
+    resource: dict[str, Any], include_gated: bool
 ) -> HuggingFaceResource | None:
     if not (resource_id := resource.get("id")):
         logger.warning(f"Resource missing ID: {resource}")
         return None
 
     try:
-        details_task = hf_client.aget_details(search_type, resource_id)
-        readme_task = hf_client.aget_readme(search_type, resource_id)
-        results = await asyncio.gather(
-            details_task, readme_task, return_exceptions=True
+        hf_resource = _apply_hf_resource_type(resource, {}, "")
+    except Exception as e:
+        logger.error(f"Error parsing resource {resource_id}: {e}")
+        return None
+
+    if hf_resource.private or hf_resource.disabled:
+        logger.info(
+            f"Skipping inaccessible resource: {resource_id} (private={hf_resource.private}, disabled={hf_resource.disabled})"
         )
+        return None
 
-        if isinstance(results[0], Exception):
-            logger.warning(f"Failed to get details for {resource_id}: {results[0]}")
-            return None
-        detailed_resource = results[0]
+    if bool(hf_resource.gated) and not include_gated:
+        logger.info(
+            f"Skipping gated resource: {resource_id} (gated={hf_resource.gated}, include_gated={include_gated})"
+        )
+        return None
 
-        if isinstance(results[1], Exception):
-            logger.warning(f"Failed to get README for {resource_id}: {results[1]}")
-            return None
-        readme_content = results[1]
+    return hf_resource
 
-        if not readme_content or not readme_content.strip():
-            logger.info(f"Skipping resource without README: {resource_id}")
-            return None
 
-        hf_resource = _apply_hf_resource_type(
-            resource, detailed_resource, readme_content
-        )
+async def _attach_readmes(
+    hf_client: HuggingFaceClient,
+    search_type: HF_RESOURCE_TYPE,
+    candidates: list[HuggingFaceResource],
+    readme_shortlist_size: int,
+    readme_semaphore: asyncio.Semaphore,
+) -> list[HuggingFaceResource]:
+    """Fetch READMEs for the most downloaded candidates only.
 
-        if hf_resource.private or hf_resource.disabled:
-            logger.info(
-                f"Skipping inaccessible resource: {resource_id} (private={hf_resource.private}, disabled={hf_resource.disabled})"
-            )
-            return None
+    Candidates arrive sorted by downloads. Resources without a README are
+    skipped as before, and the next candidates are fetched in their place
+    until the shortlist is full or the candidates run out.
+    """
 
-        if bool(hf_resource.gated) and not include_gated:
-            logger.info(
-                f"Skipping gated resource: {resource_id} (gated={hf_resource.gated}, include_gated={include_gated})"
+    async def fetch(resource: HuggingFaceResource) -> str:
+        async with readme_semaphore:
+            return await hf_client.aget_readme(
+                search_type, resource.id, sha=resource.sha
             )
-            return None
-
-        return hf_resource
 
-    except Exception as e:
-        logger.error(f"Error enriching resource {resource_id}: {e}")
-        return None
+    shortlist: list[HuggingFaceResource] = []
+    remaining = candidates
+    while remaining and len(shortlist) < readme_shortlist_size:
+        wanted = readme_shortlist_size - len(shortlist)
+        batch, remaining = remaining[:wanted], remaining[wanted:]
+        readmes = await asyncio.gather(
+            *(fetch(resource) for resource in batch), return_exceptions=True
+        )
+        for resource, readme in zip(batch, readmes, strict=True):
+            if isinstance(readme, Exception):
+                logger.warning(f"Failed to get README for {resource.id}: {readme}")
+            elif not readme or not readme.strip():
+                logger.info(f"Skipping resource without README: {resource.id}")
+            else:
+                shortlist.append(resource.model_copy(update={"readme": readme}))
+    return shortlist
 
 
 def _apply_hf_resource_type(
@@ -215,5 +238,5 @@ def _apply_hf_resource_type(
         pipeline_tag=merged_data.get("pipeline_tag"),
         library_name=merged_data.get("library_name"),
         readme=readme_content,
-        model_index=merged_data.get("model_index"),
+        model_index=merged_data.get("model-index", merged_data.get("model_index")),
     )
@@ -1,9 +1,9 @@
 import logging
 
 from airas.core.types.research_session import ResearchSession
-from jinja2 import Environment
 from pydantic import BaseModel
 
+from airas.core.prompt_templates import get_template
 from airas.core.types.hugging_face import HuggingFace
 from airas.infra.langchain_client import LangChainClient
 from airas.infra.llm_specs import LLM_MODELS
@@ -28,8 +28,7 @@ async def select_resources(
     max_models: int = 10,
     max_datasets: int = 10,
 ) -> HuggingFace:
-    env = Environment()
-    template = env.from_string(prompt_template)
+    template = get_template(prompt_template)
     messages = template.render(
         {
             "research_session": research_session,
@@ -67,19 +66,26 @@ async def select_resources(
     return HuggingFace(models=selected_models, datasets=selected_datasets)
 
 
+def _format_resource(resource: dict) -> str:
+    # Metadata comes with the expanded search call, so it costs no extra request.
+    card_data = resource["card_data"] or {}
+    return f"""
+- Pipeline: {resource["pipeline_tag"] or "unknown"}
+- Library: {resource["library_name"] or card_data.get("library_name") or "unknown"}
+- Downloads: {resource["downloads"]}, Likes: {resource["likes"]}
+- README:
+  {resource["readme"][:3000]}\n"""
+
+
 def _format_huggingface_data(huggingface_search_results: HuggingFace) -> str:
     hugging_face_data = huggingface_search_results.model_dump()
     hugging_face_data_str = ""
     hugging_face_data_str += "## Models"
     for model in hugging_face_data["models"]:
         hugging_face_data_str += f"""
-- Model Name: {model["id"]}
-- README:
-  {model["readme"][:3000]}\n"""
+- Model Name: {model["id"]}{_format_resource(model)}"""
     hugging_face_data_str += "\n## Datasets"
     for dataset in hugging_face_data["datasets"]:
         hugging_face_data_str += f"""
-- Dataset Name: {dataset["id"]}
-- README:
-  {dataset["readme"][:3000]}\n"""
+- Dataset Name: {dataset["id"]}{_format_resource(dataset)}"""
     return hugging_face_data_str
@@ -77,10 +77,12 @@ class RetrieveHuggingFaceSubgraph(BaseSubgraph):
         max_results_per_search: int = 10,
         max_models: int = 10,
         max_datasets: int = 10,
+        readme_shortlist_size: int = 5,
     ):
         self.hf_client = hf_client
         self.llm_client = llm_client
         self.max_results_per_search = max_results_per_search
+        self.readme_shortlist_size = readme_shortlist_size
         self.max_models = max_models
         self.max_datasets = max_datasets
         if llm_mapping is None:
@@ -111,6 +113,7 @@ class RetrieveHuggingFaceSubgraph(BaseSubgraph):
             research_session=state["research_session"],
             max_results_per_search=self.max_results_per_search,
             include_gated=self.include_gated,
+            readme_shortlist_size=self.readme_shortlist_size,
         )
         return {"huggingface_search_results": huggingface_search_results}
 
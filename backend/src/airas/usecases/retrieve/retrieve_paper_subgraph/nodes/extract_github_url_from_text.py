@@ -3,10 +3,11 @@ import re
 from logging import getLogger
 from urllib.parse import urlparse
 
-from jinja2 import Environment, Template
+from jinja2 import Template
 from pydantic import BaseModel, field_validator
 
 from airas.core.llm_config import NodeLLMConfig
+from airas.core.prompt_templates import get_template
 from airas.infra.github_client import GithubClient
 from airas.infra.langchain_client import LangChainClient
 from airas.usecases.retrieve.retrieve_paper_subgraph.nodes.summarize_paper import (
@@ -107,7 +108,7 @@ async def extract_github_url_from_text(
     llm_client: LangChainClient,
     github_client: GithubClient,
 ) -> list[str]:
-    template = Environment().from_string(prompt_template)
+    template = get_template(prompt_template)
 
     async def _extract_for_paper(
         paper_idx: int,
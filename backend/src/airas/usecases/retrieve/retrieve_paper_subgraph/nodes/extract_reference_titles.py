@@ -2,10 +2,10 @@ import asyncio
 import string
 from logging import getLogger
 
-from jinja2 import Environment
 from pydantic import BaseModel
 
 from airas.core.llm_config import NodeLLMConfig
+from airas.core.prompt_templates import get_template
 from airas.infra.langchain_client import LangChainClient
 from airas.usecases.retrieve.retrieve_paper_subgraph.prompt.extract_reference_titles_prompt import (
     extract_reference_titles_prompt,
@@ -39,8 +39,7 @@ async def _extract_references_from_text(
         logger.warning(f"No full_text found for {context_label}")
         return []
 
-    env = Environment()
-    jinja_template = env.from_string(template)
+    jinja_template = get_template(template)
     data = {"full_text": full_text}
     messages = jinja_template.render(data)
 
@@ -6,6 +6,7 @@ import httpx
 from pypdf import PdfReader
 
 from airas.core.types.arxiv import ArxivInfo
+from airas.infra.http_session import shared_async_session
 
 logger = getLogger(__name__)
 
@@ -33,10 +34,10 @@ async def retrieve_text_from_url(
             arxiv_id=arxiv_id,
         )
 
-    async with httpx.AsyncClient(follow_redirects=True) as client:
-        text_list: list[str] = list(
-            await asyncio.gather(*(_fetch_for_info(info) for info in arxiv_info_list))
-        )
+    client = shared_async_session()
+    text_list: list[str] = list(
+        await asyncio.gather(*(_fetch_for_info(info) for info in arxiv_info_list))
+    )
 
     return text_list
 
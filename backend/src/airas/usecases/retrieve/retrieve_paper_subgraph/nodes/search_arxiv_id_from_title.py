@@ -3,9 +3,8 @@ import json
 import logging
 import re
 
-from jinja2 import Environment
-
 from airas.core.llm_config import NodeLLMConfig
+from airas.core.prompt_templates import get_template
 from airas.infra.langchain_client import LangChainClient
 
 logger = logging.getLogger(__name__)
@@ -36,7 +35,7 @@ async def search_arxiv_id_from_title(
     paper_titles: list[str],
     conference_preference: str | None = None,
 ) -> list[str]:
-    template = Environment().from_string(prompt_template)
+    template = get_template(prompt_template)
 
     async def _retrieve_arxiv_id(title: str) -> str:
         prompt = template.render(
@@ -1,4 +1,3 @@
-import asyncio
 from logging import getLogger
 
 import feedparser
@@ -22,46 +21,36 @@ def _empty_arxiv_info(arxiv_id: str = "") -> ArxivInfo:
     )
 
 
+def _entry_to_arxiv_info(entry: feedparser.FeedParserDict) -> ArxivInfo:
+    return ArxivInfo(
+        id=entry.id.split("/abs/")[-1],
+        title=getattr(entry, "title", "") or "No Title",
+        authors=[a.name for a in getattr(entry, "authors", [])],
+        published_date=getattr(entry, "published", ""),
+        summary=getattr(entry, "summary", ""),
+        journal=getattr(entry, "arxiv_journal_ref", None),
+        doi=getattr(entry, "arxiv_doi", None),
+        affiliation=getattr(entry, "arxiv_affiliation", None),
+    )
+
+
 async def search_arxiv_info_by_id(
     arxiv_id_list: list[str],
     arxiv_client: ArxivClient,
 ) -> list[ArxivInfo]:
-    async def _build_arxiv_info(raw_arxiv_id: str) -> ArxivInfo:
-        sanitized_id = (raw_arxiv_id or "").strip()
-        if not sanitized_id:
-            return _empty_arxiv_info()
-
-        try:
-            xml_feed = await arxiv_client.aget_paper_by_id(arxiv_id=sanitized_id)
-        except Exception as e:  # pragma: no cover - network/HTTP errors
-            logger.error(
-                f"Failed to process arXiv ID {raw_arxiv_id}: {e}. Skipping to the next."
-            )
-            return _empty_arxiv_info(sanitized_id)
-
-        feed = feedparser.parse(xml_feed)
-        if not feed.entries:
-            return _empty_arxiv_info(sanitized_id)
+    sanitized_ids = [(raw_arxiv_id or "").strip() for raw_arxiv_id in arxiv_id_list]
 
-        entry = feed.entries[0]
-        if not hasattr(entry, "id"):
-            return _empty_arxiv_info(sanitized_id)
-
-        return ArxivInfo(
-            id=entry.id.split("/")[-1],
-            title=getattr(entry, "title", "") or "No Title",
-            authors=[a.name for a in getattr(entry, "authors", [])],
-            published_date=getattr(entry, "published", ""),
-            summary=getattr(entry, "summary", ""),
-            journal=getattr(entry, "arxiv_journal_ref", None),
-            doi=getattr(entry, "arxiv_doi", None),
-            affiliation=getattr(entry, "arxiv_affiliation", None),
-        )
-
-    arxiv_info_list: list[ArxivInfo] = list(
-        await asyncio.gather(
-            *(_build_arxiv_info(arxiv_id) for arxiv_id in arxiv_id_list)
+    try:
+        entries = await arxiv_client.aget_papers_by_ids(
+            [arxiv_id for arxiv_id in sanitized_ids if arxiv_id]
         )
-    )
-
-    return arxiv_info_list
+    except Exception as e:  # pragma: no cover - network/HTTP errors
+        logger.error(f"Failed to fetch arXiv metadata for {arxiv_id_list}: {e}")
+        entries = {}
+
+    return [
+        _entry_to_arxiv_info(entries[arxiv_id])
+        if arxiv_id in entries
+        else _empty_arxiv_info(arxiv_id)
+        for arxiv_id in sanitized_ids
+    ]
@@ -30,10 +30,10 @@ import asyncio
 import logging
 from typing import cast
 
-from jinja2 import Environment
 from pydantic import BaseModel, Field
 
 from airas.core.llm_config import NodeLLMConfig
+from airas.core.prompt_templates import get_template
 from airas.infra.langchain_client import LangChainClient
 from airas.usecases.retrieve.retrieve_paper_subgraph.nodes.extract_code_structure import (
     RepositoryCodeStructure,
@@ -99,8 +99,7 @@ async def _select_files_from_study(
 
     code_structure_str = code_structure.to_prompt_string()
 
-    env = Environment()
-    jinja_template = env.from_string(template)
+    jinja_template = get_template(template)
     message = jinja_template.render(
         {
             "paper_summary": paper_summary,
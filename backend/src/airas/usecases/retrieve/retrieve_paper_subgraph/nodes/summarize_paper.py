@@ -2,10 +2,11 @@ import asyncio
 import logging
 from typing import Any, Self, cast
 
-from jinja2 import Environment, Template
+from jinja2 import Template
 from pydantic import BaseModel
 
 from airas.core.llm_config import NodeLLMConfig
+from airas.core.prompt_templates import get_template
 from airas.infra.langchain_client import LangChainClient
 
 logger = logging.getLogger(__name__)
@@ -66,8 +67,7 @@ async def summarize_paper(
     prompt_template: str,
     arxiv_full_text_list: list[str],
 ) -> list[PaperSummary]:
-    env = Environment()
-    template = env.from_string(prompt_template)
+    template = get_template(prompt_template)
 
     async def _summarize_or_empty(idx: int, text: str) -> PaperSummary:
         if not text.strip():
@@ -11,6 +11,7 @@ from airas.core.papers_db_config import (
     AIRAS_PAPERS_REPO_BASE_URL,
     CONFERENCES_AND_YEARS,
 )
+from airas.infra.http_session import shared_async_session
 
 logger = getLogger(__name__)
 
@@ -50,39 +51,41 @@ class AirasDbPaperSearchIndex:
             raise
 
     async def _fetch_all_papers(self) -> list[dict[str, Any]]:
-        async with httpx.AsyncClient() as client:
-            semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
-
-            async def _bounded_fetch(url: str) -> list[dict[str, Any]]:
-                async with semaphore:
-                    return await self._fetch_papers_from_url(client, url)
-
-            tasks = []
-            urls = []
-            for conference, years in CONFERENCES_AND_YEARS.items():
-                for year in years:
-                    url = f"{AIRAS_PAPERS_REPO_BASE_URL}/{conference}/{year}.json"
-                    task = _bounded_fetch(url)
-                    tasks.append(task)
-                    urls.append(url)
-
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            all_papers: list[dict[str, Any]] = []
-            failed_count = 0
-            for url, result in zip(urls, results, strict=True):
-                if isinstance(result, Exception):
-                    failed_count += 1
-                    logger.warning(f"  -> Failed to fetch {url}: {result}")
-                    continue
-                papers = cast(list[dict[str, Any]], result)
-                all_papers.extend(papers)
-
-            if failed_count > 0:
-                logger.warning(
-                    f"Failed to fetch {failed_count}/{len(urls)} URLs. "
-                    f"Successfully loaded {len(all_papers)} papers from {len(urls) - failed_count} URLs."
-                )
+        # The shared session keeps connections alive across fetches and serves
+        # the raw files from the HTTP cache.
+        client = shared_async_session()
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+        async def _bounded_fetch(url: str) -> list[dict[str, Any]]:
+            async with semaphore:
+                return await self._fetch_papers_from_url(client, url)
+
+        tasks = []
+        urls = []
+        for conference, years in CONFERENCES_AND_YEARS.items():
+            for year in years:
+                url = f"{AIRAS_PAPERS_REPO_BASE_URL}/{conference}/{year}.json"
+                task = _bounded_fetch(url)
+                tasks.append(task)
+                urls.append(url)
+
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        all_papers: list[dict[str, Any]] = []
+        failed_count = 0
+        for url, result in zip(urls, results, strict=True):
+            if isinstance(result, Exception):
+                failed_count += 1
+                logger.warning(f"  -> Failed to fetch {url}: {result}")
+                continue
+            papers = cast(list[dict[str, Any]], result)
+            all_papers.extend(papers)
+
+        if failed_count > 0:
+            logger.warning(
+                f"Failed to fetch {failed_count}/{len(urls)} URLs. "
+                f"Successfully loaded {len(all_papers)} papers from {len(urls) - failed_count} URLs."
+            )
 
         return all_papers
 
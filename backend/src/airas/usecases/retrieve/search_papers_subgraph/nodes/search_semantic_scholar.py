@@ -1,4 +1,3 @@
-import asyncio
 from logging import getLogger
 from typing import Any
 
@@ -50,8 +49,7 @@ async def search_semantic_scholar(
     max_results: int,
     year: str | None = None,
 ) -> list[PaperSearchResult]:
-    response = await asyncio.to_thread(
-        semantic_scholar_client.search_papers,
+    response = await semantic_scholar_client.asearch_papers(
         query,
         year=year,
         limit=max_results,
@@ -0,0 +1,90 @@
+from datetime import datetime
+from pathlib import Path
+from uuid import UUID
+
+from airas.core.types.verification import VerificationModel
+from airas.infra.sqlite_database import DEFAULT_STORE_PATH, SqliteDatabase, to_epoch_us
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS verifications (
+    id TEXT PRIMARY KEY,
+    created_by TEXT NOT NULL,
+    created_at INTEGER NOT NULL,
+    updated_at INTEGER NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS verifications_created_by
+    ON verifications (created_by, created_at);
+CREATE INDEX IF NOT EXISTS verifications_updated_at
+    ON verifications (updated_at);
+"""
+
+
+class SqliteVerificationService:
+    """SQLite-backed store for verification sessions, indexed by owner."""
+
+    def __init__(self, path: str | Path = DEFAULT_STORE_PATH) -> None:
+        self.db = SqliteDatabase(path, _SCHEMA)
+
+    def create(
+        self, *, created_by: UUID, title: str = "名称未設定"
+    ) -> VerificationModel:
+        verification = VerificationModel(title=title, created_by=created_by)
+        with self.db.connect() as conn:
+            conn.execute(
+                "INSERT INTO verifications (id, created_by, created_at, updated_at, "
+                "data) VALUES (?, ?, ?, ?, ?)",
+                (
+                    str(verification.id),
+                    str(verification.created_by),
+                    to_epoch_us(verification.created_at),
+                    to_epoch_us(verification.updated_at),
+                    verification.model_dump_json(),
+                ),
+            )
+        return verification
+
+    def get(self, id: UUID) -> VerificationModel | None:
+        with self.db.connect() as conn:
+            row = conn.execute(
+                "SELECT data FROM verifications WHERE id = ?", (str(id),)
+            ).fetchone()
+        return VerificationModel.model_validate_json(row["data"]) if row else None
+
+    def list_by_user(self, created_by: UUID) -> list[VerificationModel]:
+        with self.db.connect() as conn:
+            rows = conn.execute(
+                "SELECT data FROM verifications WHERE created_by = ? "
+                "ORDER BY created_at",
+                (str(created_by),),
+            ).fetchall()
+        return [VerificationModel.model_validate_json(row["data"]) for row in rows]
+
+    def update(self, id: UUID, **kwargs: object) -> VerificationModel | None:
+        with self.db.transaction() as conn:
+            row = conn.execute(
+                "SELECT data FROM verifications WHERE id = ?", (str(id),)
+            ).fetchone()
+            if row is None:
+                return None
+            verification = VerificationModel.model_validate_json(row["data"])
+            for key, value in kwargs.items():
+                setattr(verification, key, value)
+            verification.updated_at = datetime.now().astimezone()
+            conn.execute(
+                "UPDATE verifications SET updated_at = ?, data = ? WHERE id = ?",
+                (
+                    to_epoch_us(verification.updated_at),
+                    verification.model_dump_json(),
+                    str(id),
+                ),
+            )
+        return verification
+
+    def delete(self, id: UUID) -> bool:
+        with self.db.connect() as conn:
+            return bool(
+                conn.execute(
+                    "DELETE FROM verifications WHERE id = ?", (str(id),)
+                ).rowcount
+            )
@@ -0,0 +1,19 @@
+from typing import Protocol, runtime_checkable
+from uuid import UUID
+
+from airas.core.types.verification import VerificationModel
+
+
+@runtime_checkable
+class VerificationServiceProtocol(Protocol):
+    def create(
+        self, *, created_by: UUID, title: str = "名称未設定"
+    ) -> VerificationModel: ...
+
+    def get(self, id: UUID) -> VerificationModel | None: ...
+
+    def list_by_user(self, created_by: UUID) -> list[VerificationModel]: ...
+
+    def update(self, id: UUID, **kwargs: object) -> VerificationModel | None: ...
+
+    def delete(self, id: UUID) -> bool: ...
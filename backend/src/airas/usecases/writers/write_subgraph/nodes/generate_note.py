@@ -3,8 +3,7 @@ import logging
 import re
 from typing import Any
 
-from jinja2 import Template
-
+from airas.core.prompt_templates import get_template
 from airas.core.types.experiment_code import ExperimentCode
 from airas.core.types.experiment_history import (
     ExperimentCycleAction,
@@ -18,82 +17,7 @@ logger = logging.getLogger(__name__)
 
 _NORMALIZE_RE = re.compile(r"[\W_]+")
 
-
-def _normalize(text: str) -> str:
-    if not text:
-        return ""
-    return _NORMALIZE_RE.sub("", text).lower()
-
-
-def _map_studies_to_bibtex(
-    research_study_list: list[ResearchStudy], references_bib: str
-) -> list[dict[str, Any]]:
-    parsed_references = parse_bibtex_to_dict(references_bib)
-
-    # { normalized_title: citation_key }
-    bib_map = {
-        _normalize(entry.get("title", "")): entry.get("ID")
-        for entry in parsed_references.values()
-        if entry.get("title") and entry.get("ID")
-    }
-
-    return [
-        {
-            "title": study.title,
-            "citation_key": bib_map.get(_normalize(study.title)),
-            "content": study.llm_extracted_info,
-        }
-        for study in research_study_list
-    ]
-
-
-def generate_note(
-    research_hypothesis: ResearchHypothesis,
-    experiment_history: ExperimentHistory,
-    experiment_code: ExperimentCode,
-    research_study_list: list[ResearchStudy],
-    references_bib: str,
-) -> str:
-    mapped_studies = _map_studies_to_bibtex(research_study_list, references_bib)
-
-    # Find the final cycle (complete) for main results
-    final_cycle = next(
-        (
-            c
-            for c in reversed(experiment_history.cycles)
-            if c.decision and c.decision.action == ExperimentCycleAction.COMPLETE
-        ),
-        None,
-    )
-
-    # Fallback to last cycle if no complete decision found
-    if final_cycle is None:
-        logger.warning(
-            "No cycle with COMPLETE decision found, falling back to last cycle"
-        )
-        final_cycle = (
-            experiment_history.cycles[-1] if experiment_history.cycles else None
-        )
-
-    # Collect redesign history for methodology section
-    redesign_cycles = [
-        cycle
-        for cycle in experiment_history.cycles
-        if cycle.decision and cycle.decision.action == ExperimentCycleAction.REDESIGN
-    ]
-
-    final_results = final_cycle.experimental_results if final_cycle else None
-    diagram_figures = final_results.diagram_figures or [] if final_results else []
-    result_figures = final_results.result_figures or [] if final_results else []
-
-    metrics_data_json = (
-        json.dumps(final_results.metrics_data, indent=2, ensure_ascii=False)
-        if final_results and final_results.metrics_data
-        else ""
-    )
-
-    template = Template(
-        """\
+_NOTE_TEMPLATE = """\
 # Research Paper Note
 
 ## 1. Research Hypothesis
@@ -173,8 +97,83 @@ This section lists papers available for citation.
 
 ## {{ '9' if redesign_cycles else '8' }}. Full BibTeX (For Reference)
 {{ references_bib }}"""
+
+
+def _normalize(text: str) -> str:
+    if not text:
+        return ""
+    return _NORMALIZE_RE.sub("", text).lower()
+
+
+def _map_studies_to_bibtex(
+    research_study_list: list[ResearchStudy], references_bib: str
+) -> list[dict[str, Any]]:
+    parsed_references = parse_bibtex_to_dict(references_bib)
+
+    # { normalized_title: citation_key }
+    bib_map = {
+        _normalize(entry.get("title", "")): entry.get("ID")
+        for entry in parsed_references.values()
+        if entry.get("title") and entry.get("ID")
+    }
+
+    return [
+        {
+            "title": study.title,
+            "citation_key": bib_map.get(_normalize(study.title)),
+            "content": study.llm_extracted_info,
+        }
+        for study in research_study_list
+    ]
+
+
+def generate_note(
+    research_hypothesis: ResearchHypothesis,
+    experiment_history: ExperimentHistory,
+    experiment_code: ExperimentCode,
+    research_study_list: list[ResearchStudy],
+    references_bib: str,
+) -> str:
+    mapped_studies = _map_studies_to_bibtex(research_study_list, references_bib)
+
+    # Find the final cycle (complete) for main results
+    final_cycle = next(
+        (
+            c
+            for c in reversed(experiment_history.cycles)
+            if c.decision and c.decision.action == ExperimentCycleAction.COMPLETE
+        ),
+        None,
     )
 
+    # Fallback to last cycle if no complete decision found
+    if final_cycle is None:
+        logger.warning(
+            "No cycle with COMPLETE decision found, falling back to last cycle"
+        )
+        final_cycle = (
+            experiment_history.cycles[-1] if experiment_history.cycles else None
+        )
+
+    # Collect redesign history for methodology section
+    redesign_cycles = [
+        cycle
+        for cycle in experiment_history.cycles
+        if cycle.decision and cycle.decision.action == ExperimentCycleAction.REDESIGN
+    ]
+
+    final_results = final_cycle.experimental_results if final_cycle else None
+    diagram_figures = final_results.diagram_figures or [] if final_results else []
+    result_figures = final_results.result_figures or [] if final_results else []
+
+    metrics_data_json = (
+        json.dumps(final_results.metrics_data, indent=2, ensure_ascii=False)
+        if final_results and final_results.metrics_data
+        else ""
+    )
+
+    template = get_template(_NOTE_TEMPLATE)
+
     return template.render(
         research_hypothesis=research_hypothesis,
         final_cycle=final_cycle,
@@ -0,0 +1,106 @@
+import logging
+from itertools import pairwise
+
+from pydantic import BaseModel
+
+from airas.core.llm_config import NodeLLMConfig
+from airas.core.prompt_templates import get_template
+from airas.core.types.paper import PaperContent
+from airas.infra.langchain_client import LangChainClient
+from airas.usecases.writers.write_subgraph.nodes.write_sections import SECTION_FIELDS
+from airas.usecases.writers.write_subgraph.prompts.harmonize_section_boundaries_prompt import (
+    harmonize_section_boundaries_prompt,
+)
+
+logger = logging.getLogger(__name__)
+
+# Title and Abstract are standalone; transitions only matter between body sections.
+_STANDALONE_SECTIONS = {"Title", "Abstract"}
+
+
+class BoundaryRevision(BaseModel):
+    section: str
+    revised_opening: str
+
+
+class BoundaryRevisions(BaseModel):
+    revisions: list[BoundaryRevision]
+
+
+def _split_paragraphs(text: str) -> list[str]:
+    return [p for p in text.split("\n\n") if p.strip()]
+
+
+def _opening_index(paragraphs: list[str]) -> int | None:
+    # Skip subsection headings and figure definitions when looking for prose.
+    for idx, paragraph in enumerate(paragraphs):
+        stripped = paragraph.lstrip()
+        if not stripped.startswith(("#", "![")):
+            return idx
+    return None
+
+
+def _closing_paragraph(paragraphs: list[str]) -> str:
+    for paragraph in reversed(paragraphs):
+        if not paragraph.lstrip().startswith(("#", "![")):
+            return paragraph
+    return paragraphs[-1] if paragraphs else ""
+
+
+async def harmonize_section_boundaries(
+    llm_config: NodeLLMConfig,
+    langchain_client: LangChainClient,
+    paper_content: PaperContent,
+) -> PaperContent:
+    body_sections = [
+        (name, field)
+        for name, field in SECTION_FIELDS.items()
+        if name not in _STANDALONE_SECTIONS
+    ]
+    paragraphs = {
+        field: _split_paragraphs(getattr(paper_content, field))
+        for _, field in body_sections
+    }
+
+    boundaries = []
+    for (prev_name, prev_field), (name, field) in pairwise(body_sections):
+        opening_idx = _opening_index(paragraphs[field])
+        if opening_idx is None:
+            continue
+        boundaries.append(
+            {
+                "previous_section": prev_name,
+                "previous_closing": _closing_paragraph(paragraphs[prev_field]),
+                "section": name,
+                "opening": paragraphs[field][opening_idx],
+            }
+        )
+    if not boundaries:
+        return paper_content
+
+    template = get_template(harmonize_section_boundaries_prompt)
+    messages = template.render(boundaries=boundaries)
+
+    output = await langchain_client.structured_outputs(
+        message=messages,
+        data_model=BoundaryRevisions,
+        llm_name=llm_config.llm_name,
+        params=llm_config.params,
+    )
+    if output is None:
+        raise ValueError("Error: No response from LLM in harmonize_section_boundaries.")
+
+    updates: dict[str, str] = {}
+    for revision in output.revisions:
+        field = SECTION_FIELDS.get(revision.section)
+        if field not in paragraphs or not revision.revised_opening.strip():
+            logger.warning(f"Ignoring boundary revision for '{revision.section}'")
+            continue
+        section_paragraphs = list(paragraphs[field])
+        opening_idx = _opening_index(section_paragraphs)
+        if opening_idx is None:
+            continue
+        section_paragraphs[opening_idx] = revision.revised_opening.strip()
+        updates[field] = "\n\n".join(section_paragraphs)
+
+    return paper_content.model_copy(update=updates)
@@ -1,6 +1,5 @@
-from jinja2 import Environment
-
 from airas.core.llm_config import NodeLLMConfig
+from airas.core.prompt_templates import get_template
 from airas.core.types.paper import PaperContent
 from airas.infra.langchain_client import LangChainClient
 from airas.usecases.writers.write_subgraph.prompts.refine_prompt import refine_prompt
@@ -16,14 +15,13 @@ async def refine_paper(
     paper_content: PaperContent,
     note: str,
 ) -> PaperContent:
-    env = Environment()
-    write_prompt_template = env.from_string(write_prompt)
+    write_prompt_template = get_template(write_prompt)
     rendered_system_prompt = write_prompt_template.render(
         note=note,
         tips_dict=section_tips_prompt,
     )
 
-    refine_prompt_template = env.from_string(refine_prompt)
+    refine_prompt_template = get_template(refine_prompt)
     refine_message = refine_prompt_template.render(content=paper_content)
 
     messages = rendered_system_prompt + refine_message
@@ -0,0 +1,78 @@
+import asyncio
+import logging
+
+from airas.core.llm_config import NodeLLMConfig
+from airas.core.prompt_templates import get_template
+from airas.core.types.paper import PaperContent
+from airas.infra.langchain_client import LangChainClient
+from airas.usecases.writers.write_subgraph.nodes.write_sections import (
+    SECTION_FIELDS,
+    SectionContent,
+)
+from airas.usecases.writers.write_subgraph.prompts.refine_section_prompt import (
+    refine_section_prompt,
+)
+from airas.usecases.writers.write_subgraph.prompts.section_tips_prompt import (
+    section_tips_prompt,
+)
+
+logger = logging.getLogger(__name__)
+
+
+async def refine_section(
+    llm_config: NodeLLMConfig,
+    langchain_client: LangChainClient,
+    note: str,
+    section_name: str,
+    content: str,
+) -> str:
+    template = get_template(refine_section_prompt)
+    messages = template.render(
+        note=note,
+        section_name=section_name,
+        section_tips=section_tips_prompt[section_name],
+        section_names=list(SECTION_FIELDS),
+        content=content,
+    )
+
+    output = await langchain_client.structured_outputs(
+        message=messages,
+        data_model=SectionContent,
+        llm_name=llm_config.llm_name,
+        params=llm_config.params,
+    )
+    if output is None:
+        raise ValueError(
+            f"Error: No response from LLM in refine_section ({section_name})."
+        )
+
+    logger.info(f"Refined section: {section_name}")
+    return output.content.strip()
+
+
+async def refine_sections(
+    llm_config: NodeLLMConfig,
+    langchain_client: LangChainClient,
+    paper_content: PaperContent,
+    note: str,
+    max_concurrency: int = 4,
+) -> PaperContent:
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _refine(section_name: str, field: str) -> str:
+        async with semaphore:
+            return await refine_section(
+                llm_config=llm_config,
+                langchain_client=langchain_client,
+                note=note,
+                section_name=section_name,
+                content=getattr(paper_content, field),
+            )
+
+    contents = await asyncio.gather(
+        *(
+            _refine(section_name, field)
+            for section_name, field in SECTION_FIELDS.items()
+        )
+    )
+    return PaperContent(**dict(zip(SECTION_FIELDS.values(), contents, strict=True)))
@@ -1,6 +1,5 @@
-from jinja2 import Environment
-
 from airas.core.llm_config import NodeLLMConfig
+from airas.core.prompt_templates import get_template
 from airas.core.types.paper import PaperContent
 from airas.infra.langchain_client import LangChainClient
 from airas.usecases.writers.write_subgraph.prompts.section_tips_prompt import (
@@ -14,8 +13,7 @@ async def write_paper(
     langchain_client: LangChainClient,
     note: str,
 ) -> PaperContent:
-    env = Environment()
-    template = env.from_string(write_prompt)
+    template = get_template(write_prompt)
     messages = template.render(
         note=note,
         tips_dict=section_tips_prompt,
@@ -0,0 +1,81 @@
+import asyncio
+import logging
+
+from pydantic import BaseModel
+
+from airas.core.llm_config import NodeLLMConfig
+from airas.core.prompt_templates import get_template
+from airas.core.types.paper import PaperContent
+from airas.infra.langchain_client import LangChainClient
+from airas.usecases.writers.write_subgraph.prompts.section_tips_prompt import (
+    section_tips_prompt,
+)
+from airas.usecases.writers.write_subgraph.prompts.write_section_prompt import (
+    write_section_prompt,
+)
+
+logger = logging.getLogger(__name__)
+
+# { "Related Work": "related_work", ... } in the order the sections appear in the paper
+SECTION_FIELDS: dict[str, str] = {
+    section_name: section_name.lower().replace(" ", "_")
+    for section_name in section_tips_prompt
+}
+
+
+class SectionContent(BaseModel):
+    content: str
+
+
+async def write_section(
+    llm_config: NodeLLMConfig,
+    langchain_client: LangChainClient,
+    note: str,
+    section_name: str,
+) -> str:
+    template = get_template(write_section_prompt)
+    messages = template.render(
+        note=note,
+        section_name=section_name,
+        section_tips=section_tips_prompt[section_name],
+        section_names=list(SECTION_FIELDS),
+    )
+
+    # NOTE: structured_outputs retries on its own, so a failing section is retried
+    # without re-running the sections that already succeeded.
+    output = await langchain_client.structured_outputs(
+        message=messages,
+        data_model=SectionContent,
+        llm_name=llm_config.llm_name,
+        params=llm_config.params,
+    )
+    if output is None:
+        raise ValueError(
+            f"Error: No response from LLM in write_section ({section_name})."
+        )
+
+    logger.info(f"Wrote section: {section_name}")
+    return output.content.strip()
+
+
+async def write_sections(
+    llm_config: NodeLLMConfig,
+    langchain_client: LangChainClient,
+    note: str,
+    max_concurrency: int = 4,
+) -> PaperContent:
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _write(section_name: str) -> str:
+        async with semaphore:
+            return await write_section(
+                llm_config=llm_config,
+                langchain_client=langchain_client,
+                note=note,
+                section_name=section_name,
+            )
+
+    contents = await asyncio.gather(
+        *(_write(section_name) for section_name in SECTION_FIELDS)
+    )
+    return PaperContent(**dict(zip(SECTION_FIELDS.values(), contents, strict=True)))
@@ -0,0 +1,22 @@
+harmonize_section_boundaries_prompt = """\
+The sections of a research paper were written independently and in parallel.
+Your task is a final consistency pass over the boundaries between consecutive sections only.
+
+# Section Boundaries
+For each boundary you are given the closing paragraph of the preceding section and the opening paragraph of the following section.
+{% for boundary in boundaries %}
+## Boundary {{ loop.index }}: {{ boundary.previous_section }} -> {{ boundary.section }}
+### Closing paragraph of "{{ boundary.previous_section }}"
+{{ boundary.previous_closing }}
+
+### Opening paragraph of "{{ boundary.section }}"
+{{ boundary.opening }}
+{% endfor %}
+
+# Instructions
+- For every boundary, return a revised opening paragraph for the following section (use the exact section name shown after "->")
+- Make each transition read naturally from the preceding section and remove content that duplicates it
+- Keep terminology, notation, and method names consistent across all boundaries
+- Preserve all technical content, numerical values, citations in [@citation_key] format, and figure definitions/references exactly
+- Do not add new claims, results, citations, or figures
+- If an opening paragraph needs no change, return it unchanged"""
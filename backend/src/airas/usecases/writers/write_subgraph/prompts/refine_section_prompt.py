@@ -0,0 +1,28 @@
+refine_section_prompt = """\
+You are refining ONE section of an existing research paper to improve its quality, clarity, and academic rigor.
+Other sections of the same paper are being refined in parallel by other writers.
+
+# Paper Outline
+{% for name in section_names %}
+- {{ name }}{% if name == section_name %}  <-- the section you are refining{% endif %}
+{% endfor %}
+
+# Section Guidelines: {{ section_name }}
+{{ section_tips }}
+
+# Research Context
+{{ note }}
+
+# Current Section Content
+{{ content }}
+
+# Refinement Instructions
+- Return ONLY the refined body of the "{{ section_name }}" section, without the section heading
+- Improve the writing quality, flow, and clarity while preserving all technical content
+- Use ONLY the information provided in the research context; do not add invented data or results
+- Ensure proper citation placement and format: all citations must use Pandoc/Quarto format [@citation_key]
+    - Do NOT use other formats like [citation_key] or \\cite{key}
+    - Only use citation keys explicitly provided in the "Reference Candidates" section
+- Verify that all figures belonging to this section are properly defined, referenced and captioned
+- Check for and fix any grammatical, spelling, or formatting errors
+- If there are four or more subsections, connect the text into a coherent and well-structured narrative"""
@@ -0,0 +1,29 @@
+write_section_prompt = """\
+Your goal is to write ONE section of a clear, structured, and academically rigorous research paper in plain English.
+Other sections of the same paper are being written in parallel by other writers from the same research context.
+Avoid LaTeX commands or special formatting; focus solely on academic content quality.
+
+# Paper Outline
+The full paper contains the following sections, in this order:
+{% for name in section_names %}
+- {{ name }}{% if name == section_name %}  <-- the section you are writing{% endif %}
+{% endfor %}
+
+# Section To Write: {{ section_name }}
+{{ section_tips }}
+
+# Research Context
+{{ note }}
+
+# Core Writing Instructions
+- Write ONLY the body of the "{{ section_name }}" section. Do not include the section heading itself and do not write any other section
+- Use ONLY the information provided in the context above. DO NOT add assumptions, invented data, or details that are not explicitly mentioned
+- Do not repeat material that clearly belongs to another section of the outline; refer to it instead (e.g., "as described in the Method section")
+- Insert citations using Pandoc/Quarto citation format: [@citation_key], e.g. [@vaswani-2017-attention] or [@vaswani-2017-attention; @devlin-2018-bert]
+- Only use citation keys explicitly provided in the "Reference Candidates" section, and only cite papers that are directly relevant
+- Place method diagram figures (listed under "Method Diagrams") only in the Method section and experimental result figures (listed under "Result Figures") only in the Results section
+- Define figures using Pandoc/Quarto syntax: `![Caption text](images/filename.pdf){% raw %}{#fig:label}{% endraw %}` and reference them as `@fig:label`
+- In figure captions, specify whether a higher or a lower value indicates better performance
+- Do not invent or assume the existence of any figures, results, or hardware details
+- Avoid editor instructions, placeholders, speculative text, or comments like "details are missing"
+- Structure the section into no more than two or three subsections"""
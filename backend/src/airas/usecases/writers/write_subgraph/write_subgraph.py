@@ -1,7 +1,7 @@
 import logging
 from typing import Literal
 
-from langgraph.graph import START, StateGraph
+from langgraph.graph import END, START, StateGraph
 from langgraph.types import Command
 from pydantic import BaseModel
 from typing_extensions import TypedDict
@@ -16,13 +16,27 @@ from airas.core.types.research_hypothesis import ResearchHypothesis
 from airas.core.types.research_study import ResearchStudy
 from airas.infra.langchain_client import LangChainClient
 from airas.usecases.writers.write_subgraph.nodes.generate_note import generate_note
+from airas.usecases.writers.write_subgraph.nodes.harmonize_section_boundaries import (
+    harmonize_section_boundaries,
+)
 from airas.usecases.writers.write_subgraph.nodes.refine_paper import refine_paper
+from airas.usecases.writers.write_subgraph.nodes.refine_sections import (
+    refine_sections,
+)
 from airas.usecases.writers.write_subgraph.nodes.write_paper import write_paper
+from airas.usecases.writers.write_subgraph.nodes.write_sections import (
+    write_sections,
+)
 
 setup_logging()
 logger = logging.getLogger(__name__)
 record_execution_time = lambda f: time_node("write_subgraph")(f)  # noqa: E731
 
+# "full_paper": write and refine the whole PaperContent in single LLM calls.
+# "section_parallel": write and refine each section concurrently from the shared note,
+# then run a consistency pass over the section boundaries only.
+WritingMode = Literal["full_paper", "section_parallel"]
+
 
 class WriteLLMMapping(BaseModel):
     write_paper: NodeLLMConfig = DEFAULT_NODE_LLM_CONFIG["write_paper"]
@@ -64,9 +78,13 @@ class WriteSubgraph:
         langchain_client: LangChainClient,
         llm_mapping: WriteLLMMapping | None = None,
         paper_content_refinement_iterations: int = 2,
+        writing_mode: WritingMode = "full_paper",
+        max_concurrency: int = 4,
     ):
         self.llm_mapping = llm_mapping or WriteLLMMapping()
         self.paper_content_refinement_iterations = paper_content_refinement_iterations
+        self.writing_mode = writing_mode
+        self.max_concurrency = max_concurrency
         self.langchain_client = langchain_client
 
     @record_execution_time
@@ -121,6 +139,67 @@ class WriteSubgraph:
             goto=goto,
         )
 
+    @record_execution_time
+    async def _write_sections(
+        self, state: WriteSubgraphState
+    ) -> dict[str, PaperContent]:
+        paper_content = await write_sections(
+            llm_config=self.llm_mapping.write_paper,
+            langchain_client=self.langchain_client,
+            note=state["note"],
+            max_concurrency=self.max_concurrency,
+        )
+        return {"paper_content": paper_content}
+
+    @record_execution_time
+    async def _refine_sections(
+        self, state: WriteSubgraphState
+    ) -> Command[Literal["refine_sections", "harmonize_section_boundaries"]]:
+        paper_content = await refine_sections(
+            llm_config=self.llm_mapping.refine_paper,
+            langchain_client=self.langchain_client,
+            paper_content=state["paper_content"],
+            note=state["note"],
+            max_concurrency=self.max_concurrency,
+        )
+
+        new_refinement_count = state["refinement_count"] + 1
+        goto: Literal["refine_sections", "harmonize_section_boundaries"]
+        if new_refinement_count < self.paper_content_refinement_iterations:
+            goto = "refine_sections"
+        else:
+            goto = "harmonize_section_boundaries"
+
+        return Command(
+            update={
+                "paper_content": paper_content,
+                "refinement_count": new_refinement_count,
+            },
+            goto=goto,
+        )
+
+    @record_execution_time
+    async def _harmonize_section_boundaries(
+        self, state: WriteSubgraphState
+    ) -> dict[str, PaperContent]:
+        paper_content = await harmonize_section_boundaries(
+            llm_config=self.llm_mapping.refine_paper,
+            langchain_client=self.langchain_client,
+            paper_content=state["paper_content"],
+        )
+        return {"paper_content": paper_content}
+
+    def _build_section_parallel_graph(self, graph_builder: StateGraph) -> None:
+        graph_builder.add_node("write_sections", self._write_sections)
+        graph_builder.add_node("refine_sections", self._refine_sections)
+        graph_builder.add_node(
+            "harmonize_section_boundaries", self._harmonize_section_boundaries
+        )
+
+        graph_builder.add_edge("generate_note", "write_sections")
+        graph_builder.add_edge("write_sections", "refine_sections")
+        graph_builder.add_edge("harmonize_section_boundaries", END)
+
     def build_graph(self):
         graph_builder = StateGraph(
             WriteSubgraphState,
@@ -129,11 +208,17 @@ class WriteSubgraph:
         )
         graph_builder.add_node("initialize", self._initialize)
         graph_builder.add_node("generate_note", self._generate_note)
-        graph_builder.add_node("write_paper", self._write_paper)
-        graph_builder.add_node("refine_paper", self._refine_paper)
 
         graph_builder.add_edge(START, "initialize")
         graph_builder.add_edge("initialize", "generate_note")
+
+        if self.writing_mode == "section_parallel":
+            self._build_section_parallel_graph(graph_builder)
+            return graph_builder.compile()
+
+        graph_builder.add_node("write_paper", self._write_paper)
+        graph_builder.add_node("refine_paper", self._refine_paper)
+
         graph_builder.add_edge("generate_note", "write_paper")
         graph_builder.add_edge("write_paper", "refine_paper")
 
@@ -168,7 +168,7 @@ export type { VerificationSessionResponse } from './models/VerificationSessionRe
 export type { VerificationSessionUpdateRequest } from './models/VerificationSessionUpdateRequest';
 export type { WandbConfig } from './models/WandbConfig';
 export type { WriteLLMMapping } from './models/WriteLLMMapping';
-export type { WriteSubgraphRequestBody } from './models/WriteSubgraphRequestBody';
+export { WriteSubgraphRequestBody } from './models/WriteSubgraphRequestBody';
 export type { WriteSubgraphResponseBody } from './models/WriteSubgraphResponseBody';
 
 export { BibfileService } from './services/BibfileService';
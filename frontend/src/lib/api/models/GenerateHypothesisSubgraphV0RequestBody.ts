@@ -8,6 +8,7 @@ export type GenerateHypothesisSubgraphV0RequestBody = {
     research_topic: string;
     research_study_list: Array<ResearchStudy>;
     refinement_rounds: number;
+    num_candidates?: number;
     llm_mapping?: (GenerateHypothesisSubgraphV0LLMMapping | null);
 };
 
@@ -5,5 +5,6 @@
 import type { HypothesisDrivenResearchListItemResponse } from './HypothesisDrivenResearchListItemResponse';
 export type HypothesisDrivenResearchListResponseBody = {
     items: Array<HypothesisDrivenResearchListItemResponse>;
+    next_cursor?: (string | null);
 };
 
@@ -5,5 +5,6 @@
 import type { TopicOpenEndedResearchListItemResponse } from './TopicOpenEndedResearchListItemResponse';
 export type TopicOpenEndedResearchListResponseBody = {
     items: Array<TopicOpenEndedResearchListItemResponse>;
+    next_cursor?: (string | null);
 };
 
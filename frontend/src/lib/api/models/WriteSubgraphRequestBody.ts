@@ -14,6 +14,13 @@ export type WriteSubgraphRequestBody = {
     research_study_list: Array<ResearchStudy>;
     references_bib: string;
     writing_refinement_rounds?: number;
+    writing_mode?: WriteSubgraphRequestBody.writing_mode;
     llm_mapping?: (WriteLLMMapping | null);
 };
+export namespace WriteSubgraphRequestBody {
+    export enum writing_mode {
+        FULL_PAPER = 'full_paper',
+        SECTION_PARALLEL = 'section_parallel',
+    }
+}
 
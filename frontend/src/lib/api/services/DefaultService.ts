@@ -17,4 +17,15 @@ export class DefaultService {
             url: '/health',
         });
     }
+    /**
+     * Metrics
+     * @returns string Successful Response
+     * @throws ApiError
+     */
+    public static metricsMetricsGet(): CancelablePromise<string> {
+        return __request(OpenAPI, {
+            method: 'GET',
+            url: '/metrics',
+        });
+    }
 }
@@ -30,6 +30,54 @@ export class HypothesisDrivenResearchService {
             },
         });
     }
+    /**
+     * Resume Hypothesis Driven Research
+     * Continue a failed, cancelled or interrupted run from its last completed node.
+     *
+     * The request body must match the one the task was started with; only the
+     * graph state is checkpointed, not the run settings.
+     * @param taskId
+     * @param requestBody
+     * @returns HypothesisDrivenResearchResponseBody Successful Response
+     * @throws ApiError
+     */
+    public static resumeHypothesisDrivenResearchAirasV1HypothesisDrivenResearchTaskIdResumePost(
+        taskId: string,
+        requestBody: HypothesisDrivenResearchRequestBody,
+    ): CancelablePromise<HypothesisDrivenResearchResponseBody> {
+        return __request(OpenAPI, {
+            method: 'POST',
+            url: '/airas/v1/hypothesis_driven_research/{task_id}/resume',
+            path: {
+                'task_id': taskId,
+            },
+            body: requestBody,
+            mediaType: 'application/json',
+            errors: {
+                422: `Validation Error`,
+            },
+        });
+    }
+    /**
+     * Cancel Hypothesis Driven Research
+     * @param taskId
+     * @returns HypothesisDrivenResearchStatusResponseBody Successful Response
+     * @throws ApiError
+     */
+    public static cancelHypothesisDrivenResearchAirasV1HypothesisDrivenResearchTaskIdCancelPost(
+        taskId: string,
+    ): CancelablePromise<HypothesisDrivenResearchStatusResponseBody> {
+        return __request(OpenAPI, {
+            method: 'POST',
+            url: '/airas/v1/hypothesis_driven_research/{task_id}/cancel',
+            path: {
+                'task_id': taskId,
+            },
+            errors: {
+                422: `Validation Error`,
+            },
+        });
+    }
     /**
      * Get Hypothesis Driven Research Status
      * @param taskId
@@ -54,12 +102,14 @@ export class HypothesisDrivenResearchService {
      * List Hypothesis Driven Research
      * @param offset
      * @param limit
+     * @param cursor
      * @returns HypothesisDrivenResearchListResponseBody Successful Response
      * @throws ApiError
      */
     public static listHypothesisDrivenResearchAirasV1HypothesisDrivenResearchGet(
         offset?: number,
         limit?: (number | null),
+        cursor?: (string | null),
     ): CancelablePromise<HypothesisDrivenResearchListResponseBody> {
         return __request(OpenAPI, {
             method: 'GET',
@@ -67,6 +117,7 @@ export class HypothesisDrivenResearchService {
             query: {
                 'offset': offset,
                 'limit': limit,
+                'cursor': cursor,
             },
             errors: {
                 422: `Validation Error`,
@@ -30,6 +30,54 @@ export class TopicOpenEndedResearchService {
             },
         });
     }
+    /**
+     * Resume Topic Open Ended Research
+     * Continue a failed, cancelled or interrupted run from its last completed node.
+     *
+     * The request body must match the one the task was started with; only the
+     * graph state is checkpointed, not the run settings.
+     * @param taskId
+     * @param requestBody
+     * @returns TopicOpenEndedResearchResponseBody Successful Response
+     * @throws ApiError
+     */
+    public static resumeTopicOpenEndedResearchAirasV1TopicOpenEndedResearchTaskIdResumePost(
+        taskId: string,
+        requestBody: TopicOpenEndedResearchRequestBody,
+    ): CancelablePromise<TopicOpenEndedResearchResponseBody> {
+        return __request(OpenAPI, {
+            method: 'POST',
+            url: '/airas/v1/topic_open_ended_research/{task_id}/resume',
+            path: {
+                'task_id': taskId,
+            },
+            body: requestBody,
+            mediaType: 'application/json',
+            errors: {
+                422: `Validation Error`,
+            },
+        });
+    }
+    /**
+     * Cancel Topic Open Ended Research
+     * @param taskId
+     * @returns TopicOpenEndedResearchStatusResponseBody Successful Response
+     * @throws ApiError
+     */
+    public static cancelTopicOpenEndedResearchAirasV1TopicOpenEndedResearchTaskIdCancelPost(
+        taskId: string,
+    ): CancelablePromise<TopicOpenEndedResearchStatusResponseBody> {
+        return __request(OpenAPI, {
+            method: 'POST',
+            url: '/airas/v1/topic_open_ended_research/{task_id}/cancel',
+            path: {
+                'task_id': taskId,
+            },
+            errors: {
+                422: `Validation Error`,
+            },
+        });
+    }
     /**
      * Get Topic Open Ended Research Status
      * @param taskId
@@ -54,12 +102,14 @@ export class TopicOpenEndedResearchService {
      * List Topic Open Ended Research
      * @param offset
      * @param limit
+     * @param cursor
      * @returns TopicOpenEndedResearchListResponseBody Successful Response
      * @throws ApiError
      */
     public static listTopicOpenEndedResearchAirasV1TopicOpenEndedResearchGet(
         offset?: number,
         limit?: (number | null),
+        cursor?: (string | null),
     ): CancelablePromise<TopicOpenEndedResearchListResponseBody> {
         return __request(OpenAPI, {
             method: 'GET',
@@ -67,6 +117,7 @@ export class TopicOpenEndedResearchService {
             query: {
                 'offset': offset,
                 'limit': limit,
+                'cursor': cursor,
             },
             errors: {
                 422: `Validation Error`,